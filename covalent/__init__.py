@@ -20,6 +20,7 @@
 
 """Main Covalent public functionality."""
 
+from importlib import import_module as _import_module
 from importlib import metadata
 
 from . import _file_transfer as fs  # nopycln: import
@@ -42,15 +43,36 @@ from ._workflow import (  # nopycln: import
     lattice,
 )
 from ._workflow.electron import wait  # nopycln: import
-from ._workflow.qelectron import qelectron  # nopycln: import
 from .executor.utils import get_context  # nopycln: import
-from .quantum import QCluster  # nopycln: import
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+# Public objects whose modules import PennyLane and are only loaded on first access
+_LAZY_ATTRIBUTES = {
+    "QCluster": ".quantum",
+    "qelectron": "._workflow.qelectron",
+}
+
+__all__ = sorted([s for s in dir() if not s.startswith("_")] + list(_LAZY_ATTRIBUTES))
 
 for _s in dir():
     if not _s.startswith("_"):
         _obj = globals()[_s]
         _obj.__module__ = __name__
 
+
+def __getattr__(name: str):
+    """Import the lazily loaded public objects on first access."""
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    obj = getattr(_import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    obj.__module__ = __name__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __version__ = metadata.version("covalent")
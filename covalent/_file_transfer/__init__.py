@@ -18,7 +18,8 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+from .cache import FileTransferCache
 from .enums import Order
 from .file import File
-from .file_transfer import FileTransfer, TransferFromRemote, TransferToRemote
+from .file_transfer import FileTransfer, TransferFromRemote, TransferMany, TransferToRemote
 from .folder import Folder
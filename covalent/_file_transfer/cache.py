@@ -0,0 +1,284 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Change detection and a local content-addressed cache for file transfers"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import filelock
+
+from .._shared_files import logger
+
+app_log = logger.app_log
+
+SIDECAR_SUFFIX = ".covalent-transfer.json"
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_checksum(filepath: str) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def local_metadata(filepath: str) -> dict:
+    """Returns the size and modification time of a local file."""
+
+    stat = os.stat(filepath)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def _sidecar_path(filepath: str) -> Path:
+    path = Path(filepath)
+    return path.with_name(f".{path.name}{SIDECAR_SUFFIX}")
+
+
+def _load_sidecar(filepath: str) -> dict:
+    try:
+        with open(_sidecar_path(filepath)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_up_to_date(local_filepath: str, remote_uri: str, remote_metadata: dict) -> bool:
+    """Checks whether a local file is unchanged since it was last transferred to or from a remote file.
+
+    The local file is considered unchanged if its size and modification time, or failing
+    that its checksum, match those recorded in its sidecar file after the last transfer.
+
+    Args:
+        local_filepath: Path to the local side of the transfer
+        remote_uri: URI of the remote side of the transfer
+        remote_metadata: Current metadata of the remote file, e.g. its size and ETag
+
+    Returns:
+        Whether both sides are unchanged since the last recorded transfer
+    """
+
+    if not os.path.isfile(local_filepath):
+        return False
+
+    record = _load_sidecar(local_filepath).get(remote_uri)
+    if not record or record["remote"] != remote_metadata:
+        return False
+
+    current = local_metadata(local_filepath)
+    if current == record["local"]:
+        return True
+
+    return current["size"] == record["local"]["size"] and (
+        file_checksum(local_filepath) == record["checksum"]
+    )
+
+
+def record_transfer(local_filepath: str, remote_uri: str, remote_metadata: dict) -> None:
+    """Records the state of both sides of a completed transfer in the local file's sidecar.
+
+    Args:
+        local_filepath: Path to the local side of the transfer
+        remote_uri: URI of the remote side of the transfer
+        remote_metadata: Metadata of the remote file after the transfer
+    """
+
+    records = _load_sidecar(local_filepath)
+    records[remote_uri] = {
+        "remote": remote_metadata,
+        "local": local_metadata(local_filepath),
+        "checksum": file_checksum(local_filepath),
+    }
+
+    sidecar_path = _sidecar_path(local_filepath)
+    tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(records, f)
+    os.replace(tmp_path, sidecar_path)
+
+
+class FileTransferCache:
+    """
+    Local content-addressed cache of downloaded files, shared by all file transfers which use
+    the same cache directory, e.g. across electrons and dispatches running on one machine.
+
+    Cached files are keyed by the remote file's URI and version metadata, and stored once
+    per distinct content. When the cache grows beyond `max_size` bytes, the least recently
+    used contents are evicted.
+
+    Args:
+        cache_dir: Directory in which cached files are stored
+        max_size: Maximum total size in bytes of the cached files, unlimited if None
+
+    Attributes:
+        cache_dir: Directory in which cached files are stored
+        max_size: Maximum total size in bytes of the cached files, unlimited if None
+    """
+
+    def __init__(self, cache_dir: str, max_size: Optional[int] = None) -> None:
+        self.cache_dir = str(Path(cache_dir).expanduser())
+        self.max_size = max_size
+
+    @property
+    def _objects_dir(self) -> Path:
+        return Path(self.cache_dir) / "objects"
+
+    @property
+    def _refs_dir(self) -> Path:
+        return Path(self.cache_dir) / "refs"
+
+    @property
+    def _stats_path(self) -> Path:
+        return Path(self.cache_dir) / "stats.json"
+
+    def _lock(self) -> filelock.FileLock:
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+        return filelock.FileLock(str(Path(self.cache_dir) / ".lock"))
+
+    @staticmethod
+    def key(remote_uri: str, remote_metadata: dict) -> str:
+        """Returns the cache key of a version of a remote file."""
+
+        identity = json.dumps([remote_uri, remote_metadata], sort_keys=True)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _update_stats(self, **increments) -> None:
+        # Must be called with the cache lock held
+        stats = self._read_stats()
+        for name, increment in increments.items():
+            stats[name] = stats.get(name, 0) + increment
+
+        tmp_path = self._stats_path.with_name("stats.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, self._stats_path)
+
+    def _read_stats(self) -> dict:
+        try:
+            with open(self._stats_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def fetch(self, key: str, to_filepath: str) -> bool:
+        """Copies a cached file to `to_filepath` if present.
+
+        Args:
+            key: Cache key of the remote file's version
+            to_filepath: Local destination path
+
+        Returns:
+            Whether the file was found in the cache
+        """
+
+        with self._lock():
+            try:
+                content_hash = (self._refs_dir / key).read_text()
+                object_path = self._objects_dir / content_hash
+                shutil.copyfile(object_path, to_filepath)
+            except FileNotFoundError:
+                self._update_stats(misses=1)
+                return False
+
+            # Mark as recently used for eviction
+            os.utime(object_path)
+            self._update_stats(hits=1, bytes_served=os.path.getsize(object_path))
+
+        app_log.debug(f"File transfer cache hit for {to_filepath}")
+        return True
+
+    def store(self, key: str, from_filepath: str) -> None:
+        """Adds a downloaded file to the cache and evicts old contents if over the size limit.
+
+        Args:
+            key: Cache key of the remote file's version
+            from_filepath: Local path of the downloaded file
+        """
+
+        content_hash = file_checksum(from_filepath)
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        self._refs_dir.mkdir(parents=True, exist_ok=True)
+
+        object_path = self._objects_dir / content_hash
+        if not object_path.exists():
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, delete=False) as f:
+                tmp_path = f.name
+            shutil.copyfile(from_filepath, tmp_path)
+            os.replace(tmp_path, object_path)
+
+        with self._lock():
+            (self._refs_dir / key).write_text(content_hash)
+            os.utime(object_path)
+            self._evict()
+
+    def _evict(self) -> None:
+        # Must be called with the cache lock held
+        if self.max_size is None:
+            return
+
+        objects = [(path.stat(), path) for path in self._objects_dir.iterdir() if path.is_file()]
+        total_size = sum(stat.st_size for stat, _ in objects)
+        evicted = 0
+
+        for stat, path in sorted(objects, key=lambda item: item[0].st_mtime_ns):
+            if total_size <= self.max_size:
+                break
+            path.unlink()
+            total_size -= stat.st_size
+            evicted += 1
+
+        if evicted:
+            # References to evicted contents are dropped too
+            existing = {path.name for _, path in objects if path.exists()}
+            for ref_path in self._refs_dir.iterdir():
+                if ref_path.read_text() not in existing:
+                    ref_path.unlink()
+            self._update_stats(evictions=evicted)
+
+    def get_stats(self) -> dict:
+        """Returns the cache's hit and miss counts, hit rate, evictions and current size."""
+
+        with self._lock():
+            stats = self._read_stats()
+            sizes = (
+                [path.stat().st_size for path in self._objects_dir.iterdir()]
+                if self._objects_dir.exists()
+                else []
+            )
+
+        hits = stats.get("hits", 0)
+        misses = stats.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "bytes_served": stats.get("bytes_served", 0),
+            "evictions": stats.get("evictions", 0),
+            "num_objects": len(sizes),
+            "size": sum(sizes),
+        }
@@ -18,8 +18,9 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
-from typing import Optional, Union
+from typing import Callable, List, Optional, Union
 
+from .cache import FileTransferCache, is_up_to_date, local_metadata, record_transfer
 from .enums import FileTransferStrategyTypes, FtCallDepReturnValue, Order
 from .file import File
 from .strategies.http_strategy import HTTP
@@ -36,6 +37,8 @@ class FileTransfer:
         to_file: Filepath or File object corresponding to the destination file.
         order: Order (enum) to execute the file transfer before (Order.BEFORE) or after (Order.AFTER) electron execution.
         strategy: Optional File Transfer Strategy to perform file operations - default will be resolved from provided file schemes.
+        skip_unchanged: Whether to skip the transfer of a file when neither side changed since its last transfer, as recorded in a sidecar file next to the local file.
+        cache: Optional local cache from which remote files are copied instead of downloaded when already present.
     """
 
     def __init__(
@@ -44,6 +47,8 @@ class FileTransfer:
         to_file: Optional[Union[File, str]] = None,
         order: Order = Order.BEFORE,
         strategy: Optional[FileTransferStrategy] = None,
+        skip_unchanged: bool = False,
+        cache: Optional[FileTransferCache] = None,
     ) -> None:
         if isinstance(from_file, str) or from_file is None:
             from_file = File(from_file)
@@ -75,6 +80,8 @@ class FileTransfer:
         self.to_file = to_file
         self.from_file = from_file
         self.order = order
+        self.skip_unchanged = skip_unchanged
+        self.cache = cache
 
         # this is currently the case but as we further develop file transfer strategies we may support this
         # for example we may support streaming files between buckets in S3
@@ -99,12 +106,137 @@ class FileTransfer:
         if self.from_file.is_remote and not self.to_file.is_remote:
             file_transfer_call_dep = self.strategy.download(self.from_file, self.to_file)
 
+        if (self.skip_unchanged or self.cache) and not (
+            self.from_file.is_dir or self.to_file.is_dir
+        ):
+            file_transfer_call_dep = self._transfer_if_changed(file_transfer_call_dep)
+
         pre_transfer_hook_call_dep = self.strategy.pre_transfer_hook(
             self.from_file, self.to_file, return_value_type=return_value_type
         )
 
         return (pre_transfer_hook_call_dep, file_transfer_call_dep)
 
+    def _transfer_if_changed(self, file_transfer_call_dep: Callable) -> Callable:
+        """Wraps a file transfer so that it is skipped when neither side changed since the last
+        transfer, and downloads are served from the local cache when possible."""
+
+        strategy = self.strategy
+        from_file = self.from_file
+        to_file = self.to_file
+        skip_unchanged = self.skip_unchanged
+        cache = self.cache if from_file.is_remote and not to_file.is_remote else None
+
+        # The side of the transfer whose version is compared, and the local side holding the sidecar
+        if to_file.is_remote:
+            source_file, local_file = to_file, from_file
+        else:
+            source_file, local_file = from_file, to_file
+
+        def get_source_metadata():
+            if source_file.is_remote:
+                return strategy.get_metadata(source_file)
+            return local_metadata(source_file.filepath)
+
+        def transfer_if_changed():
+            # Metadata is None when the remote file's version is unknown or it does not exist yet
+            source_metadata = get_source_metadata()
+
+            if (
+                skip_unchanged
+                and source_metadata is not None
+                and is_up_to_date(local_file.filepath, source_file.uri, source_metadata)
+            ):
+                return None
+
+            cache_key = (
+                cache.key(source_file.uri, source_metadata)
+                if cache and source_metadata is not None
+                else None
+            )
+            if cache_key and cache.fetch(cache_key, to_file.filepath):
+                result = None
+            else:
+                result = file_transfer_call_dep()
+                if cache_key:
+                    cache.store(cache_key, to_file.filepath)
+
+            if skip_unchanged:
+                # Uploads change the remote side's version
+                if to_file.is_remote:
+                    source_metadata = get_source_metadata()
+                if source_metadata is not None:
+                    record_transfer(local_file.filepath, source_file.uri, source_metadata)
+
+            return result
+
+        return transfer_if_changed
+
+
+class TransferMany:
+    """
+    Batch of file transfers performed together, so that transfers which share an rsync strategy
+    go through as few rsync invocations and SSH sessions as possible instead of one per file.
+
+    Can be used anywhere a FileTransfer can, e.g. in an electron's `files`. The value injected
+    into the electron's `files` keyword argument for a batch is the list of (from, to) filepath
+    pairs of its transfers.
+
+    Attributes:
+        file_transfers: FileTransfer objects to perform, all with the same order.
+        order: Order (enum) to execute the file transfers before (Order.BEFORE) or after (Order.AFTER) electron execution.
+    """
+
+    def __init__(self, file_transfers: List[FileTransfer]) -> None:
+        if not file_transfers:
+            raise ValueError("TransferMany requires at least one file transfer.")
+
+        orders = {ft.order for ft in file_transfers}
+        if len(orders) > 1:
+            raise ValueError("All file transfers in a TransferMany must have the same order.")
+
+        self.file_transfers = list(file_transfers)
+        self.order = orders.pop()
+
+    def _batch_key(self, file_transfer: FileTransfer):
+        # Only plain rsync transfers to or from the same host can share invocations
+        strategy = file_transfer.strategy
+        if (
+            not isinstance(strategy, Rsync)
+            or file_transfer.skip_unchanged
+            or file_transfer.cache is not None
+        ):
+            return None
+        return (strategy.user, strategy.host, strategy.private_key_path)
+
+    def cp(self):
+        pre_transfer_hooks = []
+        single_call_deps = []
+        batches = {}
+
+        for ft in self.file_transfers:
+            pre_transfer_hook, file_transfer_call_dep = ft.cp()
+            pre_transfer_hooks.append(pre_transfer_hook)
+
+            batch_key = self._batch_key(ft)
+            if batch_key is None:
+                single_call_deps.append(file_transfer_call_dep)
+            else:
+                batches.setdefault(batch_key, []).append(ft)
+
+        batch_call_deps = [
+            batch[0].strategy.transfer_many(batch) for batch in batches.values()
+        ] + single_call_deps
+
+        def pre_transfer_hook():
+            return [hook() for hook in pre_transfer_hooks]
+
+        def file_transfer_call_dep():
+            for call_dep in batch_call_deps:
+                call_dep()
+
+        return (pre_transfer_hook, file_transfer_call_dep)
+
 
 # Factories
 
@@ -114,6 +246,8 @@ def TransferFromRemote(
     to_filepath: Union[str, None] = None,
     strategy: Optional[FileTransferStrategy] = None,
     order: Order = Order.BEFORE,
+    skip_unchanged: bool = False,
+    cache: Optional[FileTransferCache] = None,
 ) -> FileTransfer:
     """
     Factory for creating a FileTransfer instance where from_filepath is implicitly created as a remote File Object, and the order (Order.BEFORE) is set so that this file transfer will occur prior to electron execution.
@@ -123,6 +257,8 @@ def TransferFromRemote(
         to_filepath: File path corresponding to local file (destination)
         strategy: Optional File Transfer Strategy to perform file operations - default will be resolved from provided file schemes.
         order: Order (enum) to execute the file transfer before (Order.BEFORE) or after (Order.AFTER) electron execution - default is BEFORE
+        skip_unchanged: Whether to skip the download when neither file changed since the last one - default is False
+        cache: Optional local cache from which the remote file is copied instead of downloaded when already present
 
     Returns:
         FileTransfer instance with implicit Order.BEFORE enum set and from (source) file marked as remote
@@ -134,7 +270,12 @@ def TransferFromRemote(
         raise ValueError("Please specify a directory path (ending with '/') as the destination.")
     to_file = File(to_filepath, is_dir=is_dir)
     return FileTransfer(
-        from_file=from_file, to_file=to_file, order=Order.BEFORE, strategy=strategy
+        from_file=from_file,
+        to_file=to_file,
+        order=Order.BEFORE,
+        strategy=strategy,
+        skip_unchanged=skip_unchanged,
+        cache=cache,
     )
 
 
@@ -143,6 +284,7 @@ def TransferToRemote(
     from_filepath: Union[str, None] = None,
     strategy: Optional[FileTransferStrategy] = None,
     order: Order = Order.AFTER,
+    skip_unchanged: bool = False,
 ) -> FileTransfer:
     """
     Factory for creating a FileTransfer instance where to_filepath is implicitly created as a remote File Object, and the order (Order.AFTER) is set so that this file transfer will occur post electron execution.
@@ -152,6 +294,7 @@ def TransferToRemote(
         from_filepath: File path corresponding to local file (source).
         strategy: Optional File Transfer Strategy to perform file operations - default will be resolved from provided file schemes.
         order: Order (enum) to execute the file transfer before (Order.BEFORE) or after (Order.AFTER) electron execution - default is AFTER
+        skip_unchanged: Whether to skip the upload when neither file changed since the last one - default is False
 
     Returns:
         FileTransfer instance with implicit Order.AFTER enum set and to (destination) file marked as remote
@@ -163,4 +306,10 @@ def TransferToRemote(
         raise ValueError("Please specify a directory path (ending with '/') as the destination.")
     to_file = File(to_filepath, is_remote=True, is_dir=is_dir)
 
-    return FileTransfer(from_file=from_file, to_file=to_file, order=Order.AFTER, strategy=strategy)
+    return FileTransfer(
+        from_file=from_file,
+        to_file=to_file,
+        order=Order.AFTER,
+        strategy=strategy,
+        skip_unchanged=skip_unchanged,
+    )
@@ -19,12 +19,18 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 from pathlib import Path
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 from furl import furl
 
 from ..._shared_files import logger
 from .. import File
+from .chunked_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    ObjectChangedError,
+    download_in_chunks,
+)
 from .transfer_strategy_base import FileTransferStrategy
 
 app_log = logger.app_log
@@ -37,9 +43,13 @@ class Blob(FileTransferStrategy):
         client_id: ID of a service principal authorized to perform the transfer
         client_secret: Corresponding secret key for the service principal credentials
         tenant_id: The Azure Active Directory tenant ID which owns the cloud resources.
+        chunk_size: Size in bytes of the ranges and blocks transferred in parallel
+        max_concurrency: Maximum number of ranges or blocks transferred at the same time
 
     Attributes:
         credentials: A tuple containing (client_id, client_secret, tenant_id)
+        chunk_size: Size in bytes of the ranges and blocks transferred in parallel
+        max_concurrency: Maximum number of ranges or blocks transferred at the same time
     """
 
     def __init__(
@@ -47,8 +57,12 @@ class Blob(FileTransferStrategy):
         client_id: str = None,
         client_secret: str = None,
         tenant_id: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         self.credentials = (tenant_id, client_id, client_secret)
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
 
     def _get_blob_service_client(self, storage_account_url):
         """Returns the service client object for the Blob storage account.
@@ -70,7 +84,10 @@ class Blob(FileTransferStrategy):
             raise
 
         return BlobServiceClient(
-            account_url=storage_account_url, credential=ClientSecretCredential(*self.credentials)
+            account_url=storage_account_url,
+            credential=ClientSecretCredential(*self.credentials),
+            max_block_size=self.chunk_size,
+            max_single_put_size=self.chunk_size,
         )
 
     def _parse_blob_uri(self, blob_uri: str) -> Tuple[str, str, str]:
@@ -94,7 +111,7 @@ class Blob(FileTransferStrategy):
         return (storage_account_url, storage_container_name, base_path)
 
     def _download_file(self, container_client, blob_name: str, destination_path: Path) -> None:
-        """Downloads a single blob to the local filesystem.
+        """Downloads a single blob to the local filesystem in parallel, resumable chunks.
 
         Args:
             container_client: Azure Blob storage container client object
@@ -102,11 +119,33 @@ class Blob(FileTransferStrategy):
             destination_path: Path on the local filesystem where the file will be saved
         """
 
-        blob_client = container_client.get_blob_client(blob=blob_name)
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceModifiedError
 
-        with open(destination_path, "wb") as f:
-            stream = blob_client.download_blob()
-            f.write(stream.readall())
+        blob_client = container_client.get_blob_client(blob=blob_name)
+        properties = blob_client.get_blob_properties()
+
+        # Every range is read from the version of the blob whose size was read
+        def read_range(start, end):
+            try:
+                stream = blob_client.download_blob(
+                    offset=start,
+                    length=end - start + 1,
+                    etag=properties.etag,
+                    match_condition=MatchConditions.IfNotModified,
+                )
+                yield from stream.chunks()
+            except ResourceModifiedError as ex:
+                raise ObjectChangedError(f"{blob_name} changed during download") from ex
+
+        download_in_chunks(
+            read_range,
+            properties.size,
+            str(destination_path),
+            self.chunk_size,
+            self.max_concurrency,
+            properties.etag,
+        )
 
     def download(self, from_file: File, to_file: File = File()) -> Callable:
         """Download files or the contents of folders from Azure Blob Storage.
@@ -164,7 +203,12 @@ class Blob(FileTransferStrategy):
         """
 
         with open(file_path, "rb") as f:
-            container_client.upload_blob(name=str(dest_obj_path), data=f, overwrite=True)
+            container_client.upload_blob(
+                name=str(dest_obj_path),
+                data=f,
+                overwrite=True,
+                max_concurrency=self.max_concurrency,
+            )
 
     def upload(self, from_file: File, to_file: File = File()) -> Callable:
         """Upload files or the contents of folders to Azure Blob Storage.
@@ -208,5 +252,21 @@ class Blob(FileTransferStrategy):
 
         return callable
 
+    def get_metadata(self, file: File) -> Optional[dict]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        storage_account_url, storage_container_name, blob_name = self._parse_blob_uri(file.uri)
+        blob_service_client = self._get_blob_service_client(storage_account_url)
+        blob_client = blob_service_client.get_container_client(
+            storage_container_name
+        ).get_blob_client(blob=blob_name)
+
+        try:
+            properties = blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+
+        return {"size": properties.size, "etag": properties.etag}
+
     def cp(self, from_file: File, to_file: File = File()) -> File:  # pragma: no cover
         raise NotImplementedError
@@ -0,0 +1,172 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Chunked, parallel and resumable downloads shared by the remote file transfer strategies"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable
+
+from ..._shared_files import logger
+
+app_log = logger.app_log
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Size of the blocks in which each chunk is streamed to disk
+STREAM_BLOCK_SIZE = 256 * 1024
+
+
+class ObjectChangedError(IOError):
+    """Raised when an object changed while it was being downloaded in chunks."""
+
+
+def _load_progress(progress_filepath: str, size: int, chunk_size: int, fingerprint: str) -> set:
+    """Returns the indices of the chunks already downloaded by a previous, interrupted attempt."""
+
+    try:
+        with open(progress_filepath) as f:
+            progress = json.load(f)
+    except (OSError, ValueError):
+        return set()
+
+    if (progress.get("size"), progress.get("chunk_size"), progress.get("fingerprint")) != (
+        size,
+        chunk_size,
+        fingerprint,
+    ):
+        return set()
+
+    return set(progress.get("done", []))
+
+
+def _save_progress(
+    progress_filepath: str, size: int, chunk_size: int, fingerprint: str, done: set
+) -> None:
+    tmp_filepath = f"{progress_filepath}.tmp"
+    with open(tmp_filepath, "w") as f:
+        json.dump(
+            {
+                "size": size,
+                "chunk_size": chunk_size,
+                "fingerprint": fingerprint,
+                "done": sorted(done),
+            },
+            f,
+        )
+    os.replace(tmp_filepath, progress_filepath)
+
+
+def download_in_chunks(
+    read_range: Callable[[int, int], Iterable[bytes]],
+    size: int,
+    to_filepath: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    fingerprint: str = "",
+) -> str:
+    """Download an object of known size by reading byte ranges of it in parallel.
+
+    Data is streamed into a `<to_filepath>.part` file which is moved to `to_filepath` once
+    complete. For objects of more than one chunk, the completed chunks are recorded in a
+    `<to_filepath>.part.json` file so that a failed download resumes where it stopped,
+    provided the object's size and fingerprint are unchanged. If the object changes
+    during the download, the partial download is discarded.
+
+    Args:
+        read_range: Function returning an iterable over the bytes from `start` to `end`, inclusive.
+            It should raise `ObjectChangedError` if the object no longer matches `fingerprint`.
+        size: Size of the object in bytes
+        to_filepath: Path on the local filesystem where the object will be saved
+        chunk_size: Size in bytes of the ranges read in parallel
+        max_concurrency: Maximum number of ranges read at the same time
+        fingerprint: Version identifier of the object, e.g. its ETag
+
+    Returns:
+        to_filepath: Path where the object was saved
+    """
+
+    part_filepath = f"{to_filepath}.part"
+    progress_filepath = f"{part_filepath}.json"
+    num_chunks = max(-(-size // chunk_size), 1)
+
+    done = set()
+    if num_chunks > 1 and os.path.exists(part_filepath):
+        done = _load_progress(progress_filepath, size, chunk_size, fingerprint)
+
+    if done:
+        app_log.debug(f"Resuming download of {to_filepath}, {len(done)}/{num_chunks} chunks done")
+    else:
+        with open(part_filepath, "wb") as f:
+            f.truncate(size)
+
+    progress_lock = threading.Lock()
+
+    def download_chunk(index: int) -> None:
+        start = index * chunk_size
+        end = min(start + chunk_size, size) - 1
+
+        with open(part_filepath, "r+b") as f:
+            f.seek(start)
+            written = 0
+            for block in read_range(start, end):
+                f.write(block)
+                written += len(block)
+
+        if written != end - start + 1:
+            raise IOError(
+                f"Expected {end - start + 1} bytes at offset {start} of {to_filepath}, got {written}"
+            )
+
+        if num_chunks > 1:
+            with progress_lock:
+                done.add(index)
+                _save_progress(progress_filepath, size, chunk_size, fingerprint, done)
+
+    pending = [index for index in range(num_chunks) if index not in done]
+    try:
+        if size and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as pool:
+                futures = [pool.submit(download_chunk, index) for index in pending]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    # Fail fast, the chunks done so far are kept for resuming
+                    for future in futures:
+                        future.cancel()
+                    raise
+        elif size and pending:
+            download_chunk(pending[0])
+    except ObjectChangedError:
+        # Chunks of another version of the object cannot be resumed from
+        for filepath in (part_filepath, progress_filepath):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        raise
+
+    os.replace(part_filepath, to_filepath)
+    if os.path.exists(progress_filepath):
+        os.remove(progress_filepath)
+
+    return to_filepath
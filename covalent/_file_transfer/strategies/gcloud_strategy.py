@@ -20,12 +20,18 @@
 
 import json
 from pathlib import Path
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 from furl import furl
 
 from ..._shared_files import logger
 from .. import File
+from .chunked_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    ObjectChangedError,
+    download_in_chunks,
+)
 from .transfer_strategy_base import FileTransferStrategy
 
 app_log = logger.app_log
@@ -37,13 +43,25 @@ class GCloud(FileTransferStrategy):
     Args:
         credentials: Path to OAuth 2.0 credentials JSON file for a service account
         project_id: ID of a project in GCP
+        chunk_size: Size in bytes of the ranges downloaded in parallel and of the
+            chunks of resumable uploads, must be a multiple of 256 KiB
+        max_concurrency: Maximum number of ranges downloaded at the same time
 
     Attributes:
         credentials: String containing OAuth 2.0 credentials
         project_id: ID of a project in GCP
+        chunk_size: Size in bytes of the ranges downloaded in parallel and of the
+            chunks of resumable uploads
+        max_concurrency: Maximum number of ranges downloaded at the same time
     """
 
-    def __init__(self, credentials: str = None, project_id: str = None):
+    def __init__(
+        self,
+        credentials: str = None,
+        project_id: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         if credentials is not None:
             credentials_json = Path(credentials).resolve()
 
@@ -56,6 +74,8 @@ class GCloud(FileTransferStrategy):
             self.credentials = None
 
         self.project_id = project_id
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
 
     def _get_service_client(self, bucket_name: str):
         """Returns the service client object for the Blob storage account.
@@ -100,7 +120,27 @@ class GCloud(FileTransferStrategy):
         return (bucket_name, object_path)
 
     def _download_file(self, blob_client, destination_path: str) -> None:
-        blob_client.download_to_filename(destination_path)
+        from google.api_core.exceptions import PreconditionFailed
+
+        generation = blob_client.generation
+
+        # Every range is read from the generation of the object whose size was read
+        def read_range(start, end):
+            try:
+                yield blob_client.download_as_bytes(
+                    start=start, end=end, if_generation_match=generation
+                )
+            except PreconditionFailed as ex:
+                raise ObjectChangedError(f"{blob_client.name} changed during download") from ex
+
+        download_in_chunks(
+            read_range,
+            blob_client.size,
+            destination_path,
+            self.chunk_size,
+            self.max_concurrency,
+            str(generation),
+        )
 
     def download(self, from_file: File, to_file: File = File()) -> Callable:
         from_filepath = from_file.filepath
@@ -134,7 +174,7 @@ class GCloud(FileTransferStrategy):
         return callable
 
     def _upload_file(self, service_client, source_path: str, destination_path: Path) -> None:
-        blob = service_client.blob(destination_path)
+        blob = service_client.blob(destination_path, chunk_size=self.chunk_size)
         blob.upload_from_filename(source_path)
 
     def upload(self, from_file: File, to_file: File = File()) -> Callable:
@@ -168,5 +208,13 @@ class GCloud(FileTransferStrategy):
 
         return callable
 
+    def get_metadata(self, file: File) -> Optional[dict]:
+        bucket_name, object_path = self._parse_uri(file.uri)
+        blob = self._get_service_client(bucket_name).get_blob(str(object_path))
+        if blob is None:
+            return None
+
+        return {"size": blob.size, "generation": blob.generation, "md5": blob.md5_hash}
+
     def cp(self, from_file: File, to_file: File = File()) -> File:  # pragma: no cover
         raise NotImplementedError
@@ -19,27 +19,128 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 import urllib.request
+from typing import Optional
 
+import requests
+
+from ..._shared_files import logger
 from .. import File
+from .chunked_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    STREAM_BLOCK_SIZE,
+    ObjectChangedError,
+    download_in_chunks,
+)
 from .transfer_strategy_base import FileTransferStrategy
 
+app_log = logger.app_log
+
+# Seconds to wait for the server to respond or send more data
+DEFAULT_TIMEOUT = 60
+
+# Number of times a download is restarted when the file changes on the server
+MAX_RESTARTS = 3
+
 
 class HTTP(FileTransferStrategy):
     """
     Implements Base FileTransferStrategy class to use HTTP to download files from public URLs.
+
+    Servers which accept byte range requests are downloaded from in parallel chunks,
+    and interrupted downloads resume from the chunks already saved. Every range is
+    requested for the version of the file seen when the download started, and the
+    download is restarted if the file changes on the server.
+
+    Args:
+        chunk_size: Size in bytes of the ranges requested in parallel
+        max_concurrency: Maximum number of ranges requested at the same time
+        timeout: Seconds to wait for the server to respond or send more data
     """
 
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
     # return callable to download here implies 'from' is a remote source
     def download(self, from_file: File, to_file: File = File()) -> File:
         from_filepath = from_file.uri
         to_filepath = to_file.filepath
 
+        chunk_size = self.chunk_size
+        max_concurrency = self.max_concurrency
+        timeout = self.timeout
+
+        def make_read_range(validator):
+            def read_range(start, end):
+                headers = {"Range": f"bytes={start}-{end}"}
+                if validator:
+                    headers["If-Range"] = validator
+                with requests.get(
+                    from_filepath, headers=headers, stream=True, timeout=timeout
+                ) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        if validator:
+                            raise ObjectChangedError(f"{from_filepath} changed during download")
+                        raise IOError(
+                            f"Server did not honour the range request for {from_filepath}"
+                        )
+                    yield from response.iter_content(STREAM_BLOCK_SIZE)
+
+            return read_range
+
         def callable():
-            urllib.request.urlretrieve(from_filepath, to_filepath)
-            return to_filepath
+            for attempt in range(MAX_RESTARTS + 1):
+                response = requests.head(from_filepath, allow_redirects=True, timeout=timeout)
+                size = int(response.headers.get("Content-Length", 0))
+
+                if not response.ok or response.headers.get("Accept-Ranges") != "bytes" or not size:
+                    urllib.request.urlretrieve(from_filepath, to_filepath)
+                    return to_filepath
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified", "")
+                fingerprint = etag or last_modified
+
+                # If-Range only accepts strong ETags
+                validator = etag if etag and not etag.startswith("W/") else last_modified
+
+                try:
+                    return download_in_chunks(
+                        make_read_range(validator),
+                        size,
+                        to_filepath,
+                        chunk_size,
+                        max_concurrency,
+                        fingerprint,
+                    )
+                except ObjectChangedError:
+                    if attempt == MAX_RESTARTS:
+                        raise
+                    app_log.debug(f"{from_filepath} changed during download, restarting")
 
         return callable
 
+    def get_metadata(self, file: File) -> Optional[dict]:
+        response = requests.head(file.uri, allow_redirects=True, timeout=self.timeout)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not response.ok or not (etag or last_modified):
+            return None
+
+        return {
+            "size": response.headers.get("Content-Length"),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+
     # HTTP Strategy is read only
     def upload(self, from_file: File, to_file: File = File()) -> File:
         raise NotImplementedError
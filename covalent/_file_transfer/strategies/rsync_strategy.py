@@ -19,12 +19,17 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 import os
+import tempfile
+from collections import defaultdict
 from subprocess import PIPE, CalledProcessError, Popen
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from .. import File
 from .transfer_strategy_base import FileTransferStrategy
 
+if TYPE_CHECKING:
+    from ..file_transfer import FileTransfer
+
 
 class Rsync(FileTransferStrategy):
     """
@@ -51,14 +56,29 @@ class Rsync(FileTransferStrategy):
                 f"Provided private key ({self.private_key_path}) does not exist. Could not instantiate Rsync File Transfer Strategy. "
             )
 
+    def get_ssh_cmd(self, control_path: Optional[str] = None) -> str:
+        args = ["ssh"]
+        if self.private_key_path:
+            args.append(f"-i {self.private_key_path}")
+        if control_path:
+            # Multiplex all connections to the host over one persistent SSH session
+            args.append(
+                f"-o ControlMaster=auto -o ControlPath={control_path} -o ControlPersist=60"
+            )
+        return " ".join(args)
+
     def get_rsync_ssh_cmd(
-        self, local_file: File, remote_file: File, transfer_from_remote: bool = False
+        self,
+        local_file: File,
+        remote_file: File,
+        transfer_from_remote: bool = False,
+        control_path: Optional[str] = None,
     ) -> str:
         local_filepath = local_file.filepath
         remote_filepath = remote_file.filepath
         args = ["rsync"]
-        if self.private_key_path:
-            args.append(f'-ae "ssh -i {self.private_key_path}"')
+        if self.private_key_path or control_path:
+            args.append(f'-ae "{self.get_ssh_cmd(control_path)}"')
         else:
             args.append("-ae ssh")
 
@@ -89,6 +109,116 @@ class Rsync(FileTransferStrategy):
 
         return callable
 
+    def get_rsync_files_from_cmd(
+        self,
+        from_dir: str,
+        to_dir: str,
+        files_from: str,
+        operation: str,
+        control_path: Optional[str] = None,
+    ) -> str:
+        """Returns an rsync command transferring the files listed in `files_from`, relative to
+        `from_dir`, into `to_dir`.
+
+        Args:
+            from_dir: Directory containing the files to transfer
+            to_dir: Directory into which the files are transferred
+            files_from: Path to a local file listing the files to transfer, one per line
+            operation: One of "cp", "upload" or "download"
+            control_path: Path of the SSH control socket shared by the batch's connections
+        """
+
+        remote_prefix = f"{self.user}@{self.host}:"
+        if operation == "download":
+            from_dir = f"{remote_prefix}{from_dir}"
+        elif operation == "upload":
+            to_dir = f"{remote_prefix}{to_dir}"
+
+        args = ["rsync -a", f"--files-from={files_from}"]
+        if operation != "cp":
+            args.append(f'-e "{self.get_ssh_cmd(control_path)}"')
+        args.extend([f"{from_dir}/", f"{to_dir}/"])
+        return " ".join(args)
+
+    def transfer_many(self, file_transfers: List["FileTransfer"]) -> Callable:
+        """Returns a callable performing several file transfers with as few rsync invocations
+        and SSH handshakes as possible.
+
+        Files keeping their name and moving between the same pair of directories in the same
+        direction are transferred by one rsync invocation with a `--files-from` list. Every
+        other file gets its own invocation. All SSH connections of the batch share one
+        persistent SSH session.
+
+        Args:
+            file_transfers: File transfers to perform, all using this strategy's host
+
+        Returns:
+            callable: Function performing all the transfers
+        """
+
+        groups: Dict[Tuple[str, str, str], List[str]] = defaultdict(list)
+        single_transfers = []
+
+        for ft in file_transfers:
+            if ft.from_file.is_remote:
+                operation = "download"
+            elif ft.to_file.is_remote:
+                operation = "upload"
+            else:
+                operation = "cp"
+
+            from_dir, from_name = os.path.split(ft.from_file.filepath)
+            to_dir, to_name = os.path.split(ft.to_file.filepath)
+
+            # Relative paths are relative to the working directory, or the remote home
+            from_dir = from_dir or "."
+            to_dir = to_dir or "."
+
+            if ft.from_file.is_dir or ft.to_file.is_dir or not from_name or from_name != to_name:
+                single_transfers.append((operation, ft.from_file, ft.to_file))
+            else:
+                groups[(operation, from_dir, to_dir)].append(from_name)
+
+        uses_ssh = any(key[0] != "cp" for key in groups) or any(
+            operation != "cp" for operation, _, _ in single_transfers
+        )
+
+        def run(cmd):
+            self.return_subprocess_callable(cmd)()
+
+        def callable():
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                control_path = os.path.join(tmp_dir, "ssh-control") if uses_ssh else None
+                try:
+                    for i, ((operation, from_dir, to_dir), names) in enumerate(groups.items()):
+                        files_from = os.path.join(tmp_dir, f"files-from-{i}")
+                        with open(files_from, "w") as f:
+                            f.write("\n".join(names) + "\n")
+                        run(
+                            self.get_rsync_files_from_cmd(
+                                from_dir, to_dir, files_from, operation, control_path
+                            )
+                        )
+
+                    for operation, from_file, to_file in single_transfers:
+                        if operation == "download":
+                            cmd = self.get_rsync_ssh_cmd(to_file, from_file, True, control_path)
+                        elif operation == "upload":
+                            cmd = self.get_rsync_ssh_cmd(from_file, to_file, False, control_path)
+                        else:
+                            cmd = self.get_rsync_cmd(from_file, to_file)
+                        run(cmd)
+                finally:
+                    if control_path and os.path.exists(control_path):
+                        try:
+                            run(
+                                f"ssh -o ControlPath={control_path} -O exit {self.user}@{self.host}"
+                            )
+                        except CalledProcessError:
+                            pass
+
+        return callable
+
     # return callable to move files in the local file system
     def cp(self, from_file: File, to_file: File = File()) -> None:
         cmd = self.get_rsync_cmd(from_file, to_file)
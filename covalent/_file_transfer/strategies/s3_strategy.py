@@ -19,27 +19,83 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 import os
+from typing import Optional
 
 from furl import furl
 
 from ..._shared_files import logger
 from .. import File
+from .chunked_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    STREAM_BLOCK_SIZE,
+    ObjectChangedError,
+    download_in_chunks,
+)
 from .transfer_strategy_base import FileTransferStrategy
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+def _download_object(
+    s3, bucket_name: str, key: str, to_filepath: str, chunk_size: int, max_concurrency: int
+) -> None:
+    """Download an S3 object with parallel, resumable ranged GETs."""
+
+    from botocore.exceptions import ClientError
+
+    metadata = s3.head_object(Bucket=bucket_name, Key=key)
+    etag = metadata["ETag"]
+
+    # Every range is read from the version of the object whose size was read
+    def read_range(start, end):
+        try:
+            response = s3.get_object(
+                Bucket=bucket_name, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+            )
+        except ClientError as ex:
+            error_code = ex.response.get("Error", {}).get("Code")
+            status_code = ex.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if error_code == "PreconditionFailed" or status_code == 412:
+                raise ObjectChangedError(f"{key} changed during download") from ex
+            raise
+        yield from response["Body"].iter_chunks(STREAM_BLOCK_SIZE)
+
+    download_in_chunks(
+        read_range, metadata["ContentLength"], to_filepath, chunk_size, max_concurrency, etag
+    )
+
+
 class S3(FileTransferStrategy):
 
     """
     Implements Base FileTransferStrategy class to upload/download files from S3 Bucket.
+
+    Objects are downloaded in parallel ranged chunks which resume after an interruption,
+    and uploaded as parallel multipart uploads.
+
+    Args:
+        credentials: Path to the AWS shared credentials file
+        profile: AWS profile to use
+        region_name: AWS region to use
+        chunk_size: Size in bytes of the ranges and upload parts transferred in parallel
+        max_concurrency: Maximum number of ranges or parts transferred at the same time
     """
 
-    def __init__(self, credentials: str = None, profile: str = None, region_name: str = None):
+    def __init__(
+        self,
+        credentials: str = None,
+        profile: str = None,
+        region_name: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         self.credentials = credentials
         self.profile = profile
         self.region_name = region_name
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
 
         try:
             import boto3
@@ -69,6 +125,8 @@ class S3(FileTransferStrategy):
 
         executor_profile = self.profile
         executor_region = self.region_name
+        chunk_size = self.chunk_size
+        max_concurrency = self.max_concurrency
 
         def get_boto_options(profile=None, region=None):
             boto_options = {}
@@ -100,10 +158,13 @@ class S3(FileTransferStrategy):
                         app_log.debug(
                             f"Downloading file {str(Path(from_filepath) / obj_key)} to {str(obj_destination_filepath)}."
                         )
-                        s3.download_file(
+                        _download_object(
+                            s3,
                             bucket_name,
                             str(Path(from_filepath) / obj_key),
                             str(obj_destination_filepath),
+                            chunk_size,
+                            max_concurrency,
                         )
 
         else:
@@ -116,7 +177,9 @@ class S3(FileTransferStrategy):
                 region = executor_region
                 s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
 
-                s3.download_file(bucket_name, from_filepath, to_filepath)
+                _download_object(
+                    s3, bucket_name, from_filepath, to_filepath, chunk_size, max_concurrency
+                )
 
         return callable
 
@@ -136,6 +199,8 @@ class S3(FileTransferStrategy):
 
         executor_profile = self.profile
         executor_region = self.region_name
+        chunk_size = self.chunk_size
+        max_concurrency = self.max_concurrency
 
         def get_boto_options(profile=None, region=None):
             boto_options = {}
@@ -145,6 +210,15 @@ class S3(FileTransferStrategy):
                 boto_options["region_name"] = region
             return boto_options
 
+        def get_transfer_config():
+            from boto3.s3.transfer import TransferConfig
+
+            return TransferConfig(
+                multipart_threshold=chunk_size,
+                multipart_chunksize=chunk_size,
+                max_concurrency=max_concurrency,
+            )
+
         if from_file._is_dir:
 
             def callable():
@@ -157,6 +231,7 @@ class S3(FileTransferStrategy):
                 profile = executor_profile
                 region = executor_region
                 s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
+                transfer_config = get_transfer_config()
 
                 for dir_, _, files in os.walk(from_filepath):
                     for file_name in files:
@@ -165,7 +240,12 @@ class S3(FileTransferStrategy):
                         obj_from_filepath = str(Path(from_filepath) / rel_file)
                         obj_to_filepath = str(Path(to_filepath) / rel_file)
                         app_log.debug(f"Uploading from {obj_from_filepath} to {obj_to_filepath}.")
-                        s3.upload_file(obj_from_filepath, bucket_name, obj_to_filepath)
+                        s3.upload_file(
+                            obj_from_filepath,
+                            bucket_name,
+                            obj_to_filepath,
+                            Config=transfer_config,
+                        )
 
         else:
 
@@ -177,10 +257,31 @@ class S3(FileTransferStrategy):
                 region = executor_region
                 s3 = boto3.Session(**get_boto_options(profile, region)).client("s3")
 
-                s3.upload_file(from_filepath, bucket_name, to_filepath)
+                s3.upload_file(
+                    from_filepath, bucket_name, to_filepath, Config=get_transfer_config()
+                )
 
         return callable
 
+    def get_metadata(self, file: File) -> Optional[dict]:
+        import boto3
+        from botocore.exceptions import ClientError
+
+        boto_options = {}
+        if self.profile:
+            boto_options["profile_name"] = self.profile
+        if self.region_name:
+            boto_options["region_name"] = self.region_name
+        s3 = boto3.Session(**boto_options).client("s3")
+
+        bucket_name = furl(file.uri).origin[5:]
+        try:
+            metadata = s3.head_object(Bucket=bucket_name, Key=file.filepath.strip("/"))
+        except ClientError:
+            return None
+
+        return {"size": metadata["ContentLength"], "etag": metadata["ETag"]}
+
     # No S3 Strategy for copy
     def cp(self, from_file: File, to_file: File = File()) -> File:
         raise NotImplementedError
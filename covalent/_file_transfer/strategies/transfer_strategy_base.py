@@ -20,6 +20,7 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
 
 from ..enums import FtCallDepReturnValue
 from ..file import File
@@ -46,6 +47,19 @@ class FileTransferStrategy(ABC):
     def upload(self, from_file: File, to_file: File) -> None:
         raise NotImplementedError
 
+    def get_metadata(self, file: File) -> Optional[dict]:
+        """Returns metadata identifying the current version of a remote file, such as its
+        size and ETag, used to skip transfers of unchanged files. Strategies which cannot
+        tell versions apart return None, in which case the file is always transferred.
+
+        Args:
+            file: File object referencing a remote file
+
+        Returns:
+            metadata: JSON serializable metadata of the file, or None
+        """
+        return None
+
     def pre_transfer_hook(
         self,
         from_file: File,
@@ -21,7 +21,7 @@
 """Result object."""
 import os
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 from .._shared_files import logger
 from .._shared_files.config import get_config
@@ -30,10 +30,11 @@ from .._shared_files.defaults import postprocess_prefix, prefix_separator, subla
 from .._shared_files.qelectron_utils import QE_DB_DIRNAME
 from .._shared_files.util_classes import RESULT_STATUS, Status
 from .._workflow.lattice import Lattice
+from .._workflow.postprocessing import _NodeOutputStream
 from .._workflow.transport import TransportableObject
-from ..quantum.qserver import database as qe_db
 
 if TYPE_CHECKING:
+    from .._shared_files.metrics import DispatchMetrics
     from .._shared_files.util_classes import Status
 
 app_log = logger.app_log
@@ -104,6 +105,8 @@ class Result:
 
         self._error = None
 
+        self._metrics = None
+
     def __str__(self):
         """String representation of the result object"""
 
@@ -222,6 +225,14 @@ Node Outputs
 
         return self._error
 
+    @property
+    def metrics(self) -> Optional["DispatchMetrics"]:
+        """
+        Performance metrics collected by the dispatcher while running the dispatch, if available.
+        """
+
+        return getattr(self, "_metrics", None)
+
     def _initialize_nodes(self) -> None:
         """
         Initialize the nodes of the transport graph with a blank result.
@@ -316,7 +327,7 @@ Node Outputs
         """
         node_outputs = self.get_all_node_outputs()
         ordered_node_outputs = [
-            val.get_deserialized()
+            val
             for key, val in node_outputs.items()
             if (
                 not key.startswith(prefix_separator)
@@ -330,7 +341,7 @@ Node Outputs
 
         with active_lattice_manager.claim(lattice):
             lattice.post_processing = True
-            lattice.electron_outputs = ordered_node_outputs
+            lattice.electron_outputs = _NodeOutputStream(ordered_node_outputs)
             args = [arg.get_deserialized() for arg in lattice.args]
             kwargs = {k: v.get_deserialized() for k, v in lattice.kwargs.items()}
             workflow_function = lattice.workflow_function.get_deserialized()
@@ -391,10 +402,15 @@ Node Outputs
         except KeyError:
             return None
 
+        # Deferred since the QElectron database pulls in PennyLane
+        from ..quantum.qserver import database as qe_db
+
         results_dir = get_config("dispatcher")["results_dir"]
         db_dir = os.path.join(results_dir, self.dispatch_id, QE_DB_DIRNAME)
 
-        return qe_db.Database(db_dir).get_db(dispatch_id=self.dispatch_id, node_id=node_id)
+        return qe_db.Database(db_dir, readonly=True).get_db(
+            dispatch_id=self.dispatch_id, node_id=node_id
+        )
 
     def _get_node_error(self, node_id: int) -> Union[None, str]:
         """
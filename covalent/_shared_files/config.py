@@ -21,11 +21,12 @@
 
 import os
 import shutil
+import threading
 from dataclasses import asdict
 from functools import reduce
 from operator import getitem
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import filelock
 import toml
@@ -47,6 +48,9 @@ class ConfigManager:
 
         self.config_file = DEFAULT_CONFIG["sdk"]["config_file"]
 
+        # Stat of the config file when it was last read or written by this manager
+        self._file_stat = None
+
         self.generate_default_config()
 
         try:
@@ -111,15 +115,40 @@ class ConfigManager:
                             old_dict.setdefault(key, value)
 
         with filelock.FileLock(f"{self.config_file}.lock", timeout=1):
+            file_stat = self._stat()
             with open(self.config_file, "r+") as f:
                 file_config = toml.load(f)
+                self._file_stat = file_stat
 
                 update_nested_dict(self.config_data, file_config)
                 if new_entries:
                     update_nested_dict(self.config_data, new_entries, override_existing)
 
-                # Writing it back to the file
-                self.write_config()
+                # Writing it back to the file, unless it already has the same contents
+                if self.config_data != file_config:
+                    self.write_config()
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        """Return the modification time, size and inode of the config file, if it exists."""
+
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def is_current(self) -> bool:
+        """
+        Check whether the config file is unchanged since this manager last read or wrote it.
+
+        Args:
+            None
+
+        Returns:
+            True if the in-memory configuration reflects the config file.
+        """
+
+        return self._file_stat is not None and self._stat() == self._file_stat
 
     def read_config(self) -> None:
         """
@@ -132,7 +161,9 @@ class ConfigManager:
             None
         """
 
+        file_stat = self._stat()
         self.config_data = toml.load(self.config_file)
+        self._file_stat = file_stat
 
     def write_config(self) -> None:
         """
@@ -147,6 +178,7 @@ class ConfigManager:
 
         with open(self.config_file, "w") as f:
             toml.dump(self.config_data, f)
+        self._file_stat = self._stat()
 
     def purge_config(self) -> None:
         """
@@ -200,6 +232,39 @@ class ConfigManager:
             data[keys[-1]] = value
 
 
+# Config managers by config file, reused for as long as the file is unchanged
+_config_managers: Dict[str, ConfigManager] = {}
+_config_managers_lock = threading.Lock()
+
+
+def _get_config_manager() -> ConfigManager:
+    """
+    Return a cached config manager for the current config file, reloading it if the
+    file was modified since it was last read.
+
+    Changes to environment variables are only picked up when they change the location
+    of the config file: the other defaults they set are only used for keys missing from
+    the config file, which is written with every default when it is first created.
+
+    Args:
+        None
+
+    Returns:
+        The config manager.
+    """
+
+    from .defaults import get_default_sdk_config
+
+    config_file = get_default_sdk_config()["config_file"]
+
+    with _config_managers_lock:
+        cm = _config_managers.get(config_file)
+        if cm is None or not cm.is_current():
+            cm = ConfigManager()
+            _config_managers[config_file] = cm
+        return cm
+
+
 def set_config(new_config: Union[Dict, str], new_value: Any = None) -> None:
     """
     Update the configuration.
@@ -214,7 +279,7 @@ def set_config(new_config: Union[Dict, str], new_value: Any = None) -> None:
     Returns:
         None
     """
-    cm = ConfigManager()
+    cm = _get_config_manager()
 
     if isinstance(new_config, str):
         cm.set(new_config, new_value)
@@ -241,23 +306,77 @@ def get_config(entries: Union[str, List] = None) -> Union[Dict, Union[str, int]]
     """
 
     entries = entries or []
-    cm = ConfigManager()
+    cm = _get_config_manager()
 
+    # Copy mutable values so that callers cannot modify the cached configuration
     if isinstance(entries, List) and len(entries) == 0:
         # If no arguments are passed, return the full configuration as a dict
-        return cm.config_data
+        return _copy_value(cm.config_data)
     elif isinstance(entries, List) and len(entries) == 1:
         # If the argument is a single key in a List, return the corresponding value
-        return cm.get(entries[0])
+        return _copy_value(cm.get(entries[0]))
     elif isinstance(entries, str):
         # If the argument is a string key, return the corresponding value
-        return cm.get(entries)
+        return _copy_value(cm.get(entries))
     else:
         # If a set of keys are passed, return a corresponding dict of key-value pairs
-        values = [cm.get(entry) for entry in entries]
+        values = [_copy_value(cm.get(entry)) for entry in entries]
         return dict(zip(entries, values))
 
 
+def _copy_value(value: Any) -> Any:
+    # Config values are parsed from TOML, so only dicts and lists need copying. This is
+    # several times faster than copy.deepcopy, which would dominate cached lookups.
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def get_results_dir() -> str:
+    """
+    Return the dispatcher's results directory.
+
+    Args:
+        None
+
+    Returns:
+        The `dispatcher.results_dir` setting.
+    """
+
+    return get_config("dispatcher.results_dir")
+
+
+def get_db_path() -> str:
+    """
+    Return the path of the dispatcher's database.
+
+    Args:
+        None
+
+    Returns:
+        The `dispatcher.db_path` setting.
+    """
+
+    return get_config("dispatcher.db_path")
+
+
+def get_executor_config(executor_name: str) -> Dict:
+    """
+    Return the default parameters of an executor.
+
+    Args:
+        executor_name: Short name of the executor plugin, e.g. "dask".
+
+    Returns:
+        A copy of the `executors.<executor_name>` settings, or an empty dict if there are none.
+    """
+
+    executors_config = _get_config_manager().config_data.get("executors", {})
+    return _copy_value(executors_config.get(executor_name, {}))
+
+
 def reload_config() -> None:
     """
     Reload the configuration from the TOML file.
@@ -268,7 +387,7 @@ def reload_config() -> None:
     Returns:
         None
     """
-    cm = ConfigManager()
+    cm = _get_config_manager()
     cm.read_config()
 
 
@@ -286,5 +405,5 @@ def update_config(new_entries: Optional[Dict] = None, override_existing: bool =
     Returns:
         None
     """
-    cm = ConfigManager()
+    cm = _get_config_manager()
     cm.update_config(new_entries, override_existing)
@@ -107,6 +107,13 @@ def get_default_dispatcher_config():
             ),
             "heartbeat",
         ),
+        "max_idle_dispatches": 100,
+        "cancel_fanout": 32,
+        # Threads per executor class for running synchronous executors, by short name
+        "executor_pool_sizes": {"default": 32},
+        # Bytes of a task's stdout and stderr kept from the start and the end of each
+        "task_stream_head_bytes": 1024 * 1024,
+        "task_stream_tail_bytes": 1024 * 1024,
     }
 
 
@@ -18,15 +18,48 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import bisect
 import platform
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel
 
+# Phases of a task's lifecycle timed by the dispatcher
+QUEUEING = "queueing"
+INPUT_FETCH = "input_fetch"
+EXECUTOR_SETUP = "executor_setup"
+EXECUTION = "execution"
+RESULT_FETCH = "result_fetch"
+PERSISTENCE = "persistence"
+NODE_PHASES = (QUEUEING, INPUT_FETCH, EXECUTOR_SETUP, EXECUTION, RESULT_FETCH, PERSISTENCE)
+
+# Phases timed for the dispatch as a whole
+RUNTIME = "runtime"
+
+# Node id under which dispatch-level events are recorded
+DISPATCH_NODE_ID = -1
+
+# Counters kept per dispatch
+DB_READS = "db_reads"
+DB_WRITES = "db_writes"
+DB_BYTES_WRITTEN = "db_bytes_written"
+BYTES_SERIALIZED = "bytes_serialized"
+
+# Dispatch whose work is being done in the current context; used to
+# attribute DB statements and serialized bytes to a dispatch.
+current_dispatch_id: ContextVar[Optional[str]] = ContextVar("current_dispatch_id", default=None)
+
 
 class PlatformMetadata(BaseModel):
     """Information about the platform used to run the benchmarks"""
 
-    arch: str = platform.architecture()
+    arch: str = platform.architecture()[0]
     system: str = platform.system()
     machine: str = platform.machine()
     os: str = platform.node()
@@ -52,6 +85,209 @@ class PerformanceMetrics(BaseModel):
     covalent_total_db_writes: float = 0.0
     covalent_electron_throughput: float = 0.0
     covalent_electron_latency: float = 0.0
+    covalent_electron_latency_p50: float = 0.0
+    covalent_electron_latency_p99: float = 0.0
+    covalent_peak_rss: float = 0.0
+    covalent_db_bytes_written: float = 0.0
+    covalent_bytes_serialized: float = 0.0
+    covalent_file_count: float = 0.0
+
+
+class NodeMetrics(BaseModel):
+    """Wall-clock seconds spent by a task in each phase of its lifecycle"""
+
+    node_id: int
+    queueing: float = 0.0
+    input_fetch: float = 0.0
+    executor_setup: float = 0.0
+    execution: float = 0.0
+    result_fetch: float = 0.0
+    persistence: float = 0.0
+
+    @property
+    def overhead(self) -> float:
+        """Time spent in Covalent rather than in the executor"""
+
+        return (
+            self.queueing
+            + self.input_fetch
+            + self.executor_setup
+            + self.result_fetch
+            + self.persistence
+        )
+
+
+class DispatchMetrics(BaseModel):
+    """Timings and counters collected by the dispatcher while running a dispatch"""
+
+    dispatch_id: str
+    runtime: float = 0.0
+    persistence: float = 0.0
+    db_reads: int = 0
+    db_writes: int = 0
+    db_bytes_written: int = 0
+    bytes_serialized: int = 0
+    nodes: Dict[int, NodeMetrics] = {}
+
+    def to_performance_metrics(self) -> PerformanceMetrics:
+        """Summarize the dispatch in terms of the benchmark performance metrics.
+
+        The workflow runtime is taken to be the total time spent executing
+        tasks, i.e. the runtime of the workflow run serially without Covalent.
+
+        """
+
+        workflow_runtime = sum(node.execution for node in self.nodes.values())
+        covalent_runtime = self.runtime
+        num_nodes = len(self.nodes)
+
+        return PerformanceMetrics(
+            workflow_runtime=workflow_runtime,
+            covalent_runtime=covalent_runtime,
+            covalent_speedup=workflow_runtime / covalent_runtime if covalent_runtime else 0.0,
+            covalent_overhead=(covalent_runtime - workflow_runtime) / workflow_runtime
+            if workflow_runtime
+            else 0.0,
+            covalent_disk_io_time=self.persistence
+            + sum(node.persistence for node in self.nodes.values()),
+            covalent_total_db_reads=self.db_reads,
+            covalent_total_db_writes=self.db_writes,
+            covalent_electron_throughput=num_nodes / covalent_runtime if covalent_runtime else 0.0,
+            covalent_electron_latency=sum(node.overhead for node in self.nodes.values())
+            / num_nodes
+            if num_nodes
+            else 0.0,
+        )
+
+
+class MetricsRecorder:
+    """Low overhead recorder of dispatch timings and counters.
+
+    Timings are taken with the monotonic `time.perf_counter` clock and
+    appended as (dispatch_id, node_id, phase, start, end) tuples to a
+    bounded ring buffer; they are only aggregated when the metrics of a
+    dispatch are requested. Once the buffer is full the oldest events are
+    overwritten, so metrics of long finished dispatches become partial.
+    Phases started but never stopped are discarded once their dispatch
+    finishes, or once more than `max_events` of them are pending.
+
+    Args:
+        max_events: Capacity of the ring buffer of timing events.
+        max_dispatches: Number of dispatches for which counters are kept.
+
+    """
+
+    def __init__(self, max_events: int = 100_000, max_dispatches: int = 1000):
+        self._events = deque(maxlen=max_events)
+        self._max_events = max_events
+        self._pending = {}
+        self._counters = OrderedDict()
+        self._max_dispatches = max_dispatches
+        self._lock = threading.Lock()
+
+    def record(self, dispatch_id: str, node_id: int, phase: str, start: float, end: float) -> None:
+        """Record that a phase of a task ran between two `perf_counter` readings."""
+
+        self._events.append((dispatch_id, node_id, phase, start, end))
+
+    def start(self, dispatch_id: str, node_id: int, phase: str) -> None:
+        """Mark the start of a phase which is stopped from another coroutine."""
+
+        self._pending[(dispatch_id, node_id, phase)] = time.perf_counter()
+        if len(self._pending) > self._max_events:
+            self._pending.pop(next(iter(self._pending)), None)
+
+    def stop(self, dispatch_id: str, node_id: int, phase: str) -> None:
+        """Record a phase started with `start`; no-op if it was never started."""
+
+        start = self._pending.pop((dispatch_id, node_id, phase), None)
+        if start is not None:
+            self._events.append((dispatch_id, node_id, phase, start, time.perf_counter()))
+
+    def discard_pending(self, dispatch_id: str) -> None:
+        """Discard the phases of a finished dispatch which were started but never stopped."""
+
+        for key in [key for key in list(self._pending) if key[0] == dispatch_id]:
+            self._pending.pop(key, None)
+
+    @contextmanager
+    def timed(self, dispatch_id: str, node_id: int, phase: str):
+        """Context manager recording the time spent in its body."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._events.append((dispatch_id, node_id, phase, start, time.perf_counter()))
+
+    def count(self, counter: str, amount: int = 1, dispatch_id: Optional[str] = None) -> None:
+        """Increment a counter of the given dispatch.
+
+        Args:
+            counter: Name of the counter.
+            amount: Amount to increment the counter by.
+            dispatch_id: Dispatch to attribute the increment to. Defaults to
+                the dispatch being processed in the current context; the
+                increment is dropped if there is none.
+
+        """
+
+        dispatch_id = dispatch_id or current_dispatch_id.get()
+        if dispatch_id is None:
+            return
+
+        with self._lock:
+            counters = self._counters.get(dispatch_id)
+            if counters is None:
+                counters = self._counters[dispatch_id] = {}
+                if len(self._counters) > self._max_dispatches:
+                    self._counters.popitem(last=False)
+            counters[counter] = counters.get(counter, 0) + amount
+
+    def get_dispatch_metrics(self, dispatch_id: str) -> Optional[DispatchMetrics]:
+        """Aggregate the events and counters recorded for a dispatch.
+
+        Returns:
+            The dispatch metrics, or None if nothing was recorded for the dispatch.
+
+        """
+
+        with self._lock:
+            counters = dict(self._counters.get(dispatch_id, {}))
+
+        events = [event for event in list(self._events) if event[0] == dispatch_id]
+        if not events and not counters:
+            return None
+
+        metrics = DispatchMetrics(
+            dispatch_id=dispatch_id,
+            db_reads=counters.get(DB_READS, 0),
+            db_writes=counters.get(DB_WRITES, 0),
+            db_bytes_written=counters.get(DB_BYTES_WRITTEN, 0),
+            bytes_serialized=counters.get(BYTES_SERIALIZED, 0),
+            nodes={},
+        )
+        for _, node_id, phase, start, end in events:
+            if node_id == DISPATCH_NODE_ID:
+                target = metrics
+            else:
+                target = metrics.nodes.get(node_id)
+                if target is None:
+                    target = metrics.nodes[node_id] = NodeMetrics(node_id=node_id)
+            setattr(target, phase, getattr(target, phase) + end - start)
+
+        return metrics
+
+    def reset(self) -> None:
+        """Discard all recorded events and counters."""
+
+        with self._lock:
+            self._events.clear()
+            self._pending.clear()
+            self._counters.clear()
+
+
+performance_recorder = MetricsRecorder()
 
 
 class WorkflowBenchmarkResult(BaseModel):
@@ -59,5 +295,337 @@ class WorkflowBenchmarkResult(BaseModel):
 
     run_id: int
     workflow_name: str
+    parameters: Dict[str, Any] = {}
     metadata: PlatformMetadata = PlatformMetadata()
     metrics: PerformanceMetrics
+
+
+# Metrics compared against a benchmark baseline, and whether higher is better
+REGRESSION_METRICS = {
+    "covalent_electron_throughput": True,
+    "covalent_electron_latency_p50": False,
+    "covalent_electron_latency_p99": False,
+    "covalent_peak_rss": False,
+    "covalent_db_bytes_written": False,
+    "covalent_file_count": False,
+}
+
+
+class BenchmarkRegression(BaseModel):
+    """A metric of a benchmarked workflow which is worse than its baseline"""
+
+    workflow_name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def find_regressions(
+    results: List[WorkflowBenchmarkResult],
+    baseline: List[WorkflowBenchmarkResult],
+    tolerance: float = 0.2,
+) -> List[BenchmarkRegression]:
+    """Compare benchmark results with a baseline.
+
+    The median of each metric over the runs of a workflow is compared with
+    the median over the baseline runs of the same workflow; workflows absent
+    from the baseline are skipped.
+
+    Args:
+        results: Results of the current benchmark runs.
+        baseline: Results of the baseline benchmark runs.
+        tolerance: Relative change in the wrong direction above which a
+            metric is considered to have regressed.
+
+    Returns:
+        The metrics which regressed.
+
+    """
+
+    def medians(runs: List[WorkflowBenchmarkResult]) -> Dict[str, Dict[str, float]]:
+        values = {}
+        for run in runs:
+            workflow_values = values.setdefault(run.workflow_name, {})
+            for metric in REGRESSION_METRICS:
+                workflow_values.setdefault(metric, []).append(getattr(run.metrics, metric))
+        return {
+            workflow_name: {metric: statistics.median(v) for metric, v in workflow_values.items()}
+            for workflow_name, workflow_values in values.items()
+        }
+
+    baseline_medians = medians(baseline)
+    regressions = []
+    for workflow_name, current_values in medians(results).items():
+        baseline_values = baseline_medians.get(workflow_name)
+        if baseline_values is None:
+            continue
+
+        for metric, higher_is_better in REGRESSION_METRICS.items():
+            expected = baseline_values[metric]
+            if not expected:
+                continue
+            change = (current_values[metric] - expected) / expected
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    BenchmarkRegression(
+                        workflow_name=workflow_name,
+                        metric=metric,
+                        baseline=expected,
+                        current=current_values[metric],
+                        change=change,
+                    )
+                )
+
+    return regressions
+
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Metrics exported by this process, by name
+_registry: Dict[str, "_Metric"] = {}
+
+
+def _escape(value: str, quotes: bool = True) -> str:
+    value = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quotes else value
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class of metrics exported in the Prometheus text format.
+
+    Metrics with labels hold one child per combination of label values,
+    obtained with `labels`; metrics without labels can be updated directly.
+    Creating a metric registers it for export, replacing any metric of the
+    same name.
+
+    Args:
+        name: Name of the metric.
+        documentation: Help text of the metric.
+        labelnames: Names of the labels of the metric.
+
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self.labels()
+        _registry[name] = self
+
+    def labels(self, *values: str):
+        """Get the child metric for the given label values."""
+
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Expected labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation, quotes=False)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(
+            f"{name}{labels} {_format_value(value)}" for name, labels, value in self._samples()
+        )
+        return "\n".join(lines) + "\n"
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count of events"""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        return [
+            (self.name, _format_labels(self.labelnames, values), child.value)
+            for values, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value which can go up and down.
+
+    Args:
+        function: Optional callable evaluated when the metric is exported,
+            returning the value of the gauge or, if the gauge has labels, a
+            dictionary from tuples of label values to values. This keeps
+            gauges of existing state off the hot path.
+
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        function: Optional[Callable] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        if self.function is None:
+            values = {values: child.value for values, child in list(self._children.items())}
+        elif self.labelnames:
+            values = self.function()
+        else:
+            values = {(): self.function()}
+
+        return [
+            (self.name, _format_labels(self.labelnames, label_values), value)
+            for label_values, value in values.items()
+        ]
+
+
+class _HistogramValue:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        """Observe the time spent in the body of the context manager."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, such as latencies in seconds
+
+    Args:
+        buckets: Upper bounds of the histogram buckets, in increasing order.
+
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self):
+        """Observe the time spent in the body of the context manager."""
+
+        return self.labels().time()
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        samples = []
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        _format_labels(self.labelnames, values, le),
+                        cumulative,
+                    )
+                )
+            labels = _format_labels(self.labelnames, values)
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+def render_metrics() -> str:
+    """Export all registered metrics in the Prometheus text format."""
+
+    return "".join(metric.render() for metric in list(_registry.values()))
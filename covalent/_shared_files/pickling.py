@@ -22,15 +22,28 @@
 
 """Hopefully temporary custom tools to handle pickling and/or un-pickling."""
 
+import sys
 from contextlib import contextmanager
 from typing import Any, Callable, Tuple
 
-from pennylane.ops.qubit.observables import Projector
 
-_PENNYLANE_METHOD_OVERRIDES = (
-    # class, method_name, method_func
-    (Projector, "__reduce__", lambda self: (Projector, (self.data[0], self.wires))),
-)
+def _pennylane_method_overrides() -> Tuple[Tuple[Any, str, Callable], ...]:
+    """
+    Returns the overrides to apply to PennyLane objects.
+
+    PennyLane is only imported if it is already loaded, since no PennyLane object
+    can need overriding otherwise. This keeps it out of `import covalent`.
+    """
+
+    if "pennylane" not in sys.modules:
+        return ()
+
+    from pennylane.ops.qubit.observables import Projector
+
+    return (
+        # class, method_name, method_func
+        (Projector, "__reduce__", lambda self: (Projector, (self.data[0], self.wires))),
+    )
 
 
 def _qml_mods_pickle(func: Callable) -> Callable:
@@ -40,7 +53,7 @@ def _qml_mods_pickle(func: Callable) -> Callable:
     """
 
     def _wrapper(*args, **kwargs):
-        with _method_overrides(_PENNYLANE_METHOD_OVERRIDES):
+        with _method_overrides(_pennylane_method_overrides()):
             return func(*args, **kwargs)
 
     return _wrapper
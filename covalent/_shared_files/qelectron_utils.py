@@ -19,9 +19,12 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 import base64
+import os
 import re
+import shutil
+import uuid
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..executor.utils.context import get_context
 from .config import get_config
@@ -33,6 +36,36 @@ _DATA_FILENAME = "data.mdb"
 QE_DB_DIRNAME = ".database"
 
 
+def _get_task_subdir() -> Path:
+    """Return the QServer database directory of the current task."""
+    context = get_context()
+    node_id, dispatch_id = context.node_id, context.dispatch_id
+
+    db_dir = Path(get_config("dispatcher")["qelectron_db_path"]).resolve()
+    return db_dir / dispatch_id / f"node-{node_id}"
+
+
+def get_qelectron_db_dir(
+    dispatch_id: str, node_id: int, results_dir: Optional[str] = None
+) -> Path:
+    """
+    Return the directory of a node's Qelectron database inside the results directory.
+
+    Arg(s)
+        dispatch_id: ID of the dispatched workflow
+        node_id: ID of the node in the transport graph
+        results_dir: Results directory - defaults to the dispatcher's
+
+    Return(s)
+        Path to the `results_dir/dispatch_id/.database/dispatch_id/node-<node_id>` directory
+    """
+    if results_dir is None:
+        results_dir = get_config("dispatcher")["results_dir"]
+
+    results_dir = Path(results_dir).resolve()
+    return results_dir / dispatch_id / QE_DB_DIRNAME / dispatch_id / f"node-{node_id}"
+
+
 def print_qelectron_db() -> None:
     """
     Check for QElectron database file and dump it into stdout
@@ -44,10 +77,9 @@ def print_qelectron_db() -> None:
         None
     """
     context = get_context()
-    node_id, dispatch_id = context.node_id, context.dispatch_id
+    node_id = context.node_id
 
-    db_dir = Path(get_config("dispatcher")["qelectron_db_path"]).resolve()
-    task_subdir = db_dir / dispatch_id / f"node-{node_id}"
+    task_subdir = _get_task_subdir()
     if not task_subdir.exists():
         # qelectron database not found for dispatch_id/node
         return
@@ -60,6 +92,54 @@ def print_qelectron_db() -> None:
     print(output_string)
 
 
+def export_qelectron_db(qelectron_db_dir: str) -> None:
+    """
+    Check for QElectron database file and copy it to the dispatcher's results directory
+
+    The file is copied directly when the dispatch's results directory is reachable from
+    the task, e.g. on local executors. Otherwise, it is dumped into stdout instead.
+
+    Args(s)
+        qelectron_db_dir: Directory of the node's Qelectron database inside the dispatcher's
+            results directory, as returned by `get_qelectron_db_dir`
+
+    Return(s)
+        None
+    """
+    task_subdir = _get_task_subdir()
+    if not task_subdir.exists():
+        # qelectron database not found for dispatch_id/node
+        return
+
+    qelectron_db_dir = Path(qelectron_db_dir)
+    dispatch_results_dir = qelectron_db_dir.parents[2]
+    if not dispatch_results_dir.is_dir():
+        print_qelectron_db()
+        return
+
+    qelectron_db_dir.mkdir(parents=True, exist_ok=True)
+
+    # replace the file atomically so that readers never see a partial copy
+    tmp_path = qelectron_db_dir / f".{_DATA_FILENAME}.{uuid.uuid4()}"
+    shutil.copyfile(task_subdir / _DATA_FILENAME, tmp_path)
+    os.replace(tmp_path, qelectron_db_dir / _DATA_FILENAME)
+    app_log.debug(f"Copied Qelectron database to {qelectron_db_dir}")
+
+
+def qelectron_db_exists(dispatch_id: str, node_id: int) -> bool:
+    """
+    Check for a node's Qelectron database file in the dispatcher's results directory
+
+    Arg(s)
+        dispatch_id: ID of the dispatched workflow
+        node_id: ID of the node in the transport graph
+
+    Return(s)
+        Whether the database file exists
+    """
+    return (get_qelectron_db_dir(dispatch_id, node_id) / _DATA_FILENAME).exists()
+
+
 def extract_qelectron_db(s: str) -> Tuple[str, bytes]:
     """
     Detect Qelectron data in `s` and process into dict if found
@@ -72,8 +152,11 @@ def extract_qelectron_db(s: str) -> Tuple[str, bytes]:
         bytes_data: bytes representing the `data.mdb` file
     """
     # do nothing if string is empty or no database bytes found in the `s`
+    if not s or _QE_DB_DATA_MARKER not in s:
+        return s, b""
+
     data_pattern = f".*{_QE_DB_DATA_MARKER}(.*){_QE_DB_DATA_MARKER}.*"
-    if not s or not (_matches := re.findall(data_pattern, s)):
+    if not (_matches := re.findall(data_pattern, s)):
         app_log.debug("No Qelectron data detected")
         return s, b""
 
@@ -97,7 +180,8 @@ def remove_qelectron_db(output: str):
     Return:
         the output string without QElectron database removed
     """
-    output = re.sub(f"{_QE_DB_DATA_MARKER}.*{_QE_DB_DATA_MARKER}", "", output)
+    if _QE_DB_DATA_MARKER in output:
+        output = re.sub(f"{_QE_DB_DATA_MARKER}.*{_QE_DB_DATA_MARKER}", "", output)
     return output.strip()
 
 
@@ -122,18 +206,16 @@ def write_qelectron_db(
 
     inside the `results_dir/dispatch_id`.
     """
-    results_dir = Path(get_config("dispatcher")["results_dir"]).resolve()
-
-    # create the database directory if it does not exist
-    qelectron_db_dir = results_dir / dispatch_id / QE_DB_DIRNAME
-    if not qelectron_db_dir.exists():
-        qelectron_db_dir.mkdir()
-
     # create node subdirectory if it does not exist
-    node_dir = qelectron_db_dir / dispatch_id / f"node-{node_id}"
+    node_dir = get_qelectron_db_dir(dispatch_id, node_id)
     if not node_dir.exists():
         node_dir.mkdir(parents=True)
 
+    # close any open handles to the database before replacing its file
+    from ..quantum.qserver.database import close_environments
+
+    close_environments(node_dir)
+
     # write 'data.mdb' file
     data_mdb_path = node_dir / _DATA_FILENAME
     app_log.debug(f"Writing Qelectron database file {str(data_mdb_path)}")
@@ -18,12 +18,80 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
-from typing import Tuple
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import filelock
 
 from .transport import TransportableObject
 
 
+def _deps_cache_dir() -> Optional[Path]:
+    """
+    Directory holding the markers of deps which were set up on this machine, or None
+    if no cache directory is configured and the home directory cannot be resolved.
+    """
+
+    cache_dir = os.environ.get("COVALENT_CACHE_DIR")
+    if not cache_dir:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+        if not xdg_cache_home:
+            try:
+                xdg_cache_home = str(Path.home() / ".cache")
+            except (KeyError, RuntimeError):
+                return None
+        cache_dir = os.path.join(xdg_cache_home, "covalent")
+    return Path(cache_dir) / "deps"
+
+
+def is_deps_cache_enabled() -> bool:
+    """Whether deps which were already set up are skipped, per `COVALENT_DEPS_CACHE`."""
+
+    return os.environ.get("COVALENT_DEPS_CACHE", "true").lower() not in ("0", "false", "no")
+
+
+@contextmanager
+def cached_setup(kind: str, spec: List[str], environment: Callable[[], Any]) -> Iterator[bool]:
+    """
+    Skip setting up deps which were already set up in the same environment.
+
+    Yields whether the setup must run. A marker is recorded if it then succeeds,
+    holding the state returned by `environment`, which must be JSON serializable.
+    Later setups with the same `kind` and `spec` are skipped while the environment
+    is in the same state. Concurrent setups with the same spec wait for each other.
+
+    Args:
+        kind: Kind of deps, such as "pip" or "bash".
+        spec: Normalized list of requirements or commands.
+        environment: Returns the state of the environment the deps are set up in.
+    """
+
+    cache_dir = _deps_cache_dir() if is_deps_cache_enabled() else None
+    if cache_dir is None:
+        yield True
+        return
+
+    key = hashlib.sha256(json.dumps([kind, spec]).encode()).hexdigest()
+    marker = cache_dir / kind / key
+    marker.parent.mkdir(parents=True, exist_ok=True)
+
+    with filelock.FileLock(f"{marker}.lock"):
+        try:
+            needed = json.loads(marker.read_text()) != environment()
+        except (OSError, ValueError):
+            needed = True
+
+        yield needed
+
+        if needed:
+            marker.write_text(json.dumps(environment()))
+
+
 class Deps(ABC):
     """Generic dependency class used in specifying any kind of dependency for an electron.
 
@@ -22,11 +22,18 @@ import subprocess
 from copy import deepcopy
 from typing import List, Union
 
-from .deps import Deps
+from .deps import Deps, cached_setup
 from .transport import TransportableObject
 
 
-def apply_bash_commands(commands):
+def apply_bash_commands(commands, cache=False):
+    if cache:
+        spec = [cmd.strip() for cmd in commands]
+        with cached_setup("bash", spec, dict) as needed:
+            if needed:
+                apply_bash_commands(commands)
+        return
+
     for cmd in commands:
         proc = subprocess.run(
             cmd, stdin=subprocess.DEVNULL, shell=True, capture_output=True, check=True, text=True
@@ -43,16 +50,22 @@ class DepsBash(Deps):
 
     Attributes:
         commands: A list of bash commands to execute before the electron runs.
+        cache: Run the commands only once on each machine, skipping them
+            for later electrons with the same commands. Only suitable for
+            commands which set up the environment, such as installing packages.
 
     """
 
-    def __init__(self, commands: Union[List, str] = []):
+    def __init__(self, commands: Union[List, str] = [], cache: bool = False):
         if isinstance(commands, str):
             self.commands = [commands]
         else:
             self.commands = commands
 
-        super().__init__(apply_fn=apply_bash_commands, apply_args=[self.commands])
+        apply_kwargs = {"cache": True} if cache else {}
+        super().__init__(
+            apply_fn=apply_bash_commands, apply_args=[self.commands], apply_kwargs=apply_kwargs
+        )
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation of self"""
@@ -18,28 +18,78 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import os
+import site
 import subprocess
+import sys
 import tempfile
 from copy import deepcopy
-from typing import List, Union
+from typing import Dict, List, Union
 
-from .deps import Deps
+from .deps import Deps, cached_setup
 from .transport import TransportableObject
 
 
+def _normalize_requirements(pkgs: List[str], requirements_content: str) -> List[str]:
+    """Requirements as a list which is the same for equivalent specifications."""
+
+    pkgs = [pkg.strip() for pkg in pkgs if pkg.strip()]
+    # Options such as `--find-links <dir>` depend on the order of their arguments
+    if not any(pkg.startswith("-") for pkg in pkgs):
+        pkgs = sorted(set(pkgs))
+
+    lines = set()
+    for line in requirements_content.splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if line and not line.startswith("#"):
+            lines.add(line)
+
+    return pkgs + sorted(lines)
+
+
+def _site_packages_state() -> Dict[str, int]:
+    """Modification times of the directories pip installs into.
+
+    Installing or removing a distribution adds or removes its metadata directory
+    and thereby changes the modification time of the directory containing it.
+    """
+
+    dirs = [p for p in sys.path if os.path.basename(p) in ("site-packages", "dist-packages")]
+    try:
+        dirs.extend(site.getsitepackages())
+    except AttributeError:  # pragma: no cover
+        pass
+
+    state = {"prefix": sys.prefix}
+    for path in sorted(set(dirs)):
+        try:
+            state[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return state
+
+
 def apply_pip_deps(pkgs: [] = [], requirements_content: str = ""):
-    if requirements_content:
-        reqs_filename = ""
-        with tempfile.NamedTemporaryFile("w", delete=False) as f:
-            f.write(requirements_content)
-            reqs_filename = f.name
-        cmd = f"pip install --no-input -r {reqs_filename}".split()
-
-    else:
-        pkg_list = " ".join(pkgs)
-        cmd = f"pip install --no-input {pkg_list}".split()
-
-    subprocess.run(cmd, stdin=subprocess.DEVNULL, check=True, capture_output=True)
+    requirements = _normalize_requirements(pkgs, requirements_content)
+
+    with cached_setup("pip", requirements, _site_packages_state) as needed:
+        if not needed:
+            return
+
+        if requirements_content:
+            reqs_filename = ""
+            with tempfile.NamedTemporaryFile("w", delete=False) as f:
+                f.write(requirements_content)
+                reqs_filename = f.name
+            args = ["-r", reqs_filename]
+
+        else:
+            pkg_list = " ".join(pkgs)
+            args = pkg_list.split()
+
+        # Install into the environment of the running interpreter, whose state is cached
+        cmd = [sys.executable, "-m", "pip", "install", "--no-input", *args]
+        subprocess.run(cmd, stdin=subprocess.DEVNULL, check=True, capture_output=True)
 
 
 class DepsPip(Deps):
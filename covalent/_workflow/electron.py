@@ -375,9 +375,7 @@ class Electron:
             return self.function(*args, **kwargs)
 
         if active_lattice.post_processing:
-            output = active_lattice.electron_outputs[0]
-            active_lattice.electron_outputs.pop(0)
-            return output
+            return active_lattice.electron_outputs.pop(0)
 
         # Setting metadata for default values according to lattice's metadata.
         for k in self.metadata:
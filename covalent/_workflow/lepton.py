@@ -20,10 +20,18 @@
 
 """Language translation module for Electron objects."""
 
+import atexit
+import contextlib
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
 from builtins import list
 from dataclasses import asdict
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .._file_transfer.enums import Order
 from .._file_transfer.file_transfer import FileTransfer
@@ -46,6 +54,199 @@ log_stack_info = logger.log_stack_info
 # TODO: Review exceptions/errors
 
 
+# The foreign functions of leptons are looked up once per worker process, since
+# leptons wrapping small functions may be called many times by the same worker.
+@lru_cache(maxsize=256)
+def _load_python_function(library_name: str, function_name: str) -> Callable:
+    """Import a module and return one of its functions."""
+
+    import importlib
+
+    try:
+        module = importlib.import_module(library_name)
+    except ModuleNotFoundError:
+        app_log.warning(f"Could not import the module '{library_name}'.")
+        raise
+
+    try:
+        return getattr(module, function_name)
+    except AttributeError:
+        app_log.warning(f"Could not find the function '{function_name}' in '{library_name}'.")
+        raise
+
+
+@lru_cache(maxsize=256)
+def _load_c_function(
+    library_name: str, function_name: str, argtypes: Tuple[Tuple[str, int], ...]
+) -> Tuple[Callable, List]:
+    """Open a shared library and prepare one of its functions for calls.
+
+    Returns:
+        The function, with its argument and return types set, and the ctypes
+        types of its arguments.
+    """
+
+    import ctypes
+
+    try:
+        handle = ctypes.CDLL(library_name)
+    except OSError:
+        app_log.warning(f"Could not open '{library_name}'.")
+        raise
+
+    # Format the variable type translation
+    types = []
+    for t in argtypes:
+        if t[0].startswith("LP_"):  # This is a pointer
+            types.append(ctypes.POINTER(getattr(ctypes, t[0][3:])))
+        else:
+            types.append(getattr(ctypes, t[0]))
+
+    func = handle[function_name]
+    func.argtypes = types
+    func.restype = None
+    return func, types
+
+
+def _read_bytes(path: str) -> bytes:
+    """Return the contents of a file, or nothing if it does not exist."""
+
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+class _PersistentShell:
+    """
+    A bash process to which the commands of shell leptons are sent.
+
+    Each command runs in a subshell, so it cannot change the state of the
+    shell, but the cost of starting bash and sourcing the library is only
+    paid once per worker process. The library is sourced again if it is modified.
+
+    Args:
+        library_name: Absolute path of the script sourced by the shell, if any.
+    """
+
+    _EXIT_MARKER = "COVALENT-LEPTON-EXIT:"
+
+    def __init__(self, library_name: str = "") -> None:
+        self.library_name = library_name
+        self._lock = threading.Lock()
+        self._proc = None
+        self._pid = None
+        self._library_mtime = None
+        self._stream_dir = None
+
+    def _start(self) -> None:
+        # Processes forked from the one which started the shell need their own
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._stream_dir = tempfile.mkdtemp(prefix="covalent-lepton-")
+        # Errors of the shell itself, e.g. syntax errors, are reported if it exits
+        with open(os.path.join(self._stream_dir, "shell.stderr"), "wb") as shell_stderr:
+            self._proc = subprocess.Popen(
+                ["/bin/bash"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=shell_stderr,
+                text=True,
+            )
+        self._library_mtime = None
+
+    def _source_library(self) -> None:
+        """Source the library if it was modified since it was last sourced."""
+
+        try:
+            mtime = os.stat(self.library_name).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._library_mtime:
+            self._proc.stdin.write(f"source {shlex.quote(self.library_name)}\n")
+            self._library_mtime = mtime
+
+    def run(self, script: str, args: List = []) -> subprocess.CompletedProcess:
+        """Run a script with the given positional arguments in a subshell."""
+
+        positional = " ".join(shlex.quote(str(arg)) for arg in args)
+
+        with self._lock:
+            if self._pid != os.getpid() or self._proc is None or self._proc.poll() is not None:
+                self._start()
+            if self.library_name:
+                self._source_library()
+
+            stdout_path = os.path.join(self._stream_dir, "stdout")
+            stderr_path = os.path.join(self._stream_dir, "stderr")
+            for path in (stdout_path, stderr_path):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+
+            # Run in the current directory of the worker, as a new shell would
+            try:
+                self._proc.stdin.write(
+                    f"( cd {shlex.quote(os.getcwd())} || exit 1\nset -- {positional}\n{script}\n ) "
+                    f"> {shlex.quote(stdout_path)} 2> {shlex.quote(stderr_path)} < /dev/null; "
+                    f"echo {self._EXIT_MARKER}$?\n"
+                )
+                self._proc.stdin.flush()
+            except BrokenPipeError:
+                line = ""
+            else:
+                line = self._proc.stdout.readline()
+                while line and not line.startswith(self._EXIT_MARKER):
+                    line = self._proc.stdout.readline()
+
+            stdout = _read_bytes(stdout_path)
+            stderr = _read_bytes(stderr_path)
+
+            if not line:
+                # The shell exited, so the call fails with the errors of the shell
+                returncode = self._proc.wait() or 1
+                stderr += _read_bytes(os.path.join(self._stream_dir, "shell.stderr"))
+                self._proc = None
+                return subprocess.CompletedProcess(script, returncode, stdout, stderr)
+
+        returncode = int(line[len(self._EXIT_MARKER) :])
+        return subprocess.CompletedProcess(script, returncode, stdout, stderr)
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            return
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc = None
+        if self._stream_dir is not None:
+            shutil.rmtree(self._stream_dir, ignore_errors=True)
+        # A later call starts a new shell in a new directory
+        self._pid = None
+
+
+_persistent_shells: Dict[str, _PersistentShell] = {}
+_persistent_shells_lock = threading.Lock()
+
+
+def _get_persistent_shell(library_name: str) -> _PersistentShell:
+    """Return this process' persistent shell which has sourced `library_name`."""
+
+    if library_name:
+        library_name = os.path.abspath(library_name)
+
+    with _persistent_shells_lock:
+        if library_name not in _persistent_shells:
+            _persistent_shells[library_name] = _PersistentShell(library_name)
+        return _persistent_shells[library_name]
+
+
+@atexit.register
+def _close_persistent_shells() -> None:
+    for shell in _persistent_shells.values():
+        shell.close()
+
+
 class Lepton(Electron):
     """
     A generalization of an Electron to languages other than Python.
@@ -65,6 +266,8 @@ class Lepton(Electron):
         executor: Alternative executor object to be used for lepton execution. If not passed, the dask
         executor is used by default
         files: An optional list of FileTransfer objects which copy files to/from remote or local filesystems.
+        persistent_shell: Run shell leptons in a bash process which is kept for the following
+        calls in the same worker, sourcing `library_name` only once. Each call still runs in a subshell.
     """
 
     INPUT = 0
@@ -94,6 +297,7 @@ class Lepton(Electron):
         deps_pip: Union[DepsPip, list] = DEFAULT_METADATA_VALUES["deps"].get("pip", None),
         call_before: Union[List[DepsCall], DepsCall] = DEFAULT_METADATA_VALUES["call_before"],
         call_after: Union[List[DepsCall], DepsCall] = DEFAULT_METADATA_VALUES["call_after"],
+        persistent_shell: bool = False,
     ) -> None:
         self.language = language
         self.library_name = library_name
@@ -103,6 +307,12 @@ class Lepton(Electron):
         self.command = command
         self.named_outputs = named_outputs
         self.display_name = display_name
+        self.persistent_shell = persistent_shell
+
+        if persistent_shell and self.language not in Lepton._LANG_SHELL:
+            raise ValueError(
+                f"Keyword argument 'persistent_shell' incompatible with language {self.language}."
+            )
 
         if self.language in Lepton._SCRIPTING_LANGUAGES:
             if self.command and self.library_name:
@@ -201,21 +411,7 @@ class Lepton(Electron):
         def python_wrapper(*args, **kwargs) -> Any:
             """Call a Python function specified in some other module."""
 
-            import importlib
-
-            try:
-                module = importlib.import_module(self.library_name)
-            except ModuleNotFoundError:
-                app_log.warning(f"Could not import the module '{self.library_name}'.")
-                raise
-
-            try:
-                func = getattr(module, self.function_name)
-            except AttributeError:
-                app_log.warning(
-                    f"Could not find the function '{self.function_name}' in '{self.library_name}'."
-                )
-                raise
+            func = _load_python_function(self.library_name, self.function_name)
 
             # Foreign function invoked
             return func(*args, **kwargs)
@@ -230,23 +426,10 @@ class Lepton(Electron):
                     f"Keyword arguments {kwargs} are not supported when calling {self.function}."
                 )
 
-            try:
-                handle = ctypes.CDLL(self.library_name)
-            except OSError:
-                app_log.warning(f"Could not open '{self.library_name}'.")
-                raise
-
-            # Format the variable type translation
-            entrypoint = self.function_name
-            types = []
-            for t in self.argtypes:
-                if t[0].startswith("LP_"):  # This is a pointer
-                    types.append(ctypes.POINTER(getattr(ctypes, t[0][3:])))
-                else:
-                    types.append(getattr(ctypes, t[0]))
+            func, types = _load_c_function(
+                self.library_name, self.function_name, tuple(map(tuple, self.argtypes))
+            )
             attrs = [a[1] for a in self.argtypes]
-            handle[entrypoint].argtypes = types
-            handle[entrypoint].restype = None
 
             # Translate the variables
             c_func_args = []
@@ -280,7 +463,7 @@ class Lepton(Electron):
                     raise ValueError("An invalid type was specified.")
 
             # Foreign function invoked
-            handle[entrypoint](*c_func_args)
+            func(*c_func_args)
 
             # Format the return values
             return_vals = []
@@ -311,7 +494,6 @@ class Lepton(Electron):
             """Invoke a shell function or script."""
 
             import builtins
-            import subprocess
 
             mutated_kwargs = ""
             for k, v in kwargs.items():
@@ -334,20 +516,33 @@ class Lepton(Electron):
                 for output in self.named_outputs:
                     output_string += f" && echo COVALENT-LEPTON-OUTPUT-{output}: ${output}"
 
+            # Leptons unpickled from older versions lack this attribute
+            persistent_shell = getattr(self, "persistent_shell", False)
+
             if self.command:
                 if isinstance(self.command, list):
                     self.command = " && ".join(self.command)
                 self.command = self.command.format(**kwargs)
-                cmd = ["/bin/bash", "-c", f"{mutated_kwargs} {self.command} {output_string}", "_"]
-                cmd += args
-                proc = subprocess.run(cmd, capture_output=True)
+                script = f"{mutated_kwargs} {self.command} {output_string}"
+                if persistent_shell:
+                    proc = _get_persistent_shell("").run(script, args)
+                else:
+                    cmd = ["/bin/bash", "-c", script, "_"]
+                    cmd += args
+                    proc = subprocess.run(cmd, capture_output=True)
             elif self.library_name:
                 mutated_args = ""
                 for arg in args:
                     mutated_args += f'"{arg}" '
 
-                cmd = f"{mutated_kwargs} source {self.library_name} && {self.function_name} {mutated_args} {output_string}"
-                proc = subprocess.run(["/bin/bash", "-c", cmd], capture_output=True)
+                if persistent_shell:
+                    script = (
+                        f"{mutated_kwargs} {self.function_name} {mutated_args} {output_string}"
+                    )
+                    proc = _get_persistent_shell(self.library_name).run(script)
+                else:
+                    cmd = f"{mutated_kwargs} source {self.library_name} && {self.function_name} {mutated_args} {output_string}"
+                    proc = subprocess.run(["/bin/bash", "-c", cmd], capture_output=True)
             else:
                 raise AttributeError(
                     "Shell task does not have enough information to run."
@@ -418,6 +613,7 @@ def bash(
     deps_pip: Union[DepsPip, list] = DEFAULT_METADATA_VALUES["deps"].get("pip", None),
     call_before: Union[List[DepsCall], DepsCall] = DEFAULT_METADATA_VALUES["call_before"],
     call_after: Union[List[DepsCall], DepsCall] = DEFAULT_METADATA_VALUES["call_after"],
+    persistent_shell: bool = False,
 ) -> Callable:
     """Bash decorator which wraps a Python function as a Bash Lepton."""
 
@@ -454,6 +650,7 @@ def bash(
                 deps_pip=deps_pip,
                 call_before=call_before,
                 call_after=call_after,
+                persistent_shell=persistent_shell,
             )
             return lepton_object()
 
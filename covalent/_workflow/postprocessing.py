@@ -21,18 +21,21 @@
 """Module containing post-processing related functions."""
 
 from builtins import list
+from collections import deque
 from dataclasses import asdict
-from typing import TYPE_CHECKING, Any, Dict, List, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Union
 
 from .._shared_files import logger
 from .._shared_files.context_managers import active_lattice_manager
 from .._shared_files.defaults import (
     DefaultMetadataValues,
+    parameter_prefix,
     postprocess_prefix,
     prefix_separator,
     sublattice_prefix,
 )
-from .transport import _TransportGraph, encode_metadata
+from .transport import TransportableObject, _TransportGraph, encode_metadata
+from .transportable_object import takes_serialized_inputs
 
 if TYPE_CHECKING:
     from .electron import Electron
@@ -43,6 +46,56 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+class _NodeOutputStream:
+    """Outputs of the nodes of a lattice, in the order in which they are consumed
+    when its workflow function is rerun for postprocessing.
+
+    Outputs are kept serialized and each is deserialized only when the electron
+    call it replaces is reached, so that only the outputs which the workflow
+    function holds on to are in memory at once.
+
+    Args:
+        outputs: Serialized outputs of the nodes, ordered by node id.
+
+    """
+
+    def __init__(self, outputs: Iterable[TransportableObject]) -> None:
+        self._outputs = deque(outputs)
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def pop(self, index: int = 0) -> Any:
+        """Deserialize and return the output of the next node."""
+
+        if index != 0:
+            raise IndexError("Node outputs can only be consumed in order")
+        return self._outputs.popleft().get_deserialized()
+
+
+class _NodeOutputRef:
+    """Placeholder for the output of a node in the return value of a lattice.
+
+    Args:
+        node_id: Node id of the electron whose output is referenced.
+
+    """
+
+    __slots__ = ("node_id",)
+
+    def __init__(self, node_id: int) -> None:
+        self.node_id = node_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _NodeOutputRef) and other.node_id == self.node_id
+
+    def __hash__(self) -> int:
+        return hash((_NodeOutputRef, self.node_id))
+
+    def __repr__(self) -> str:
+        return f"<output of node {self.node_id}>"
+
+
 class Postprocessor:
     def __init__(self, lattice) -> None:
         self.lattice = lattice
@@ -79,7 +132,8 @@ class Postprocessor:
         ]
         return [bound_electrons[node_id] for node_id in filtered_node_ids]
 
-    def _postprocess(self, *ordered_node_outputs: List[Any]) -> Any:
+    @takes_serialized_inputs
+    def _postprocess(self, *ordered_node_outputs: TransportableObject) -> Any:
         """
         Post processing function to be called after the lattice execution.
         This takes care of executing statements that were not an electron
@@ -91,8 +145,11 @@ class Postprocessor:
         arguments, but every time it's called, it will be executed as a separate node.
         Thus, output of every node is used.
 
+        The outputs are received serialized and each is only deserialized
+        when the electron call it replaces is reached.
+
         Args:
-            ordered_node_outputs: List of outputs of every node in the lattice.
+            ordered_node_outputs: Serialized outputs of every node in the lattice.
 
         Returns:
             result: The result of the lattice function.
@@ -100,7 +157,7 @@ class Postprocessor:
         """
         with active_lattice_manager.claim(self.lattice):
             self.lattice.post_processing = True
-            self.lattice.electron_outputs = list(ordered_node_outputs)
+            self.lattice.electron_outputs = _NodeOutputStream(ordered_node_outputs)
             args = [arg.get_deserialized() for arg in self.lattice.args]
             kwargs = {k: v.get_deserialized() for k, v in self.lattice.kwargs.items()}
             workflow_function = self.lattice.workflow_function.get_deserialized()
@@ -177,7 +234,7 @@ class Postprocessor:
     def _postprocess_recursively(self, retval, **referenced_outputs):
         from .electron import Electron
 
-        if isinstance(retval, Electron):
+        if isinstance(retval, (Electron, _NodeOutputRef)):
             key = f"node:{retval.node_id}"
             return referenced_outputs[key]
         elif isinstance(retval, list):
@@ -198,11 +255,35 @@ class Postprocessor:
         else:
             return retval
 
+    @takes_serialized_inputs
+    def _reconstruct(
+        self, retval: TransportableObject, **referenced_outputs: TransportableObject
+    ) -> Any:
+        """Rebuild the return value of the lattice function from the outputs it references.
+
+        Args:
+            retval: Serialized return value of the lattice function, in which
+                    electrons are replaced by `_NodeOutputRef` placeholders.
+            referenced_outputs: Serialized outputs of the referenced nodes,
+                                keyed by `node:<node_id>`.
+
+        Returns:
+            The result of the lattice function.
+
+        """
+        outputs = {k: v.get_deserialized() for k, v in referenced_outputs.items()}
+        return self._postprocess_recursively(retval.get_deserialized(), **outputs)
+
     def add_reconstruct_postprocess_node(
         self, retval: Union["Electron", List, Dict], bound_electrons: Dict
     ):
         """This function adds a postprocess node to the transport graph based on the 'eager reconstruction' algorithm.
 
+        The postprocess node only receives the outputs of the electrons referenced
+        by the return value, each exactly once. The return value itself is passed
+        as a parameter in which those electrons are replaced by placeholders, so
+        that no collection nodes gathering the referenced outputs are added.
+
         Args:
             retval: Return value of the lattice function.
             bound_electrons: Dictionary of bound electrons with node_id as key and the electron object as the value. A bound is an electron that has been assigned a node_id and is part of a transport graph.
@@ -215,22 +296,28 @@ class Postprocessor:
 
         node_id_refs = self._get_node_ids_from_retval(retval)
         referenced_electrons = {}
+        placeholders = {}
         for node_id in node_id_refs:
             key = f"node:{node_id}"
             referenced_electrons[key] = bound_electrons[node_id]
+            placeholders[key] = _NodeOutputRef(node_id)
+
+        retval_template = self._postprocess_recursively(retval, **placeholders)
 
         with active_lattice_manager.claim(self.lattice):
             pp_metadata = self._get_electron_metadata()
-            pp_electron = Electron(function=self._postprocess_recursively, metadata=pp_metadata)
+            pp_electron = Electron(function=self._reconstruct, metadata=pp_metadata)
 
-            # Add pp_electron to the graph -- this will also add a
-            # parameter node in case retval is not a single electron
-            bound_pp = pp_electron(retval, **referenced_electrons)
+            # Add pp_electron to the graph -- the return value is added as a
+            # single parameter node, since it no longer contains any electrons
+            bound_pp = pp_electron(TransportableObject(retval_template), **referenced_electrons)
 
-            # Edit pp electron name
-            self.lattice.transport_graph.set_node_value(
-                bound_pp.node_id, "name", f"{postprocess_prefix}reconstruct"
-            )
+            # Edit pp electron and return value parameter names
+            tg = self.lattice.transport_graph
+            tg.set_node_value(bound_pp.node_id, "name", f"{postprocess_prefix}reconstruct")
+            for parent, _, edge_data in tg._graph.in_edges(bound_pp.node_id, data=True):
+                if edge_data.get("edge_name") == "retval":
+                    tg.set_node_value(parent, "name", parameter_prefix + str(retval_template))
 
             # Wait for non-referenced electrons
             wait_parents = [v for k, v in bound_electrons.items() if k not in node_id_refs]
@@ -423,3 +423,26 @@ class TransportableObject:
         object_string = self._object_string.encode("utf-8")
         data = self._object.encode("utf-8")
         return _TOArchive(header=header, object_string=object_string, data=data)
+
+
+def takes_serialized_inputs(fn: Callable) -> Callable:
+    """Mark a task function as taking its inputs as `TransportableObject`s.
+
+    The inputs of such a function are passed to it without being deserialized,
+    so that it can deserialize each input only when it needs it.
+
+    Args:
+        fn: The task function.
+
+    Returns:
+        The same function.
+
+    """
+    fn._takes_serialized_inputs = True
+    return fn
+
+
+def has_serialized_inputs(fn: Callable) -> bool:
+    """Return whether a task function was marked with `takes_serialized_inputs`."""
+
+    return getattr(fn, "_takes_serialized_inputs", False)
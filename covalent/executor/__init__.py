@@ -20,23 +20,25 @@
 
 """
 Defines executors and provides a "manager" to get all available executors
+
+The managers, and with them the executor plugins, are only loaded the first
+time they or one of the plugin classes are accessed from this module.
 """
 
 import contextlib
+import functools
 import glob
 import importlib
 import inspect
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Union
-
-import pkg_resources
+from typing import Any, Dict, List, Optional, Union
 
 from .._shared_files import logger
-from .._shared_files.config import get_config, update_config
-from ..quantum import QCluster, Simulator
+from .._shared_files.config import get_config, get_executor_config, update_config
 from .base import BaseExecutor, wrapper_fn
+from .plugin_index import LazyPluginMap, PluginIndex, environment_key, is_index_enabled
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -55,9 +57,13 @@ class _ExecutorManager:
 
     def __init__(self) -> None:
         # Dictionary mapping executor name to executor class
-        self.executor_plugins_map: Dict[str, Any] = {}
+        self.executor_plugins_map: Dict[str, Any] = LazyPluginMap()
         self.executor_plugins_exports_map: Dict[str, Any] = {}
 
+        # Plugins found by the current discovery, which are recorded in the plugin index
+        self._discovered_plugins: List[Dict[str, Any]] = []
+        self._plugin_distributions: Dict[str, str] = {}
+
         if os.environ.get("COVALENT_PLUGIN_LOAD", "true").lower() == "true":
             self.generate_plugins_list()
 
@@ -67,7 +73,7 @@ class _ExecutorManager:
             cls.instance = super().__new__(cls)
         return cls.instance
 
-    def generate_plugins_list(self) -> None:
+    def generate_plugins_list(self, use_index: bool = True) -> None:
         """
         Generate a list of available executor plugins.
         This is called automatically when the class is initialized.
@@ -81,18 +87,18 @@ class _ExecutorManager:
         The module should have an attribute named executor_plugin_name
         which is set to the class name defining the plugin.
 
+        The plugins found are recorded in an on-disk index. While the installed
+        distributions and the plugin directories are unchanged, the plugins are
+        taken from the index instead and each is only imported when first used.
+
         Args:
-            None
+            use_index: If False, the plugins are discovered even if the index is up to date.
 
         Returns:
             None
         """
 
-        # Load plugins that are part of the covalent path:
         pkg_plugins_path = os.path.join(os.path.dirname(__file__), "executor_plugins")
-        self._load_executors(pkg_plugins_path)
-
-        # Look for executor plugins in a user-defined path:
         user_plugins_path = ":".join(
             filter(
                 None,
@@ -102,11 +108,77 @@ class _ExecutorManager:
                 ],
             )
         )
+
+        index = None
+        if is_index_enabled():
+            plugin_files = _plugin_files(pkg_plugins_path) + _plugin_files(user_plugins_path)
+            index = PluginIndex("executors", environment_key(plugin_files))
+            indexed_plugins = index.load() if use_index else None
+            if indexed_plugins is not None:
+                self._load_indexed_plugins(indexed_plugins)
+                return
+
+        self._discovered_plugins = []
+        self._plugin_distributions = {}
+
+        # Load plugins that are part of the covalent path:
+        self._load_executors(pkg_plugins_path)
+
+        # Look for executor plugins in a user-defined path:
         self._load_executors(user_plugins_path)
 
         # Look for pip-installed plugins:
         self._load_installed_plugins()
 
+        if index is not None:
+            index.save(self._discovered_plugins, self._plugin_distributions)
+
+    def _load_indexed_plugins(self, indexed_plugins: List[Dict[str, Any]]) -> None:
+        """
+        Populate the executor map from the plugin index without importing the plugins.
+
+        Args:
+            indexed_plugins: The plugins recorded by `_record_plugin`.
+
+        Returns:
+            None
+        """
+
+        for plugin in indexed_plugins:
+            if "file" in plugin:
+                load = functools.partial(_load_file_plugin, plugin["file"], plugin["class_name"])
+            else:
+                load = functools.partial(
+                    _load_entry_point_plugin, plugin["entry_point"], plugin["class_name"]
+                )
+            self.executor_plugins_map.add_loader(plugin["name"], plugin["class_name"], load)
+
+            if plugin["defaults"] is not None:
+                default_params = {"executors": {plugin["name"]: plugin["defaults"]}}
+                update_config(default_params, override_existing=False)
+
+    def _record_plugin(self, the_module: Any, short_name: str, **source: str) -> None:
+        """
+        Record a discovered plugin for the plugin index.
+
+        Args:
+            the_module: The module containing the plugin.
+            short_name: The name of the executor.
+            source: Either the `file` or the `entry_point` the plugin was loaded from.
+
+        Returns:
+            None
+        """
+
+        self._discovered_plugins.append(
+            {
+                "name": short_name,
+                "class_name": self.executor_plugins_map[short_name].__name__,
+                "defaults": getattr(the_module, "_EXECUTOR_PLUGIN_DEFAULTS", None),
+                **source,
+            }
+        )
+
     def get_executor(self, name: Union[str, BaseExecutor]) -> BaseExecutor:
         """
         Get an executor by name.
@@ -128,8 +200,8 @@ class _ExecutorManager:
 
         elif isinstance(name, str):
             if name in self.executor_plugins_map:
-                update_config()
-                default_options = get_config(f"executors.{name}")
+                # The config is reloaded whenever its file changed
+                default_options = get_executor_config(name)
                 return self.executor_plugins_map[name](**default_options)
             else:
                 message = f"No executor found by name: {name}."
@@ -153,7 +225,7 @@ class _ExecutorManager:
 
         return bool(len(plugin_class))
 
-    def _populate_executor_map_from_module(self, the_module: Any) -> None:
+    def _populate_executor_map_from_module(self, the_module: Any) -> Optional[str]:
         """
         Populate the executor map from a module.
         Also checks whether `EXECUTOR_PLUGIN_NAME` is defined in the module.
@@ -162,7 +234,7 @@ class _ExecutorManager:
             the_module: The module to populate the executor map from.
 
         Returns:
-            None
+            The name of the executor, or None if the module does not define a plugin.
         """
 
         if not self._is_plugin_name_valid(the_module):
@@ -195,6 +267,8 @@ class _ExecutorManager:
                 }
                 update_config(default_params, override_existing=False)
 
+            return short_name
+
         else:
             # The requested plugin (the_module.module_name) was not found in the module.
             executor_name = (
@@ -219,10 +293,19 @@ class _ExecutorManager:
             None
         """
 
+        import pkg_resources
+
         entry_points = pkg_resources.iter_entry_points("covalent.executor.executor_plugins")
         for entry in entry_points:
             the_module = entry.load()
-            self._populate_executor_map_from_module(the_module)
+            short_name = self._populate_executor_map_from_module(the_module)
+            if short_name:
+                entry_point = entry.module_name
+                if entry.attrs:
+                    entry_point += ":" + ".".join(entry.attrs)
+                self._record_plugin(the_module, short_name, entry_point=entry_point)
+                if entry.dist is not None:
+                    self._plugin_distributions[entry.dist.project_name] = entry.dist.version
 
     def _load_executors(self, executor_dir: str) -> None:
         """
@@ -246,14 +329,12 @@ class _ExecutorManager:
                     if module_file.endswith("__init__.py"):
                         continue
 
-                    module_name = module_file[:-3]
-
                     # Import the module that contains the plugin
-                    module_spec = importlib.util.spec_from_file_location(module_name, module_file)
-                    the_module = importlib.util.module_from_spec(module_spec)
-                    module_spec.loader.exec_module(the_module)
+                    the_module = _import_plugin_file(module_file)
 
-                    self._populate_executor_map_from_module(the_module)
+                    short_name = self._populate_executor_map_from_module(the_module)
+                    if short_name:
+                        self._record_plugin(the_module, short_name, file=module_file)
 
     def list_executors(self, regenerate: bool = False, print_names: bool = True) -> List[str]:
         """
@@ -268,7 +349,7 @@ class _ExecutorManager:
         """
 
         if regenerate:
-            self.generate_plugins_list()
+            self.generate_plugins_list(use_index=False)
 
         executor_list = []
         for n, name in enumerate(self.executor_plugins_map, start=1):
@@ -288,11 +369,11 @@ class _QExecutorManager:
     """
 
     def __init__(self):
+        from ..quantum import QCluster, Simulator
+
         # Dictionary mapping executor name to executor class
-        self.executor_plugins_map: Dict[str, Any] = {
-            "QCluster": QCluster,
-            "Simulator": Simulator,
-        }
+        self.executor_plugins_map: Dict[str, Any] = LazyPluginMap()
+        self.executor_plugins_map.update({"QCluster": QCluster, "Simulator": Simulator})
         self.load_executors()
 
     def __new__(cls):
@@ -301,12 +382,17 @@ class _QExecutorManager:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def load_executors(self) -> None:
+    def load_executors(self, use_index: bool = True) -> None:
         """
         Looks for `plugin.py` modules in the subdirectories of the given path and
         loads QExecutor classes from them.
+
+        As for executor plugins, the QExecutor classes found are recorded in an
+        on-disk index and only imported on first use while the index is up to date.
         """
 
+        plugin_module_paths = []
+
         # Iterate over all subdirectories of the plugins path except for those starting with "_" like "__pycache__"
         for plugin_dir in filter(
             lambda _p: _p.is_dir() and not _p.name.startswith("_"), _QUANTUM_PLUGINS_PATH.iterdir()
@@ -318,19 +404,49 @@ class _QExecutorManager:
             plugin_module_path = plugin_module_path[0]
 
             if plugin_module_path.exists():
-                # Suppress any exceptions that may occur while importing the plugin module
-                # This is to prevent the plugin module from crashing the application
-                with contextlib.suppress(Exception):
-                    sys.path.append(str(plugin_module_path.parent))
-                    plugin_module_spec = importlib.util.spec_from_file_location(
-                        plugin_module_path.stem, plugin_module_path
-                    )
-                    plugin_module = importlib.util.module_from_spec(plugin_module_spec)
-                    sys.modules[plugin_module_path.stem] = plugin_module
-                    plugin_module_spec.loader.exec_module(plugin_module)
-                    self.populate_executors_map(plugin_module)
-
-        # print("Loaded QExecutor plugins: ", self.executor_plugins_map.keys())
+                plugin_module_paths.append(str(plugin_module_path))
+
+        index = None
+        if is_index_enabled():
+            index = PluginIndex("qexecutors", environment_key(plugin_module_paths))
+            indexed_plugins = index.load() if use_index else None
+            if indexed_plugins is not None:
+                self._load_indexed_executors(indexed_plugins)
+                return
+
+        discovered_plugins = []
+        for plugin_module_path in plugin_module_paths:
+            # Suppress any exceptions that may occur while importing the plugin module
+            # This is to prevent the plugin module from crashing the application
+            with contextlib.suppress(Exception):
+                plugin_module = _import_quantum_plugin(plugin_module_path)
+                self.populate_executors_map(plugin_module)
+                discovered_plugins.append(
+                    {
+                        "file": plugin_module_path,
+                        "class_names": list(plugin_module.__all__),
+                        "defaults": getattr(plugin_module, _QUANTUM_DEFAULTS_VARNAME),
+                    }
+                )
+
+        if index is not None:
+            index.save(discovered_plugins)
+
+    def _load_indexed_executors(self, indexed_plugins: List[Dict[str, Any]]) -> None:
+        """
+        Populates the `executor_plugins_map` dictionary from the plugin index
+        without importing the plugin modules, and updates the config.
+        """
+
+        for plugin in indexed_plugins:
+            for qexecutor_cls_name in plugin["class_names"]:
+                load = functools.partial(_load_quantum_plugin, plugin["file"], qexecutor_cls_name)
+                self.executor_plugins_map.add_loader(qexecutor_cls_name, qexecutor_cls_name, load)
+
+            for qexecutor_cls_name, defaults_dict in plugin["defaults"].items():
+                update_config(
+                    {"qelectron": {qexecutor_cls_name: defaults_dict}}, override_existing=False
+                )
 
     def populate_executors_map(self, module_obj) -> None:
         """
@@ -373,12 +489,99 @@ class _QExecutorManager:
             )
 
 
-_executor_manager = _ExecutorManager()
-_qexecutor_manager = _QExecutorManager()
+def _plugin_files(executor_dir: str) -> List[str]:
+    """Return the directories in `executor_dir` and the executor plugin modules in them."""
+
+    plugin_files = []
+    for e_dir in set(executor_dir.split(":")):
+        if os.path.exists(e_dir):
+            plugin_files.append(e_dir)
+            plugin_files.extend(
+                f for f in glob.glob(os.path.join(e_dir, "*.py")) if not f.endswith("__init__.py")
+            )
+    return sorted(plugin_files)
+
+
+def _import_plugin_file(module_file: str) -> Any:
+    """Import an executor plugin module from its file."""
+
+    module_name = module_file[:-3]
+    module_spec = importlib.util.spec_from_file_location(module_name, module_file)
+    the_module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(the_module)
+    return the_module
+
 
-for name in _executor_manager.executor_plugins_map:
-    plugin_class = _executor_manager.executor_plugins_map[name]
-    globals()[plugin_class.__name__] = plugin_class
+def _load_file_plugin(module_file: str, class_name: str) -> Any:
+    """Import an indexed executor plugin class from a plugin directory."""
+
+    return getattr(_import_plugin_file(module_file), class_name)
+
+
+def _load_entry_point_plugin(entry_point: str, class_name: str) -> Any:
+    """Import an indexed executor plugin class from an installed distribution."""
+
+    module_name, _, attrs = entry_point.partition(":")
+    the_module = importlib.import_module(module_name)
+    for attr in filter(None, attrs.split(".")):
+        the_module = getattr(the_module, attr)
+    return getattr(the_module, class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_quantum_plugin(plugin_module_path: str) -> Any:
+    """Import a QExecutor plugin module, once per process."""
+
+    plugin_module_path = Path(plugin_module_path)
+    sys.path.append(str(plugin_module_path.parent))
+    plugin_module_spec = importlib.util.spec_from_file_location(
+        plugin_module_path.stem, plugin_module_path
+    )
+    plugin_module = importlib.util.module_from_spec(plugin_module_spec)
+    sys.modules[plugin_module_path.stem] = plugin_module
+    plugin_module_spec.loader.exec_module(plugin_module)
+    return plugin_module
+
+
+def _load_quantum_plugin(plugin_module_path: str, qexecutor_cls_name: str) -> Any:
+    """Import an indexed QExecutor class."""
+
+    return getattr(_import_quantum_plugin(plugin_module_path), qexecutor_cls_name)
+
+
+def _find_plugin_class(plugins_map: LazyPluginMap, class_name: str) -> Any:
+    """Return the plugin class named `class_name`, importing only that plugin."""
+
+    plugin_class = None
+    for name in plugins_map:
+        # Later plugins take precedence, as they used to overwrite earlier ones
+        if plugins_map.class_name(name) == class_name:
+            plugin_class = plugins_map[name]
+    return plugin_class
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load the executor managers on first access.
+
+    Plugin discovery imports every installed plugin, or reads the plugin index, so it
+    only happens once the managers or one of the plugin classes are requested. The
+    results are stored in the module globals so that this is only called once per name.
+    """
 
-for qexecutor_cls in _qexecutor_manager.executor_plugins_map.values():
-    globals()[qexecutor_cls.__name__] = qexecutor_cls
+    if name == "_executor_manager":
+        globals()[name] = _ExecutorManager()
+        return globals()[name]
+    if name == "_qexecutor_manager":
+        globals()[name] = _QExecutorManager()
+        return globals()[name]
+
+    if not name.startswith("__"):
+        for manager_name in ("_executor_manager", "_qexecutor_manager"):
+            manager = globals().get(manager_name) or __getattr__(manager_name)
+            plugin_class = _find_plugin_class(manager.executor_plugins_map, name)
+            if plugin_class is not None:
+                globals()[name] = plugin_class
+                return plugin_class
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -28,8 +28,10 @@ import io
 import json
 import os
 import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     Any,
@@ -47,18 +49,148 @@ from typing import (
 import aiofiles
 
 from .._shared_files import TaskRuntimeError, logger
+from .._shared_files.config import get_config
 from .._shared_files.context_managers import active_dispatch_info_manager
 from .._shared_files.exceptions import TaskCancelledError
+from .._shared_files.metrics import Gauge, Histogram
 from .._shared_files.qelectron_utils import remove_qelectron_db
 from .._shared_files.util_classes import RESULT_STATUS, DispatchInfo
 from .._workflow.depscall import RESERVED_RETVAL_KEY__FILES
 from .._workflow.transport import TransportableObject
+from .._workflow.transportable_object import has_serialized_inputs
 from .utils import Signals
+from .utils.streams import SpooledStream, get_stream_limits
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 TypeJSON = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
+# Number of threads per executor class if not set in `dispatcher.executor_pool_sizes`
+DEFAULT_EXECUTOR_POOL_SIZE = 32
+
+_pool_size_gauge = Gauge(
+    "covalent_executor_pool_size",
+    "Number of threads in the pool of each executor",
+    ("executor",),
+)
+_pool_active_gauge = Gauge(
+    "covalent_executor_pool_active_threads",
+    "Number of threads of each executor pool which are running a call",
+    ("executor",),
+)
+_pool_queued_gauge = Gauge(
+    "covalent_executor_pool_queued_calls",
+    "Number of calls waiting for a free thread in the pool of each executor",
+    ("executor",),
+)
+_pool_wait_histogram = Histogram(
+    "covalent_executor_pool_wait_seconds",
+    "Time calls waited for a free thread in the pool of each executor",
+    ("executor",),
+)
+_async_tasks_gauge = Gauge(
+    "covalent_executor_async_tasks",
+    "Number of tasks submitted by synchronous executors which are awaited without a thread",
+    ("executor",),
+)
+
+
+class _ExecutionPool:
+    """
+    Thread pool in which the blocking methods of one executor class are run.
+
+    Giving each executor class its own pool keeps long running tasks from
+    exhausting the event loop's default pool, which is shared with everything
+    else running on the loop, and with the tasks of other executors.
+
+    Args:
+        executor_name: Short name of the executor, used to label the metrics.
+        max_workers: Number of threads in the pool.
+    """
+
+    def __init__(self, executor_name: str, max_workers: int) -> None:
+        self.executor_name = executor_name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"covalent-{executor_name}"
+        )
+        _pool_size_gauge.labels(executor_name).set(max_workers)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run `fn(*args)` in the pool and wait for the result."""
+
+        queued = _pool_queued_gauge.labels(self.executor_name)
+        active = _pool_active_gauge.labels(self.executor_name)
+        state = {"started": False}
+        queued_at = time.perf_counter()
+
+        def _call():
+            state["started"] = True
+            queued.dec()
+            _pool_wait_histogram.labels(self.executor_name).observe(
+                time.perf_counter() - queued_at
+            )
+            active.inc()
+            try:
+                return fn(*args)
+            finally:
+                active.dec()
+
+        queued.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, _call)
+        finally:
+            # The call never starts if it was cancelled while queued
+            if not state["started"]:
+                queued.dec()
+
+
+_execution_pools: Dict[type, _ExecutionPool] = {}
+_execution_pools_lock = threading.Lock()
+
+
+def get_executor_pool_size(executor_name: str) -> int:
+    """
+    Return the number of threads of an executor's pool.
+
+    Sizes are configured in `dispatcher.executor_pool_sizes` by executor short name,
+    with the `default` entry applying to all other executors.
+    """
+
+    try:
+        pool_sizes = get_config("dispatcher.executor_pool_sizes")
+    except KeyError:
+        pool_sizes = {}
+    return int(
+        pool_sizes.get(executor_name, pool_sizes.get("default", DEFAULT_EXECUTOR_POOL_SIZE))
+    )
+
+
+def _get_execution_pool(executor_class: type, executor_name: str) -> _ExecutionPool:
+    """Return the pool of an executor class, creating it on first use."""
+
+    with _execution_pools_lock:
+        pool = _execution_pools.get(executor_class)
+        if pool is None:
+            pool = _ExecutionPool(executor_name, get_executor_pool_size(executor_name))
+            _execution_pools[executor_class] = pool
+        return pool
+
+
+def _submits_tasks(executor_class: type) -> bool:
+    """
+    Check whether an executor class runs its tasks with `submit_task`.
+
+    This is the case when a class below `BaseExecutor` implements `submit_task` and none
+    of its subclasses override `run` or `execute`, which would otherwise be bypassed.
+    """
+
+    mro = executor_class.__mro__
+    submit_index = next(i for i, cls in enumerate(mro) if "submit_task" in vars(cls))
+    if mro[submit_index] is BaseExecutor:
+        return False
+    return not any("run" in vars(cls) or "execute" in vars(cls) for cls in mro[:submit_index])
+
 
 def wrapper_fn(
     function: TransportableObject,
@@ -98,9 +230,12 @@ def wrapper_fn(
 
     fn = function.get_deserialized()
 
-    new_args = [arg.get_deserialized() for arg in args]
-
-    new_kwargs = {k: v.get_deserialized() for k, v in kwargs.items()}
+    if has_serialized_inputs(fn):
+        new_args = list(args)
+        new_kwargs = dict(kwargs)
+    else:
+        new_args = [arg.get_deserialized() for arg in args]
+        new_kwargs = {k: v.get_deserialized() for k, v in kwargs.items()}
 
     # Inject return values into kwargs
     for key, val in cb_retvals.items():
@@ -195,6 +330,25 @@ class _AbstractBaseExecutor(ABC):
     def task_stderr(self):
         return self.__dict__.get("_task_stderr")
 
+    def _open_task_streams(self) -> None:
+        """Create the streams to which the executor writes a task's stdout and stderr."""
+
+        head_bytes, tail_bytes = get_stream_limits()
+        self._task_stdout = SpooledStream(head_bytes=head_bytes, tail_bytes=tail_bytes)
+        self._task_stderr = SpooledStream(head_bytes=head_bytes, tail_bytes=tail_bytes)
+
+    def _close_task_streams(self) -> Tuple[str, str]:
+        """Close the task's streams, returning their contents."""
+
+        values = []
+        for attr in ("_task_stdout", "_task_stderr"):
+            stream = self.__dict__[attr]
+            values.append(stream.getvalue())
+            stream.close()
+            # Keep the (size-limited) output available as before
+            self.__dict__[attr] = io.StringIO(values[-1])
+        return tuple(values)
+
 
 class BaseExecutor(_AbstractBaseExecutor):
     """
@@ -327,7 +481,6 @@ class BaseExecutor(_AbstractBaseExecutor):
                 filename = Path(filepath)
                 filename = filename.expanduser()
                 filename.parent.mkdir(parents=True, exist_ok=True)
-                filename.touch(exist_ok=True)
 
                 with open(filepath, "a") as f:
                     f.write(remove_qelectron_db(ss))
@@ -341,9 +494,13 @@ class BaseExecutor(_AbstractBaseExecutor):
         results_dir: str,
         node_id: int = -1,
     ) -> Any:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
+        if _submits_tasks(type(self)):
+            return await self._execute_async(
+                function, args, kwargs, dispatch_id, results_dir, node_id
+            )
+
+        pool = _get_execution_pool(type(self), self.short_name())
+        return await pool.run(
             self.execute,
             function,
             args,
@@ -353,6 +510,65 @@ class BaseExecutor(_AbstractBaseExecutor):
             node_id,
         )
 
+    async def _execute_async(
+        self,
+        function: Callable,
+        args: List,
+        kwargs: Dict,
+        dispatch_id: str,
+        results_dir: str,
+        node_id: int = -1,
+    ) -> Any:
+        """
+        Execute the function for executors which implement `submit_task`.
+
+        Like `execute()`, but the task is awaited on the event loop, so the
+        executor's thread pool is only used to set up, submit and tear down the task.
+        """
+
+        pool = _get_execution_pool(type(self), self.short_name())
+        self._open_task_streams()
+
+        task_metadata = {
+            "dispatch_id": dispatch_id,
+            "node_id": node_id,
+            "results_dir": results_dir,
+        }
+
+        try:
+            await pool.run(self.setup, task_metadata)
+            future = await pool.run(self.submit_task, function, args, kwargs, task_metadata)
+
+            async_tasks = _async_tasks_gauge.labels(pool.executor_name)
+            async_tasks.inc()
+            try:
+                output = await asyncio.wrap_future(future)
+            finally:
+                async_tasks.dec()
+
+            result = await pool.run(self.collect_task_output, output, task_metadata)
+            job_status = RESULT_STATUS.COMPLETED
+        except TaskRuntimeError as err:
+            job_status = RESULT_STATUS.FAILED
+            result = None
+        except TaskCancelledError as err:
+            job_status = RESULT_STATUS.CANCELLED
+            result = None
+        finally:
+            self._notify(Signals.EXIT)
+            await pool.run(self.teardown, task_metadata)
+
+        stdout, stderr = self._close_task_streams()
+        await pool.run(
+            self.write_streams_to_file,
+            (stdout, stderr),
+            (self.log_stdout, self.log_stderr),
+            dispatch_id,
+            results_dir,
+        )
+
+        return (result, stdout, stderr, job_status)
+
     def execute(
         self,
         function: Callable,
@@ -383,8 +599,7 @@ class BaseExecutor(_AbstractBaseExecutor):
 
         dispatch_info = DispatchInfo(dispatch_id)
         fn_version = function.args[0].python_version
-        self._task_stdout = io.StringIO()
-        self._task_stderr = io.StringIO()
+        self._open_task_streams()
 
         task_metadata = {
             "dispatch_id": dispatch_id,
@@ -406,14 +621,15 @@ class BaseExecutor(_AbstractBaseExecutor):
             self._notify(Signals.EXIT)
             self.teardown(task_metadata=task_metadata)
 
+        stdout, stderr = self._close_task_streams()
         self.write_streams_to_file(
-            (self._task_stdout.getvalue(), self._task_stderr.getvalue()),
+            (stdout, stderr),
             (self.log_stdout, self.log_stderr),
             dispatch_id,
             results_dir,
         )
 
-        return (result, self._task_stdout.getvalue(), self._task_stderr.getvalue(), job_status)
+        return (result, stdout, stderr, job_status)
 
     def setup(self, task_metadata: Dict) -> Any:
         """Placeholder to run any executor specific tasks"""
@@ -436,6 +652,41 @@ class BaseExecutor(_AbstractBaseExecutor):
 
         raise NotImplementedError
 
+    def submit_task(
+        self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict
+    ) -> Future:
+        """Optional method to start running a function without waiting for it.
+
+        Executors whose `run` method blocks on a future until the task is done can
+        implement this and `collect_task_output` instead. The task is then awaited
+        on the dispatcher's event loop without holding a thread while it runs.
+
+        Args:
+            function: The function to run in the executor
+            args: List of positional arguments to be used by the function
+            kwargs: Dictionary of keyword arguments to be used by the function.
+            task_metadata: Dictionary of metadata for the task. Current keys are
+                          `dispatch_id` and `node_id`
+
+        Returns:
+            A `concurrent.futures.Future` resolving to the output of the task
+        """
+
+        raise NotImplementedError
+
+    def collect_task_output(self, output: Any, task_metadata: Dict) -> Any:
+        """Process the output of a task started with `submit_task`.
+
+        Args:
+            output: The value the future returned by `submit_task` resolved to
+            task_metadata: Dictionary of metadata for the task
+
+        Returns:
+            output: The result of the function execution
+        """
+
+        return output
+
     def cancel(self, task_metadata: Dict, job_handle: Any) -> Literal[False]:
         """
         Method to cancel the job identified uniquely by the `job_handle` (base class)
@@ -610,7 +861,6 @@ class AsyncBaseExecutor(_AbstractBaseExecutor):
                 filename = Path(filepath)
                 filename = filename.expanduser()
                 filename.parent.mkdir(parents=True, exist_ok=True)
-                filename.touch(exist_ok=True)
 
                 async with aiofiles.open(filepath, "a") as f:
                     await f.write(remove_qelectron_db(ss))
@@ -642,8 +892,7 @@ class AsyncBaseExecutor(_AbstractBaseExecutor):
         results_dir: str,
         node_id: int = -1,
     ) -> Any:
-        self._task_stdout = io.StringIO()
-        self._task_stderr = io.StringIO()
+        self._open_task_streams()
 
         task_metadata = {
             "dispatch_id": dispatch_id,
@@ -665,14 +914,15 @@ class AsyncBaseExecutor(_AbstractBaseExecutor):
             self._notify(Signals.EXIT)
             await self.teardown(task_metadata=task_metadata)
 
+        stdout, stderr = self._close_task_streams()
         await self.write_streams_to_file(
-            (self._task_stdout.getvalue(), self._task_stderr.getvalue()),
+            (stdout, stderr),
             (self.log_stdout, self.log_stderr),
             dispatch_id,
             results_dir,
         )
 
-        return (result, self._task_stdout.getvalue(), self._task_stderr.getvalue(), job_status)
+        return (result, stdout, stderr, job_status)
 
     async def setup(self, task_metadata: Dict):
         """Executor specific setup method"""
@@ -25,8 +25,11 @@ and waits for execution to finish then returns the result.
 This is a plugin executor module; it is loaded if found and properly structured.
 """
 
+import asyncio
+import hashlib
 import os
-from typing import Callable, Dict, List, Literal, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 from dask.distributed import CancelledError, Client, Future
 
@@ -36,7 +39,9 @@ from covalent._shared_files import TaskRuntimeError, logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.exceptions import TaskCancelledError
 from covalent._shared_files.utils import _address_client_mapper
+from covalent._workflow.transport import TransportableObject
 from covalent.executor.base import AsyncBaseExecutor
+from covalent.executor.utils.streams import get_stream_limits
 from covalent.executor.utils.wrappers import io_wrapper as dask_wrapper
 
 # The plugin class name must be given by the executor_plugin_name attribute:
@@ -57,8 +62,90 @@ _EXECUTOR_PLUGIN_DEFAULTS = {
         "workdir",
     ),
     "create_unique_workdir": False,
+    "batch_window": 0,
+    "scatter_threshold": 0,
 }
 
+# Tasks waiting to be submitted together, per scheduler address
+_pending_submissions: Dict[str, List] = {}
+
+# Scattered task inputs per scheduler address, keyed by content digest
+_scattered_inputs: Dict[str, OrderedDict] = {}
+
+# Maximum number of scattered inputs kept alive per scheduler address
+SCATTER_CACHE_SIZE = 128
+
+
+def _flush_submissions(dask_client: Client, scheduler_address: str) -> None:
+    """Submit all pending tasks for a scheduler in a single `client.map` call."""
+
+    batch = _pending_submissions.pop(scheduler_address, [])
+    if not batch:
+        return
+
+    try:
+        functions, args, kwargs, workdirs = zip(*(entry for entry, _ in batch))
+        dask_futures = dask_client.map(
+            dask_wrapper,
+            functions,
+            args,
+            kwargs,
+            workdirs,
+            stream_limits=get_stream_limits(),
+            pure=False,
+        )
+    except Exception as ex:
+        for _, waiter in batch:
+            if not waiter.done():
+                waiter.set_exception(ex)
+        return
+
+    app_log.debug(f"Submitted batch of {len(batch)} tasks to {scheduler_address}")
+    for (_, waiter), future in zip(batch, dask_futures):
+        if not waiter.done():
+            waiter.set_result(future)
+
+
+async def _scatter_input(
+    dask_client: Client, scheduler_address: str, value: Any, threshold: int
+) -> Any:
+    """Replace a large input by a reference to a copy scattered on the cluster.
+
+    Inputs are `TransportableObject`s; those whose serialized size is at
+    least `threshold` bytes are scattered once per scheduler and reused by
+    every task which receives an identical value. Other inputs are passed
+    unchanged.
+    """
+
+    if not isinstance(value, TransportableObject):
+        return value
+
+    # Sizing and hashing the existing serialized form avoids pickling the input again
+    data = value.get_serialized()
+    if len(data) < threshold:
+        return value
+
+    digest = hashlib.sha1(data.encode("utf-8")).hexdigest()
+    cache = _scattered_inputs.setdefault(scheduler_address, OrderedDict())
+    if digest in cache:
+        cache.move_to_end(digest)
+        return await cache[digest]
+
+    # Tasks arriving while the scatter is in flight wait for the same copy
+    scatter_task = asyncio.ensure_future(dask_client.scatter(value, hash=False))
+    cache[digest] = scatter_task
+    while len(cache) > SCATTER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    try:
+        future = await scatter_task
+    except Exception:
+        cache.pop(digest, None)
+        raise
+
+    app_log.debug(f"Scattered input of {len(data)} bytes to {scheduler_address}")
+    return future
+
 
 class DaskExecutor(AsyncBaseExecutor):
     """
@@ -75,6 +162,8 @@ class DaskExecutor(AsyncBaseExecutor):
         current_env_on_conda_fail: bool = False,
         workdir: str = "",
         create_unique_workdir: Optional[bool] = None,
+        batch_window: Optional[float] = None,
+        scatter_threshold: Optional[int] = None,
     ) -> None:
         if not cache_dir:
             cache_dir = _EXECUTOR_PLUGIN_DEFAULTS["cache_dir"]
@@ -95,6 +184,18 @@ class DaskExecutor(AsyncBaseExecutor):
                 debug_msg = f"Couldn't find `executors.dask.create_unique_workdir` in config, using default value {create_unique_workdir}."
                 app_log.debug(debug_msg)
 
+        if batch_window is None:
+            try:
+                batch_window = get_config("executors.dask.batch_window")
+            except KeyError:
+                batch_window = _EXECUTOR_PLUGIN_DEFAULTS["batch_window"]
+
+        if scatter_threshold is None:
+            try:
+                scatter_threshold = get_config("executors.dask.scatter_threshold")
+            except KeyError:
+                scatter_threshold = _EXECUTOR_PLUGIN_DEFAULTS["scatter_threshold"]
+
         super().__init__(
             log_stdout,
             log_stderr,
@@ -106,6 +207,45 @@ class DaskExecutor(AsyncBaseExecutor):
         self.workdir = workdir
         self.create_unique_workdir = create_unique_workdir
         self.scheduler_address = scheduler_address
+        self.batch_window = batch_window
+        self.scatter_threshold = scatter_threshold
+
+    async def _submit(
+        self, dask_client: Client, function: Callable, args: List, kwargs: Dict, workdir: str
+    ) -> Future:
+        """Submit a task to the cluster, batching it with other tasks if enabled."""
+
+        if self.scatter_threshold:
+            args = [
+                await _scatter_input(
+                    dask_client, self.scheduler_address, arg, self.scatter_threshold
+                )
+                for arg in args
+            ]
+            kwargs = {
+                k: await _scatter_input(
+                    dask_client, self.scheduler_address, v, self.scatter_threshold
+                )
+                for k, v in kwargs.items()
+            }
+
+        if not self.batch_window:
+            return dask_client.submit(
+                dask_wrapper, function, args, kwargs, workdir, stream_limits=get_stream_limits()
+            )
+
+        loop = asyncio.get_running_loop()
+        if self.scheduler_address not in _pending_submissions:
+            _pending_submissions[self.scheduler_address] = []
+            loop.call_later(
+                self.batch_window, _flush_submissions, dask_client, self.scheduler_address
+            )
+
+        waiter = loop.create_future()
+        _pending_submissions[self.scheduler_address].append(
+            ((function, args, kwargs, workdir), waiter)
+        )
+        return await waiter
 
     async def run(self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict):
         """Submit the function and inputs to the dask cluster"""
@@ -130,14 +270,16 @@ class DaskExecutor(AsyncBaseExecutor):
         if not dask_client:
             dask_client = Client(address=self.scheduler_address, asynchronous=True)
             _address_client_mapper[self.scheduler_address] = dask_client
-            await dask_client
+
+        # Concurrent tasks may find the client before it has finished starting
+        await dask_client
 
         if self.create_unique_workdir:
             current_workdir = os.path.join(self.workdir, dispatch_id, f"node_{node_id}")
         else:
             current_workdir = self.workdir
 
-        future = dask_client.submit(dask_wrapper, function, args, kwargs, current_workdir)
+        future = await self._submit(dask_client, function, args, kwargs, current_workdir)
         await self.set_job_handle(future.key)
         app_log.debug(f"Submitted task {node_id} to dask with key {future.key}")
 
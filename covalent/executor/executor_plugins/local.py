@@ -26,7 +26,7 @@ This is a plugin executor module; it is loaded if found and properly structured.
 
 
 import os
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 
 # Relative imports are not allowed in executor plugins
@@ -36,6 +36,7 @@ from covalent.executor import BaseExecutor
 
 # Store the wrapper function in an external module to avoid module
 # import errors during pickling
+from covalent.executor.utils.streams import get_stream_limits, get_task_stream_paths
 from covalent.executor.utils.wrappers import io_wrapper
 
 # The plugin class name must be given by the executor_plugin_name attribute:
@@ -105,6 +106,25 @@ class LocalExecutor(BaseExecutor):
             Task output
         """
 
+        fut = self.submit_task(function, args, kwargs, task_metadata)
+        return self.collect_task_output(fut.result(), task_metadata)
+
+    def submit_task(
+        self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict
+    ) -> Future:
+        """
+        Start executing the function in a separate process
+
+        Arg(s)
+            function: Function to be executed
+            args: Arguments passed to the function
+            kwargs: Keyword arguments passed to the function
+            task_metadata: Metadata of the task to be executed
+
+        Return(s)
+            Future of the output, stdout, stderr and traceback of the function
+        """
+
         app_log.debug(f"Running function {function} locally")
 
         self.set_job_handle(42)
@@ -121,10 +141,33 @@ class LocalExecutor(BaseExecutor):
         else:
             current_workdir = self.workdir
 
+        # Spool the output where the dispatcher can read it while the task runs
+        stream_paths = get_task_stream_paths(dispatch_id, node_id)
+
         # Run the target function in a separate process
-        fut = proc_pool.submit(io_wrapper, function, args, kwargs, current_workdir)
+        return proc_pool.submit(
+            io_wrapper,
+            function,
+            args,
+            kwargs,
+            current_workdir,
+            stream_paths,
+            get_stream_limits(),
+        )
+
+    def collect_task_output(self, output: Any, task_metadata: Dict) -> Any:
+        """
+        Record the streams of a finished function and return its output
+
+        Arg(s)
+            output: Output, stdout, stderr and traceback of the function
+            task_metadata: Metadata of the task
+
+        Return(s)
+            Task output
+        """
 
-        output, worker_stdout, worker_stderr, tb = fut.result()
+        output, worker_stdout, worker_stderr, tb = output
 
         print(worker_stdout, end="", file=self.task_stdout)
         print(worker_stderr, end="", file=self.task_stderr)
@@ -0,0 +1,233 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""
+On-disk index of discovered executor plugins
+
+Discovering plugins iterates over the entry points of every installed distribution
+and imports every plugin module. The index records what a discovery found, keyed by
+the state it depends on, so that later processes can skip the discovery and only
+import a plugin when it is first used.
+"""
+
+import json
+import os
+import site
+import sys
+from collections.abc import MutableMapping
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .._shared_files import logger
+from .._shared_files.config import get_config
+
+app_log = logger.app_log
+
+INDEX_VERSION = 1
+
+# Environment variables which the default parameters of the bundled plugins depend on
+_ENVIRONMENT_VARIABLES = ("HOME", "XDG_CACHE_HOME", "XDG_CONFIG_DIR")
+
+
+def is_index_enabled() -> bool:
+    """Whether plugin discovery may use the on-disk index."""
+
+    return os.environ.get("COVALENT_PLUGIN_INDEX", "true").lower() == "true"
+
+
+def _site_packages_dirs() -> List[str]:
+    """Directories into which distributions are installed."""
+
+    dirs = [p for p in sys.path if os.path.basename(p) in ("site-packages", "dist-packages")]
+    try:
+        dirs.extend(site.getsitepackages())
+    except AttributeError:  # pragma: no cover
+        pass
+    return sorted(set(dirs))
+
+
+def _mtimes(paths: Iterable[str]) -> Dict[str, int]:
+    """Modification times in ns of the given paths which exist."""
+
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[str(path)] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def environment_key(plugin_files: Iterable[str]) -> Dict[str, Any]:
+    """
+    Key of the state which plugin discovery depends on.
+
+    Installing, upgrading or removing a distribution adds or removes its metadata
+    directory and thereby changes the modification time of the site-packages directory
+    containing it.
+
+    Args:
+        plugin_files: Paths of the plugin modules which are loaded from directories,
+            along with the directories themselves.
+
+    Returns:
+        A JSON serializable dictionary which changes whenever the discovery might.
+    """
+
+    return {
+        "index_version": INDEX_VERSION,
+        "python": sys.version,
+        "covalent": metadata.version("covalent"),
+        "site_packages": _mtimes(_site_packages_dirs()),
+        "plugin_files": _mtimes(plugin_files),
+        "environment": {name: os.environ.get(name) for name in _ENVIRONMENT_VARIABLES},
+    }
+
+
+def _distributions_unchanged(distributions: Dict[str, str]) -> bool:
+    for name, version in distributions.items():
+        try:
+            if metadata.version(name) != version:
+                return False
+        except metadata.PackageNotFoundError:
+            return False
+    return True
+
+
+class PluginIndex:
+    """
+    Cached result of a plugin discovery.
+
+    Args:
+        name: Name of the index, which determines the file it is stored in.
+        key: Key of the state the discovery depends on, see `environment_key`.
+
+    Attributes:
+        path: Path of the index file.
+    """
+
+    def __init__(self, name: str, key: Dict[str, Any]) -> None:
+        self.path = Path(get_config("dispatcher.cache_dir")) / "plugin_index" / f"{name}.json"
+        self.key = json.loads(json.dumps(key))
+
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the indexed plugins, or None if the index is missing or out of date.
+        """
+
+        try:
+            with open(self.path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get("key") != self.key:
+            return None
+        if not _distributions_unchanged(index.get("distributions", {})):
+            return None
+
+        return index["plugins"]
+
+    def save(
+        self, plugins: List[Dict[str, Any]], distributions: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store the plugins found by a discovery.
+
+        Args:
+            plugins: JSON serializable descriptions of the plugins.
+            distributions: Versions of the distributions which provide the plugins by name.
+        """
+
+        index = {"key": self.key, "distributions": distributions or {}, "plugins": plugins}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as ex:
+            # The plugins are still loaded; the next process will discover them again
+            app_log.debug(f"Unable to write the plugin index {self.path}: {ex}")
+            tmp_path.unlink(missing_ok=True)
+
+
+class _PluginLoader:
+    """Imports an indexed plugin class on first use."""
+
+    def __init__(self, class_name: str, load: Callable[[], Any]) -> None:
+        self.class_name = class_name
+        self.load = load
+
+
+class LazyPluginMap(MutableMapping):
+    """
+    Mapping of plugin names to plugin classes.
+
+    Plugins known from an index are added with `add_loader` and only imported the first
+    time they are looked up.
+    """
+
+    def __init__(self) -> None:
+        self._plugins: Dict[str, Any] = {}
+
+    def add_loader(self, name: str, class_name: str, load: Callable[[], Any]) -> None:
+        """
+        Add a plugin which is imported on first lookup.
+
+        Args:
+            name: Name of the plugin.
+            class_name: Name of the plugin class.
+            load: Function which imports and returns the plugin class.
+        """
+
+        self._plugins[name] = _PluginLoader(class_name, load)
+
+    def class_name(self, name: str) -> str:
+        """Return the class name of a plugin without importing it."""
+
+        plugin = self._plugins[name]
+        return plugin.class_name if isinstance(plugin, _PluginLoader) else plugin.__name__
+
+    def __getitem__(self, name: str) -> Any:
+        plugin = self._plugins[name]
+        if isinstance(plugin, _PluginLoader):
+            plugin = plugin.load()
+            self._plugins[name] = plugin
+        return plugin
+
+    def __setitem__(self, name: str, plugin: Any) -> None:
+        self._plugins[name] = plugin
+
+    def __delitem__(self, name: str) -> None:
+        del self._plugins[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._plugins)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._plugins
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._plugins)})"
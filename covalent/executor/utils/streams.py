@@ -0,0 +1,267 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""
+Size-limited capture of the stdout and stderr of tasks
+"""
+
+import io
+import os
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..._shared_files.config import get_config
+
+DEFAULT_STREAM_HEAD_BYTES = 1024 * 1024
+DEFAULT_STREAM_TAIL_BYTES = 1024 * 1024
+
+# Unnamed spools are kept in memory up to this size
+_SPOOL_MEMORY_BYTES = 64 * 1024
+
+# Output is batched up to this many characters before being written to the spool
+_WRITE_BUFFER_CHARS = 64 * 1024
+
+# Output written to named spools becomes readable by other processes within this many seconds
+_FLUSH_INTERVAL = 0.5
+
+TRUNCATION_MARKER = "\n... [{} bytes of output truncated] ...\n"
+
+
+def get_stream_limits() -> Tuple[int, int]:
+    """
+    Return the number of bytes kept from the start and the end of a task's output.
+
+    The limits are read from `dispatcher.task_stream_head_bytes` and
+    `dispatcher.task_stream_tail_bytes`.
+    """
+
+    limits = []
+    for key, default in (
+        ("task_stream_head_bytes", DEFAULT_STREAM_HEAD_BYTES),
+        ("task_stream_tail_bytes", DEFAULT_STREAM_TAIL_BYTES),
+    ):
+        try:
+            limits.append(int(get_config(f"dispatcher.{key}")))
+        except KeyError:
+            limits.append(default)
+    return tuple(limits)
+
+
+def get_task_stream_paths(dispatch_id: str, node_id: int) -> Tuple[str, str]:
+    """Return the paths to which the stdout and stderr of a running task are spooled."""
+
+    stream_dir = os.path.join(get_config("dispatcher.cache_dir"), "task_streams", dispatch_id)
+    return tuple(
+        os.path.join(stream_dir, f"node_{node_id}.{name}") for name in ("stdout", "stderr")
+    )
+
+
+def read_stream_tail(path: str, max_bytes: int) -> str:
+    """
+    Return at most the last `max_bytes` bytes of a spooled stream.
+
+    Args:
+        path: Path of the spool file.
+        max_bytes: Maximum number of bytes to read.
+
+    Returns:
+        The decoded tail, or the empty string if the file does not exist.
+    """
+
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - max_bytes, 0))
+            return f.read(max_bytes).decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
+class SpooledStream(io.TextIOBase):
+    """
+    Writable text stream which keeps only the start and the end of its output.
+
+    Output is spooled to a file in batches of up to 64 KiB rather than held
+    in memory. The first `head_bytes` bytes are kept, followed by a window of
+    the most recent output which is trimmed to `tail_bytes` bytes whenever it
+    grows past twice that, so the file never exceeds `head_bytes + 2 * tail_bytes`.
+    Named spools are flushed from a timer thread within 0.5 seconds of being
+    written to, so their output can be tailed even while the task writing it is
+    busy computing.
+
+    Args:
+        path: File to spool to, which other processes can read with
+              `read_stream_tail` while output is written. It is removed when
+              the stream is closed. If None, an anonymous temporary file is used.
+        head_bytes: Number of bytes kept from the start of the output.
+        tail_bytes: Number of bytes kept from the end of the output.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        head_bytes: int = DEFAULT_STREAM_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_STREAM_TAIL_BYTES,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self._bytes_written = 0
+        self._size = 0
+        # Writes only append to the deque, which is thread-safe, so that they need
+        # not take the lock serializing access to the file with the timer thread
+        self._pending = deque()
+        self._pending_chars = 0
+        self._flush_timer = None
+        self._lock = threading.RLock()
+
+        if path is None:
+            self._file = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MEMORY_BYTES, mode="w+b")
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "w+b")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        # Small writes are batched, as tasks tend to print line by line
+        self._pending.append(s)
+        self._pending_chars += len(s)
+        if self._pending_chars >= _WRITE_BUFFER_CHARS:
+            self._drain()
+
+        if self.path is not None and self._flush_timer is None:
+            # Make the output readable by other processes even if nothing else is written
+            self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self._flush_later)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+        return len(s)
+
+    def _flush_later(self) -> None:
+        """Flush output written since the last flush, from the timer thread."""
+
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+
+    def _drain(self) -> None:
+        """Write the batched output to the spool."""
+
+        with self._lock:
+            if not self._pending:
+                return
+
+            self._pending_chars = 0
+            pending = self._pending
+            data = "".join([pending.popleft() for _ in range(len(pending))])
+            data = data.encode("utf-8", errors="replace")
+
+            self._file.write(data)
+            self._size += len(data)
+            self._bytes_written += len(data)
+
+            if self._size > self.head_bytes + 2 * self.tail_bytes:
+                self._trim()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self.closed:
+                self._drain()
+                self._file.flush()
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes of output written to the stream."""
+
+        with self._lock:
+            self._drain()
+            return self._bytes_written
+
+    @property
+    def bytes_truncated(self) -> int:
+        """Number of bytes of output which were dropped."""
+
+        return max(self.bytes_written - self.head_bytes - self.tail_bytes, 0)
+
+    def _trim(self) -> None:
+        """Drop the output between the head and the last `tail_bytes` bytes."""
+
+        self._file.seek(self._size - self.tail_bytes)
+        tail = self._file.read()
+        self._file.seek(self.head_bytes)
+        self._file.write(tail)
+        self._file.truncate()
+        self._size = self.head_bytes + len(tail)
+
+    def getvalue(self) -> str:
+        """Return the kept output, marking where output was dropped."""
+
+        with self._lock:
+            self._drain()
+            self._file.seek(0)
+            data = self._file.read()
+            self._file.seek(0, os.SEEK_END)
+
+        if self.bytes_truncated:
+            head = data[: self.head_bytes].decode("utf-8", errors="replace")
+            tail = data[len(data) - self.tail_bytes :].decode("utf-8", errors="replace")
+            return head + TRUNCATION_MARKER.format(self.bytes_truncated) + tail
+
+        return data.decode("utf-8", errors="replace")
+
+    def tail(self, max_bytes: int) -> str:
+        """Return at most the last `max_bytes` bytes of output."""
+
+        with self._lock:
+            if self.bytes_written > self._size:
+                # Do not join the tail onto the head across the dropped output
+                max_bytes = min(max_bytes, self._size - self.head_bytes)
+            self._file.seek(max(self._size - max_bytes, 0))
+            data = self._file.read()
+            self._file.seek(0, os.SEEK_END)
+        return data.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                super().close()
+            finally:
+                self._file.close()
+                if self.path is not None:
+                    Path(self.path).unlink(missing_ok=True)
+                    # Remove the dispatch's directory once its last spool is closed
+                    try:
+                        Path(self.path).parent.rmdir()
+                    except OSError:
+                        pass
@@ -22,13 +22,14 @@
 Helper functions for the local executor
 """
 
-import io
 import os
 import traceback
 from contextlib import redirect_stderr, redirect_stdout
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .streams import DEFAULT_STREAM_HEAD_BYTES, DEFAULT_STREAM_TAIL_BYTES, SpooledStream
 
 
 class Signals(Enum):
@@ -46,19 +47,31 @@ def io_wrapper(
     args: List,
     kwargs: Dict,
     workdir: str = ".",
+    stream_paths: Tuple[Optional[str], Optional[str]] = (None, None),
+    stream_limits: Tuple[int, int] = (DEFAULT_STREAM_HEAD_BYTES, DEFAULT_STREAM_TAIL_BYTES),
 ) -> Tuple[Any, str, str, str]:
     """Wrapper function to execute the given function in a separate
-    process and capture stdout and stderr"""
-    with redirect_stdout(io.StringIO()) as stdout, redirect_stderr(io.StringIO()) as stderr:
-        try:
-            Path(workdir).mkdir(parents=True, exist_ok=True)
-            current_dir = os.getcwd()
-            os.chdir(workdir)
-            output = fn(*args, **kwargs)
-            tb = ""
-        except Exception as ex:
-            output = None
-            tb = "".join(traceback.TracebackException.from_exception(ex).format())
-        finally:
-            os.chdir(current_dir)
-    return output, stdout.getvalue(), stderr.getvalue(), tb
+    process and capture stdout and stderr
+
+    The streams are spooled to `stream_paths` (temporary files if None) while
+    the function runs, and only the number of bytes in `stream_limits` is kept
+    from the start and the end of each."""
+    stdout = SpooledStream(stream_paths[0], *stream_limits)
+    stderr = SpooledStream(stream_paths[1], *stream_limits)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                Path(workdir).mkdir(parents=True, exist_ok=True)
+                current_dir = os.getcwd()
+                os.chdir(workdir)
+                output = fn(*args, **kwargs)
+                tb = ""
+            except Exception as ex:
+                output = None
+                tb = "".join(traceback.TracebackException.from_exception(ex).format())
+            finally:
+                os.chdir(current_dir)
+        return output, stdout.getvalue(), stderr.getvalue(), tb
+    finally:
+        stdout.close()
+        stderr.close()
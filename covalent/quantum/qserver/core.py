@@ -112,12 +112,25 @@ class QServer:
         based on the self.selector function
         """
 
+        # Selectors return executors from the given lists, so the cached executor
+        # for each selected one is looked up once per batch instead of per qscript.
+        # The selected executor is kept alongside so that its `id` is not reused.
+        cached_executors = {}
+
+        def _get_cached_executor(executor):
+            if id(executor) not in cached_executors:
+                cached_executors[id(executor)] = (
+                    executor,
+                    get_cached_executor(**executor.dict()),
+                )
+            return cached_executors[id(executor)][1]
+
         linked_executors = []
         for qscript in qscripts:
             selected_executor = self.selector(qscript, executors)
 
             # Use cached executor.
-            selected_executor = get_cached_executor(**selected_executor.dict())
+            selected_executor = _get_cached_executor(selected_executor)
 
             if isinstance(selected_executor, AsyncBaseQCluster):
                 # Apply QCluster's selector as well.
@@ -125,7 +138,7 @@ class QServer:
                 selected_executor = qcluster.get_selector()(qscript, qcluster.executors)
 
                 # Use cached executor.
-                selected_executor = get_cached_executor(**selected_executor.dict())
+                selected_executor = _get_cached_executor(selected_executor)
 
             # This is the only place where the qnode_specs are set.
             selected_executor.qnode_specs = qnode_specs.copy()
@@ -148,33 +161,36 @@ class QServer:
         of qscripts on respective executors
         """
 
-        # Since we will be modifying the qscripts list (or sometimes tuple).
-        qscripts = list(qscripts).copy()
-
-        submission_order = []
+        # Sub-batches of qscripts to be executed on the same executor, keyed by the
+        # executor's `id`. Equal executors that are distinct objects (e.g. after an
+        # eviction from the executor cache) still share a sub-batch.
         executor_qscript_sub_batch_pairs = []
+        sub_batch_by_id = {}
         for i, qscript in enumerate(qscripts):
             if qscript is None:
                 continue
 
-            # Generate a sub batch of qscripts to be executed on the same executor
-            qscript_sub_batch = [linked_executors[i], {i: qscript}]
-
-            # The qscript submission order is stored in this list to ensure that
-            # the final result is recombined correctly, even if task-circuit
-            # correspondence is not one-to-one. See, for example, PR #13.
-            submission_order.append(i)
-
-            for j in range(i + 1, len(qscripts)):
-                if linked_executors[i] == linked_executors[j]:
-                    qscript_sub_batch[1][j] = qscripts[j]
-                    qscripts[j] = None
-                    submission_order.append(j)
-
-            # An example `qscript_sub_batch` will look like:
-            # [exec_4, {0: qscript_1, 3: qscript_4}]
-
-            executor_qscript_sub_batch_pairs.append(qscript_sub_batch)
+            executor = linked_executors[i]
+            if (qscript_sub_batch := sub_batch_by_id.get(id(executor))) is None:
+                for sub_batch_executor, sub_batch in executor_qscript_sub_batch_pairs:
+                    if sub_batch_executor == executor:
+                        qscript_sub_batch = sub_batch
+                        break
+                else:
+                    qscript_sub_batch = {}
+                    executor_qscript_sub_batch_pairs.append([executor, qscript_sub_batch])
+                sub_batch_by_id[id(executor)] = qscript_sub_batch
+
+            qscript_sub_batch[i] = qscript
+
+        # The qscript submission order is stored in this list to ensure that
+        # the final result is recombined correctly, even if task-circuit
+        # correspondence is not one-to-one. See, for example, PR #13.
+        submission_order = [
+            i
+            for _, qscript_sub_batch in executor_qscript_sub_batch_pairs
+            for i in qscript_sub_batch
+        ]
 
         # An example `executor_qscript_sub_batch_pairs` will look like:
         # [
@@ -255,7 +271,8 @@ class QServer:
                 dispatch_id=context.dispatch_id,
                 circuit_name=qelectron_info.name,
                 circuit_description=qelectron_info.description,
-                circuit_diagram=qscript.draw(),
+                # Only draw the diagram if it will be persisted.
+                circuit_diagram=qscript.draw() if linked_executors[i].persist_data else None,
                 qnode_specs=qnode_specs,
                 qexecutor=linked_executors[i],
                 save_time=batch_time,
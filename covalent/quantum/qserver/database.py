@@ -18,12 +18,29 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional, Tuple
+
+import lmdb
 
 from ..._shared_files.config import get_config
 from .serialize import JsonLmdb, Strategy
 from .utils import CircuitInfo
 
+# Long-lived LMDB environments by database path, along with the id of the process
+# that opened them, whether they are read-only and the identity of their data file.
+# LMDB allows an environment to be open only once per process and environments must
+# not be used across a fork. Ordered from least to most recently used; the least
+# recently used environments are closed once more than `MAX_CACHED_ENVIRONMENTS` are open.
+MAX_CACHED_ENVIRONMENTS = 32
+_environments: "OrderedDict[str, Tuple[int, bool, lmdb.Environment, Optional[Tuple]]]" = (
+    OrderedDict()
+)
+_environments_lock = threading.Lock()
+
 
 def set_serialization_strategy(strategy_name):
     """
@@ -32,6 +49,77 @@ def set_serialization_strategy(strategy_name):
     Database.serialization_strategy = strategy_name
 
 
+def _data_file_identity(db_path: str, readonly: bool) -> Optional[Tuple]:
+    """
+    Identify the data file of the database at `db_path`, to detect when it was replaced,
+    e.g. by a copy exported from a task. Read-only environments never write to the file,
+    so they also detect when it was modified by another process.
+    """
+    try:
+        stat = os.stat(os.path.join(db_path, "data.mdb"))
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns if readonly else None)
+
+
+def _get_environment(db_path: str, readonly: bool) -> lmdb.Environment:
+    """
+    Return the cached environment of the database at `db_path`, opening it if needed.
+    A writable environment also serves read-only access. Environments are reopened
+    once their data file has changed.
+    """
+    with _environments_lock:
+        if db_path in _environments:
+            pid, env_readonly, env, identity = _environments[db_path]
+            if pid != os.getpid():
+                # Inherited from the parent process, so discard without closing.
+                del _environments[db_path]
+            elif env_readonly and not readonly:
+                env.close()
+                del _environments[db_path]
+            elif _data_file_identity(db_path, env_readonly) != identity:
+                env.close()
+                del _environments[db_path]
+            else:
+                _environments.move_to_end(db_path)
+                return env
+
+        flag = "r" if readonly else "c"
+        env = JsonLmdb.open_with_strategy(
+            file=db_path, flag=flag, strategy_name=Database.serialization_strategy
+        ).env
+        identity = _data_file_identity(db_path, readonly)
+        _environments[db_path] = (os.getpid(), readonly, env, identity)
+
+        while len(_environments) > MAX_CACHED_ENVIRONMENTS:
+            pid, _, evicted_env, _ = _environments.popitem(last=False)[1]
+            if pid == os.getpid():
+                evicted_env.close()
+
+        return env
+
+
+def close_environments(db_dir=None) -> None:
+    """
+    Close cached database environments, e.g. before their files are replaced.
+
+    Args:
+        db_dir: Only close environments of databases in or inside this directory.
+            All environments are closed if not given.
+    """
+    if db_dir is not None:
+        db_dir = Path(db_dir).resolve().absolute()
+
+    with _environments_lock:
+        for db_path in list(_environments):
+            if db_dir is not None and db_dir not in [Path(db_path), *Path(db_path).parents]:
+                continue
+
+            pid, _, env, _ = _environments.pop(db_path)
+            if pid == os.getpid():
+                env.close()
+
+
 class Database:
     # dash-separated names result in fallback strategy with try/except loops,
     # other valid strategy names uses the one strategy every time
@@ -44,12 +132,15 @@ class Database:
         # allows runtime strategy selection with `set_serialization_strategy()`
         return Database.serialization_strategy
 
-    def __init__(self, db_dir=None):
+    def __init__(self, db_dir=None, readonly=False):
         if db_dir:
             self.db_dir = Path(db_dir)
         else:
             self.db_dir = Path(get_config("dispatcher")["qelectron_db_path"])
 
+        # Read-only databases never write and open their environments read-only.
+        self.readonly = readonly
+
     def _get_db_path(self, dispatch_id, node_id, *, mkdir=False):
         dispatch_id = "default-dispatch" if dispatch_id is None else dispatch_id
         node_id = "default-node" if node_id is None else node_id
@@ -65,34 +156,21 @@ class Database:
         if not db_path.exists():
             raise FileNotFoundError(f"Missing database directory {db_path}.")
 
-        return JsonLmdb.open_with_strategy(
-            file=str(db_path), flag="c", strategy_name=self.strategy_name
-        )
+        env = _get_environment(str(db_path), self.readonly)
+        return JsonLmdb(self.strategy_name, env=env, autogrow=True)
 
     def set(self, keys, values, *, dispatch_id, node_id):
-        with self._open(dispatch_id, node_id, mkdir=True) as db:
-            for i, circuit_id in enumerate(keys):
-                stored_val: dict = db.get(circuit_id, None)
-                if stored_val is None:
-                    continue
-
-                stored_val.update(values[i])
-                values[i] = stored_val
-
-            db.update(dict(zip(keys, values)))
+        db = self._open(dispatch_id, node_id, mkdir=True)
+        db.merge_update(dict(zip(keys, values)))
 
     def get_circuit_ids(self, *, dispatch_id, node_id):
-        with self._open(dispatch_id, node_id) as db:
-            return list(db.keys())
+        db = self._open(dispatch_id, node_id)
+        return list(db.keys())
 
     def get_circuit_info(self, circuit_id, *, dispatch_id, node_id):
-        with self._open(dispatch_id, node_id) as db:
-            return CircuitInfo(**db.get(circuit_id, None))
+        db = self._open(dispatch_id, node_id)
+        return CircuitInfo(**db.get(circuit_id, None))
 
     def get_db(self, *, dispatch_id, node_id):
-        db_copy = {}
-        with self._open(dispatch_id, node_id) as db:
-            for key, value in db.items():
-                db_copy[key] = value
-
-        return db_copy
+        db = self._open(dispatch_id, node_id)
+        return dict(db.items())
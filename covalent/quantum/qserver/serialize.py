@@ -183,6 +183,26 @@ class JsonLmdb(Lmdb):
             raise ValueError(f"unknown database strategy '{strategy_type}'")
         return strategy_cls()
 
+    def merge_update(self, items):
+        """
+        Update the stored (dict) values of keys in `items` with the given values, and
+        insert keys that are not stored yet, all in a single write transaction.
+        """
+        for _ in range(12):
+            try:
+                with self.env.begin(write=True) as txn:
+                    for key, value in items.items():
+                        pre_key = self._pre_key(key)
+                        if (stored_value := txn.get(pre_key)) is not None:
+                            value = {**self._post_value(stored_value), **value}
+                        txn.put(pre_key, self._pre_value(value))
+                    return
+            except lmdb.MapFullError:
+                if not self.autogrow:
+                    raise
+                self.map_size = self.map_size * 2
+        raise RuntimeError(self.autogrow_error.format(self.env.path()))
+
     @classmethod
     def open_with_strategy(
         cls,
@@ -20,11 +20,16 @@
 
 
 import asyncio
+import threading
+import time
+from concurrent.futures import Executor
 from pathlib import Path
 from types import MethodType
+from typing import List, Optional
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 
 from covalent._shared_files import logger
 
@@ -56,6 +61,11 @@ class DirTrigger(BaseTrigger):
                      Possible options can be a subset of: `["created", "deleted", "modified", "moved", "closed"]`.
         batch_size: The number of changes to wait for before performing the trigger action, default is 1.
         recursive: Whether to recursively watch the directory, default is False.
+        debounce: If set, events are coalesced by path and the trigger action is performed once no
+                  new events have arrived for this many seconds, default is None.
+        max_latency: If set along with `debounce`, upper bound in seconds between the first event
+                     of a batch and its trigger action, even if events keep arriving or fewer than
+                     `batch_size` paths have changed, default is None.
 
     Attributes:
         self.dir_path: Path to the file/dir which is to be observed for events
@@ -64,6 +74,11 @@ class DirTrigger(BaseTrigger):
         self.batch_size: The number of events to wait for before performing the trigger action, default is `1`.
         self.recursive: Whether to recursively watch the directory, default is False.
         self.n_changes: Number of events since last trigger action. Whenever `self.n_changes == self.batch_size` a trigger action happens.
+        self.debounce: Quiet period in seconds after which a batch of coalesced events is fired.
+                       When set, `self.batch_size` is the number of distinct changed paths needed for a batch to fire.
+        self.max_latency: Upper bound in seconds between the first event of a batch and its trigger action.
+                          Once it has passed, the batch fires even if fewer than `self.batch_size` paths changed.
+        self.changed_paths: Sorted list of the paths which changed in the most recently fired batch.
     """
 
     def __init__(
@@ -75,6 +90,8 @@ class DirTrigger(BaseTrigger):
         lattice_dispatch_id: str = None,
         dispatcher_addr: str = None,
         triggers_server_addr: str = None,
+        debounce: float = None,
+        max_latency: float = None,
     ):
         super().__init__(lattice_dispatch_id, dispatcher_addr, triggers_server_addr)
 
@@ -87,6 +104,10 @@ class DirTrigger(BaseTrigger):
         self.batch_size = batch_size
         self.recursive = recursive
 
+        self.debounce = debounce
+        self.max_latency = max_latency
+        self.changed_paths = []
+
         self.observe_blocks = False
         self.event_handler = None
 
@@ -103,39 +124,195 @@ class DirTrigger(BaseTrigger):
 
         self.n_changes = 0
 
+        # Batching state is created here rather than in `__init__`
+        # so that it is not part of the trigger's serialized form
+        self._pending_paths = set()
+        self._batch_started = None
+        self._flush_deadline = None
+        self._flusher = None
+        self._flusher_stopped = False
+        self._batch_cond = threading.Condition()
+
         def proxy_trigger(_, event_object):
-            self.n_changes += 1
-            if self.n_changes == self.batch_size:
-                self.trigger()
-                self.n_changes = 0
+            if self.debounce is None:
+                self.n_changes += 1
+                if self.n_changes == self.batch_size:
+                    self._fire()
+                    self.n_changes = 0
+                return
+
+            self._add_event(event_object)
 
         for en in self.event_names:
             func_name = self.event_handler.supported_event_to_func_names[en]
             proxy_trigger.__name__ = func_name
             setattr(self.event_handler, func_name, MethodType(proxy_trigger, self.event_handler))
 
-    def observe(self) -> None:
+    def _fire(self) -> None:
         """
-        Start observing the file/dir for any possible events among the ones
-        mentioned in `self.event_names`.
-        Currently only supports running within the Covalent/Triggers server.
+        Perform the trigger action, off the observer's thread
+        if an executor was given when scheduling this trigger.
         """
 
-        app_log.warning(f"In DirTrigger's observe, dir path is: {self.dir_path}")
+        if trigger_executor := getattr(self, "_trigger_executor", None):
+            trigger_executor.submit(self.trigger)
+        else:
+            self.trigger()
+
+    def _add_event(self, event_object) -> None:
+        """
+        Add the paths touched by an event to the pending batch and move
+        the deadline at which the batch is fired to when the debounce window closes.
+
+        Args:
+            event_object: Watchdog event which was observed
+        """
+
+        with self._batch_cond:
+            self._pending_paths.add(event_object.src_path)
+            if dest_path := getattr(event_object, "dest_path", None):
+                self._pending_paths.add(dest_path)
+            self.n_changes = len(self._pending_paths)
+
+            now = time.monotonic()
+            if self._batch_started is None:
+                self._batch_started = now
+
+            deadline = now + self.debounce
+            if self.max_latency is not None:
+                deadline = min(deadline, self._batch_started + self.max_latency)
+            self._flush_deadline = deadline
+
+            # A single thread per trigger waits for the deadline of the pending batch
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run_flusher, daemon=True)
+                self._flusher.start()
+            self._batch_cond.notify()
+
+    def _run_flusher(self) -> None:
+        """
+        Wait for the deadline of each pending batch and flush it, until stopped.
+        """
+
+        while True:
+            with self._batch_cond:
+                while not self._flusher_stopped:
+                    if self._flush_deadline is None:
+                        self._batch_cond.wait()
+                    elif (remaining := self._flush_deadline - time.monotonic()) > 0:
+                        self._batch_cond.wait(remaining)
+                    else:
+                        break
+
+                if self._flusher_stopped:
+                    return
+
+                self._flush_deadline = None
+                changed_paths = self._take_batch()
+                if changed_paths is None:
+                    continue
+
+            app_log.debug(f"DirTrigger firing for {len(changed_paths)} changed paths")
+            self.trigger(changed_paths=changed_paths)
+
+    def _take_batch(self) -> Optional[List[str]]:
+        """
+        Take the pending batch if at least `self.batch_size` distinct paths have changed,
+        or if `self.max_latency` has passed since its first event. Otherwise, the batch
+        is flushed again once `self.max_latency` has passed, if set.
+        Must be called with the batch lock held.
+
+        Returns:
+            Sorted list of the changed paths of the batch, or None if it is not ready to be fired.
+        """
+
+        if not self._pending_paths:
+            return None
+
+        if len(self._pending_paths) < self.batch_size:
+            if self.max_latency is None:
+                return None
+
+            latency_deadline = self._batch_started + self.max_latency
+            if time.monotonic() < latency_deadline:
+                self._flush_deadline = latency_deadline
+                return None
+
+        self.changed_paths = sorted(self._pending_paths)
+        self._pending_paths = set()
+        self._batch_started = None
+        self.n_changes = 0
+        return self.changed_paths
+
+    def trigger(self, changed_paths: List[str] = None) -> None:
+        """
+        Perform a redispatch of the connected dispatch id's workflow.
+
+        Args:
+            changed_paths: Sorted list of the paths which changed in the batch
+                           causing this trigger action, if events are debounced
+        """
+
+        if changed_paths is not None:
+            app_log.debug(f"DirTrigger redispatching for changed paths: {changed_paths}")
+        super().trigger()
+
+    def _stop_flusher(self) -> None:
+        """
+        Stop the thread flushing debounced batches, if it was started.
+        """
+
+        if (batch_cond := getattr(self, "_batch_cond", None)) is None:
+            return
+
+        with batch_cond:
+            self._flusher_stopped = True
+            batch_cond.notify()
+
+    def schedule(self, observer: BaseObserver, trigger_executor: Executor = None) -> None:
+        """
+        Schedule watching the file/dir on an observer, which may be shared with other triggers.
+
+        Args:
+            observer: Watchdog observer on which to schedule the watch
+            trigger_executor: Executor in which to perform trigger actions so that
+                              they do not block the observer's thread, default is None
+        """
 
         # Resolving the path at the place where observation will happen
         self.dir_path = str(Path(self.dir_path).expanduser().resolve())
 
-        self.event_loop = asyncio.get_running_loop()
-
         self.event_handler = DirEventHandler()
 
         # Attach methods before scheduling the observer
         self.attach_methods_to_handler()
+        self._trigger_executor = trigger_executor
+
+        self.observer = observer
+        self._watch = self.observer.schedule(
+            self.event_handler, self.dir_path, recursive=self.recursive
+        )
+
+    def unschedule(self) -> None:
+        """
+        Stop watching the file/dir without stopping the observer it was scheduled on.
+        """
+
+        self.observer.unschedule(self._watch)
+        self._stop_flusher()
+
+    def observe(self) -> None:
+        """
+        Start observing the file/dir for any possible events among the ones
+        mentioned in `self.event_names`.
+        Currently only supports running within the Covalent/Triggers server.
+        """
+
+        app_log.warning(f"In DirTrigger's observe, dir path is: {self.dir_path}")
+
+        self.event_loop = asyncio.get_running_loop()
 
-        self.observer = Observer()
-        print("Schedule is: ", type(self.observer.schedule))
-        self.observer.schedule(self.event_handler, self.dir_path, recursive=self.recursive)
+        self.schedule(Observer())
         self.observer.start()
 
     def stop(self) -> None:
@@ -144,3 +321,4 @@ class DirTrigger(BaseTrigger):
         """
         self.observer.stop()
         self.observer.join()
+        self._stop_flusher()
@@ -20,9 +20,8 @@
 
 import sqlite3
 import time
-from functools import partial
 from threading import Event
-from typing import List
+from typing import List, Tuple
 
 from covalent._shared_files import logger
 
@@ -48,6 +47,14 @@ class SQLiteTrigger(BaseTrigger):
         lattice_dispatch_id: Lattice dispatch id of the workflow to be triggered
         dispatcher_addr: Address of the dispatcher server
         triggers_server_addr: Address of the triggers server
+        incremental: Whether to only look at rows added since the last poll, tracked by a
+                     high-water mark on `watermark_column`, instead of re-reading every matching row
+        watermark_column: Monotonically increasing column used as the high-water mark in
+                          incremental mode, defaults to "rowid"
+        use_data_version: Whether to skip incremental polls when `PRAGMA data_version` reports
+                          that the database has not been modified since the last poll
+        max_poll_interval: If set, the poll interval is doubled after every poll which finds no
+                           new rows, up to this many seconds, and reset once new rows are found
 
     Attributes:
         self.db_path: Absolute path to the database file
@@ -57,6 +64,11 @@ class SQLiteTrigger(BaseTrigger):
                             polling the database
         self.trigger_after_n: Number of times the event must happen after which the workflow will be triggered.
                               e.g value of 2 means workflow will be triggered once the event has occurred twice.
+        self.incremental: Whether to only look at rows added since the last poll
+        self.watermark_column: Column used as the high-water mark in incremental mode
+        self.use_data_version: Whether to skip polls when the database file has not changed
+        self.max_poll_interval: Upper bound in seconds for the adaptive poll interval
+        self.high_water_mark: Largest value of `watermark_column` seen so far in incremental mode
         self.stop_flag: Thread safe flag used to check whether the stop condition has been met
 
     """
@@ -71,6 +83,10 @@ class SQLiteTrigger(BaseTrigger):
         lattice_dispatch_id: str = None,
         dispatcher_addr: str = None,
         triggers_server_addr: str = None,
+        incremental: bool = False,
+        watermark_column: str = "rowid",
+        use_data_version: bool = True,
+        max_poll_interval: float = None,
     ):
         super().__init__(lattice_dispatch_id, dispatcher_addr, triggers_server_addr)
 
@@ -82,8 +98,104 @@ class SQLiteTrigger(BaseTrigger):
 
         self.trigger_after_n = trigger_after_n
 
+        self.incremental = incremental
+        self.watermark_column = watermark_column
+        self.use_data_version = use_data_version
+        self.max_poll_interval = max_poll_interval
+        self.high_water_mark = None
+        self._data_version = None
+        self._event_count = 0
+
         self.stop_flag = None
 
+    def _poll_new_rows(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Advance the high-water mark past any matching rows added since the last poll
+
+        Args:
+            cursor: Cursor on the observed database
+
+        Returns:
+            Whether any new matching rows were found
+        """
+
+        if self.use_data_version:
+            cursor.execute("PRAGMA data_version")
+            data_version = cursor.fetchone()[0]
+            if data_version == self._data_version:
+                return False
+            self._data_version = data_version
+
+        sql_poll_cmd = f"SELECT MAX({self.watermark_column}) FROM {self.table_name}"
+        conditions = [f"({clause})" for clause in self.where_clauses or []]
+        params = []
+        if self.high_water_mark is not None:
+            conditions.insert(0, f"{self.watermark_column} > ?")
+            params.append(self.high_water_mark)
+
+        if conditions:
+            sql_poll_cmd += " WHERE "
+            sql_poll_cmd += " AND ".join(conditions)
+
+        cursor.execute(sql_poll_cmd, params)
+        new_mark = cursor.fetchone()[0]
+        if new_mark is None:
+            return False
+
+        self.high_water_mark = new_mark
+        return True
+
+    def poll(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Read the database once with the configured query
+
+        Args:
+            cursor: Cursor on the observed database
+
+        Returns:
+            Whether any (new) matching rows were found
+
+        Raises:
+            sqlite3.OperationalError: If the database could not be read, e.g. when it is locked
+        """
+
+        if self.incremental:
+            return self._poll_new_rows(cursor)
+
+        sql_poll_cmd = f"SELECT * FROM {self.table_name}"
+
+        if self.where_clauses:
+            sql_poll_cmd += " WHERE "
+            sql_poll_cmd += " AND ".join(list(self.where_clauses))
+
+        cursor.execute(sql_poll_cmd)
+        return bool(cursor.fetchall())
+
+    def record_poll(self, found_rows: bool, poll_interval: float) -> Tuple[bool, float]:
+        """
+        Update the event count after a successful poll
+
+        Args:
+            found_rows: Whether the poll found any matching rows
+            poll_interval: Seconds waited before the poll
+
+        Returns:
+            Whether the trigger action should be performed, and how many
+            seconds to wait before the next poll
+        """
+
+        if not found_rows:
+            if self.max_poll_interval:
+                poll_interval = min(poll_interval * 2, self.max_poll_interval)
+            return False, poll_interval
+
+        self._event_count += 1
+        if self._event_count == self.trigger_after_n:
+            self._event_count = 0
+            return True, self.poll_interval
+
+        return False, self.poll_interval
+
     def observe(self) -> None:
         """
         Keep performing the trigger action as long as
@@ -91,38 +203,30 @@ class SQLiteTrigger(BaseTrigger):
         """
 
         app_log.debug("Inside SQLiteTrigger's observe")
-        event_count = 0
+        self._event_count = 0
 
         connection = sqlite3.connect(self.db_path)
         connection.row_factory = sqlite3.Row
 
         cursor = connection.cursor()
 
-        sql_poll_cmd = f"SELECT * FROM {self.table_name}"
-
-        if self.where_clauses:
-            sql_poll_cmd += " WHERE "
-            sql_poll_cmd += " AND ".join(list(self.where_clauses))
-
-        execute_cmd = partial(cursor.execute, sql_poll_cmd)
+        poll_interval = self.poll_interval
 
         self.stop_flag = Event()
         while not self.stop_flag.is_set():
             # Read the DB with specified command
             try:
-                execute_cmd()
+                found_rows = self.poll(cursor)
             except sqlite3.OperationalError:
                 time.sleep(self.poll_interval)
                 continue
 
             # If command ran successfuly, trigger the workflow
-            if selected_rows := cursor.fetchall():
-                event_count += 1
-                if event_count == self.trigger_after_n:
-                    self.trigger()
-                    event_count = 0
+            should_trigger, poll_interval = self.record_poll(found_rows, poll_interval)
+            if should_trigger:
+                self.trigger()
 
-            time.sleep(self.poll_interval)
+            time.sleep(poll_interval)
 
         cursor.close()
         connection.close()
@@ -18,4 +18,25 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
-from .entry_point import cancel_running_dispatch, run_dispatcher, run_redispatch
+"""Covalent dispatcher.
+
+The dispatcher entry points pull in the whole server, so they are only imported
+on first access. This keeps the CLI, which lives in this package, fast to start.
+"""
+
+from importlib import import_module as _import_module
+
+_ENTRY_POINTS = ("cancel_running_dispatch", "run_dispatcher", "run_redispatch")
+
+__all__ = list(_ENTRY_POINTS)
+
+
+def __getattr__(name: str):
+    """Import the dispatcher entry points on first access."""
+
+    if name not in _ENTRY_POINTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    obj = getattr(_import_module(".entry_point", __name__), name)
+    globals()[name] = obj
+    return obj
@@ -23,8 +23,6 @@ from subprocess import PIPE, Popen
 
 import click
 
-from ..._db.datastore import DataStore
-
 MIGRATION_WARNING_MSG = "There was an issue running migrations.\nPlease read https://covalent.readthedocs.io/en/latest/how_to/db/migration_error.html for more information."
 
 
@@ -44,6 +42,8 @@ def migrate(ctx: click.Context) -> None:
     """
     Run database migrations
     """
+    from ..._db.datastore import DataStore
+
     try:
         db = DataStore.factory()
         db.run_migrations()
@@ -39,11 +39,6 @@ import click
 import dask.system
 import psutil
 import requests
-import sqlalchemy
-from dask.distributed import Client
-from distributed.comm import unparse_address
-from distributed.comm.core import CommClosedError
-from distributed.core import connect, rpc
 from furl import furl
 from natsort import natsorted
 from rich.box import ROUNDED
@@ -57,9 +52,6 @@ from rich.text import Text
 
 from covalent._shared_files.config import ConfigManager, get_config, set_config
 
-from .._db.datastore import DataStore
-from .migrate import migrate_pickled_result_object
-
 UI_PIDFILE = get_config("dispatcher.cache_dir") + "/ui.pid"
 UI_LOGFILE = get_config("user_interface.log_dir") + "/covalent_ui.log"
 UI_SRVDIR = f"{os.path.dirname(os.path.abspath(__file__))}/../../covalent_ui"
@@ -249,6 +241,7 @@ def _graceful_start(
     Path(get_config("dispatcher.results_dir")).mkdir(parents=True, exist_ok=True)
     Path(get_config("dispatcher.log_dir")).mkdir(parents=True, exist_ok=True)
     Path(get_config("user_interface.log_dir")).mkdir(parents=True, exist_ok=True)
+    Path(get_config("dispatcher.db_path")).parent.mkdir(parents=True, exist_ok=True)
 
     return port
 
@@ -413,6 +406,8 @@ def start(
     if develop:
         set_config({"sdk.log_level": "debug"})
 
+    from .._db.datastore import DataStore
+
     db = DataStore.factory()
 
     # No migrations have run as of yet - run them automatically
@@ -596,6 +591,12 @@ def status() -> None:
     """
     Display local server status
     """
+
+    import sqlalchemy
+    from dask.distributed import Client
+
+    from .._db.datastore import DataStore
+
     console = Console()
     print_header(console)
 
@@ -783,16 +784,22 @@ def migrate_legacy_result_object(result_pickle_path) -> None:
     Example: `covalent migrate-legacy-result-object result.pkl`
     """
 
+    from .migrate import migrate_pickled_result_object
+
     migrate_pickled_result_object(result_pickle_path)
 
 
 # Cluster CLI handlers (client side wrappers for the async handlers exposed
-# in the dask cluster process)
+# in the dask cluster process). Distributed is imported by each handler so that
+# commands which do not talk to the cluster start quickly.
 async def _get_cluster_status(uri: str):
     """
     Returns status of all workers and scheduler in the cluster
     """
 
+    from distributed.comm.core import CommClosedError
+    from distributed.core import rpc
+
     try:
         async with rpc(uri, timeout=2) as r:
             cluster_status = await r.cluster_status()
@@ -805,6 +812,8 @@ async def _get_cluster_address(uri):
     """
     Returns the TCP addresses of the scheduler and workers
     """
+    from distributed.core import rpc
+
     async with rpc(uri, timeout=2) as r:
         addresses = await r.cluster_address()
     return addresses
@@ -814,6 +823,8 @@ async def _get_cluster_info(uri):
     """
     Return summary of cluster info
     """
+    from distributed.core import rpc
+
     async with rpc(uri, timeout=2) as r:
         return await r.cluster_info()
 
@@ -822,6 +833,8 @@ async def _cluster_restart(uri):
     """
     Restart the cluster by individually restarting the cluster workers
     """
+    from distributed.core import rpc
+
     async with rpc(uri, timeout=2) as r:
         await r.cluster_restart()
 
@@ -830,6 +843,8 @@ async def _cluster_scale(uri: str, nworkers: int):
     """
     Scale the cluster up/down depending on `nworkers`
     """
+    from distributed.core import connect
+
     comm = await connect(uri, timeout=2)
     await comm.write({"op": "cluster_scale", "size": nworkers})
     result = await comm.read()
@@ -838,6 +853,8 @@ async def _cluster_scale(uri: str, nworkers: int):
 
 
 async def _get_cluster_size(uri) -> int:
+    from distributed.core import rpc
+
     async with rpc(uri, timeout=2) as r:
         size = await r.cluster_size()
     return size
@@ -847,6 +864,8 @@ async def _get_cluster_logs(uri):
     """
     Retrieve the cluster logs from the scheduler directly
     """
+    from distributed.core import connect
+
     comm = await connect(uri, timeout=2)
     await comm.write({"op": "cluster_logs"})
     cluster_logs = await comm.read()
@@ -855,6 +874,8 @@ async def _get_cluster_logs(uri):
 
 
 def _get_cluster_admin_address():
+    from distributed.comm import unparse_address
+
     try:
         admin_host = get_config("dask.admin_host")
         admin_port = get_config("dask.admin_port")
@@ -25,13 +25,20 @@ Defines the core functionality of the result service
 import asyncio
 import traceback
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Callable, Dict, Optional
 
 from covalent._results_manager import Result
 from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
 from covalent._shared_files.defaults import sublattice_prefix
-from covalent._shared_files.qelectron_utils import extract_qelectron_db, write_qelectron_db
+from covalent._shared_files.metrics import Gauge
+from covalent._shared_files.qelectron_utils import (
+    extract_qelectron_db,
+    qelectron_db_exists,
+    write_qelectron_db,
+)
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
 from covalent._workflow.transport_graph_ops import TransportGraphOps
@@ -49,6 +56,31 @@ _registered_dispatches = {}
 # to dispatcher
 _dispatch_status_queues = {}
 
+# Registered dispatches not yet picked up by `run_workflow`, in least
+# recently used order. Their result objects have already been persisted
+# and may be evicted from memory.
+_idle_dispatches = OrderedDict()
+
+# Map of dispatch_id -> parent electron id for idle dispatches whose result
+# objects were evicted and must be reloaded from the DB on next access
+_spilled_dispatches = {}
+
+_registry_counters = {"evictions": 0, "rehydrations": 0}
+
+# Number of idle dispatches whose result objects are kept in memory
+_max_idle_dispatches = int(get_config("dispatcher.max_idle_dispatches"))
+
+_resident_dispatches_gauge = Gauge(
+    "covalent_resident_dispatches",
+    "Number of dispatches whose result objects are held in memory",
+    function=lambda: len(_registered_dispatches),
+)
+_status_queue_depth_gauge = Gauge(
+    "covalent_dispatch_status_queue_depth",
+    "Number of node status updates waiting to be processed by the dispatcher",
+    function=lambda: sum(queue.qsize() for queue in list(_dispatch_status_queues.values())),
+)
+
 
 def generate_node_result(
     dispatch_id: str,
@@ -85,12 +117,14 @@ def generate_node_result(
         Dictionary of the inputs
     """
     clean_stdout, bytes_data = extract_qelectron_db(stdout)
-    qelectron_data_exists = bool(bytes_data)
 
-    if qelectron_data_exists:
+    if bytes_data:
         app_log.debug(f"Reproducing Qelectron database for node {node_id}")
         write_qelectron_db(dispatch_id, node_id, bytes_data)
 
+    # Tasks which can reach the results directory copy their database there directly
+    qelectron_data_exists = bool(bytes_data) or qelectron_db_exists(dispatch_id, node_id)
+
     return {
         "node_id": node_id,
         "node_name": node_name,
@@ -350,6 +384,10 @@ def make_derived_dispatch(
 
 
 def get_result_object(dispatch_id: str) -> Result:
+    if dispatch_id in _spilled_dispatches:
+        _rehydrate_result_object(dispatch_id)
+    if dispatch_id in _idle_dispatches:
+        _idle_dispatches.move_to_end(dispatch_id)
     return _registered_dispatches.get(dispatch_id)
 
 
@@ -357,14 +395,88 @@ def _register_result_object(result_object: Result):
     dispatch_id = result_object.dispatch_id
     _registered_dispatches[dispatch_id] = result_object
     _dispatch_status_queues[dispatch_id] = asyncio.Queue()
+    _idle_dispatches[dispatch_id] = None
+    _evict_idle_dispatches()
+
+
+def _rehydrate_result_object(dispatch_id: str):
+    """Reload an evicted idle dispatch from the DB."""
+
+    parent_electron_id = _spilled_dispatches.pop(dispatch_id)
+    result_object = load.get_result_object_from_storage(dispatch_id)
+    result_object._electron_id = parent_electron_id
+    _registered_dispatches[dispatch_id] = result_object
+    _dispatch_status_queues[dispatch_id] = asyncio.Queue()
+    _registry_counters["rehydrations"] += 1
+    app_log.debug(f"Rehydrated idle dispatch {dispatch_id} from the DB")
+
+    # Make room for the reloaded dispatch
+    _evict_idle_dispatches(keep=dispatch_id)
+
+
+def _evict_idle_dispatches(keep: Optional[str] = None):
+    """Spill the least recently used idle dispatches beyond the memory budget.
+
+    Only dispatches that have not started running are evicted; their state is
+    already persisted so they can be rehydrated on demand.
+
+    Args:
+        keep: Dispatch id which must remain resident.
+
+    """
+    resident_idle = [d for d in _idle_dispatches if d not in _spilled_dispatches and d != keep]
+    num_to_evict = len(resident_idle) - _max_idle_dispatches + (keep is not None)
+
+    for dispatch_id in resident_idle[: max(num_to_evict, 0)]:
+        result_object = _registered_dispatches.pop(dispatch_id)
+        del _dispatch_status_queues[dispatch_id]
+        _spilled_dispatches[dispatch_id] = result_object._electron_id
+        _registry_counters["evictions"] += 1
+        app_log.debug(f"Evicted idle dispatch {dispatch_id} from memory")
+
+
+def activate_dispatch(dispatch_id: str):
+    """Pin a dispatch in memory while its workflow is running."""
+
+    get_result_object(dispatch_id)
+    _idle_dispatches.pop(dispatch_id, None)
 
 
 def finalize_dispatch(dispatch_id: str):
-    del _dispatch_status_queues[dispatch_id]
-    del _registered_dispatches[dispatch_id]
+    _dispatch_status_queues.pop(dispatch_id, None)
+    _registered_dispatches.pop(dispatch_id, None)
+    _idle_dispatches.pop(dispatch_id, None)
+    _spilled_dispatches.pop(dispatch_id, None)
+
+
+def get_registry_stats() -> Dict[str, int]:
+    """Gauges describing the dispatches held by this dispatcher.
+
+    Returns:
+        Dictionary with the number of resident, running, idle and spilled
+        dispatches, the number of transport graph nodes held in memory, and
+        cumulative eviction and rehydration counts.
+
+    """
+    resident_nodes = sum(
+        res.lattice.transport_graph._graph.number_of_nodes()
+        for res in _registered_dispatches.values()
+    )
+    return {
+        "resident_dispatches": len(_registered_dispatches),
+        "running_dispatches": len(_registered_dispatches)
+        - len(_idle_dispatches)
+        + len(_spilled_dispatches),
+        "idle_dispatches": len(_idle_dispatches),
+        "spilled_dispatches": len(_spilled_dispatches),
+        "resident_nodes": resident_nodes,
+        **_registry_counters,
+    }
 
 
 def get_status_queue(dispatch_id: str):
+    # Reload the dispatch and its queue if it was spilled
+    activate_dispatch(dispatch_id)
     return _dispatch_status_queues[dispatch_id]
 
 
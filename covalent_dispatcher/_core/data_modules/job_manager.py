@@ -20,9 +20,9 @@
 
 # """Interface to the Jobs table"""
 
-from typing import Any, List
+from typing import Any, Dict, List
 
-from ..._db.jobdb import get_job_records, to_job_ids, update_job_records
+from ..._db.jobdb import get_job_records, to_job_id_map, to_job_ids, update_job_records
 
 
 def _set_cancel_requested(job_ids: List[int]) -> None:
@@ -36,7 +36,8 @@ def _set_cancel_requested(job_ids: List[int]) -> None:
         None
     """
     records = [{"job_id": job_id, "cancel_requested": True} for job_id in job_ids]
-    update_job_records(records)
+    if records:
+        update_job_records(records)
 
 
 async def set_cancel_requested(dispatch_id: str, task_ids: List[int]):
@@ -115,3 +116,25 @@ async def set_cancel_result(dispatch_id: str, task_id: int, cancel_status: bool)
         None
     """
     await _set_job_metadata(dispatch_id, task_id, cancel_successful=cancel_status)
+
+
+async def set_cancel_results(dispatch_id: str, cancel_statuses: Dict[int, bool]) -> None:
+    """
+    Record the outcome of a batch of task cancellations in a single DB transaction
+
+    Arg(s)
+        dispatch_id: Dispatch ID of the lattice
+        cancel_statuses: Map of task id to True/False indicating whether the task was cancelled
+
+    Return(s)
+        None
+    """
+    if not cancel_statuses:
+        return
+
+    job_id_map = to_job_id_map(dispatch_id, list(cancel_statuses))
+    records = [
+        {"job_id": job_id_map[task_id], "cancel_successful": cancel_status}
+        for task_id, cancel_status in cancel_statuses.items()
+    ]
+    update_job_records(records)
@@ -23,12 +23,16 @@ Defines the core functionality of the dispatcher
 """
 
 import asyncio
+import time
 import traceback
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
 from covalent._results_manager import Result
-from covalent._shared_files import logger
+from covalent._shared_files import logger, metrics
+from covalent._shared_files.config import get_config
 from covalent._shared_files.defaults import parameter_prefix
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent_ui import result_webhook
@@ -51,6 +55,74 @@ Dispatcher module is responsible for planning and dispatching workflows. The dis
 """
 
 
+# Per-dispatch index of abstract task inputs, built with one pass over the
+# transport graph edges. Entries are (weakref to graph, {node_id: inputs}).
+_task_input_index = OrderedDict()
+
+# Maximum number of transport graph nodes kept across all indexed dispatches
+MAX_INDEXED_NODES = 1_000_000
+
+_task_input_index_stats = {"hits": 0, "misses": 0, "indexed_nodes": 0}
+
+
+def _build_task_input_index(result_object: Result) -> Dict[int, dict]:
+    """Compute the abstract task inputs of every node in the transport graph."""
+
+    g = result_object.lattice.transport_graph._graph
+    index = {node_id: {"args": [], "kwargs": {}} for node_id in g.nodes}
+
+    for parent, node_id, d in g.edges(data=True):
+        if not d.get("wait_for"):
+            if d["param_type"] == "arg":
+                index[node_id]["args"].append((parent, d["arg_index"]))
+            elif d["param_type"] == "kwarg":
+                key = d["edge_name"]
+                index[node_id]["kwargs"][key] = parent
+
+    for abstract_task_input in index.values():
+        sorted_args = sorted(abstract_task_input["args"], key=lambda x: x[1])
+        abstract_task_input["args"] = [x[0] for x in sorted_args]
+
+    return index
+
+
+def _get_task_input_index(result_object: Result) -> Dict[int, dict]:
+    """Get the cached task input index of a dispatch, building it on first use."""
+
+    dispatch_id = result_object.dispatch_id
+    tg = result_object.lattice.transport_graph
+
+    entry = _task_input_index.get(dispatch_id)
+    if entry is not None and entry[0]() is tg:
+        _task_input_index.move_to_end(dispatch_id)
+        _task_input_index_stats["hits"] += 1
+        return entry[1]
+
+    _task_input_index_stats["misses"] += 1
+    _clear_task_input_index(dispatch_id)
+    index = _build_task_input_index(result_object)
+    _task_input_index[dispatch_id] = (weakref.ref(tg), index)
+    _task_input_index_stats["indexed_nodes"] += len(index)
+
+    while (
+        _task_input_index_stats["indexed_nodes"] > MAX_INDEXED_NODES and len(_task_input_index) > 1
+    ):
+        _clear_task_input_index(next(iter(_task_input_index)))
+
+    return index
+
+
+def _clear_task_input_index(dispatch_id: str) -> None:
+    if entry := _task_input_index.pop(dispatch_id, None):
+        _task_input_index_stats["indexed_nodes"] -= len(entry[1])
+
+
+def get_task_input_index_stats() -> Dict[str, int]:
+    """Hit/miss counts and size of the task input index."""
+
+    return {"indexed_dispatches": len(_task_input_index), **_task_input_index_stats}
+
+
 # Domain: dispatcher
 def _get_abstract_task_inputs(node_id: int, node_name: str, result_object: Result) -> dict:
     """Return placeholders for the required inputs for a task execution.
@@ -66,23 +138,11 @@ def _get_abstract_task_inputs(node_id: int, node_name: str, result_object: Resul
         resolved to their values later.
     """
 
-    abstract_task_input = {"args": [], "kwargs": {}}
-
-    for parent in result_object.lattice.transport_graph.get_dependencies(node_id):
-        edge_data = result_object.lattice.transport_graph.get_edge_data(parent, node_id)
-
-        for _, d in edge_data.items():
-            if not d.get("wait_for"):
-                if d["param_type"] == "arg":
-                    abstract_task_input["args"].append((parent, d["arg_index"]))
-                elif d["param_type"] == "kwarg":
-                    key = d["edge_name"]
-                    abstract_task_input["kwargs"][key] = parent
-
-    sorted_args = sorted(abstract_task_input["args"], key=lambda x: x[1])
-    abstract_task_input["args"] = [x[0] for x in sorted_args]
-
-    return abstract_task_input
+    abstract_task_input = _get_task_input_index(result_object)[node_id]
+    return {
+        "args": list(abstract_task_input["args"]),
+        "kwargs": dict(abstract_task_input["kwargs"]),
+    }
 
 
 # Domain: dispatcher
@@ -216,6 +276,7 @@ async def _submit_task(result_object, node_id):
             abstract_inputs=abs_task_input,
         )
         app_log.debug(f"Creating task {node_id}.")
+        metrics.performance_recorder.start(result_object.dispatch_id, node_id, metrics.QUEUEING)
         asyncio.create_task(coro)
 
 
@@ -347,9 +408,16 @@ async def run_workflow(result_object: Result) -> Result:
         datasvc.finalize_dispatch(result_object.dispatch_id)
         return result_object
 
+    dispatch_id = result_object.dispatch_id
+    start = time.perf_counter()
+
+    # Attribute DB accesses made while running the workflow, including by the
+    # tasks it spawns, to this dispatch
+    token = metrics.current_dispatch_id.set(dispatch_id)
+
     try:
         _plan_workflow(result_object)
-        status_queue = datasvc.get_status_queue(result_object.dispatch_id)
+        status_queue = datasvc.get_status_queue(dispatch_id)
         result_object = await _run_planned_workflow(result_object, status_queue)
 
     except Exception as ex:
@@ -361,8 +429,18 @@ async def run_workflow(result_object: Result) -> Result:
         result_object._end_time = datetime.now(timezone.utc)
 
     finally:
-        await datasvc.persist_result(result_object.dispatch_id)
-        datasvc.finalize_dispatch(result_object.dispatch_id)
+        with metrics.performance_recorder.timed(
+            dispatch_id, metrics.DISPATCH_NODE_ID, metrics.PERSISTENCE
+        ):
+            await datasvc.persist_result(dispatch_id)
+        datasvc.finalize_dispatch(dispatch_id)
+        _clear_task_input_index(dispatch_id)
+        runner._clear_rehydrated_deps(dispatch_id)
+        metrics.performance_recorder.record(
+            dispatch_id, metrics.DISPATCH_NODE_ID, metrics.RUNTIME, start, time.perf_counter()
+        )
+        metrics.performance_recorder.discard_pending(dispatch_id)
+        metrics.current_dispatch_id.reset(token)
 
     return result_object
 
@@ -396,12 +474,25 @@ async def cancel_dispatch(dispatch_id: str, task_ids: List[int] = None) -> None:
         app_log.debug(f"Cancelling dispatch {dispatch_id}")
 
     await set_cancel_requested(dispatch_id, task_ids)
-    await runner.cancel_tasks(dispatch_id, task_ids)
 
-    # Recursively cancel running sublattice dispatches
-    sub_ids = list(map(lambda x: tg.get_node_value(x, "sub_dispatch_id"), task_ids))
-    for sub_dispatch_id in sub_ids:
-        await cancel_dispatch(sub_dispatch_id)
+    # Cancel running sublattice dispatches concurrently with the tasks of
+    # this dispatch, at most `dispatcher.cancel_fanout` sublattices at a time.
+    # The cancel requests themselves are sent in the background, also at most
+    # `dispatcher.cancel_fanout` at a time across all dispatches.
+    sub_ids = [
+        sub_dispatch_id
+        for sub_dispatch_id in map(lambda x: tg.get_node_value(x, "sub_dispatch_id"), task_ids)
+        if sub_dispatch_id
+    ]
+    semaphore = asyncio.Semaphore(int(get_config("dispatcher.cancel_fanout")))
+
+    async def _cancel_sublattice(sub_dispatch_id: str) -> None:
+        async with semaphore:
+            await cancel_dispatch(sub_dispatch_id)
+
+    await asyncio.gather(
+        runner.cancel_tasks(dispatch_id, task_ids), *map(_cancel_sublattice, sub_ids)
+    )
 
 
 def run_dispatch(dispatch_id: str) -> asyncio.Future:
@@ -416,5 +507,6 @@ def run_dispatch(dispatch_id: str) -> asyncio.Future:
 
     """
     app_log.debug(f"Running dispatch with dispatch_id: {dispatch_id}.")
+    datasvc.activate_dispatch(dispatch_id)
     result_object = datasvc.get_result_object(dispatch_id)
     return asyncio.create_task(run_workflow(result_object))
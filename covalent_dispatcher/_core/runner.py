@@ -23,26 +23,33 @@ Defines the core functionality of the runner
 """
 
 import asyncio
+import hashlib
 import importlib
 import json
+import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import partial
 from typing import Any, Dict, List, Literal, Tuple, Union
 
+import orjson
+
 from covalent._results_manager import Result
-from covalent._shared_files import logger
+from covalent._shared_files import logger, metrics
 from covalent._shared_files.config import get_config
+from covalent._shared_files.metrics import Counter, Gauge, Histogram, performance_recorder
+from covalent._shared_files.qelectron_utils import get_qelectron_db_dir
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow import DepsBash, DepsCall, DepsPip
 from covalent._workflow.transport import TransportableObject
+from covalent._workflow.transportable_object import has_serialized_inputs, takes_serialized_inputs
 from covalent.executor import _executor_manager
 from covalent.executor.base import AsyncBaseExecutor, wrapper_fn
 from covalent.executor.utils import set_context
 
 from . import data_manager as datasvc
-from .data_modules.job_manager import get_jobs_metadata, set_cancel_result
+from .data_modules.job_manager import get_jobs_metadata, set_cancel_results
 from .runner_modules import executor_proxy
 
 app_log = logger.app_log
@@ -51,6 +58,29 @@ debug_mode = get_config("sdk.log_level") == "debug"
 
 _cancel_threadpool = ThreadPoolExecutor()
 
+# Running loop and semaphore bounding the cancel requests in flight
+_cancel_semaphore = None
+
+# Strong references to the background tasks sending cancel requests
+_cancel_background_tasks = set()
+
+_tasks_in_flight = Gauge(
+    "covalent_tasks_in_flight",
+    "Number of tasks being executed, by executor",
+    ("executor",),
+)
+_task_latency = Histogram(
+    "covalent_task_latency_seconds",
+    "Time taken by executors to run tasks, by executor",
+    ("executor",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+_tasks_total = Counter(
+    "covalent_tasks_total",
+    "Number of tasks run, by executor and final status",
+    ("executor", "status"),
+)
+
 
 # Domain: runner
 def get_executor(
@@ -122,7 +152,8 @@ async def run_abstract_task(
     )
 
     result_object = datasvc.get_result_object(dispatch_id)
-    await datasvc.update_node_result(result_object, node_result)
+    with performance_recorder.timed(dispatch_id, node_id, metrics.PERSISTENCE):
+        await datasvc.update_node_result(result_object, node_result)
 
 
 # Domain: runner
@@ -133,6 +164,9 @@ async def _run_abstract_task(
     abstract_inputs: Dict,
     executor: Any,
 ) -> None:
+    performance_recorder.stop(dispatch_id, node_id, metrics.QUEUEING)
+    input_fetch_start = time.perf_counter()
+
     # Resolve abstract task and inputs to their concrete (serialized) values
     result_object = datasvc.get_result_object(dispatch_id)
     timestamp = datetime.now(timezone.utc)
@@ -166,6 +200,10 @@ async def _run_abstract_task(
         app_log.debug(f"Collecting deps for task {node_id}")
         call_before, call_after = _gather_deps(result_object, node_id)
 
+        performance_recorder.record(
+            dispatch_id, node_id, metrics.INPUT_FETCH, input_fetch_start, time.perf_counter()
+        )
+
     except Exception as ex:
         app_log.error(f"Exception when trying to resolve inputs or deps: {ex}")
         node_result = datasvc.generate_node_result(
@@ -188,6 +226,7 @@ async def _run_abstract_task(
     )
     app_log.debug(f"7: Marking node {node_id} as running (_run_abstract_task)")
 
+    performance_recorder.start(dispatch_id, node_id, metrics.EXECUTOR_SETUP)
     await datasvc.update_node_result(result_object, node_result)
 
     return await _run_task(
@@ -232,6 +271,7 @@ async def _run_task(
     """
     dispatch_id = result_object.dispatch_id
     results_dir = result_object.results_dir
+    executor_name = str(executor[0])
 
     # Instantiate the executor from JSON
     try:
@@ -250,28 +290,50 @@ async def _run_task(
             status=RESULT_STATUS.FAILED,
             error=error_msg,
         )
+        _tasks_total.labels(executor_name, str(RESULT_STATUS.FAILED)).inc()
+        performance_recorder.stop(dispatch_id, node_id, metrics.EXECUTOR_SETUP)
         return node_result
 
     # Run the task on the executor and register any failures.
     try:
         app_log.debug(f"Executing task {node_name}")
 
-        def qelectron_compatible_wrapper(node_id, dispatch_id, ser_user_fn, *args, **kwargs):
+        def qelectron_compatible_wrapper(
+            node_id, dispatch_id, qelectron_db_dir, ser_user_fn, *args, **kwargs
+        ):
             user_fn = ser_user_fn.get_deserialized()
 
+            # The wrapper receives the inputs serialized, as the task may take them
+            # serialized. Return values of call_before deps are injected as is.
+            if not has_serialized_inputs(user_fn):
+                args = [arg.get_deserialized() for arg in args]
+                kwargs = {
+                    k: v.get_deserialized() if isinstance(v, TransportableObject) else v
+                    for k, v in kwargs.items()
+                }
+
             try:
                 mod_qe_utils = importlib.import_module("covalent._shared_files.qelectron_utils")
 
                 with set_context(node_id, dispatch_id):
                     res = user_fn(*args, **kwargs)
-                    mod_qe_utils.print_qelectron_db()
+                    mod_qe_utils.export_qelectron_db(qelectron_db_dir)
 
                 return res
             except ModuleNotFoundError:
                 return user_fn(*args, **kwargs)
 
+        qelectron_db_dir = str(get_qelectron_db_dir(dispatch_id, node_id))
         serialized_callable = TransportableObject(
-            partial(qelectron_compatible_wrapper, node_id, dispatch_id, serialized_callable)
+            takes_serialized_inputs(
+                partial(
+                    qelectron_compatible_wrapper,
+                    node_id,
+                    dispatch_id,
+                    qelectron_db_dir,
+                    serialized_callable,
+                )
+            )
         )
 
         assembled_callable = partial(wrapper_fn, serialized_callable, call_before, call_after)
@@ -279,25 +341,35 @@ async def _run_task(
         # Note: Executor proxy monitors the executors instances and watches the send and receive queues of the executor.
         asyncio.create_task(executor_proxy.watch(dispatch_id, node_id, executor))
 
-        output, stdout, stderr, status = await executor._execute(
-            function=assembled_callable,
-            args=inputs["args"],
-            kwargs=inputs["kwargs"],
-            dispatch_id=dispatch_id,
-            results_dir=results_dir,
-            node_id=node_id,
-        )
-
-        node_result = datasvc.generate_node_result(
-            dispatch_id=dispatch_id,
-            node_id=node_id,
-            node_name=node_name,
-            end_time=datetime.now(timezone.utc),
-            status=status,
-            output=output,
-            stdout=stdout,
-            stderr=stderr,
-        )
+        performance_recorder.stop(dispatch_id, node_id, metrics.EXECUTOR_SETUP)
+        in_flight = _tasks_in_flight.labels(executor_name)
+        in_flight.inc()
+        try:
+            with performance_recorder.timed(
+                dispatch_id, node_id, metrics.EXECUTION
+            ), _task_latency.labels(executor_name).time():
+                output, stdout, stderr, status = await executor._execute(
+                    function=assembled_callable,
+                    args=inputs["args"],
+                    kwargs=inputs["kwargs"],
+                    dispatch_id=dispatch_id,
+                    results_dir=results_dir,
+                    node_id=node_id,
+                )
+        finally:
+            in_flight.dec()
+
+        with performance_recorder.timed(dispatch_id, node_id, metrics.RESULT_FETCH):
+            node_result = datasvc.generate_node_result(
+                dispatch_id=dispatch_id,
+                node_id=node_id,
+                node_name=node_name,
+                end_time=datetime.now(timezone.utc),
+                status=status,
+                output=output,
+                stdout=stdout,
+                stderr=stderr,
+            )
 
     except Exception as ex:
         tb = "".join(traceback.TracebackException.from_exception(ex).format())
@@ -312,84 +384,90 @@ async def _run_task(
             status=RESULT_STATUS.FAILED,
             error=error_msg,
         )
+
+    _tasks_total.labels(executor_name, str(node_result["status"])).inc()
     return node_result
 
 
+# Rehydrated deps by dispatch id, keyed by dep class and digest of the dep's JSON.
+# Held only while the dispatch runs, since `apply()` tuples can be large.
+_rehydrated_deps: Dict[str, Dict[Tuple[type, bytes], Tuple]] = {}
+
+
+# Domain: runner
+def _rehydrate_dep(dispatch_id: str, dep_class: type, dep_json: bytes) -> Tuple:
+    """Rehydrate a dep from its JSON, returning the result of its `apply()`.
+
+    Nodes of a dispatch with identical deps share the rehydrated objects, which
+    are only read when the task is assembled.
+    """
+
+    deps = _rehydrated_deps.setdefault(dispatch_id, {})
+    key = (dep_class, hashlib.blake2b(dep_json, digest_size=16).digest())
+    applied = deps.get(key)
+    if applied is None:
+        dep = dep_class()
+        dep.from_dict(orjson.loads(dep_json))
+        applied = deps[key] = dep.apply()
+    return applied
+
+
+def _clear_rehydrated_deps(dispatch_id: str) -> None:
+    _rehydrated_deps.pop(dispatch_id, None)
+
+
 # Domain: runner
 def _gather_deps(result_object: Result, node_id: int) -> Tuple[List, List]:
     """Assemble deps for a node into the final call_before and call_after"""
 
-    deps = result_object.lattice.transport_graph.get_node_value(node_id, "metadata")["deps"]
+    metadata = result_object.lattice.transport_graph.get_node_value(node_id, "metadata")
+    deps = metadata["deps"]
 
     # Assemble call_before and call_after from all the deps
 
-    call_before_objs_json = result_object.lattice.transport_graph.get_node_value(
-        node_id, "metadata"
-    )["call_before"]
-    call_after_objs_json = result_object.lattice.transport_graph.get_node_value(
-        node_id, "metadata"
-    )["call_after"]
-
     call_before = []
     call_after = []
 
     # Rehydrate deps from JSON
+    dispatch_id = result_object.dispatch_id
     if "bash" in deps:
-        dep = DepsBash()
-        dep.from_dict(deps["bash"])
-        call_before.append(dep.apply())
+        call_before.append(_rehydrate_dep(dispatch_id, DepsBash, orjson.dumps(deps["bash"])))
 
     if "pip" in deps:
-        dep = DepsPip()
-        dep.from_dict(deps["pip"])
-        call_before.append(dep.apply())
+        call_before.append(_rehydrate_dep(dispatch_id, DepsPip, orjson.dumps(deps["pip"])))
 
-    for dep_json in call_before_objs_json:
-        dep = DepsCall()
-        dep.from_dict(dep_json)
-        call_before.append(dep.apply())
+    for dep_json in metadata["call_before"]:
+        call_before.append(_rehydrate_dep(dispatch_id, DepsCall, orjson.dumps(dep_json)))
 
-    for dep_json in call_after_objs_json:
-        dep = DepsCall()
-        dep.from_dict(dep_json)
-        call_after.append(dep.apply())
+    for dep_json in metadata["call_after"]:
+        call_after.append(_rehydrate_dep(dispatch_id, DepsCall, orjson.dumps(dep_json)))
 
     return call_before, call_after
 
 
-async def _cancel_task(
-    dispatch_id: str, task_id: int, executor, executor_data: Dict, job_handle: str
+async def _request_cancel(
+    dispatch_id: str, task_id: int, executor: AsyncBaseExecutor, job_handle: str
 ) -> Union[Any, Literal[False]]:
     """
-    Cancel the task currently being executed by the executor
+    Ask an initialized executor to cancel a task without recording the outcome
 
     Arg(s)
         dispatch_id: Dispatch ID
         task_id: Task ID of the electron in transport graph to be cancelled
-        executor: Covalent executor currently being used to execute the task
-        executor_data: Executor configuration arguments
+        executor: Initialized executor instance which ran the task
         job_handle: Unique identifier assigned to the task by the backend running the job
 
     Return(s)
         cancel_job_result: Status of the job cancellation action
 
     """
-    app_log.debug(f"Cancel task {task_id} using executor {executor}, {executor_data}")
-    app_log.debug(f"job_handle: {job_handle}")
-
     try:
-        executor = get_executor(
-            executor=executor, loop=asyncio.get_running_loop(), cancel_pool=_cancel_threadpool
-        )
         task_metadata = {"dispatch_id": dispatch_id, "node_id": task_id}
-        cancel_job_result = await executor._cancel(task_metadata, json.loads(job_handle))
+        return await executor._cancel(task_metadata, json.loads(job_handle))
 
     except Exception as ex:
         app_log.debug(f"Exception when cancel task {dispatch_id}:{task_id}: {ex}")
-        cancel_job_result = False
-
-    await set_cancel_result(dispatch_id, task_id, cancel_job_result)
-    return cancel_job_result
+        return False
 
 
 def to_cancel_kwargs(
@@ -415,16 +493,33 @@ def to_cancel_kwargs(
     }
 
 
-async def cancel_tasks(dispatch_id: str, task_ids: List[int]) -> None:
+def _get_cancel_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding the cancel requests in flight across all dispatches."""
+
+    global _cancel_semaphore
+
+    loop = asyncio.get_running_loop()
+    if _cancel_semaphore is None or _cancel_semaphore[0] is not loop:
+        _cancel_semaphore = (loop, asyncio.Semaphore(int(get_config("dispatcher.cancel_fanout"))))
+    return _cancel_semaphore[1]
+
+
+async def cancel_tasks(dispatch_id: str, task_ids: List[int]) -> asyncio.Task:
     """
     Request all tasks with `task_ids` to be cancelled in the workflow identified by `dispatch_id`
 
+    The cancel requests are sent in the background, so that cancelling does not
+    wait for the executors. Tasks sharing an executor configuration are cancelled
+    through a single executor instance. At most `dispatcher.cancel_fanout` cancel
+    requests are in flight at once across all dispatches, and the outcomes for
+    `task_ids` are recorded in one DB transaction.
+
     Arg(s)
         dispatch_id: Dispatch ID of the workflow
         task_ids: List of task ids to be cancelled
 
     Return(s)
-        None
+        The background task sending the cancel requests
     """
     job_metadata = await get_jobs_metadata(dispatch_id, task_ids)
     node_metadata = _get_metadata_for_nodes(dispatch_id, task_ids)
@@ -433,8 +528,49 @@ async def cancel_tasks(dispatch_id: str, task_ids: List[int]) -> None:
         to_cancel_kwargs(i, x, node_metadata, job_metadata) for i, x in enumerate(task_ids)
     ]
 
-    for kwargs in cancel_task_kwargs:
-        asyncio.create_task(_cancel_task(dispatch_id, **kwargs))
+    task = asyncio.create_task(_send_cancel_requests(dispatch_id, cancel_task_kwargs))
+    _cancel_background_tasks.add(task)
+
+    def _on_done(task: asyncio.Task) -> None:
+        _cancel_background_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()):
+            app_log.exception(f"Failed to cancel tasks of dispatch {dispatch_id}", exc_info=exc)
+
+    task.add_done_callback(_on_done)
+    return task
+
+
+async def _send_cancel_requests(dispatch_id: str, cancel_task_kwargs: List[dict]) -> None:
+    """Send the cancel requests for the tasks of a dispatch and record their outcomes."""
+
+    loop = asyncio.get_running_loop()
+    semaphore = _get_cancel_semaphore()
+    executors = {}
+
+    async def _bounded_cancel(kwargs: dict):
+        task_id = kwargs["task_id"]
+
+        # Tasks which were never submitted are still passed to the executor,
+        # which tears down any infrastructure it set up for them
+        key = (kwargs["executor"], json.dumps(kwargs["executor_data"], sort_keys=True))
+        async with semaphore:
+            try:
+                if key not in executors:
+                    executors[key] = get_executor(
+                        executor=[kwargs["executor"], kwargs["executor_data"]],
+                        loop=loop,
+                        cancel_pool=_cancel_threadpool,
+                    )
+            except Exception as ex:
+                app_log.debug(f"Exception when cancel task {dispatch_id}:{task_id}: {ex}")
+                return task_id, False
+
+            return task_id, await _request_cancel(
+                dispatch_id, task_id, executors[key], kwargs["job_handle"]
+            )
+
+    cancel_statuses = await asyncio.gather(*map(_bounded_cancel, cancel_task_kwargs))
+    await set_cancel_results(dispatch_id, dict(cancel_statuses))
 
 
 def _get_metadata_for_nodes(dispatch_id: str, node_ids: list) -> List[Any]:
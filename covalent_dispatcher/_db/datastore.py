@@ -28,11 +28,12 @@ from alembic.config import Config
 from alembic.environment import EnvironmentContext
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists
 
-from covalent._shared_files.config import get_config
+from covalent._shared_files import metrics
+from covalent._shared_files.config import get_db_path
 
 from . import models
 
@@ -47,9 +48,10 @@ class DataStore:
         if db_URL:
             self.db_URL = db_URL
         else:
-            self.db_URL = "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
+            self.db_URL = "sqlite+pysqlite:///" + get_db_path()
 
         self.engine = create_engine(self.db_URL, **kwargs)
+        event.listen(self.engine, "before_cursor_execute", _count_statement)
         if not database_exists(self.engine.url):
             try:
                 create_database(self.engine.url)
@@ -100,10 +102,44 @@ class DataStore:
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
-        with self.Session.begin() as session:
+        with _session_duration.time(), self.Session.begin() as session:
             yield session
 
 
+_session_duration = metrics.Histogram(
+    "covalent_db_session_duration_seconds",
+    "Time DB sessions are held open, including the final commit",
+)
+
+
+def _parameter_size(value) -> int:
+    """Approximate number of bytes of bound statement parameters."""
+
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(map(_parameter_size, value))
+    if isinstance(value, dict):
+        return sum(map(_parameter_size, value.values()))
+    return 8
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    """Count a statement as a DB read or write of the dispatch being processed."""
+
+    if metrics.current_dispatch_id.get() is None:
+        return
+
+    keyword = statement.lstrip()[:6].upper()
+    if keyword == "SELECT":
+        metrics.performance_recorder.count(metrics.DB_READS)
+    elif keyword in ("INSERT", "UPDATE", "DELETE"):
+        metrics.performance_recorder.count(metrics.DB_WRITES)
+        metrics.performance_recorder.count(
+            metrics.DB_BYTES_WRITTEN, len(statement) + _parameter_size(parameters)
+        )
+
+
 class DataStoreSession:
     def __init__(self, session: Session, metadata={}):
         self.db_session = session
@@ -73,6 +73,7 @@ def _update_job_record(
     cancel_requested: bool = None,
     cancel_successful: bool = None,
     job_handle: str = None,
+    job_record: Job = None,
 ):
     """
     Update the job record in the database
@@ -83,11 +84,13 @@ def _update_job_record(
         cancel_requested: Boolean flag indicating whether the job was requested to be cancelled
         cancel_successful: Boolean indicating whether the job was cancelled successfully
         job_handle: Unique job handle returned by the execution backend
+        job_record: Job record already loaded in `session`, if any
 
     Return(s)
         None
     """
-    job_record = session.query(Job).where(Job.id == job_id).first()
+    if job_record is None:
+        job_record = session.query(Job).where(Job.id == job_id).first()
     if not job_record:
         raise MissingJobRecordError(message=f"Job {job_id} not found")
 
@@ -116,15 +119,22 @@ def update_job_records(record_kwargs_list: list):
     """
     Update job records in the database
 
+    All records are fetched with a single query and updated in one transaction.
+
     Arg(s)
         record_kwargs_list: List of keyword arguments of the fields that need to be updated in the job records
 
     Return(s)
         None
     """
+    job_ids = [entry["job_id"] for entry in record_kwargs_list]
     with workflow_db.session() as session:
+        job_records = {
+            job_record.id: job_record
+            for job_record in session.query(Job).where(Job.id.in_(job_ids)).all()
+        }
         for entry in record_kwargs_list:
-            _update_job_record(session, **entry)
+            _update_job_record(session, job_record=job_records.get(entry["job_id"]), **entry)
 
 
 def get_job_records(job_ids: List[int]) -> List[Dict]:
@@ -168,3 +178,29 @@ def to_job_ids(dispatch_id: str, task_ids: List[int]) -> List[int]:
         records = session.scalars(stmt).all()
 
         return records
+
+
+def to_job_id_map(dispatch_id: str, task_ids: List[int]) -> Dict[int, int]:
+    """
+    Map lattice task ids to their corresponding job ids in a single query
+
+    Arg(s)
+        dispatch_id: Dispatch ID of the lattice
+        task_ids: IDs of tasks in the lattice
+
+    Return(s)
+        Dictionary mapping each task id to its job id
+    """
+    with workflow_db.session() as session:
+        stmt = select(Lattice).where(Lattice.dispatch_id == dispatch_id)
+        lattice_rec = session.scalars(stmt).first()
+        if not lattice_rec:
+            raise KeyError(f"Invalid dispatch {dispatch_id}")
+
+        stmt = (
+            select(Electron.transport_graph_node_id, Electron.job_id)
+            .where(Electron.parent_lattice_id == lattice_rec.id)
+            .where(Electron.transport_graph_node_id.in_(task_ids))
+        )
+
+        return {node_id: job_id for node_id, job_id in session.execute(stmt).all()}
@@ -26,7 +26,7 @@ from sqlalchemy.orm import Session
 
 from covalent._results_manager import Result
 from covalent._shared_files import logger
-from covalent._shared_files.config import get_config
+from covalent._shared_files.config import get_results_dir
 
 from . import models
 from .datastore import workflow_db
@@ -100,7 +100,7 @@ def _lattice_data(session: Session, result: Result, electron_id: int = None) ->
         workflow_func_string = None
 
     # Store all lattice info that belongs in filenames in the results directory
-    results_dir = os.environ.get("COVALENT_DATA_DIR") or get_config("dispatcher.results_dir")
+    results_dir = os.environ.get("COVALENT_DATA_DIR") or get_results_dir()
     data_storage_path = os.path.join(results_dir, result.dispatch_id)
     for filename, data in [
         (LATTICE_FUNCTION_FILENAME, result.lattice.workflow_function),
@@ -190,8 +190,8 @@ def _electron_data(session: Session, result: Result, cancel_requested: bool = Fa
     tg = result.lattice.transport_graph
     dirty_nodes = set(tg.dirty_nodes)
     tg.dirty_nodes.clear()  # Ensure that dirty nodes list is reset once the data is updated
+    results_dir = os.environ.get("COVALENT_DATA_DIR") or get_results_dir()
     for node_id in dirty_nodes:
-        results_dir = os.environ.get("COVALENT_DATA_DIR") or get_config("dispatcher.results_dir")
         node_path = Path(os.path.join(results_dir, result.dispatch_id, f"node_{node_id}"))
 
         if not node_path.exists():
@@ -31,7 +31,7 @@ import networkx as nx
 from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from covalent._shared_files import logger
+from covalent._shared_files import logger, metrics
 from covalent._shared_files.defaults import (
     arg_prefix,
     attr_prefix,
@@ -525,6 +525,7 @@ def store_file(storage_path: str, filename: str, data: Any = None) -> None:
     if filename.endswith(".pkl"):
         with open(Path(storage_path) / filename, "wb") as f:
             cloudpickle.dump(data, f)
+            metrics.performance_recorder.count(metrics.BYTES_SERIALIZED, f.tell())
 
     elif filename.endswith(".log") or filename.endswith(".txt"):
         if data is None:
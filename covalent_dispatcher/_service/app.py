@@ -25,11 +25,16 @@ from uuid import UUID
 
 import cloudpickle as pickle
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 import covalent_dispatcher as dispatcher
 from covalent._results_manager.result import Result
 from covalent._shared_files import logger
+from covalent._shared_files.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    performance_recorder,
+    render_metrics,
+)
 
 from .._db.datastore import workflow_db
 from .._db.load import _result_from
@@ -140,9 +145,9 @@ async def get_result(
                 "status": lattice_record.status,
             }
             if not status_only:
-                output["result"] = codecs.encode(
-                    pickle.dumps(_result_from(lattice_record)), "base64"
-                ).decode()
+                result_object = _result_from(lattice_record)
+                result_object._metrics = performance_recorder.get_dispatch_metrics(dispatch_id)
+                output["result"] = codecs.encode(pickle.dumps(result_object), "base64").decode()
             return output
 
         return JSONResponse(
@@ -152,3 +157,44 @@ async def get_result(
             },
             headers={"Retry-After": "2"},
         )
+
+
+@router.get("/v1/dispatch/{dispatch_id}/metrics")
+async def get_dispatch_metrics(dispatch_id: str):
+    """
+    Get the performance metrics recorded while running a dispatch.
+
+    Args:
+        dispatch_id: Dispatch id of the workflow
+
+    Returns:
+        Per-node phase timings, DB read and write counts, and number of
+        bytes serialized for the dispatch, along with a summary in terms
+        of the benchmark performance metrics.
+    """
+
+    metrics = performance_recorder.get_dispatch_metrics(dispatch_id)
+    if metrics is None:
+        return JSONResponse(
+            status_code=404,
+            content={"message": f"No metrics were recorded for dispatch ID {dispatch_id}."},
+        )
+
+    return {
+        **metrics.model_dump(mode="json"),
+        "summary": metrics.to_performance_metrics().model_dump(mode="json"),
+    }
+
+
+@router.get("/metrics")
+async def get_metrics() -> PlainTextResponse:
+    """
+    Export operational metrics of the dispatcher in the Prometheus text format.
+
+    Returns:
+        Counters, gauges and histograms covering task latencies and tasks in
+        flight by executor, DB session durations, result webhook latency,
+        resident dispatches and the depth of the dispatch status queues.
+    """
+
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
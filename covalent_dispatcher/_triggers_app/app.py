@@ -23,6 +23,7 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from functools import lru_cache
 from inspect import signature
 
@@ -31,13 +32,22 @@ from fastapi import APIRouter, FastAPI, HTTPException, Request
 from covalent._shared_files import logger
 from covalent.triggers import BaseTrigger, available_triggers
 
+from .runtime import TriggerRuntime
+
 disable_triggers = False
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_runtime()
+
+
 router = APIRouter()
-triggers_only_app = FastAPI()
+triggers_only_app = FastAPI(lifespan=lifespan)
 
 active_triggers = {}
 
@@ -80,6 +90,20 @@ def get_threadpool():
     return ThreadPoolExecutor()
 
 
+@lru_cache
+def get_runtime():
+    return TriggerRuntime(get_threadpool())
+
+
+def shutdown_runtime():
+    """
+    Stop observing all active triggers, if any were ever started
+    """
+
+    if get_runtime.cache_info().currsize:
+        get_runtime().shutdown()
+
+
 @router.get("/triggers/status")
 def trigger_server_status(request: Request):
     if disable_triggers:
@@ -97,7 +121,7 @@ async def register_and_observe(request: Request):
     if disable_triggers:
         raise HTTPException(status_code=412, detail="Trigger endpoints are disabled as requested")
 
-    thread_pool = get_threadpool()
+    runtime = get_runtime()
 
     trigger_dict = await request.json()
 
@@ -106,10 +130,7 @@ async def register_and_observe(request: Request):
     if trigger.use_internal_funcs:
         trigger.event_loop = asyncio.get_running_loop()
 
-    if trigger.observe_blocks:
-        thread_pool.submit(trigger.observe)
-    else:
-        trigger.observe()
+    runtime.start(trigger)
 
     lattice_did = trigger.lattice_dispatch_id
 
@@ -130,11 +151,13 @@ async def stop_observe(request: Request):
     if disable_triggers:
         raise HTTPException(status_code=412, detail="Trigger endpoints are disabled as requested")
 
+    runtime = get_runtime()
+
     dispatch_ids = await request.json()
 
     for d_id in dispatch_ids:
-        for trigger in active_triggers[d_id]:
-            trigger.stop()
+        for trigger in active_triggers.pop(d_id, []):
+            runtime.stop(trigger)
             app_log.debug(f"Stopped observing on trigger(s) with lattice dispatch id: {d_id}")
 
 
@@ -0,0 +1,174 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Shared asyncio runtime on which the Triggers server observes registered triggers"""
+
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from watchdog.observers import Observer
+
+from covalent._shared_files import logger
+from covalent.triggers import BaseTrigger, DirTrigger, SQLiteTrigger, TimeTrigger
+
+app_log = logger.app_log
+log_stack_info = logger.log_stack_info
+
+
+class TriggerRuntime:
+    """
+    Observes triggers without dedicating a thread to each of them.
+
+    Time and SQLite triggers run as tasks on the server's event loop, whose timer heap
+    schedules their wake-ups, and all directory triggers share a single watchdog observer.
+    Threads from `thread_pool` are only used while a database is read or a trigger
+    action is performed. Any other trigger falls back to its own `observe()`, which is
+    run in `thread_pool` if it blocks.
+
+    Args:
+        thread_pool: Executor in which blocking calls are made
+
+    Attributes:
+        self.thread_pool: Executor in which blocking calls are made
+        self.tasks: Running asyncio task of each time or SQLite trigger, keyed by `id(trigger)`
+        self.observer: Watchdog observer shared by all directory triggers, started on first use
+    """
+
+    def __init__(self, thread_pool: ThreadPoolExecutor) -> None:
+        self.thread_pool = thread_pool
+        self.tasks: Dict[int, asyncio.Task] = {}
+        self.observer = None
+
+    def start(self, trigger: BaseTrigger) -> None:
+        """
+        Start observing a trigger, must be called from within the event loop.
+
+        Args:
+            trigger: Trigger to observe
+        """
+
+        if isinstance(trigger, TimeTrigger):
+            self._start_task(trigger, self._run_time_trigger(trigger))
+
+        elif isinstance(trigger, SQLiteTrigger):
+            self._start_task(trigger, self._run_sqlite_trigger(trigger))
+
+        elif isinstance(trigger, DirTrigger):
+            trigger.event_loop = asyncio.get_running_loop()
+            if self.observer is None:
+                self.observer = Observer()
+                self.observer.start()
+            trigger.schedule(self.observer, self.thread_pool)
+
+        elif trigger.observe_blocks:
+            self.thread_pool.submit(trigger.observe)
+
+        else:
+            trigger.observe()
+
+    def stop(self, trigger: BaseTrigger) -> None:
+        """
+        Stop observing a trigger started with `self.start()`.
+
+        Args:
+            trigger: Trigger to stop observing
+        """
+
+        if task := self.tasks.pop(id(trigger), None):
+            task.cancel()
+
+        elif isinstance(trigger, DirTrigger):
+            trigger.unschedule()
+
+        elif not isinstance(trigger, (TimeTrigger, SQLiteTrigger)):
+            trigger.stop()
+
+    def shutdown(self) -> None:
+        """
+        Stop observing all triggers and stop the shared observer.
+        """
+
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def _start_task(self, trigger: BaseTrigger, coro) -> None:
+        task = asyncio.create_task(coro)
+        self.tasks[id(trigger)] = task
+
+        def _on_done(task: asyncio.Task) -> None:
+            if self.tasks.get(id(trigger)) is task:
+                del self.tasks[id(trigger)]
+            if not task.cancelled() and (exc := task.exception()):
+                app_log.exception(
+                    f"Trigger for dispatch {trigger.lattice_dispatch_id} stopped observing",
+                    exc_info=exc,
+                )
+
+        task.add_done_callback(_on_done)
+
+    async def _perform_trigger(self, trigger: BaseTrigger) -> None:
+        # The trigger action waits on coroutines submitted to this
+        # event loop, so it has to be performed from another thread
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.thread_pool, trigger.trigger)
+
+    async def _run_time_trigger(self, trigger: TimeTrigger) -> None:
+        while True:
+            await asyncio.sleep(trigger.time_gap)
+            await self._perform_trigger(trigger)
+
+    async def _run_sqlite_trigger(self, trigger: SQLiteTrigger) -> None:
+        # Database reads happen in the thread pool but never
+        # concurrently, so the connection can be shared across threads
+        connection = sqlite3.connect(trigger.db_path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        cursor = connection.cursor()
+
+        poll_future = None
+        poll_interval = trigger.poll_interval
+        try:
+            while True:
+                poll_future = self.thread_pool.submit(trigger.poll, cursor)
+                try:
+                    found_rows = await asyncio.wrap_future(poll_future)
+                except sqlite3.OperationalError:
+                    await asyncio.sleep(trigger.poll_interval)
+                    continue
+
+                should_trigger, poll_interval = trigger.record_poll(found_rows, poll_interval)
+                if should_trigger:
+                    await self._perform_trigger(trigger)
+
+                await asyncio.sleep(poll_interval)
+        finally:
+            # A read still running in the pool must finish before the connection is closed
+            if poll_future is None:
+                connection.close()
+            else:
+                poll_future.add_done_callback(lambda _: connection.close())
@@ -298,7 +298,9 @@ class Electrons:
             return None
         qdb_path = _path_to_qelectron_db(dispatch_id=str(dispatch_id))
         return len(
-            Database(qdb_path).get_circuit_ids(dispatch_id=str(dispatch_id), node_id=node_id)
+            Database(qdb_path, readonly=True).get_circuit_ids(
+                dispatch_id=str(dispatch_id), node_id=node_id
+            )
         )
 
     def get_avg_quantum_calls(self, dispatch_id, node_id, is_qa_electron: bool):
@@ -345,4 +347,4 @@ def _path_to_qelectron_db(dispatch_id: str) -> Path:
 def _qelectron_get_db(dispatch_id: str, node_id: int) -> dict:
     """Return the QElectron jobs dictionary for a given node."""
     qdb_path = _path_to_qelectron_db(dispatch_id)
-    return Database(qdb_path).get_db(dispatch_id=dispatch_id, node_id=node_id)
+    return Database(qdb_path, readonly=True).get_db(dispatch_id=dispatch_id, node_id=node_id)
@@ -127,3 +127,10 @@ class ElectronFileOutput(str, Enum):
     ERROR = "error"
     INFO = "info"
     INPUTS = "inputs"
+
+
+class ElectronStream(str, Enum):
+    """Electron output stream"""
+
+    STDOUT = "stdout"
+    STDERR = "stderr"
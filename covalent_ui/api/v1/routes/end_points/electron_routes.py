@@ -20,6 +20,7 @@
 
 """Electrons Route"""
 
+import os
 import uuid
 from typing import List, Optional
 
@@ -28,6 +29,7 @@ from sqlalchemy.orm import Session
 
 import covalent_ui.api.v1.database.config.db as db
 from covalent._results_manager.results_manager import get_result
+from covalent.executor.utils.streams import get_task_stream_paths, read_stream_tail
 from covalent_dispatcher._core.execution import _get_task_inputs as get_task_inputs
 from covalent_ui.api.v1.data_layer.electron_dal import Electrons
 from covalent_ui.api.v1.models.electrons_model import (
@@ -35,6 +37,7 @@ from covalent_ui.api.v1.models.electrons_model import (
     ElectronFileOutput,
     ElectronFileResponse,
     ElectronResponse,
+    ElectronStream,
     Job,
     JobDetails,
     JobDetailsResponse,
@@ -193,6 +196,50 @@ def get_electron_file(dispatch_id: uuid.UUID, electron_id: int, name: ElectronFi
             )
 
 
+@routes.get("/{dispatch_id}/electron/{electron_id}/tail/{name}")
+def get_electron_stream_tail(
+    dispatch_id: uuid.UUID,
+    electron_id: int,
+    name: ElectronStream,
+    max_bytes: int = Query(64 * 1024, gt=0),
+):
+    """
+    Get the end of an electron's stdout or stderr
+    Args:
+        dispatch_id: Dispatch id of lattice/sublattice
+        electron_id: Transport graph node id of a electron
+        name: stdout or stderr
+        max_bytes: Maximum number of bytes to return
+    Returns:
+        Returns the latest output of a running electron, or the end of the
+        stored output once it has completed
+    """
+
+    stdout_path, stderr_path = get_task_stream_paths(str(dispatch_id), electron_id)
+    spool_path = stdout_path if name == ElectronStream.STDOUT else stderr_path
+    if os.path.exists(spool_path):
+        return ElectronFileResponse(data=read_stream_tail(spool_path, max_bytes))
+
+    with Session(db.engine) as session:
+        electron = Electrons(session)
+        result = electron.get_electrons_id(dispatch_id, electron_id)
+        if result is None:
+            raise HTTPException(
+                status_code=400,
+                detail=[
+                    {
+                        "loc": ["path", "dispatch_id"],
+                        "msg": f"Dispatch ID {dispatch_id} or Electron ID does not exist",
+                        "type": None,
+                    }
+                ],
+            )
+        handler = FileHandler(result["storage_path"])
+        response = handler.read_from_text(result[f"{name.value}_filename"]) or ""
+        tail = response.encode("utf-8")[-max_bytes:].decode("utf-8", errors="replace")
+        return ElectronFileResponse(data=tail)
+
+
 @routes.get("/{dispatch_id}/electron/{electron_id}/jobs", response_model=List[Job])
 def get_electron_jobs(
     dispatch_id: uuid.UUID,
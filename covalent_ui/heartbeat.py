@@ -90,6 +90,9 @@ async def cancel_all_with_status(status: Status) -> List[str]:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from covalent_dispatcher._triggers_app.app import shutdown_runtime
+    from covalent_ui import result_webhook
+
     heartbeat = Heartbeat()
     asyncio.create_task(heartbeat.start())
 
@@ -103,4 +106,6 @@ async def lifespan(app: FastAPI):
     ]:
         await cancel_all_with_status(status)
 
+    await result_webhook.close()
+    shutdown_runtime()
     Heartbeat.stop()
@@ -18,19 +18,167 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import asyncio
+import atexit
 import json
+import os
+import threading
+from typing import Dict, Optional
 
 import aiohttp
-import requests
 
 import covalent_ui.app as ui_server
 from covalent._results_manager import Result
 from covalent._shared_files import logger
+from covalent._shared_files.metrics import Histogram
 from covalent._shared_files.utils import get_ui_url
 from covalent_dispatcher._db.dispatchdb import encode_dict, extract_graph, extract_metadata
 
 app_log = logger.app_log
 
+# Window (in seconds) during which status changes of the same dispatch are
+# merged into a single message
+UPDATE_COALESCE_WINDOW = 0.05
+
+# Number of distinct dispatches with a pending update beyond which
+# `send_update` waits for the UI server to catch up
+MAX_PENDING_UPDATES = 1000
+
+# Maximum number of simultaneous connections to the UI server
+MAX_CONNECTIONS = 16
+
+# Timeout (in seconds) for connecting to the UI server and for each read of its
+# response. Waiting for a pooled connection does not count towards it.
+REQUEST_TIMEOUT = 1
+
+# Timeout (in seconds) for a draw request, which sends the whole graph
+DRAW_REQUEST_TIMEOUT = 30
+
+_send_latency = Histogram(
+    "covalent_webhook_send_latency_seconds",
+    "Time taken to deliver result updates to the UI server",
+)
+
+
+class _UpdateCoalescer:
+    """Merges result updates per dispatch and flushes them to the UI server.
+
+    Only the latest update for each dispatch is kept; the UI server reads the
+    rest of the result from the database. A single flush task drains the
+    pending updates every `window` seconds over a pooled `aiohttp` session.
+    Producers are held back once `max_pending` distinct dispatches are waiting
+    to be sent.
+    """
+
+    def __init__(
+        self,
+        window: float = UPDATE_COALESCE_WINDOW,
+        max_pending: int = MAX_PENDING_UPDATES,
+        max_connections: int = MAX_CONNECTIONS,
+    ):
+        self.window = window
+        self.max_pending = max_pending
+        self.max_connections = max_connections
+
+        self._loop = asyncio.get_running_loop()
+        self._pending: Dict[str, dict] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flushed = asyncio.Event()
+
+        self.updates_received = 0
+        self.updates_sent = 0
+        self.updates_dropped = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def submit(self, dispatch_id: str, update: dict) -> None:
+        """Queue an update, replacing any unsent update for the same dispatch."""
+
+        while dispatch_id not in self._pending and len(self._pending) >= self.max_pending:
+            self._flushed.clear()
+            await self._flushed.wait()
+
+        self._pending[dispatch_id] = update
+        self.updates_received += 1
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.window)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send all pending updates to the UI server."""
+
+        updates = list(self._pending.values())
+        self._pending.clear()
+        try:
+            results = await asyncio.gather(
+                *(self._post(update) for update in updates), return_exceptions=True
+            )
+        finally:
+            self._flushed.set()
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.updates_dropped += len(errors)
+            app_log.warning(
+                f"Dropped {len(errors)} of {len(updates)} result updates which could not be "
+                f"sent to the UI server: {errors[0]!r}"
+            )
+
+    async def _post(self, update: dict) -> None:
+        session = self._get_session()
+        with _send_latency.time():
+            async with session.post(get_ui_url(ui_server.WEBHOOK_PATH), json=update) as resp:
+                status = resp.status
+                text = await resp.text()
+        app_log.debug(f"send_update received response {status}, {text}")
+        self.updates_sent += 1
+
+    async def close(self) -> None:
+        """Flush outstanding updates and release pooled connections."""
+
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        if self._pending:
+            await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_coalescer: Optional[_UpdateCoalescer] = None
+
+
+def _get_coalescer() -> _UpdateCoalescer:
+    """Get the update coalescer bound to the running event loop."""
+
+    global _coalescer
+    if _coalescer is None or _coalescer._loop is not asyncio.get_running_loop():
+        _coalescer = _UpdateCoalescer()
+    return _coalescer
+
+
+async def close() -> None:
+    """Flush pending result updates and close the shared UI session."""
+
+    global _coalescer
+    if _coalescer is not None and _coalescer._loop is asyncio.get_running_loop():
+        await _coalescer.close()
+    _coalescer = None
+
+
 # UI server webhook for result updates
 
 
@@ -40,34 +188,70 @@ async def send_update(result: Result) -> None:
     updated result to have been saved to the results directory prior to the
     update.
 
+    Updates are coalesced per dispatch and delivered asynchronously over a
+    shared connection pool.
+
     Args: result: The updated result object.
 
     Returns: None
     """
 
-    result_update = json.dumps(
-        {
-            "event": "result-update",
-            "result": {
-                "dispatch_id": result.dispatch_id,
-                "results_dir": result.results_dir,
-                "status": result.status.STATUS,
-            },
+    result_update = {
+        "event": "result-update",
+        "result": {
+            "dispatch_id": result.dispatch_id,
+            "results_dir": result.results_dir,
+            "status": result.status.STATUS,
         },
-    )
+    }
+    await _get_coalescer().submit(result.dispatch_id, result_update)
+
+
+# Draw requests are sent from synchronous code, so their session lives on an
+# event loop run by a background thread of the process which sends them
+_draw_loop: Optional[asyncio.AbstractEventLoop] = None
+_draw_loop_pid: Optional[int] = None
+_draw_session: Optional[aiohttp.ClientSession] = None
+_draw_lock = threading.Lock()
+
+
+def _get_draw_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop on which draw requests are sent, starting it if needed."""
+
+    global _draw_loop, _draw_loop_pid, _draw_session
+    with _draw_lock:
+        if _draw_loop is None or _draw_loop_pid != os.getpid():
+            _draw_loop = asyncio.new_event_loop()
+            _draw_loop_pid = os.getpid()
+            _draw_session = None
+            threading.Thread(target=_draw_loop.run_forever, daemon=True).start()
+        return _draw_loop
+
+
+async def _post_draw_request(draw_request: str) -> None:
+    global _draw_session
+    if _draw_session is None or _draw_session.closed:
+        timeout = aiohttp.ClientTimeout(total=DRAW_REQUEST_TIMEOUT, sock_connect=REQUEST_TIMEOUT)
+        _draw_session = aiohttp.ClientSession(timeout=timeout)
+
+    async with _draw_session.post(
+        get_ui_url("/api/draw"),
+        data=draw_request,
+        headers={"Content-Type": "application/json"},
+        raise_for_status=True,
+    ):
+        pass
+
+
+@atexit.register
+def _close_draw_session() -> None:
+    if _draw_session is None or _draw_loop_pid != os.getpid():
+        return
+    future = asyncio.run_coroutine_threadsafe(_draw_session.close(), _draw_loop)
     try:
-        # ignore response
-        timeout = aiohttp.ClientTimeout(total=1)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                get_ui_url(ui_server.WEBHOOK_PATH), json=json.loads(result_update)
-            ) as resp:
-                status = resp.status
-                text = await resp.text()
-                app_log.debug(f"send_update received response {status}, {text}")
-    except Exception as ex:
-        # catch all requests-related exceptions
-        app_log.debug(f"Unable to send result update to UI server: {ex}")
+        future.result(timeout=REQUEST_TIMEOUT)
+    except Exception:
+        pass
 
 
 def send_draw_request(lattice) -> None:
@@ -75,6 +259,9 @@ def send_draw_request(lattice) -> None:
     Sends a lattice draw request to UI server along with all necessary lattice
     graph data.
 
+    The request is sent over a long-lived `aiohttp` session, and this call
+    waits until it has been delivered.
+
     Args: lattice: The lattice to draw with a pre-built graph.
 
     Returns: None
@@ -101,10 +288,10 @@ def send_draw_request(lattice) -> None:
         }
     )
 
+    future = asyncio.run_coroutine_threadsafe(_post_draw_request(draw_request), _get_draw_loop())
     try:
-        response = requests.post(get_ui_url("/api/draw"), data=draw_request)
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as ex:
+        future.result()
+    except aiohttp.ClientResponseError as ex:
         app_log.error(ex)
-    except requests.exceptions.RequestException:
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         app_log.error("Connection failure. Please check Covalent server is running.")
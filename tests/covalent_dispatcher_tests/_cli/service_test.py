@@ -651,7 +651,7 @@ def test_cluster_size(mocker, workers):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_size_mock = mocker.patch(
         "covalent_dispatcher._cli.service._get_cluster_size", return_value=workers
     )
@@ -687,7 +687,7 @@ def test_cluster_info(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_info_cli_mock = mocker.patch("covalent_dispatcher._cli.service._get_cluster_info")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
     json_dumps_mock = mocker.patch("covalent_dispatcher._cli.service.json.dumps")
@@ -719,7 +719,7 @@ def test_cluster_status_cli(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_status_cli_mock = mocker.patch("covalent_dispatcher._cli.service._get_cluster_status")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
     json_dumps_mock = mocker.patch("covalent_dispatcher._cli.service.json.dumps")
@@ -753,7 +753,7 @@ def test_cluster_address_cli(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_cli_mock = mocker.patch("covalent_dispatcher._cli.service._get_cluster_address")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
     json_dumps_mock = mocker.patch("covalent_dispatcher._cli.service.json.dumps")
@@ -788,7 +788,7 @@ def test_cluster_logs_cli(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_cli_mock = mocker.patch("covalent_dispatcher._cli.service._get_cluster_logs")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
     json_dumps_mock = mocker.patch("covalent_dispatcher._cli.service.json.dumps")
@@ -823,7 +823,7 @@ def test_cluster_restart_cli(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_cli_mock = mocker.patch("covalent_dispatcher._cli.service._cluster_restart")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
 
@@ -857,7 +857,7 @@ def test_cluster_scale_cli(mocker):
         "covalent_dispatcher._cli.service._is_server_running", return_value=True
     )
     get_config_mock = mocker.patch("covalent_dispatcher._cli.service.get_config")
-    unparse_addr_mock = mocker.patch("covalent_dispatcher._cli.service.unparse_address")
+    unparse_addr_mock = mocker.patch("distributed.comm.unparse_address")
     cluster_cli_mock = mocker.patch("covalent_dispatcher._cli.service._cluster_scale")
     click_echo_mock = mocker.patch("covalent_dispatcher._cli.service.click.echo")
 
@@ -34,14 +34,17 @@ from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
 from covalent_dispatcher._core.data_manager import (
     _dispatch_status_queues,
+    _evict_idle_dispatches,
     _get_result_object_from_new_lattice,
     _get_result_object_from_old_result,
     _handle_built_sublattice,
     _register_result_object,
     _registered_dispatches,
     _update_parent_electron,
+    activate_dispatch,
     finalize_dispatch,
     generate_node_result,
+    get_registry_stats,
     get_result_object,
     get_status_queue,
     initialize_result_object,
@@ -91,6 +94,31 @@ def get_mock_result() -> Result:
     return result_object
 
 
+@pytest.mark.parametrize("exported", [True, False])
+def test_generate_node_result_qelectron_data(mocker, exported):
+    """Test that qelectron data copied directly by the task is detected."""
+
+    qelectron_db_exists_mock = mocker.patch(
+        "covalent_dispatcher._core.data_manager.qelectron_db_exists", return_value=exported
+    )
+    write_qelectron_db_mock = mocker.patch(
+        "covalent_dispatcher._core.data_manager.write_qelectron_db"
+    )
+
+    node_result = generate_node_result(
+        dispatch_id="mock-dispatch-id",
+        node_id=0,
+        node_name="mock_node_name",
+        status=RESULT_STATUS.COMPLETED,
+        stdout="hello\n",
+    )
+
+    qelectron_db_exists_mock.assert_called_with("mock-dispatch-id", 0)
+    write_qelectron_db_mock.assert_not_called()
+    assert node_result["qelectron_data_exists"] is exported
+    assert node_result["stdout"] == "hello\n"
+
+
 @pytest.mark.asyncio
 async def test_handle_built_sublattice(mocker):
     """Test the handle_built_sublattice function."""
@@ -436,7 +464,63 @@ def test_register_result_object(mocker):
     dispatch_id = result_object.dispatch_id
     _register_result_object(result_object)
     assert _registered_dispatches[dispatch_id] is result_object
-    del _registered_dispatches[dispatch_id]
+    finalize_dispatch(dispatch_id)
+
+
+def test_idle_dispatch_eviction_and_rehydration(mocker):
+    """
+    Test that idle dispatches beyond the budget are spilled and reloaded on access
+    """
+    mocker.patch("covalent_dispatcher._core.data_manager._max_idle_dispatches", 1)
+    result_1 = get_mock_result()
+    result_1._dispatch_id = "dispatch_1"
+    result_1._electron_id = 5
+    result_2 = get_mock_result()
+    result_2._dispatch_id = "dispatch_2"
+
+    _register_result_object(result_1)
+    _register_result_object(result_2)
+
+    assert "dispatch_1" not in _registered_dispatches
+    assert "dispatch_1" not in _dispatch_status_queues
+    assert get_registry_stats()["spilled_dispatches"] == 1
+
+    reloaded = get_mock_result()
+    mock_load = mocker.patch(
+        "covalent_dispatcher._core.data_manager.load.get_result_object_from_storage",
+        return_value=reloaded,
+    )
+    assert get_result_object("dispatch_1") is reloaded
+    mock_load.assert_called_once_with("dispatch_1")
+    assert reloaded._electron_id == 5
+    assert "dispatch_1" in _dispatch_status_queues
+    assert "dispatch_2" not in _registered_dispatches
+
+    stats = get_registry_stats()
+    assert stats["resident_dispatches"] == 1
+    assert stats["idle_dispatches"] == 2
+    assert stats["rehydrations"] >= 1
+
+    finalize_dispatch("dispatch_1")
+    finalize_dispatch("dispatch_2")
+    assert get_registry_stats()["idle_dispatches"] == 0
+
+
+def test_activate_dispatch_pins_result_object(mocker):
+    """
+    Test that running dispatches are never evicted
+    """
+    mocker.patch("covalent_dispatcher._core.data_manager._max_idle_dispatches", 0)
+    result_object = get_mock_result()
+    dispatch_id = result_object.dispatch_id
+    _registered_dispatches[dispatch_id] = result_object
+    activate_dispatch(dispatch_id)
+
+    _evict_idle_dispatches()
+
+    assert get_result_object(dispatch_id) is result_object
+    assert get_registry_stats()["running_dispatches"] == 1
+    finalize_dispatch(dispatch_id)
 
 
 def test_unregister_result_object(mocker):
@@ -462,6 +546,26 @@ def test_get_status_queue():
     assert get_status_queue(dispatch_id) is q
 
 
+def test_get_status_queue_rehydrates_spilled_dispatch(mocker):
+    """
+    Test that the status queue of a spilled dispatch is recreated along with its result object
+    """
+    mocker.patch("covalent_dispatcher._core.data_manager._max_idle_dispatches", 0)
+    result_object = get_mock_result()
+    dispatch_id = result_object.dispatch_id
+    _register_result_object(result_object)
+    assert dispatch_id not in _dispatch_status_queues
+
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.load.get_result_object_from_storage",
+        return_value=result_object,
+    )
+    assert get_status_queue(dispatch_id) is _dispatch_status_queues[dispatch_id]
+    assert get_result_object(dispatch_id) is result_object
+    assert get_registry_stats()["running_dispatches"] == 1
+    finalize_dispatch(dispatch_id)
+
+
 @pytest.mark.asyncio
 async def test_persist_result(mocker):
     """
@@ -26,6 +26,7 @@ from covalent_dispatcher._core.data_modules.job_manager import (
     get_jobs_metadata,
     set_cancel_requested,
     set_cancel_result,
+    set_cancel_results,
     set_job_handle,
 )
 
@@ -117,3 +118,23 @@ async def test_set_cancel_result(cancel_requested, mocker):
     )
     await set_cancel_result("dispatch", 0, cancel_status=cancel_requested)
     mock_update.assert_called_with([{"job_id": 1, "cancel_successful": cancel_requested}])
+
+
+@pytest.mark.asyncio
+async def test_set_cancel_results(mocker):
+    """
+    Test recording the outcome of several cancellations at once
+    """
+    mock_to_job_id_map = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.to_job_id_map",
+        return_value={0: 1, 1: 2},
+    )
+    mock_update = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.update_job_records"
+    )
+    await set_cancel_results("dispatch", {0: True, 1: False})
+
+    mock_to_job_id_map.assert_called_once_with("dispatch", [0, 1])
+    mock_update.assert_called_once_with(
+        [{"job_id": 1, "cancel_successful": True}, {"job_id": 2, "cancel_successful": False}]
+    )
@@ -22,7 +22,7 @@
 Tests for the core functionality of the dispatcher.
 """
 
-
+import asyncio
 from typing import Dict, List
 from unittest.mock import AsyncMock, call
 
@@ -43,7 +43,9 @@ from covalent_dispatcher._core.dispatcher import (
     _plan_workflow,
     _run_planned_workflow,
     _submit_task,
+    _task_input_index,
     cancel_dispatch,
+    get_task_input_index_stats,
     run_dispatch,
     run_workflow,
 )
@@ -201,6 +203,36 @@ def test_get_abstract_task_inputs():
     assert task_inputs["args"] == [0, 2]
 
 
+def test_get_abstract_task_inputs_index_cache():
+    """Test that task inputs of a dispatch are indexed once and reused"""
+
+    result_object = get_mock_result()
+    result_object._dispatch_id = "index_cache_dispatch"
+    tg = result_object.lattice.transport_graph
+
+    before = get_task_input_index_stats()
+    first = [
+        _get_abstract_task_inputs(n, tg.get_node_value(n, "name"), result_object)
+        for n in tg._graph.nodes
+    ]
+    second = [
+        _get_abstract_task_inputs(n, tg.get_node_value(n, "name"), result_object)
+        for n in tg._graph.nodes
+    ]
+    after = get_task_input_index_stats()
+
+    assert first == second
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2 * len(tg._graph.nodes) - 1
+    assert "index_cache_dispatch" in _task_input_index
+
+    # A different graph under the same dispatch id is re-indexed
+    other_result = get_mock_result()
+    other_result._dispatch_id = "index_cache_dispatch"
+    _get_abstract_task_inputs(0, "", other_result)
+    assert get_task_input_index_stats()["misses"] - after["misses"] == 1
+
+
 @pytest.mark.asyncio
 async def test_handle_completed_node(mocker):
     """Unit test for completed node handler"""
@@ -556,6 +588,52 @@ async def test_cancel_dispatch_with_task_ids(mocker):
     assert mock_app_log.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_cancel_dispatch_concurrent_sublattices(mocker):
+    """Test that sublattices are cancelled concurrently with the tasks of the dispatch,
+    at most `dispatcher.cancel_fanout` at a time"""
+    res = get_mock_result()
+    res._initialize_nodes()
+    tg = res.lattice.transport_graph
+    node_ids = list(tg._graph.nodes)
+    for node_id in node_ids:
+        tg.set_node_value(node_id, "sub_dispatch_id", f"sub_{node_id}")
+
+    sub_results = {}
+    for node_id in node_ids:
+        sub_res = get_mock_result()
+        sub_res._dispatch_id = f"sub_{node_id}"
+        sub_res._initialize_nodes()
+        sub_results[sub_res._dispatch_id] = sub_res
+
+    def mock_get_result_object(dispatch_id):
+        return res if dispatch_id == res._dispatch_id else sub_results[dispatch_id]
+
+    in_flight = []
+    max_in_flight = 0
+
+    async def mock_cancel_tasks(dispatch_id, task_ids):
+        nonlocal max_in_flight
+        in_flight.append(dispatch_id)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(dispatch_id)
+
+    mocker.patch("covalent_dispatcher._core.dispatcher.set_cancel_requested")
+    mocker.patch("covalent_dispatcher._core.dispatcher.get_config", return_value=2)
+    mock_runner = mocker.patch("covalent_dispatcher._core.dispatcher.runner")
+    mock_runner.cancel_tasks = AsyncMock(side_effect=mock_cancel_tasks)
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.get_result_object", mock_get_result_object
+    )
+
+    await cancel_dispatch(res._dispatch_id)
+
+    assert len(node_ids) > 2
+    assert mock_runner.cancel_tasks.await_count == len(node_ids) + 1
+    assert max_in_flight == 3
+
+
 @pytest.mark.asyncio
 async def test_submit_task(mocker):
     """Test the submit task function."""
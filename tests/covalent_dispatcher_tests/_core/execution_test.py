@@ -24,12 +24,15 @@ Integration tests for the dispatcher, runner, and result modules
 
 import asyncio
 from typing import Dict, List
+from unittest.mock import MagicMock
 
 import pytest
 
 import covalent as ct
 from covalent._results_manager import Result
+from covalent._shared_files.metrics import render_metrics
 from covalent._workflow.lattice import Lattice
+from covalent_dispatcher._core import data_manager
 from covalent_dispatcher._core.dispatcher import run_workflow
 from covalent_dispatcher._core.execution import _get_task_inputs
 from covalent_dispatcher._db import update
@@ -429,3 +432,71 @@ async def test_run_workflow_with_failed_postprocess(test_db, mocker):
 
     assert result_object.status == Result.RUNNING
     assert mock_run_abstract_task.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_exports_metrics(mocker):
+    """Scrape the dispatcher metrics while running a wide workflow"""
+
+    num_tasks = 50
+
+    @ct.electron(executor="local")
+    def task(x):
+        return x
+
+    @ct.lattice
+    def wide_workflow(n):
+        return [task(i) for i in range(n)]
+
+    wide_workflow.build_graph(n=num_tasks)
+    received_workflow = Lattice.deserialize_from_json(wide_workflow.serialize_to_json())
+    result_object = Result(received_workflow, "wide_workflow")
+    result_object._initialize_nodes()
+
+    async def execute(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return ct.TransportableObject(0), "", "", Result.COMPLETED
+
+    mock_executor = MagicMock()
+    mock_executor._execute = execute
+    mocker.patch(
+        "covalent_dispatcher._core.runner._executor_manager.get_executor",
+        return_value=mock_executor,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.runner.executor_proxy._get_cancel_requested",
+        return_value=False,
+    )
+    mocker.patch("covalent_dispatcher._core.runner.executor_proxy.watch")
+    mocker.patch("covalent_dispatcher._core.data_manager.update")
+    mocker.patch("covalent_dispatcher._core.data_manager.upsert")
+    mocker.patch("covalent_dispatcher._core.dispatcher.result_webhook.send_update")
+    data_manager._register_result_object(result_object)
+
+    scrapes = []
+
+    async def scrape():
+        while True:
+            scrapes.append(render_metrics())
+            await asyncio.sleep(0.01)
+
+    def sample(text, name):
+        return sum(
+            float(line.rsplit(" ", 1)[1])
+            for line in text.splitlines()
+            if line.startswith(name + "{") or line.startswith(name + " ")
+        )
+
+    tasks_before = sample(render_metrics(), "covalent_task_latency_seconds_count")
+    scraper = asyncio.create_task(scrape())
+    result_object = await run_workflow(result_object)
+    scraper.cancel()
+
+    assert not result_object._task_failed
+    assert max(sample(text, "covalent_tasks_in_flight") for text in scrapes) > 1
+    assert max(sample(text, "covalent_resident_dispatches") for text in scrapes) >= 1
+
+    text = render_metrics()
+    assert sample(text, "covalent_tasks_in_flight") == 0
+    assert sample(text, "covalent_task_latency_seconds_count") - tasks_before >= num_tasks
+    assert 'covalent_tasks_total{executor="local",status="COMPLETED"}' in text
@@ -22,7 +22,7 @@
 Tests for the core functionality of the runner.
 """
 
-
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -31,11 +31,15 @@ from mock import call
 
 import covalent as ct
 from covalent._results_manager import Result
+from covalent._shared_files import metrics
+from covalent._shared_files.metrics import MetricsRecorder
+from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
 from covalent_dispatcher._core.runner import (
-    _cancel_task,
+    _clear_rehydrated_deps,
     _gather_deps,
     _get_metadata_for_nodes,
+    _rehydrated_deps,
     _run_abstract_task,
     _run_task,
     cancel_tasks,
@@ -125,6 +129,37 @@ def test_gather_deps():
     assert len(after) == 1
 
 
+def test_gather_deps_shares_unchanged_deps():
+    """Test that nodes with identical deps share the rehydrated deps"""
+
+    @ct.electron(deps_pip=ct.DepsPip(["pandas"]), call_before=[ct.DepsCall(print, ["x"])])
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x):
+        return task(task(x))
+
+    workflow.build_graph(5)
+
+    received_workflow = Lattice.deserialize_from_json(workflow.serialize_to_json())
+    result_object = Result(received_workflow, "asdf")
+
+    before_0, _ = _gather_deps(result_object, 0)
+    before_2, _ = _gather_deps(result_object, 2)
+    assert before_0 == before_2
+    assert all(dep_0 is dep_2 for dep_0, dep_2 in zip(before_0, before_2))
+    assert before_0[0][1].get_deserialized() == [["pandas"], ""]
+
+    # Rehydrated deps are only held until the dispatch is cleared.
+    _clear_rehydrated_deps("asdf")
+    before_0_again, _ = _gather_deps(result_object, 0)
+    assert before_0_again == before_0
+    assert before_0_again[0] is not before_0[0]
+    _clear_rehydrated_deps("asdf")
+    assert "asdf" not in _rehydrated_deps
+
+
 @pytest.mark.asyncio
 async def test_run_abstract_task_exception_handling(mocker):
     """Test that exceptions from resolving abstract inputs are handled"""
@@ -243,66 +278,159 @@ async def test_run_task_runtime_exception_handling(mocker):
 
 
 @pytest.mark.asyncio
-async def test__cancel_task(mocker):
-    """
-    Test module private _cancel_task method
-    """
-    mock_executor = AsyncMock()
-    mock_executor.from_dict = MagicMock()
-    mock_executor._init_runtime = MagicMock()
-    mock_executor._cancel = AsyncMock()
+@pytest.mark.parametrize("exhaustive_postprocess", ["true", "false"])
+async def test_run_task_postprocess_node(mocker, exhaustive_postprocess):
+    """Test that the postprocess node runs through the runner's wrapping of tasks"""
+    from covalent._shared_files.config import get_config
+    from covalent._workflow.transport import TransportableObject
+    from covalent_dispatcher._core.dispatcher import _get_abstract_task_inputs
+    from covalent_dispatcher._core.runner import _get_task_input_values
 
-    mock_app_log = mocker.patch("covalent_dispatcher._core.runner.app_log.debug")
-    get_executor_mock = mocker.patch(
-        "covalent_dispatcher._core.runner.get_executor", return_value=mock_executor
+    mocker.patch(
+        "covalent._workflow.lattice.get_config",
+        side_effect=lambda key: exhaustive_postprocess
+        if key == "sdk.exhaustive_postprocess"
+        else get_config(key),
     )
-    mock_set_cancel_result = mocker.patch("covalent_dispatcher._core.runner.set_cancel_result")
 
-    dispatch_id = "abcd"
-    task_id = 0
-    executor = "mock_executor"
-    executor_data = {}
-    job_handle = "42"
+    @ct.electron
+    def task(x):
+        return x
 
-    task_metadata = {"dispatch_id": dispatch_id, "node_id": task_id}
+    @ct.lattice
+    def pipeline(x):
+        a = task(x)
+        b = task(a)
+        return {"a": [a, 1], "b": b}
 
-    await _cancel_task(dispatch_id, task_id, executor, executor_data, job_handle)
+    pipeline.build_graph(x=2)
+    received_workflow = Lattice.deserialize_from_json(pipeline.serialize_to_json())
+    result_object = Result(received_workflow, "pipeline_workflow")
+    result_object._initialize_nodes()
 
-    assert mock_app_log.call_count == 2
-    get_executor_mock.assert_called_once()
-    mock_executor._cancel.assert_called_with(task_metadata, json.loads(job_handle))
-    mock_set_cancel_result.assert_called()
+    tg = result_object.lattice.transport_graph
+    for node_id in tg._graph.nodes:
+        name = tg.get_node_value(node_id, "name")
+        if name.startswith("task"):
+            tg.set_node_value(node_id, "output", TransportableObject(2))
+        elif name.startswith(":parameter:"):
+            tg.set_node_value(node_id, "output", tg.get_node_value(node_id, "value"))
+        elif name.startswith(":postprocess:"):
+            pp_node_id = node_id
+
+    abstract_inputs = _get_abstract_task_inputs(pp_node_id, "postprocess", result_object)
+    input_values = _get_task_input_values(result_object, abstract_inputs)
+    inputs = {
+        "args": [input_values[node_id] for node_id in abstract_inputs["args"]],
+        "kwargs": {k: input_values[v] for k, v in abstract_inputs["kwargs"].items()},
+    }
+
+    async def execute(function, args, kwargs, **_):
+        return function(*args, **kwargs), "", "", RESULT_STATUS.COMPLETED
+
+    mock_executor = MagicMock()
+    mock_executor._execute = execute
+    mocker.patch(
+        "covalent_dispatcher._core.runner._executor_manager.get_executor",
+        return_value=mock_executor,
+    )
+    mocker.patch("covalent_dispatcher._core.runner.executor_proxy.watch", AsyncMock())
+    mocker.patch(
+        "covalent_dispatcher._core.runner.get_qelectron_db_dir", return_value=TEST_RESULTS_DIR
+    )
+
+    node_result = await _run_task(
+        result_object=result_object,
+        node_id=pp_node_id,
+        inputs=inputs,
+        serialized_callable=tg.get_node_value(pp_node_id, "function"),
+        executor=["local", {}],
+        call_before=[],
+        call_after=[],
+        node_name="postprocess",
+    )
+
+    assert node_result["status"] == RESULT_STATUS.COMPLETED, node_result.get("error")
+    assert node_result["output"].get_deserialized() == {"a": [2, 1], "b": 2}
 
 
 @pytest.mark.asyncio
-async def test__cancel_task_exception(mocker):
-    """
-    Test exception raised in module private _cancel task exception
-    """
-    mock_executor = AsyncMock()
-    mock_executor.from_dict = MagicMock()
-    mock_executor._init_runtime = MagicMock()
-    mock_executor._cancel = AsyncMock(side_effect=Exception("cancel"))
+async def test_run_task_deserializes_inputs(mocker):
+    """Test that tasks receive their inputs deserialized along with call_before return values"""
+    from covalent._workflow.transport import TransportableObject
+
+    def task(x, y, files):
+        return x + y, files
+
+    call_before = [
+        (
+            TransportableObject(lambda: "file"),
+            TransportableObject([]),
+            TransportableObject({}),
+            "files",
+        )
+    ]
 
-    mock_app_log = mocker.patch("covalent_dispatcher._core.runner.app_log.debug")
-    get_executor_mock = mocker.patch(
-        "covalent_dispatcher._core.runner.get_executor", return_value=mock_executor
+    async def execute(function, args, kwargs, **_):
+        return function(*args, **kwargs), "", "", RESULT_STATUS.COMPLETED
+
+    mock_executor = MagicMock()
+    mock_executor._execute = execute
+    mocker.patch(
+        "covalent_dispatcher._core.runner._executor_manager.get_executor",
+        return_value=mock_executor,
+    )
+    mocker.patch("covalent_dispatcher._core.runner.executor_proxy.watch", AsyncMock())
+    mocker.patch(
+        "covalent_dispatcher._core.runner.get_qelectron_db_dir", return_value=TEST_RESULTS_DIR
     )
-    mocker.patch("covalent_dispatcher._core.runner.set_cancel_result")
 
-    dispatch_id = "abcd"
-    task_id = 0
-    executor = "mock_executor"
-    executor_data = {}
-    job_handle = "42"
+    node_result = await _run_task(
+        result_object=get_mock_result(),
+        node_id=0,
+        inputs={"args": [TransportableObject(1)], "kwargs": {"y": TransportableObject(2)}},
+        serialized_callable=TransportableObject(task),
+        executor=["local", {}],
+        call_before=call_before,
+        call_after=[],
+        node_name="task",
+    )
+
+    assert node_result["output"].get_deserialized() == (3, ["file"])
+
+
+@pytest.mark.asyncio
+async def test_run_task_records_metrics(mocker):
+    """Test that the executor setup, execution and result fetch phases are timed."""
+    recorder = MetricsRecorder()
+    mocker.patch("covalent_dispatcher._core.runner.performance_recorder", recorder)
+    result_object = get_mock_result()
+    inputs = {"args": [], "kwargs": {}}
+    mock_executor = MagicMock()
+    mock_executor._execute = AsyncMock(return_value=("", "", "", RESULT_STATUS.COMPLETED))
+    mocker.patch(
+        "covalent_dispatcher._core.runner._executor_manager.get_executor",
+        return_value=mock_executor,
+    )
 
-    task_metadata = {"dispatch_id": dispatch_id, "node_id": task_id}
+    recorder.start(result_object.dispatch_id, 1, metrics.EXECUTOR_SETUP)
+    await _run_task(
+        result_object=result_object,
+        node_id=1,
+        inputs=inputs,
+        serialized_callable=None,
+        executor=["local", {}],
+        call_before=[],
+        call_after=[],
+        node_name="task",
+    )
 
-    cancel_result = await _cancel_task(dispatch_id, task_id, executor, executor_data, job_handle)
-    assert mock_app_log.call_count == 3
-    get_executor_mock.assert_called_once()
-    mock_executor._cancel.assert_called_with(task_metadata, json.loads(job_handle))
-    assert cancel_result is False
+    events = [event[1:3] for event in recorder._events]
+    assert events == [
+        (1, metrics.EXECUTOR_SETUP),
+        (1, metrics.EXECUTION),
+        (1, metrics.RESULT_FETCH),
+    ]
 
 
 @pytest.mark.asyncio
@@ -310,21 +438,112 @@ async def test_cancel_tasks(mocker):
     """
     Test cancelling multiple tasks
     """
+    job_metadata = [{"job_handle": "42"}, {"job_handle": "43"}, {"job_handle": "null"}]
+    node_metadata = [{"executor": "local", "executor_data": {}} for _ in range(3)]
     mock_get_jobs_metadata = mocker.patch(
-        "covalent_dispatcher._core.runner.get_jobs_metadata", return_value=AsyncMock()
+        "covalent_dispatcher._core.runner.get_jobs_metadata", return_value=job_metadata
     )
     mock_get_metadata_for_nodes = mocker.patch(
-        "covalent_dispatcher._core.runner._get_metadata_for_nodes", return_value=MagicMock()
+        "covalent_dispatcher._core.runner._get_metadata_for_nodes", return_value=node_metadata
     )
+    mock_executor = MagicMock()
+    mock_executor._cancel = AsyncMock(return_value=True)
+    mock_get_executor = mocker.patch(
+        "covalent_dispatcher._core.runner.get_executor", return_value=mock_executor
+    )
+    mock_set_cancel_results = mocker.patch("covalent_dispatcher._core.runner.set_cancel_results")
 
     dispatch_id = "abcd"
-    task_ids = [0, 1]
+    task_ids = [0, 1, 2]
 
-    await cancel_tasks(dispatch_id, task_ids)
+    await (await cancel_tasks(dispatch_id, task_ids))
 
     mock_get_jobs_metadata.assert_awaited_with(dispatch_id, task_ids)
     mock_get_metadata_for_nodes.assert_called_with(dispatch_id, task_ids)
 
+    # Tasks sharing an executor reuse one instance; unsubmitted tasks are also
+    # passed to the executor so that it tears them down
+    mock_get_executor.assert_called_once()
+    assert mock_executor._cancel.await_count == 3
+    assert mock_executor._cancel.await_args_list[2].args[1] is None
+    mock_set_cancel_results.assert_awaited_once_with(dispatch_id, {0: True, 1: True, 2: True})
+
+
+@pytest.mark.asyncio
+async def test_cancel_tasks_tears_down_unsubmitted_tasks(mocker):
+    """
+    Test that cancelling a task which was never submitted tears down its executor
+    """
+    from covalent.executor.base import BaseExecutor
+
+    class MockExecutor(BaseExecutor):
+        def run(self, function, args, kwargs, task_metadata):
+            pass
+
+    executor = MockExecutor()
+    executor._init_runtime(loop=asyncio.get_running_loop())
+    mocker.patch.object(executor, "teardown")
+    mocker.patch(
+        "covalent_dispatcher._core.runner.get_jobs_metadata",
+        return_value=[{"job_handle": "null"}],
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.runner._get_metadata_for_nodes",
+        return_value=[{"executor": "mock", "executor_data": {}}],
+    )
+    mocker.patch("covalent_dispatcher._core.runner.get_executor", return_value=executor)
+    mock_set_cancel_results = mocker.patch("covalent_dispatcher._core.runner.set_cancel_results")
+
+    await (await cancel_tasks("abcd", [0]))
+
+    executor.teardown.assert_called_once_with({"dispatch_id": "abcd", "node_id": 0})
+    mock_set_cancel_results.assert_awaited_once_with("abcd", {0: False})
+
+
+@pytest.mark.asyncio
+async def test_cancel_tasks_in_background(mocker):
+    """
+    Test that cancelling returns before the executors finish cancelling, and that
+    the number of cancel requests in flight is bounded across dispatches
+    """
+    num_tasks = 4
+    job_metadata = [{"job_handle": "42"} for _ in range(num_tasks)]
+    node_metadata = [{"executor": "local", "executor_data": {}} for _ in range(num_tasks)]
+    mocker.patch("covalent_dispatcher._core.runner.get_jobs_metadata", return_value=job_metadata)
+    mocker.patch(
+        "covalent_dispatcher._core.runner._get_metadata_for_nodes", return_value=node_metadata
+    )
+    mocker.patch("covalent_dispatcher._core.runner.get_config", return_value=3)
+    mocker.patch("covalent_dispatcher._core.runner._cancel_semaphore", None)
+    mock_set_cancel_results = mocker.patch("covalent_dispatcher._core.runner.set_cancel_results")
+
+    release = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_cancel(task_metadata, job_handle):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+        return True
+
+    mock_executor = MagicMock()
+    mock_executor._cancel = mock_cancel
+    mocker.patch("covalent_dispatcher._core.runner.get_executor", return_value=mock_executor)
+
+    tasks = [await cancel_tasks(f"dispatch_{i}", list(range(num_tasks))) for i in range(2)]
+    await asyncio.sleep(0.01)
+
+    assert not any(task.done() for task in tasks)
+    assert max_in_flight == 3
+    mock_set_cancel_results.assert_not_awaited()
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert mock_set_cancel_results.await_count == 2
+
 
 def test__get_metadata_for_nodes(mocker):
     """
@@ -22,7 +22,11 @@
 Unit tests for DataStore object
 """
 
+from sqlalchemy import text
+
+from covalent._shared_files import metrics
 from covalent._shared_files.config import get_config
+from covalent._shared_files.metrics import MetricsRecorder
 from covalent_dispatcher._db.datastore import DataStore
 
 
@@ -31,3 +35,28 @@ def test_datastore_init():
 
     ds = DataStore(db_URL=None)
     assert ds.db_URL == "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
+
+
+def test_datastore_counts_statements(mocker):
+    """Test that DB reads and writes are counted for the current dispatch."""
+
+    recorder = MetricsRecorder()
+    mocker.patch.object(metrics, "performance_recorder", recorder)
+    ds = DataStore(db_URL="sqlite+pysqlite:///:memory:")
+
+    token = metrics.current_dispatch_id.set("dispatch")
+    try:
+        with ds.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE test (id INTEGER)"))
+            conn.execute(text("INSERT INTO test VALUES (1)"))
+            conn.execute(text("UPDATE test SET id = 2"))
+            conn.execute(text("SELECT * FROM test"))
+    finally:
+        metrics.current_dispatch_id.reset(token)
+
+    dispatch_metrics = recorder.get_dispatch_metrics("dispatch")
+    assert dispatch_metrics.db_reads == 1
+    assert dispatch_metrics.db_writes == 2
+    assert dispatch_metrics.db_bytes_written == len("INSERT INTO test VALUES (1)") + len(
+        "UPDATE test SET id = 2"
+    )
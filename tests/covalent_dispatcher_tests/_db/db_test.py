@@ -62,7 +62,7 @@ def test_default_db_path(db: DataStore, tmp_path: Path, mocker):
 
     mocker.patch("sqlalchemy.create_engine")
     mocker.patch("sqlalchemy.orm.sessionmaker")
-    mocker.patch("covalent_dispatcher._db.datastore.get_config", return_value=DB_PATH)
+    mocker.patch("covalent_dispatcher._db.datastore.get_db_path", return_value=DB_PATH)
 
     db_url = f"sqlite+pysqlite:///{DB_PATH}"
 
@@ -27,6 +27,7 @@ from covalent_dispatcher._db.datastore import DataStore
 from covalent_dispatcher._db.jobdb import (
     MissingJobRecordError,
     get_job_record,
+    to_job_id_map,
     to_job_ids,
     update_job_records,
 )
@@ -134,3 +135,5 @@ def test_to_job_ids(test_db, mocker):
 
     job_ids = to_job_ids("test_dispatch", [0, 1])
     assert job_ids == [1, 2]
+
+    assert to_job_id_map("test_dispatch", [1, 0]) == {0: 1, 1: 2}
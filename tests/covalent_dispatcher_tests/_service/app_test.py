@@ -20,17 +20,21 @@
 
 """Unit tests for the FastAPI app."""
 
+import codecs
 import json
 import os
 from contextlib import contextmanager
+from types import SimpleNamespace
 from typing import Generator
 
+import cloudpickle as pickle
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import Column, Integer, String, create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from covalent._results_manager.result import Result
+from covalent._shared_files.metrics import PROMETHEUS_CONTENT_TYPE, DispatchMetrics, NodeMetrics
 from covalent_dispatcher._db.dispatchdb import DispatchDB
 from covalent_ui.app import fastapi_app as fast_app
 
@@ -206,13 +210,20 @@ def test_get_result(mocker, client, test_db_file):
         session.add(lattice)
         session.commit()
 
-    mocker.patch("covalent_dispatcher._service.app._result_from", return_value={})
+    mocker.patch("covalent_dispatcher._service.app._result_from", return_value=SimpleNamespace())
     mocker.patch("covalent_dispatcher._service.app.workflow_db", test_db_file)
     mocker.patch("covalent_dispatcher._service.app.Lattice", MockLattice)
+    dispatch_metrics = DispatchMetrics(dispatch_id=DISPATCH_ID)
+    mocker.patch(
+        "covalent_dispatcher._service.app.performance_recorder.get_dispatch_metrics",
+        return_value=dispatch_metrics,
+    )
     response = client.get(f"/api/result/{DISPATCH_ID}")
     result = response.json()
     assert result["id"] == DISPATCH_ID
     assert result["status"] == Result.COMPLETED
+    result_object = pickle.loads(codecs.decode(result["result"].encode(), "base64"))
+    assert result_object._metrics == dispatch_metrics
     os.remove("/tmp/testdb.sqlite")
 
 
@@ -249,3 +260,51 @@ def test_db_path_get_config(mocker):
     DispatchDB()
 
     get_config_mock.assert_called_once()
+
+
+def test_get_dispatch_metrics(mocker, client):
+    """Test the dispatch metrics endpoint."""
+    dispatch_metrics = DispatchMetrics(
+        dispatch_id=DISPATCH_ID,
+        runtime=2.0,
+        db_reads=3,
+        db_writes=4,
+        bytes_serialized=5,
+        nodes={0: NodeMetrics(node_id=0, execution=1.0, queueing=0.5)},
+    )
+    mocker.patch(
+        "covalent_dispatcher._service.app.performance_recorder.get_dispatch_metrics",
+        return_value=dispatch_metrics,
+    )
+    response = client.get(f"/api/v1/dispatch/{DISPATCH_ID}/metrics")
+    assert response.status_code == 200
+    metrics = response.json()
+    assert metrics["dispatch_id"] == DISPATCH_ID
+    assert metrics["db_reads"] == 3
+    assert metrics["db_writes"] == 4
+    assert metrics["bytes_serialized"] == 5
+    assert metrics["nodes"]["0"]["execution"] == 1.0
+    assert metrics["summary"]["workflow_runtime"] == 1.0
+    assert metrics["summary"]["covalent_runtime"] == 2.0
+
+
+def test_get_dispatch_metrics_not_found(client):
+    """Test that 404 is returned if no metrics were recorded for the dispatch."""
+    response = client.get("/api/v1/dispatch/unknown-dispatch/metrics")
+    assert response.status_code == 404
+
+
+def test_get_metrics(client):
+    """Test scraping the Prometheus metrics endpoint."""
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+    for name in [
+        "covalent_resident_dispatches",
+        "covalent_dispatch_status_queue_depth",
+        "covalent_tasks_in_flight",
+        "covalent_task_latency_seconds",
+        "covalent_db_session_duration_seconds",
+        "covalent_webhook_send_latency_seconds",
+    ]:
+        assert f"# TYPE {name} " in response.text
@@ -0,0 +1,169 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Unit tests for the Triggers server's trigger runtime"""
+
+
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from covalent.triggers import BaseTrigger, DirTrigger, SQLiteTrigger, TimeTrigger
+from covalent_dispatcher._triggers_app.runtime import TriggerRuntime
+
+
+@pytest.fixture
+def runtime():
+    """
+    Trigger runtime backed by a small threadpool
+    """
+
+    thread_pool = ThreadPoolExecutor(max_workers=2)
+    trigger_runtime = TriggerRuntime(thread_pool)
+    yield trigger_runtime
+    trigger_runtime.shutdown()
+    thread_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_time_triggers_share_event_loop(runtime):
+    """
+    Testing whether many time triggers are observed without
+    occupying a thread each and stop once asked to
+    """
+
+    trigger_threads = set()
+    triggers = [TimeTrigger(time_gap=0.05) for _ in range(50)]
+    for trigger in triggers:
+        trigger.trigger = mock.Mock(
+            side_effect=lambda: trigger_threads.add(threading.current_thread())
+        )
+        runtime.start(trigger)
+
+    await asyncio.sleep(0.3)
+
+    assert len(runtime.tasks) == 50
+    assert all(trigger.trigger.call_count >= 2 for trigger in triggers)
+    assert threading.main_thread() not in trigger_threads
+    assert len(trigger_threads) <= 2
+
+    for trigger in triggers:
+        runtime.stop(trigger)
+    await asyncio.sleep(0)
+
+    call_counts = [trigger.trigger.call_count for trigger in triggers]
+    await asyncio.sleep(0.2)
+
+    assert not runtime.tasks
+    assert [trigger.trigger.call_count for trigger in triggers] == call_counts
+
+
+@pytest.mark.asyncio
+async def test_sqlite_trigger_polls_on_event_loop(runtime, tmp_path):
+    """
+    Testing whether an SQLite trigger is polled by the runtime
+    and only fires for new rows in incremental mode
+    """
+
+    db_path = str(tmp_path / "test.db")
+    writer = sqlite3.connect(db_path)
+    writer.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, status TEXT)")
+    writer.commit()
+
+    trigger = SQLiteTrigger(db_path, "jobs", 0.02, ["status = 'pending'"], incremental=True)
+    trigger.trigger = mock.Mock()
+    runtime.start(trigger)
+
+    await asyncio.sleep(0.1)
+    trigger.trigger.assert_not_called()
+
+    writer.execute("INSERT INTO jobs (status) VALUES ('pending')")
+    writer.commit()
+    await asyncio.sleep(0.2)
+
+    trigger.trigger.assert_called_once()
+
+    runtime.stop(trigger)
+    await asyncio.sleep(0.05)
+    writer.close()
+
+    assert not runtime.tasks
+
+
+@pytest.mark.asyncio
+async def test_dir_triggers_share_observer(runtime, tmp_path):
+    """
+    Testing whether directory triggers are scheduled on one shared observer
+    and trigger actions are performed off the observer's thread
+    """
+
+    trigger_threads = []
+    triggers = []
+    for i in range(3):
+        watched_dir = tmp_path / f"dir_{i}"
+        watched_dir.mkdir()
+        trigger = DirTrigger(str(watched_dir), "created")
+        trigger.trigger = mock.Mock(
+            side_effect=lambda: trigger_threads.append(threading.current_thread())
+        )
+        runtime.start(trigger)
+        triggers.append(trigger)
+
+    assert all(trigger.observer is runtime.observer for trigger in triggers)
+
+    (tmp_path / "dir_0" / "new_file").write_text("data")
+    await asyncio.sleep(0.5)
+
+    triggers[0].trigger.assert_called_once()
+    triggers[1].trigger.assert_not_called()
+    assert runtime.observer not in trigger_threads
+
+    runtime.stop(triggers[0])
+    (tmp_path / "dir_0" / "another_file").write_text("data")
+    await asyncio.sleep(0.5)
+
+    triggers[0].trigger.assert_called_once()
+    assert runtime.observer.is_alive()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("observe_blocks", [True, False])
+async def test_other_triggers_use_observe(runtime, observe_blocks):
+    """
+    Testing whether triggers unknown to the runtime fall back to their own
+    observe method, run in the threadpool if it blocks
+    """
+
+    trigger = mock.Mock(spec=BaseTrigger)
+    trigger.observe_blocks = observe_blocks
+    runtime.thread_pool = mock.Mock()
+
+    runtime.start(trigger)
+    if observe_blocks:
+        runtime.thread_pool.submit.assert_called_once_with(trigger.observe)
+    else:
+        trigger.observe.assert_called_once()
+
+    runtime.stop(trigger)
+    trigger.stop.assert_called_once()
@@ -29,9 +29,11 @@ from fastapi import HTTPException
 import covalent_dispatcher._triggers_app.app as app
 from covalent_dispatcher._triggers_app.app import (
     available_triggers,
+    get_runtime,
     get_threadpool,
     init_trigger,
     register_and_observe,
+    shutdown_runtime,
     stop_observe,
 )
 
@@ -67,6 +69,45 @@ def test_get_threadpool(mocker: mock, file_to_test: str):
     assert first_threadpool == second_threadpool
 
 
+def test_get_runtime(mocker: mock, file_to_test: str):
+    """
+    Testing whether the same trigger runtime, backed by
+    the shared threadpool, is returned on every call
+    """
+
+    runtime_mocker = mocker.patch(f"{file_to_test}.TriggerRuntime")
+    get_threadpool_mocker = mocker.patch(f"{file_to_test}.get_threadpool")
+    get_runtime.cache_clear()
+
+    first_runtime = get_runtime()
+    second_runtime = get_runtime()
+
+    runtime_mocker.assert_called_once_with(get_threadpool_mocker.return_value)
+    assert first_runtime == second_runtime
+
+    get_runtime.cache_clear()
+
+
+@pytest.mark.parametrize("runtime_started", [True, False])
+def test_shutdown_runtime(mocker: mock, file_to_test: str, runtime_started: bool):
+    """
+    Testing whether the runtime is only shut down if it was ever created
+    """
+
+    runtime_mocker = mocker.patch(f"{file_to_test}.TriggerRuntime")
+    mocker.patch(f"{file_to_test}.get_threadpool")
+    get_runtime.cache_clear()
+    if runtime_started:
+        get_runtime()
+
+    shutdown_runtime()
+
+    assert runtime_mocker.return_value.shutdown.call_count == int(runtime_started)
+    assert runtime_mocker.call_count == int(runtime_started)
+
+    get_runtime.cache_clear()
+
+
 def test_init_trigger(mocker: mock, file_to_test: str):
     """
     Testing whether a trigger can be obtained/recreated
@@ -104,14 +145,12 @@ def test_init_trigger(mocker: mock, file_to_test: str):
 @pytest.mark.asyncio
 @pytest.mark.parametrize("disable_triggers", [True, False])
 @pytest.mark.parametrize("use_internal_funcs", [True, False])
-@pytest.mark.parametrize("observe_blocks", [True, False])
 @pytest.mark.parametrize("contains_triggers", [True, False])
 async def test_register_and_observe(
     mocker: mock,
     file_to_test: str,
     disable_triggers: bool,
     use_internal_funcs: bool,
-    observe_blocks: bool,
     contains_triggers: bool,
 ):
     """
@@ -136,24 +175,20 @@ async def test_register_and_observe(
 
         trigger_mock = mock.Mock()
         trigger_mock.use_internal_funcs = use_internal_funcs
-        trigger_mock.observe_blocks = observe_blocks
 
-        get_threadpool_mock = mocker.patch(f"{file_to_test}.get_threadpool")
+        get_runtime_mock = mocker.patch(f"{file_to_test}.get_runtime")
         init_trigger_mock = mocker.patch(f"{file_to_test}.init_trigger", return_value=trigger_mock)
         get_running_loop_mock = mocker.patch(f"{file_to_test}.asyncio.get_running_loop")
         active_triggers_mock = mocker.patch.object(app, "active_triggers", test_active_triggers)
 
         await register_and_observe(test_request)
 
-        get_threadpool_mock.assert_called_once()
+        get_runtime_mock.assert_called_once()
         test_request.json.assert_called_once()
         init_trigger_mock.assert_called_once()
         if use_internal_funcs:
             get_running_loop_mock.assert_called_once()
-        if observe_blocks:
-            get_threadpool_mock.return_value.submit.assert_called_once()
-        else:
-            trigger_mock.observe.assert_called_once()
+        get_runtime_mock.return_value.start.assert_called_once_with(trigger_mock)
 
         test_active_triggers[test_dispatch_id] = [trigger_mock]
         assert test_active_triggers == active_triggers_mock
@@ -187,8 +222,10 @@ async def test_stop_observe(
         trigger_mock = mock.Mock()
         test_active_triggers = {test_dispatch_id: [trigger_mock]}
         mocker.patch.object(app, "active_triggers", test_active_triggers)
+        get_runtime_mock = mocker.patch(f"{file_to_test}.get_runtime")
 
         await stop_observe(test_request)
 
         test_request.json.assert_called_once()
-        trigger_mock.stop.assert_called_once()
+        get_runtime_mock.return_value.stop.assert_called_once_with(trigger_mock)
+        assert test_dispatch_id not in test_active_triggers
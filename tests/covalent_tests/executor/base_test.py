@@ -22,6 +22,8 @@
 
 import os
 import tempfile
+import threading
+from concurrent.futures import Future
 from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
@@ -30,7 +32,7 @@ import pytest
 from covalent import DepsCall, TransportableObject
 from covalent._results_manager import Result
 from covalent._shared_files.exceptions import TaskCancelledError, TaskRuntimeError
-from covalent.executor import BaseExecutor, wrapper_fn
+from covalent.executor import BaseExecutor, base, wrapper_fn
 from covalent.executor.base import AsyncBaseExecutor
 from covalent.executor.utils.wrappers import Signals
 
@@ -805,3 +807,140 @@ async def test_base_async_executor_private_cancel(mocker):
     mock_app_log.assert_called_with(f"Cancel not implemented for executor {type(me)}")
     me.teardown.assert_awaited_with(task_metadata)
     assert cancel_result is False
+
+
+class MockSubmitExecutor(BaseExecutor):
+    def run(self, function, args, kwargs, task_metadata):
+        raise NotImplementedError
+
+    def submit_task(self, function, args, kwargs, task_metadata):
+        fut = Future()
+        fut.set_result(function(*args, **kwargs))
+        return fut
+
+    def collect_task_output(self, output, task_metadata):
+        if output == "fail":
+            raise TaskRuntimeError(output)
+        return output
+
+
+@pytest.mark.asyncio
+async def test_base_executor_private_execute_uses_class_pool(mocker):
+    """Test that synchronous executors run in a thread pool of their class"""
+
+    mocker.patch("covalent.executor.base._execution_pools", {})
+    mocker.patch("covalent.executor.base.get_executor_pool_size", return_value=3)
+    me = MockExecutor()
+    me.execute = MagicMock(side_effect=lambda *args: threading.current_thread().name)
+
+    thread_name = await me._execute(
+        function=MagicMock(),
+        args=[],
+        kwargs={},
+        dispatch_id="asdf",
+        results_dir="/tmp",
+    )
+    assert thread_name.startswith("covalent-base_test")
+    pool = base._execution_pools[MockExecutor]
+    assert pool.max_workers == 3
+    assert base._get_execution_pool(MockExecutor, "base_test") is pool
+
+
+@pytest.mark.asyncio
+async def test_base_executor_private_execute_async_path(mocker):
+    """Test that executors implementing `submit_task` are awaited on the event loop"""
+
+    mocker.patch("covalent.executor.base._execution_pools", {})
+    me = MockSubmitExecutor()
+    me._notify = MagicMock()
+    me.setup = MagicMock()
+    me.teardown = MagicMock()
+    me.write_streams_to_file = MagicMock()
+    main_thread = threading.current_thread()
+    collect_task_output = me.collect_task_output
+    collect_threads = []
+
+    def _collect_task_output(output, task_metadata):
+        collect_threads.append(threading.current_thread())
+        return collect_task_output(output, task_metadata)
+
+    me.collect_task_output = _collect_task_output
+
+    output, stdout, stderr, status = await me._execute(
+        function=lambda x: x + 1,
+        args=[1],
+        kwargs={},
+        dispatch_id="asdf",
+        results_dir="/tmp",
+        node_id=2,
+    )
+    task_metadata = {"dispatch_id": "asdf", "node_id": 2, "results_dir": "/tmp"}
+    assert output == 2
+    assert status == Result.COMPLETED
+    me.setup.assert_called_once_with(task_metadata)
+    me.teardown.assert_called_once_with(task_metadata)
+    me._notify.assert_called_with(Signals.EXIT)
+    me.write_streams_to_file.assert_called_once()
+    assert collect_threads and collect_threads[0] is not main_thread
+
+    output, _, _, status = await me._execute(
+        function=lambda: "fail",
+        args=[],
+        kwargs={},
+        dispatch_id="asdf",
+        results_dir="/tmp",
+    )
+    assert output is None
+    assert status == Result.FAILED
+
+
+class MockSubmitExecutorOverridingRun(MockSubmitExecutor):
+    def run(self, function, args, kwargs, task_metadata):
+        return "run"
+
+
+class MockSubmitExecutorOverridingExecute(MockSubmitExecutor):
+    def execute(self, *args, **kwargs):
+        return "execute"
+
+
+class MockSubmitExecutorSubclass(MockSubmitExecutor):
+    pass
+
+
+def test_submits_tasks():
+    """Test that `submit_task` is only used when `run` and `execute` are not overridden"""
+
+    assert not base._submits_tasks(MockExecutor)
+    assert base._submits_tasks(MockSubmitExecutor)
+    assert base._submits_tasks(MockSubmitExecutorSubclass)
+    assert not base._submits_tasks(MockSubmitExecutorOverridingRun)
+    assert not base._submits_tasks(MockSubmitExecutorOverridingExecute)
+
+
+@pytest.mark.asyncio
+async def test_base_executor_private_execute_overridden_run(mocker):
+    """Test that an overridden `run` is used even if a base class implements `submit_task`"""
+
+    mocker.patch("covalent.executor.base._execution_pools", {})
+    me = MockSubmitExecutorOverridingExecute()
+
+    output = await me._execute(
+        function=MagicMock(),
+        args=[],
+        kwargs={},
+        dispatch_id="asdf",
+        results_dir="/tmp",
+    )
+    assert output == "execute"
+
+
+def test_get_executor_pool_size(mocker):
+    """Test that pool sizes are read from the config by executor short name"""
+
+    mocker.patch("covalent.executor.base.get_config", return_value={"default": 4, "local": 8})
+    assert base.get_executor_pool_size("local") == 8
+    assert base.get_executor_pool_size("other") == 4
+
+    mocker.patch("covalent.executor.base.get_config", side_effect=KeyError)
+    assert base.get_executor_pool_size("local") == base.DEFAULT_EXECUTOR_POOL_SIZE
@@ -23,13 +23,14 @@
 import asyncio
 import os
 import tempfile
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 import covalent as ct
 from covalent._shared_files import TaskRuntimeError
 from covalent._shared_files.exceptions import TaskCancelledError
+from covalent._workflow.transport import TransportableObject
 from covalent.executor.executor_plugins.dask import _EXECUTOR_PLUGIN_DEFAULTS, DaskExecutor
 
 
@@ -288,3 +289,68 @@ def test_dask_task_cancel(mocker):
     result = asyncio.run(dask_exec.cancel(task_metadata, job_handle))
     mock_app_log.assert_called_with(f"Cancelled future with key {job_handle}")
     assert result is True
+
+
+def test_dask_executor_batched_run_with_scattered_inputs(mocker):
+    """Test that batched tasks are submitted together and share scattered inputs"""
+    import io
+
+    from dask.distributed import LocalCluster
+
+    from covalent.executor.executor_plugins import dask as dask_plugin
+
+    cluster = LocalCluster(n_workers=1)
+    shared_input = list(range(10000))
+
+    def f(x, i):
+        return sum(x.get_deserialized()) + i
+
+    async def run_tasks():
+        executors = []
+        for i in range(3):
+            de = DaskExecutor(cluster.scheduler_address, batch_window=0.05, scatter_threshold=1024)
+            mocker.patch.object(de, "get_cancel_requested", AsyncMock(return_value=False))
+            mocker.patch.object(de, "set_job_handle", AsyncMock())
+            de._task_stdout = io.StringIO()
+            de._task_stderr = io.StringIO()
+            executors.append(de)
+
+        return await asyncio.gather(
+            *(
+                de.run(
+                    f,
+                    [TransportableObject(shared_input)],
+                    {"i": i},
+                    {"dispatch_id": "asdf", "node_id": i},
+                )
+                for i, de in enumerate(executors)
+            )
+        )
+
+    spy_flush = mocker.spy(dask_plugin, "_flush_submissions")
+    results = asyncio.run(run_tasks())
+
+    assert results == [sum(shared_input) + i for i in range(3)]
+    spy_flush.assert_called_once()
+    assert len(dask_plugin._scattered_inputs[cluster.scheduler_address]) == 1
+    cluster.close()
+
+
+@pytest.mark.asyncio
+async def test_scatter_input_only_serializes_large_transportable_objects(mocker):
+    """Test that only large TransportableObjects are scattered, without pickling them again"""
+    from covalent.executor.executor_plugins import dask as dask_plugin
+
+    mocker.patch.dict(dask_plugin._scattered_inputs, clear=True)
+    mock_client = MagicMock()
+    mock_client.scatter = AsyncMock(return_value="scattered")
+    small = TransportableObject(1)
+    assert await dask_plugin._scatter_input(mock_client, "addr", small, 1024) is small
+    assert await dask_plugin._scatter_input(mock_client, "addr", "x" * 2048, 1024) == "x" * 2048
+
+    large = TransportableObject(list(range(1000)))
+    assert await dask_plugin._scatter_input(mock_client, "addr", large, 1024) == "scattered"
+    same = TransportableObject(list(range(1000)))
+    assert await dask_plugin._scatter_input(mock_client, "addr", same, 1024) == "scattered"
+
+    mock_client.scatter.assert_awaited_once_with(large, hash=False)
@@ -231,3 +231,23 @@ def test_local_executor_get_cancel_requested(mocker):
         le.run(local_executor_run__mock_task, args, kwargs, task_metadata)
         le.get_cancel_requested.assert_called_once()
         assert mock_app_log.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_executor_private_execute_awaits_task(mocker):
+    """Test that the local executor's tasks are awaited without holding a pool thread"""
+
+    le = LocalExecutor()
+    le.set_job_handle = MagicMock()
+    le.get_cancel_requested = MagicMock(return_value=False)
+    le._notify = MagicMock()
+    le.write_streams_to_file = MagicMock()
+    le.run = MagicMock()
+
+    output, _, _, status = await le._execute(
+        local_executor_run__mock_task, [5], {}, dispatch_id="asdf", results_dir="/tmp"
+    )
+    assert output == 25
+    assert status == ct.status.COMPLETED
+    le.run.assert_not_called()
+    le.get_cancel_requested.assert_called_once()
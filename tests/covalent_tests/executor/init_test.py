@@ -24,15 +24,17 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import covalent.executor
 from covalent.executor import BaseExecutor, _executor_manager, _ExecutorManager
+from covalent.executor.plugin_index import LazyPluginMap
 
 
 def test_get_executor_local(mocker):
-    """Test that config is reloaded when the get_executor method is called for the local executor."""
+    """Test that the default parameters are read from the (auto-reloading) config when the get_executor method is called for the local executor."""
 
-    update_config_mock = mocker.patch("covalent.executor.update_config")
+    get_executor_config_spy = mocker.spy(covalent.executor, "get_executor_config")
     _executor_manager.get_executor(name="local")
-    update_config_mock.assert_called_once_with()
+    get_executor_config_spy.assert_called_once_with("local")
 
 
 def test_executor_manager_init(mocker):
@@ -46,6 +48,23 @@ def test_executor_manager_init(mocker):
     generate_plugins_list_mock.assert_called_once_with()
 
 
+def test_executor_managers_loaded_lazily(mocker):
+    """Test that the executor managers are created on first access and then reused."""
+
+    mocker.patch.dict(covalent.executor.__dict__)
+    covalent.executor.__dict__.pop("_executor_manager", None)
+    covalent.executor.__dict__.pop("LocalExecutor", None)
+    generate_plugins_list_spy = mocker.spy(_ExecutorManager, "generate_plugins_list")
+
+    local_executor = covalent.executor.LocalExecutor
+    assert local_executor.__name__ == "LocalExecutor"
+    assert covalent.executor._executor_manager.executor_plugins_map["local"] is local_executor
+    generate_plugins_list_spy.assert_called_once()
+
+    with pytest.raises(AttributeError):
+        covalent.executor.NonExistentExecutor
+
+
 def test_executor_manager_generate_plugins_list(mocker):
     """Test the generate plugins list method of the executor manager object."""
 
@@ -64,6 +83,9 @@ def test_executor_manager_generate_plugins_list(mocker):
     load_installed_plugins_mock = mocker.patch(
         "covalent.executor._ExecutorManager._load_installed_plugins"
     )
+    mocker.patch("covalent.executor.environment_key")
+    plugin_index_mock = mocker.patch("covalent.executor.PluginIndex")
+    plugin_index_mock.return_value.load.return_value = None
 
     em.generate_plugins_list()
     os_path_join_mock.assert_called_once_with("covalent", "executor_plugins")
@@ -74,6 +96,7 @@ def test_executor_manager_generate_plugins_list(mocker):
         mocker.call("user_plugins_path"),
     ]
     load_installed_plugins_mock.called_once_with()
+    plugin_index_mock.return_value.save.assert_called_once()
 
 
 def test_get_executor(mocker):
@@ -94,13 +117,15 @@ def test_get_executor(mocker):
     assert isinstance(resp, MockExecutor)
 
     # Case 2 - name is str and in executor_plugin_map
-    get_config_mock = mocker.patch("covalent.executor.get_config", return_value={"test_arg": 1})
+    get_executor_config_mock = mocker.patch(
+        "covalent.executor.get_executor_config", return_value={"test_arg": 1}
+    )
     update_config_mock = mocker.patch("covalent.executor.update_config")
 
     em.executor_plugins_map = {"mock_name": plugin_mock}
     resp = em.get_executor(name="mock_name")
-    update_config_mock.assert_called_once_with()
-    get_config_mock.assert_called_once_with("executors.mock_name")
+    update_config_mock.assert_not_called()
+    get_executor_config_mock.assert_called_once_with("mock_name")
     assert resp == "plugin map func called"
 
     # Case 3 - name is str and not in executor_plugin_map
@@ -152,3 +177,29 @@ def test_zero_plugin_class_else_case(mocker):
 
     em.nonzero_plugin_classes.assert_called_once()
     app_log_mock.warning.assert_called_once()
+
+
+def test_generate_plugins_list_uses_index(mocker, tmp_path):
+    """Test that the plugins are taken from the index once they have been discovered."""
+
+    mocker.patch("covalent.executor.plugin_index.get_config", return_value=str(tmp_path))
+
+    # Bypass the singleton, whose methods are replaced by other tests
+    em = object.__new__(_ExecutorManager)
+    em.executor_plugins_map = LazyPluginMap()
+    em.generate_plugins_list()
+    discovered = list(em.executor_plugins_map)
+    assert "local" in discovered
+    assert (tmp_path / "plugin_index" / "executors.json").exists()
+
+    load_executors_spy = mocker.spy(_ExecutorManager, "_load_executors")
+    em.executor_plugins_map = LazyPluginMap()
+    em.generate_plugins_list()
+    load_executors_spy.assert_not_called()
+    assert list(em.executor_plugins_map) == discovered
+    assert em.executor_plugins_map.class_name("local") == "LocalExecutor"
+    assert em.executor_plugins_map["local"].__name__ == "LocalExecutor"
+
+    # Regenerating the list ignores the index
+    em.list_executors(regenerate=True, print_names=False)
+    assert load_executors_spy.call_count == 2
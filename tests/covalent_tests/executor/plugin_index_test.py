@@ -0,0 +1,101 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Tests for the executor plugin index."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from covalent.executor.plugin_index import LazyPluginMap, PluginIndex, environment_key
+
+
+@pytest.fixture
+def cache_dir(mocker, tmp_path):
+    mocker.patch("covalent.executor.plugin_index.get_config", return_value=str(tmp_path))
+    return tmp_path
+
+
+def test_plugin_index_round_trip(cache_dir):
+    """Test that the index returns the plugins saved under the same key."""
+
+    plugins = [{"name": "local", "class_name": "LocalExecutor", "defaults": None, "file": "f.py"}]
+    PluginIndex("executors", {"a": (1, 2)}).save(plugins)
+
+    assert PluginIndex("executors", {"a": [1, 2]}).load() == plugins
+    assert PluginIndex("executors", {"a": [1, 3]}).load() is None
+    assert PluginIndex("qexecutors", {"a": [1, 2]}).load() is None
+
+
+def test_plugin_index_checks_distributions(cache_dir, mocker):
+    """Test that the index is invalid once a plugin distribution is upgraded or removed."""
+
+    index = PluginIndex("executors", {})
+    index.save([], {"covalent-plugin": "1.0"})
+
+    version_mock = mocker.patch(
+        "covalent.executor.plugin_index.metadata.version", return_value="1.0"
+    )
+    assert index.load() == []
+
+    version_mock.return_value = "1.1"
+    assert index.load() is None
+
+
+def test_plugin_index_not_serializable(cache_dir):
+    """Test that plugins which cannot be indexed are left out without an error."""
+
+    index = PluginIndex("executors", {})
+    index.save([{"defaults": object()}])
+    assert index.load() is None
+    assert list((cache_dir / "plugin_index").iterdir()) == []
+
+
+def test_environment_key_tracks_plugin_files(tmp_path):
+    """Test that the key changes when a plugin module is modified."""
+
+    plugin_file = tmp_path / "plugin.py"
+    plugin_file.write_text("")
+    key = environment_key([str(tmp_path), str(plugin_file)])
+    assert environment_key([str(tmp_path), str(plugin_file)]) == key
+
+    stat = plugin_file.stat()
+    plugin_file.write_text("EXECUTOR_PLUGIN_NAME = 'Plugin'")
+    os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert environment_key([str(tmp_path), str(plugin_file)]) != key
+
+
+def test_lazy_plugin_map():
+    """Test that plugins added with a loader are only imported on lookup."""
+
+    load = MagicMock(return_value=dict)
+    plugins_map = LazyPluginMap()
+    plugins_map["list"] = list
+    plugins_map.add_loader("dict", "dict", load)
+
+    assert list(plugins_map) == ["list", "dict"]
+    assert "dict" in plugins_map
+    assert plugins_map.class_name("dict") == "dict"
+    load.assert_not_called()
+
+    assert plugins_map["dict"] is dict
+    assert plugins_map.get("dict") is dict
+    load.assert_called_once_with()
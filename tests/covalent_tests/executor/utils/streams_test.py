@@ -0,0 +1,157 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Tests for the size-limited task stream capture"""
+
+import os
+import time
+
+from covalent.executor.utils.streams import (
+    TRUNCATION_MARKER,
+    SpooledStream,
+    get_stream_limits,
+    get_task_stream_paths,
+    read_stream_tail,
+)
+from covalent.executor.utils.wrappers import io_wrapper
+
+
+def test_spooled_stream_keeps_all_output_within_limits():
+    """Test that output within the limits is kept whole"""
+
+    stream = SpooledStream(head_bytes=10, tail_bytes=10)
+    print("hello", file=stream)
+    print("wörld", file=stream)
+    assert stream.getvalue() == "hello\nwörld\n"
+    assert stream.bytes_truncated == 0
+    stream.close()
+
+
+def test_spooled_stream_truncates_middle_of_output():
+    """Test that only the head and tail of long output are kept"""
+
+    stream = SpooledStream(head_bytes=4, tail_bytes=4)
+    for i in range(1000):
+        stream.write(f"{i:04d}")
+
+    assert stream.bytes_written == 4000
+    assert stream.bytes_truncated == 3992
+    assert stream.getvalue() == "0000" + TRUNCATION_MARKER.format(3992) + "0999"
+    assert stream.tail(4) == "0999"
+    assert not stream.tail(100).startswith("0000")
+    stream.close()
+
+
+def test_spooled_stream_named_file_readable_while_open(tmp_path):
+    """Test that a named spool can be tailed by path and is removed on close"""
+
+    path = str(tmp_path / "task" / "node_0.stdout")
+    stream = SpooledStream(path, head_bytes=100, tail_bytes=100)
+    stream.write("line 1\nline 2\n")
+    stream.flush()
+
+    assert read_stream_tail(path, 7) == "line 2\n"
+    stream.close()
+    assert not os.path.exists(path)
+    assert read_stream_tail(path, 7) == ""
+
+
+def test_spooled_stream_named_file_flushed_without_further_writes(tmp_path, mocker):
+    """Test that output of a named spool becomes readable while nothing else is written"""
+
+    mocker.patch("covalent.executor.utils.streams._FLUSH_INTERVAL", 0.05)
+    path = str(tmp_path / "task" / "node_0.stdout")
+    stream = SpooledStream(path, head_bytes=100, tail_bytes=100)
+    stream.write("started\n")
+
+    deadline = time.monotonic() + 5
+    while read_stream_tail(path, 100) != "started\n" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read_stream_tail(path, 100) == "started\n"
+
+    stream.write("done\n")
+    stream.close()
+    assert stream._flush_timer is None
+
+
+def test_spooled_stream_named_file_keeps_order_with_timed_flushes(tmp_path, mocker):
+    """Test that flushes from the timer thread neither drop nor reorder output"""
+
+    mocker.patch("covalent.executor.utils.streams._FLUSH_INTERVAL", 0.001)
+    stream = SpooledStream(str(tmp_path / "node_0.stdout"), head_bytes=10**7, tail_bytes=10**7)
+    lines = [f"line {i}\n" for i in range(100_000)]
+    for line in lines:
+        stream.write(line)
+
+    assert stream.getvalue() == "".join(lines)
+    stream.close()
+
+
+def test_spooled_stream_removes_empty_directory(tmp_path):
+    """Test that the directory of named spools is removed with the last spool"""
+
+    stdout = SpooledStream(str(tmp_path / "task" / "node_0.stdout"), head_bytes=10, tail_bytes=10)
+    stderr = SpooledStream(str(tmp_path / "task" / "node_0.stderr"), head_bytes=10, tail_bytes=10)
+
+    stdout.close()
+    assert os.path.isdir(tmp_path / "task")
+    stderr.close()
+    assert not os.path.exists(tmp_path / "task")
+
+
+def test_get_stream_limits(mocker):
+    """Test that the limits are read from the config"""
+
+    mocker.patch("covalent.executor.utils.streams.get_config", return_value=8)
+    assert get_stream_limits() == (8, 8)
+
+    mocker.patch("covalent.executor.utils.streams.get_config", side_effect=KeyError)
+    assert get_stream_limits() == (1024 * 1024, 1024 * 1024)
+
+
+def test_get_task_stream_paths(mocker):
+    """Test that the spool files of a task are placed in the cache dir"""
+
+    mocker.patch("covalent.executor.utils.streams.get_config", return_value="/cache")
+    assert get_task_stream_paths("asdf", 2) == (
+        "/cache/task_streams/asdf/node_2.stdout",
+        "/cache/task_streams/asdf/node_2.stderr",
+    )
+
+
+def chatty_task(n):
+    for i in range(n):
+        print(f"{i:04d}")
+    return n
+
+
+def test_io_wrapper_limits_captured_output(tmp_path):
+    """Test that io_wrapper returns only the head and tail of the output"""
+
+    stream_paths = (str(tmp_path / "out"), str(tmp_path / "err"))
+    output, stdout, stderr, tb = io_wrapper(
+        chatty_task, [1000], {}, str(tmp_path), stream_paths, (5, 5)
+    )
+
+    assert output == 1000
+    assert stdout == "0000\n" + TRUNCATION_MARKER.format(4990) + "0999\n"
+    assert stderr == ""
+    assert tb == ""
+    assert not os.path.exists(stream_paths[0])
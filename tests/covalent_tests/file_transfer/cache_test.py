@@ -0,0 +1,82 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+import os
+
+from covalent._file_transfer.cache import FileTransferCache
+
+
+def test_cache_fetch_and_store(tmp_path):
+    """Test that stored files are served from the cache and identical contents are stored once."""
+
+    cache = FileTransferCache(str(tmp_path / "cache"))
+    source = tmp_path / "source.csv"
+    source.write_text("data")
+
+    key = cache.key("s3://bucket/a.csv", {"etag": "1"})
+    assert not cache.fetch(key, str(tmp_path / "dest.csv"))
+
+    cache.store(key, str(source))
+    cache.store(cache.key("s3://bucket/b.csv", {"etag": "1"}), str(source))
+
+    assert cache.fetch(key, str(tmp_path / "dest.csv"))
+    assert (tmp_path / "dest.csv").read_text() == "data"
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes_served"] == 4
+    assert stats["num_objects"] == 1
+
+
+def test_cache_key_depends_on_version():
+    """Test that different versions of a remote file have different cache keys."""
+
+    assert FileTransferCache.key("s3://bucket/a.csv", {"etag": "1"}) != FileTransferCache.key(
+        "s3://bucket/a.csv", {"etag": "2"}
+    )
+
+
+def test_cache_eviction(tmp_path):
+    """Test that the least recently used contents are evicted beyond the size limit."""
+
+    cache = FileTransferCache(str(tmp_path / "cache"), max_size=250)
+    keys = []
+    for i in range(3):
+        source = tmp_path / f"source_{i}"
+        source.write_bytes(bytes([i]) * 100)
+        keys.append(cache.key(f"s3://bucket/{i}", {"etag": "1"}))
+        cache.store(keys[-1], str(source))
+        # Make the recency order deterministic
+        os.utime(cache._objects_dir / cache._refs_dir.joinpath(keys[-1]).read_text(), ns=(i, i))
+        if i == 1:
+            # Using the first file makes the second one the least recently used
+            assert cache.fetch(keys[0], str(tmp_path / "dest"))
+            os.utime(cache._objects_dir / cache._refs_dir.joinpath(keys[0]).read_text(), ns=(5, 5))
+
+    assert cache.fetch(keys[0], str(tmp_path / "dest"))
+    assert not cache.fetch(keys[1], str(tmp_path / "dest"))
+    assert cache.fetch(keys[2], str(tmp_path / "dest"))
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["num_objects"] == 2
+    assert stats["size"] == 200
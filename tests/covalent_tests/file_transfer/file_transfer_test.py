@@ -18,18 +18,22 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import os
+import shutil
 from unittest.mock import Mock
 
 import pytest
 
-from covalent._file_transfer import File
+from covalent._file_transfer import File, FileTransferCache
 from covalent._file_transfer.enums import Order
 from covalent._file_transfer.file_transfer import (
     FileTransfer,
     TransferFromRemote,
+    TransferMany,
     TransferToRemote,
 )
 from covalent._file_transfer.strategies.rsync_strategy import Rsync
+from covalent._file_transfer.strategies.transfer_strategy_base import FileTransferStrategy
 
 
 class TestFileTransfer:
@@ -113,3 +117,178 @@ class TestFileTransfer:
 
         with pytest.raises(ValueError):
             result = TransferToRemote("file:///home/one", "file:///home/one/", strategy=strategy)
+
+
+class FakeRemoteStrategy(FileTransferStrategy):
+    """Strategy serving "remote" files from a local directory, counting downloads."""
+
+    def __init__(self, remote_dir):
+        self.remote_dir = remote_dir
+        self.num_transfers = 0
+
+    def _remote_path(self, file):
+        return os.path.join(self.remote_dir, os.path.basename(file.filepath))
+
+    def get_metadata(self, file):
+        if not os.path.exists(self._remote_path(file)):
+            return None
+        stat = os.stat(self._remote_path(file))
+        return {"size": stat.st_size, "etag": str(stat.st_mtime_ns)}
+
+    def download(self, from_file, to_file):
+        def callable():
+            self.num_transfers += 1
+            shutil.copyfile(self._remote_path(from_file), to_file.filepath)
+
+        return callable
+
+    def upload(self, from_file, to_file):
+        def callable():
+            self.num_transfers += 1
+            shutil.copyfile(from_file.filepath, self._remote_path(to_file))
+
+        return callable
+
+    def cp(self, from_file, to_file):
+        raise NotImplementedError
+
+
+class TestFileTransferSkipping:
+    @pytest.fixture
+    def remote_dir(self, tmp_path):
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+        (remote_dir / "data.csv").write_text("a,b\n1,2\n")
+        return remote_dir
+
+    def test_skip_unchanged_download(self, remote_dir, tmp_path):
+        strategy = FakeRemoteStrategy(str(remote_dir))
+        to_filepath = str(tmp_path / "data.csv")
+
+        def download():
+            ft = TransferFromRemote(
+                "s3://bucket/data.csv", to_filepath, strategy=strategy, skip_unchanged=True
+            )
+            ft.cp()[1]()
+
+        download()
+        download()
+        assert strategy.num_transfers == 1
+
+        # The remote file changing invalidates the local copy
+        (remote_dir / "data.csv").write_text("a,b\n3,4\n")
+        download()
+        assert strategy.num_transfers == 2
+
+        # So does the local copy changing
+        with open(to_filepath, "w") as f:
+            f.write("a,b\n5,6\n")
+        download()
+        assert strategy.num_transfers == 3
+        with open(to_filepath) as f:
+            assert f.read() == "a,b\n3,4\n"
+
+        # Touching the local copy without changing its contents does not
+        os.utime(to_filepath, ns=(0, 0))
+        download()
+        assert strategy.num_transfers == 3
+
+    def test_skip_unchanged_upload(self, remote_dir, tmp_path):
+        strategy = FakeRemoteStrategy(str(remote_dir))
+        from_filepath = str(tmp_path / "results.csv")
+        with open(from_filepath, "w") as f:
+            f.write("x\n")
+
+        def upload():
+            ft = TransferToRemote(
+                "s3://bucket/results.csv", from_filepath, strategy=strategy, skip_unchanged=True
+            )
+            ft.cp()[1]()
+
+        upload()
+        upload()
+        assert strategy.num_transfers == 1
+
+        with open(from_filepath, "w") as f:
+            f.write("y\n")
+        upload()
+        assert strategy.num_transfers == 2
+        assert (remote_dir / "results.csv").read_text() == "y\n"
+
+    def test_cached_download(self, remote_dir, tmp_path):
+        strategy = FakeRemoteStrategy(str(remote_dir))
+        cache = FileTransferCache(str(tmp_path / "cache"))
+
+        for i in range(3):
+            to_filepath = str(tmp_path / f"data_{i}.csv")
+            TransferFromRemote(
+                "s3://bucket/data.csv", to_filepath, strategy=strategy, cache=cache
+            ).cp()[1]()
+            with open(to_filepath) as f:
+                assert f.read() == "a,b\n1,2\n"
+
+        assert strategy.num_transfers == 1
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["num_objects"]) == (2, 1, 1)
+
+    def test_unknown_metadata_always_transfers(self, remote_dir, tmp_path):
+        strategy = FakeRemoteStrategy(str(remote_dir))
+        strategy.get_metadata = Mock(return_value=None)
+        to_filepath = str(tmp_path / "data.csv")
+
+        for _ in range(2):
+            TransferFromRemote(
+                "s3://bucket/data.csv", to_filepath, strategy=strategy, skip_unchanged=True
+            ).cp()[1]()
+
+        assert strategy.num_transfers == 2
+
+
+class TestTransferMany:
+    def test_raise_exception_invalid_args(self):
+        with pytest.raises(ValueError):
+            TransferMany([])
+
+        with pytest.raises(ValueError):
+            TransferMany(
+                [
+                    TransferFromRemote("file:///remote/a.csv", "file:///local/a.csv"),
+                    TransferToRemote("file:///remote/b.csv", "file:///local/b.csv"),
+                ]
+            )
+
+    def test_order(self):
+        file_transfers = [
+            TransferToRemote(f"file:///remote/{i}.csv", f"file:///local/{i}.csv") for i in range(3)
+        ]
+        assert TransferMany(file_transfers).order == Order.AFTER
+
+    def test_cp_batches_rsync_transfers(self, mocker):
+        strategy = Rsync(user="admin", host="11.11.11.11")
+        other_host_strategy = Rsync(user="admin", host="22.22.22.22")
+        other_strategy = Mock()
+        file_transfers = [
+            TransferFromRemote(f"/remote/{i}.csv", f"/local/{i}.csv", strategy) for i in range(3)
+        ]
+        file_transfers.append(
+            TransferFromRemote("/remote/3.csv", "/local/3.csv", other_host_strategy)
+        )
+        file_transfers.append(TransferFromRemote("/remote/4.csv", "/local/4.csv", other_strategy))
+
+        transfer_many_mock = mocker.patch.object(Rsync, "transfer_many")
+        pre_transfer_hook, file_transfer_call_dep = TransferMany(file_transfers).cp()
+
+        pre_transfer_results = pre_transfer_hook()
+        assert len(pre_transfer_results) == 5
+        assert pre_transfer_results[:4] == [
+            (f"/remote/{i}.csv", f"/local/{i}.csv") for i in range(4)
+        ]
+
+        # one batch per host, while the non-rsync transfer goes through its own strategy
+        batches = [call.args[0] for call in transfer_many_mock.call_args_list]
+        assert batches == [file_transfers[:3], file_transfers[3:4]]
+        other_strategy.download.assert_called_once()
+
+        file_transfer_call_dep()
+        assert transfer_many_mock.return_value.call_count == 2
+        other_strategy.download.return_value.assert_called_once()
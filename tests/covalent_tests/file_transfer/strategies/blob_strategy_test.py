@@ -68,7 +68,10 @@ def test_get_blob_client(mocker, blob_strategy):
 
     credential_mock.assert_called_once_with(*blob_strategy.credentials)
     blob_service_client_mock.assert_called_once_with(
-        account_url=MOCK_BLOB_STORAGE_ACCOUNT_URL, credential=credential_mock.return_value
+        account_url=MOCK_BLOB_STORAGE_ACCOUNT_URL,
+        credential=credential_mock.return_value,
+        max_block_size=blob_strategy.chunk_size,
+        max_single_put_size=blob_strategy.chunk_size,
     )
 
     sys.modules["azure.storage.blob"] = None
@@ -88,27 +91,43 @@ def test_parse_blob_uri(blob_strategy):
     assert result[2] == MOCK_BLOB_NAME
 
 
-def test_download_file(mocker, blob_strategy):
+def test_download_file(mocker, tmp_path, blob_strategy):
+    data = b"0123456789" * 100
+    destination_path = tmp_path / "data.csv"
+    blob_strategy.chunk_size = 300
+
     container_client_mock = MagicMock()
 
     blob_client_mock = container_client_mock.get_blob_client
     blob_client_mock.return_value = MagicMock()
+    blob_client_mock().get_blob_properties.return_value = MagicMock(size=len(data), etag="v1")
 
-    download_mock = blob_client_mock().download_blob
-    stream_mock = MagicMock()
-    download_mock.return_value = stream_mock
+    def download_blob(offset, length, etag, match_condition):
+        stream_mock = MagicMock()
+        stream_mock.chunks.return_value = [data[offset : offset + length]]
+        return stream_mock
 
-    readall_mock = stream_mock.readall
-    readall_mock().return_value = MagicMock()
+    download_mock = blob_client_mock().download_blob
+    download_mock.side_effect = download_blob
 
-    open_mock = mocker.patch("covalent._file_transfer.strategies.blob_strategy.open", mock_open())
+    azure_core_mock = MagicMock()
+    mocker.patch.dict(
+        sys.modules,
+        {"azure.core": azure_core_mock, "azure.core.exceptions": MagicMock()},
+    )
 
-    blob_strategy._download_file(container_client_mock, MOCK_BLOB_NAME, MOCK_LOCAL_FILEPATH)
+    blob_strategy._download_file(container_client_mock, MOCK_BLOB_NAME, destination_path)
 
     blob_client_mock.assert_called_with(blob=MOCK_BLOB_NAME)
-    open_mock.assert_called_once_with(MOCK_LOCAL_FILEPATH, "wb")
-    open_mock().write.assert_called_once_with(readall_mock.return_value)
-    download_mock.assert_called_once()
+    assert destination_path.read_bytes() == data
+    assert download_mock.call_count == 4
+    # Every range is pinned to the ETag of the blob whose size was read
+    download_mock.assert_any_call(
+        offset=900,
+        length=100,
+        etag="v1",
+        match_condition=azure_core_mock.MatchConditions.IfNotModified,
+    )
 
 
 def test_download(mocker, blob_strategy):
@@ -150,7 +169,12 @@ def test_upload_file(mocker, blob_strategy):
     blob_strategy._upload_file(container_client_mock, MOCK_LOCAL_FILEPATH, MOCK_BLOB_NAME)
 
     open_mock.assert_called_once_with(MOCK_LOCAL_FILEPATH, "rb")
-    upload_mock.assert_called_once_with(name=MOCK_BLOB_NAME, data=open_mock(), overwrite=True)
+    upload_mock.assert_called_once_with(
+        name=MOCK_BLOB_NAME,
+        data=open_mock(),
+        overwrite=True,
+        max_concurrency=blob_strategy.max_concurrency,
+    )
 
 
 def test_upload(mocker, blob_strategy):
@@ -0,0 +1,139 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+import json
+
+import pytest
+
+from covalent._file_transfer.strategies.chunked_transfer import (
+    ObjectChangedError,
+    download_in_chunks,
+)
+
+DATA = bytes(range(256)) * 40
+
+
+def make_read_range(data, requested, fail_at=None):
+    def read_range(start, end):
+        if start == fail_at:
+            raise IOError("Connection reset")
+        requested.append((start, end))
+        yield data[start : end + 1]
+
+    return read_range
+
+
+@pytest.mark.parametrize("chunk_size", [1000, len(DATA), 2 * len(DATA)])
+def test_download_in_chunks(tmp_path, chunk_size):
+    """Test that all ranges of an object are downloaded and assembled in order."""
+
+    to_filepath = str(tmp_path / "data.bin")
+    requested = []
+
+    download_in_chunks(make_read_range(DATA, requested), len(DATA), to_filepath, chunk_size, 4)
+
+    with open(to_filepath, "rb") as f:
+        assert f.read() == DATA
+    assert sorted(requested)[0] == (0, min(chunk_size, len(DATA)) - 1)
+    assert len(requested) == -(-len(DATA) // chunk_size)
+    assert list(tmp_path.iterdir()) == [tmp_path / "data.bin"]
+
+
+def test_download_in_chunks_empty(tmp_path):
+    """Test that an empty object produces an empty file without reading any ranges."""
+
+    to_filepath = str(tmp_path / "empty.bin")
+    requested = []
+
+    download_in_chunks(make_read_range(b"", requested), 0, to_filepath, 1000, 4)
+
+    with open(to_filepath, "rb") as f:
+        assert f.read() == b""
+    assert requested == []
+
+
+@pytest.mark.parametrize("fingerprint_changed", [False, True])
+def test_download_in_chunks_resume(tmp_path, fingerprint_changed):
+    """Test that an interrupted download only fetches the missing chunks, unless the object changed."""
+
+    to_filepath = str(tmp_path / "data.bin")
+    requested = []
+
+    with pytest.raises(IOError):
+        download_in_chunks(
+            make_read_range(DATA, requested, fail_at=5000),
+            len(DATA),
+            to_filepath,
+            1000,
+            1,
+            "v1",
+        )
+
+    with open(f"{to_filepath}.part.json") as f:
+        progress = json.load(f)
+    done = set(progress["done"])
+    assert {0, 1, 2, 3, 4} <= done
+    assert 5 not in done
+
+    requested.clear()
+    download_in_chunks(
+        make_read_range(DATA, requested),
+        len(DATA),
+        to_filepath,
+        1000,
+        4,
+        "v2" if fingerprint_changed else "v1",
+    )
+
+    with open(to_filepath, "rb") as f:
+        assert f.read() == DATA
+    expected_chunks = 11 if fingerprint_changed else 11 - len(done)
+    assert len(requested) == expected_chunks
+    assert list(tmp_path.iterdir()) == [tmp_path / "data.bin"]
+
+
+def test_download_in_chunks_short_read(tmp_path):
+    """Test that a range returning fewer bytes than requested fails the download."""
+
+    to_filepath = str(tmp_path / "data.bin")
+
+    def read_range(start, end):
+        yield DATA[start:end]
+
+    with pytest.raises(IOError):
+        download_in_chunks(read_range, len(DATA), to_filepath, 1000, 4)
+
+
+def test_download_in_chunks_object_changed(tmp_path):
+    """Test that a download is discarded rather than kept for resuming if the object changes."""
+
+    to_filepath = str(tmp_path / "data.bin")
+    requested = []
+    read_range = make_read_range(DATA, requested)
+
+    def changing_read_range(start, end):
+        if start >= 5000:
+            raise ObjectChangedError("changed")
+        yield from read_range(start, end)
+
+    with pytest.raises(ObjectChangedError):
+        download_in_chunks(changing_read_range, len(DATA), to_filepath, 1000, 1, "v1")
+
+    assert list(tmp_path.iterdir()) == []
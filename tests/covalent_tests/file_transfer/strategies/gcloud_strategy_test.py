@@ -109,14 +109,24 @@ def test_parse_uri(gcloud_strategy):
     assert str(result[1]) == MOCK_REMOTE_OBJECT_NAME
 
 
-def test_download_file(gcloud_strategy):
-    blob_client_mock = MagicMock()
-    destination_path = MOCK_LOCAL_FILEPATH
-    download_mock = blob_client_mock.download_to_filename
+def test_download_file(mocker, tmp_path, gcloud_strategy):
+    data = b"0123456789" * 100
+    destination_path = str(tmp_path / "data.csv")
+    gcloud_strategy.chunk_size = 300
+
+    blob_client_mock = MagicMock(size=len(data), generation=1)
+    download_mock = blob_client_mock.download_as_bytes
+    download_mock.side_effect = lambda start, end, if_generation_match: data[start : end + 1]
+
+    mocker.patch.dict(sys.modules, {"google.api_core.exceptions": MagicMock()})
 
     gcloud_strategy._download_file(blob_client_mock, destination_path)
 
-    download_mock.assert_called_once_with(destination_path)
+    with open(destination_path, "rb") as f:
+        assert f.read() == data
+    assert download_mock.call_count == 4
+    # Every range is pinned to the generation of the object whose size was read
+    download_mock.assert_any_call(start=900, end=999, if_generation_match=1)
 
 
 def test_download(mocker, gcloud_strategy):
@@ -162,7 +172,7 @@ def test_upload_file(gcloud_strategy):
 
     gcloud_strategy._upload_file(service_client, source_path, destination_path)
 
-    blob_mock.assert_called_with(destination_path)
+    blob_mock.assert_called_with(destination_path, chunk_size=gcloud_strategy.chunk_size)
     upload_mock.assert_called_once_with(source_path)
 
 
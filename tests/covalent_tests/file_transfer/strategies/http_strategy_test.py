@@ -18,11 +18,64 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+import requests
 
 from covalent._file_transfer import File
 from covalent._file_transfer.strategies.http_strategy import HTTP
 
+RANGE_SERVER_DATA = bytes(range(256)) * 4096
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves `RANGE_SERVER_DATA` with support for single byte range requests."""
+
+    def log_message(self, *args):
+        pass
+
+    def _send_headers(self, status, start, end):
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.server.data)}")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers(200, 0, len(self.server.data) - 1)
+
+    def do_GET(self):
+        self.server.range_requests.append(self.headers.get("Range"))
+        if self.server.on_get:
+            self.server.on_get(self.server)
+        start, end = 0, len(self.server.data) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and if_range in (None, self.server.etag):
+            start, end = map(int, range_header[len("bytes=") :].split("-"))
+            self._send_headers(206, start, end)
+        else:
+            self._send_headers(200, start, end)
+        self.wfile.write(self.server.data[start : end + 1])
+
+
+@pytest.fixture
+def range_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+    server.range_requests = []
+    server.data = RANGE_SERVER_DATA
+    server.etag = '"v1"'
+    server.on_get = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
 
 class TestHTTPStrategy:
     MOCK_LOCAL_FILEPATH = "/Users/user/data.csv"
@@ -31,11 +84,104 @@ class TestHTTPStrategy:
     def test_download(self, mocker):
         # validate urlretrieve called with appropriate arguments
         urlretrieve_mock = mocker.patch("urllib.request.urlretrieve")
+        mocker.patch(
+            "covalent._file_transfer.strategies.http_strategy.requests.head"
+        ).return_value.headers = {}
         from_file = File(self.MOCK_REMOTE_FILEPATH)
         to_file = File(self.MOCK_LOCAL_FILEPATH)
         HTTP().download(from_file, to_file)()
         urlretrieve_mock.assert_called_with(from_file.uri, to_file.filepath)
 
+    def test_download_ranges(self, range_server, tmp_path):
+        # validate that servers accepting ranges are downloaded from in parallel chunks
+        url = f"http://127.0.0.1:{range_server.server_port}/data.bin"
+        to_file = File(str(tmp_path / "data.bin"))
+
+        HTTP(chunk_size=100_000, max_concurrency=4).download(File(url), to_file)()
+
+        with open(to_file.filepath, "rb") as f:
+            assert f.read() == RANGE_SERVER_DATA
+        assert len(range_server.range_requests) == -(-len(RANGE_SERVER_DATA) // 100_000)
+        assert "bytes=0-99999" in range_server.range_requests
+
+    def test_download_ranges_resume(self, range_server, tmp_path, mocker):
+        # validate that an interrupted download only requests the remaining chunks
+        url = f"http://127.0.0.1:{range_server.server_port}/data.bin"
+        to_file = File(str(tmp_path / "data.bin"))
+        strategy = HTTP(chunk_size=100_000, max_concurrency=1)
+
+        original_get = requests.get
+
+        def failing_get(url, headers, **kwargs):
+            if headers["Range"].startswith("bytes=500000-"):
+                raise ConnectionError("Connection reset")
+            return original_get(url, headers=headers, **kwargs)
+
+        get_mock = mocker.patch(
+            "covalent._file_transfer.strategies.http_strategy.requests.get",
+            side_effect=failing_get,
+        )
+        with pytest.raises(ConnectionError):
+            strategy.download(File(url), to_file)()
+
+        get_mock.side_effect = original_get
+        strategy.download(File(url), to_file)()
+
+        with open(to_file.filepath, "rb") as f:
+            assert f.read() == RANGE_SERVER_DATA
+        num_chunks = -(-len(RANGE_SERVER_DATA) // 100_000)
+        assert len(range_server.range_requests) == num_chunks
+
+    def test_download_ranges_file_changed(self, range_server, tmp_path):
+        # validate that ranges are pinned to the file's version and the download
+        # is restarted when the file changes on the server
+        url = f"http://127.0.0.1:{range_server.server_port}/data.bin"
+        to_file = File(str(tmp_path / "data.bin"))
+        new_data = bytes(reversed(RANGE_SERVER_DATA))
+
+        def change_file(server):
+            if len(server.range_requests) == 3:
+                server.data = new_data
+                server.etag = '"v2"'
+
+        range_server.on_get = change_file
+        HTTP(chunk_size=100_000, max_concurrency=1).download(File(url), to_file)()
+
+        with open(to_file.filepath, "rb") as f:
+            assert f.read() == new_data
+        num_chunks = -(-len(RANGE_SERVER_DATA) // 100_000)
+        # The chunks downloaded before the change were requested again
+        assert len(range_server.range_requests) >= 3 + num_chunks
+        assert range_server.range_requests.count("bytes=0-99999") == 2
+        assert list(tmp_path.iterdir()) == [tmp_path / "data.bin"]
+
+    def test_download_timeout(self, range_server, tmp_path, mocker):
+        # validate that requests to the server time out
+        url = f"http://127.0.0.1:{range_server.server_port}/data.bin"
+        to_file = File(str(tmp_path / "data.bin"))
+        head_spy = mocker.spy(requests, "head")
+        get_spy = mocker.spy(requests, "get")
+
+        HTTP(chunk_size=100_000, timeout=5).download(File(url), to_file)()
+
+        assert head_spy.call_args.kwargs["timeout"] == 5
+        assert all(call.kwargs["timeout"] == 5 for call in get_spy.call_args_list)
+
+    def test_get_metadata(self, range_server, mocker):
+        # validate that the file's version is identified by its ETag and Last-Modified headers
+        url = f"http://127.0.0.1:{range_server.server_port}/data.bin"
+
+        assert HTTP().get_metadata(File(url)) == {
+            "size": str(len(RANGE_SERVER_DATA)),
+            "etag": '"v1"',
+            "last_modified": None,
+        }
+
+        mocker.patch(
+            "covalent._file_transfer.strategies.http_strategy.requests.head"
+        ).return_value.headers = {"Content-Length": "10"}
+        assert HTTP().get_metadata(File(url)) is None
+
     @pytest.mark.parametrize(
         "operation",
         [
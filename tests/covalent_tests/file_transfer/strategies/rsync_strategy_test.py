@@ -18,12 +18,18 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import shutil
 from subprocess import CalledProcessError
 from unittest.mock import Mock
 
 import pytest
 
 from covalent._file_transfer import File
+from covalent._file_transfer.file_transfer import (
+    FileTransfer,
+    TransferFromRemote,
+    TransferToRemote,
+)
 from covalent._file_transfer.strategies.rsync_strategy import Rsync
 
 
@@ -156,3 +162,126 @@ class TestRsyncStrategy:
             download_cmd_without_key
             == f"rsync -ae ssh {self.MOCK_USER}@{self.MOCK_HOST}:{self.MOCK_REMOTE_FILEPATH} {self.MOCK_LOCAL_FILEPATH}"
         )
+
+
+class TestRsyncTransferMany:
+    MOCK_HOST = "11.11.11.11"
+    MOCK_USER = "admin"
+
+    def test_transfer_many_groups_by_directory(self, mocker):
+        # validate files moving between the same directories share one rsync invocation
+
+        files_from_contents = []
+
+        def popen(cmd, **kwargs):
+            if "--files-from=" in cmd:
+                files_from = cmd.split("--files-from=")[1].split(" ")[0]
+                with open(files_from) as f:
+                    files_from_contents.append(f.read().split())
+            process = Mock()
+            process.communicate.return_value = ("", "")
+            process.returncode = 0
+            return process
+
+        popen_mock = mocker.patch(
+            "covalent._file_transfer.strategies.rsync_strategy.Popen", side_effect=popen
+        )
+
+        strategy = Rsync(user=self.MOCK_USER, host=self.MOCK_HOST)
+        file_transfers = [
+            TransferFromRemote(f"/remote/data/file_{i}.csv", f"/local/data/file_{i}.csv", strategy)
+            for i in range(50)
+        ]
+        file_transfers.append(
+            TransferFromRemote("/remote/data/a.csv", "/local/data/renamed.csv", strategy)
+        )
+        file_transfers.append(
+            TransferToRemote("/remote/results/out.csv", "/local/results/out.csv", strategy)
+        )
+
+        strategy.transfer_many(file_transfers)()
+
+        cmds = [call.args[0] for call in popen_mock.call_args_list]
+        assert len(cmds) == 3
+        assert cmds[0].startswith("rsync -a --files-from=")
+        assert cmds[0].endswith(f"{self.MOCK_USER}@{self.MOCK_HOST}:/remote/data/ /local/data/")
+        assert "ControlMaster=auto" in cmds[0]
+        assert files_from_contents[0] == [f"file_{i}.csv" for i in range(50)]
+        assert files_from_contents[1] == ["out.csv"]
+        assert cmds[2].endswith(
+            f"{self.MOCK_USER}@{self.MOCK_HOST}:/remote/data/a.csv /local/data/renamed.csv"
+        )
+        assert "ControlMaster=auto" in cmds[2]
+
+    def test_transfer_many_failure(self, mocker):
+        # validate that a failed invocation fails the batch
+
+        process = Mock()
+        process.communicate.return_value = ("", "syntax or usage error (code 1)")
+        process.returncode = 1
+        mocker.patch(
+            "covalent._file_transfer.strategies.rsync_strategy.Popen", return_value=process
+        )
+
+        strategy = Rsync()
+        with pytest.raises(CalledProcessError):
+            strategy.transfer_many(
+                [FileTransfer("/tmp/a.csv", "/tmp/b/a.csv", strategy=strategy)]
+            )()
+
+    @pytest.mark.skipif(shutil.which("rsync") is None, reason="rsync is not installed")
+    def test_transfer_many_local(self, tmp_path):
+        # validate a batch of local transfers with rsync's local mode
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "dest").mkdir()
+        for i in range(20):
+            (tmp_path / "src" / f"file_{i}.txt").write_text(str(i))
+
+        strategy = Rsync()
+        file_transfers = [
+            FileTransfer(
+                str(tmp_path / "src" / f"file_{i}.txt"),
+                str(tmp_path / "dest" / f"file_{i}.txt"),
+                strategy=strategy,
+            )
+            for i in range(20)
+        ]
+        strategy.transfer_many(file_transfers)()
+
+        for i in range(20):
+            assert (tmp_path / "dest" / f"file_{i}.txt").read_text() == str(i)
+
+    def test_transfer_many_relative_path(self, mocker):
+        # validate that relative paths are relative to the working directory, not the root
+
+        process = Mock()
+        process.communicate.return_value = ("", "")
+        process.returncode = 0
+        popen_mock = mocker.patch(
+            "covalent._file_transfer.strategies.rsync_strategy.Popen", return_value=process
+        )
+
+        strategy = Rsync(user=self.MOCK_USER, host=self.MOCK_HOST)
+        file_transfer = TransferToRemote("/remote/data/data.txt", "data.txt", strategy)
+        assert file_transfer.from_file.filepath == "data.txt"
+
+        strategy.transfer_many([file_transfer])()
+
+        cmd = popen_mock.call_args.args[0]
+        assert cmd.endswith(f" ./ {self.MOCK_USER}@{self.MOCK_HOST}:/remote/data/")
+
+    @pytest.mark.skipif(shutil.which("rsync") is None, reason="rsync is not installed")
+    def test_transfer_many_local_relative_path(self, tmp_path, monkeypatch):
+        # validate a local transfer from a path relative to the working directory
+
+        (tmp_path / "dest").mkdir()
+        (tmp_path / "data.txt").write_text("data")
+        monkeypatch.chdir(tmp_path)
+
+        strategy = Rsync()
+        strategy.transfer_many(
+            [FileTransfer("data.txt", str(tmp_path / "dest" / "data.txt"), strategy=strategy)]
+        )()
+
+        assert (tmp_path / "dest" / "data.txt").read_text() == "data"
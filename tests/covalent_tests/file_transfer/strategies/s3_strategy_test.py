@@ -18,6 +18,7 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import os
 import sys
 from unittest.mock import MagicMock
 
@@ -25,7 +26,8 @@ import pytest
 from furl import furl
 
 from covalent._file_transfer import File, Folder
-from covalent._file_transfer.strategies.s3_strategy import S3
+from covalent._file_transfer.strategies.chunked_transfer import ObjectChangedError
+from covalent._file_transfer.strategies.s3_strategy import S3, _download_object
 
 
 class TestS3Strategy:
@@ -63,25 +65,96 @@ class TestS3Strategy:
         sys.modules["boto3"] = boto3_mock
 
         boto3_client_mock = boto3_mock.Session().client
-        boto3_client_mock.download_file.return_value = None
+        download_object_mock = mocker.patch(
+            "covalent._file_transfer.strategies.s3_strategy._download_object"
+        )
 
         from_file = File(self.MOCK_REMOTE_FILEPATH)
         to_file = File(self.MOCK_LOCAL_FILEPATH)
 
         bucket_name = furl(from_file.uri).origin[5:]
 
-        S3(**self.MOCK_STRATEGY_CONFIG).download(from_file, to_file)()
+        strategy = S3(**self.MOCK_STRATEGY_CONFIG)
+        strategy.download(from_file, to_file)()
 
-        boto3_client_mock().download_file.assert_called_with(
-            bucket_name, from_file.filepath.strip("/"), to_file.filepath
+        download_object_mock.assert_called_with(
+            boto3_client_mock(),
+            bucket_name,
+            from_file.filepath.strip("/"),
+            to_file.filepath,
+            strategy.chunk_size,
+            strategy.max_concurrency,
         )
 
+    def test_download_object(self, tmp_path):
+        # validate that objects are fetched with ranged GETs pinned to the object's ETag
+
+        data = b"0123456789" * 100
+        s3_mock = MagicMock()
+        s3_mock.head_object.return_value = {"ContentLength": len(data), "ETag": '"v1"'}
+
+        def get_object(Bucket, Key, Range, IfMatch):
+            start, end = map(int, Range[len("bytes=") :].split("-"))
+            body = MagicMock()
+            body.iter_chunks.return_value = [data[start : end + 1]]
+            return {"Body": body}
+
+        s3_mock.get_object.side_effect = get_object
+        to_filepath = str(tmp_path / "data.csv")
+
+        _download_object(s3_mock, "covalent-tmp", "data.csv", to_filepath, 300, 4)
+
+        with open(to_filepath, "rb") as f:
+            assert f.read() == data
+        s3_mock.head_object.assert_called_once_with(Bucket="covalent-tmp", Key="data.csv")
+        assert s3_mock.get_object.call_count == 4
+        s3_mock.get_object.assert_any_call(
+            Bucket="covalent-tmp", Key="data.csv", Range="bytes=900-999", IfMatch='"v1"'
+        )
+
+    def test_download_object_changed(self, tmp_path):
+        # validate that a failed ETag precondition discards the partial download
+
+        from botocore.exceptions import ClientError
+
+        data = b"0123456789" * 100
+        s3_mock = MagicMock()
+        s3_mock.head_object.return_value = {"ContentLength": len(data), "ETag": '"v1"'}
+
+        def get_object(Bucket, Key, Range, IfMatch):
+            start, end = map(int, Range[len("bytes=") :].split("-"))
+            if start > 0:
+                raise ClientError(
+                    {
+                        "Error": {
+                            "Code": "PreconditionFailed",
+                            "Message": "Precondition Failed",
+                        },
+                        "ResponseMetadata": {"HTTPStatusCode": 412},
+                    },
+                    "GetObject",
+                )
+            body = MagicMock()
+            body.iter_chunks.return_value = [data[start : end + 1]]
+            return {"Body": body}
+
+        s3_mock.get_object.side_effect = get_object
+        to_filepath = str(tmp_path / "data.csv")
+
+        with pytest.raises(ObjectChangedError):
+            _download_object(s3_mock, "covalent-tmp", "data.csv", to_filepath, 300, 1)
+
+        assert os.listdir(tmp_path) == []
+
     def test_upload(self, mocker):
         # validate boto3.client('s3').upload_file is called with appropriate arguments
 
         boto3_mock = MagicMock()
         sys.modules["boto3"] = boto3_mock
 
+        transfer_mock = MagicMock()
+        sys.modules["boto3.s3.transfer"] = transfer_mock
+
         boto3_client_mock = boto3_mock.Session().client
         boto3_client_mock.download_file.return_value = None
 
@@ -90,12 +163,23 @@ class TestS3Strategy:
 
         bucket_name = furl(to_file.uri).origin[5:]
 
-        S3(**self.MOCK_STRATEGY_CONFIG).upload(from_file, to_file)()
+        strategy = S3(**self.MOCK_STRATEGY_CONFIG)
+        strategy.upload(from_file, to_file)()
 
+        transfer_mock.TransferConfig.assert_called_once_with(
+            multipart_threshold=strategy.chunk_size,
+            multipart_chunksize=strategy.chunk_size,
+            max_concurrency=strategy.max_concurrency,
+        )
         boto3_client_mock().upload_file.assert_called_with(
-            from_file.filepath, bucket_name, to_file.filepath.strip("/")
+            from_file.filepath,
+            bucket_name,
+            to_file.filepath.strip("/"),
+            Config=transfer_mock.TransferConfig.return_value,
         )
 
+        del sys.modules["boto3.s3.transfer"]
+
     def test_cp_failure(self, mocker):
         """Test that the cp has not been implemented."""
         mock_boto3 = MagicMock()
@@ -121,16 +205,27 @@ class TestS3Strategy:
                 {"Key": "test.csv"},
             ]
         }
-        callable_func = S3(**self.MOCK_STRATEGY_CONFIG).download(from_folder, to_folder)
+        download_object_mock = mocker.patch(
+            "covalent._file_transfer.strategies.s3_strategy._download_object"
+        )
+        strategy = S3(**self.MOCK_STRATEGY_CONFIG)
+        callable_func = strategy.download(from_folder, to_folder)
         callable_func()
-        boto3_client_mock().download_file.assert_called_once_with(
-            bucket_name, "test.csv", "/tmp/test.csv"
+        download_object_mock.assert_called_once_with(
+            boto3_client_mock(),
+            bucket_name,
+            "test.csv",
+            "/tmp/test.csv",
+            strategy.chunk_size,
+            strategy.max_concurrency,
         )
 
     def test_folder_upload(self, mocker):
         """Test the s3 file upload method when remote and local folders are provided."""
         boto3_mock = MagicMock()
         sys.modules["boto3"] = boto3_mock
+        transfer_mock = MagicMock()
+        sys.modules["boto3.s3.transfer"] = transfer_mock
 
         boto3_client_mock = boto3_mock.Session().client
 
@@ -160,5 +255,10 @@ class TestS3Strategy:
         callable_func = S3(**self.MOCK_STRATEGY_CONFIG).upload(from_folder, to_folder)
         callable_func()
         boto3_client_mock().upload_file.assert_called_once_with(
-            "/tmp/mock_join", bucket_name, "mock_join"
+            "/tmp/mock_join",
+            bucket_name,
+            "mock_join",
+            Config=transfer_mock.TransferConfig.return_value,
         )
+
+        del sys.modules["boto3.s3.transfer"]
@@ -0,0 +1,79 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Tests for the modules imported by the SDK and the CLI."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _imported_modules(statement):
+    """Return the modules imported by `statement` in a fresh interpreter."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+    return modules
+
+
+@pytest.mark.parametrize(
+    "statement,deferred_modules",
+    [
+        ("import covalent", ["pennylane", "mpire", "distributed", "pkg_resources", "sqlalchemy"]),
+        ("import covalent_dispatcher._cli.cli", ["pennylane", "distributed", "sqlalchemy"]),
+    ],
+)
+def test_deferred_imports(statement, deferred_modules):
+    """Test that importing the SDK and the CLI defers the heavy subsystems."""
+
+    modules = _imported_modules(statement)
+    assert not modules.intersection(deferred_modules)
+
+
+def test_lazy_public_api():
+    """Test that the lazily loaded public objects are available from the package."""
+
+    statement = "; ".join(
+        [
+            "import sys",
+            "import covalent as ct",
+            "assert 'pennylane' not in sys.modules",
+            "assert {'QCluster', 'qelectron'} <= set(ct.__all__) & set(dir(ct))",
+            "from covalent import qelectron",
+            "assert qelectron.__module__ == 'covalent'",
+            "assert ct.QCluster.__module__ == 'covalent'",
+            "from covalent.executor import LocalExecutor",
+            "assert 'local' in ct.executor._executor_manager.executor_plugins_map",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)
@@ -18,12 +18,24 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import multiprocessing
+import os
 import tempfile
 from dataclasses import asdict
 
 import pytest
-
-from covalent._shared_files.config import ConfigManager, get_config, reload_config, set_config
+import toml
+
+from covalent._shared_files.config import (
+    ConfigManager,
+    get_config,
+    get_db_path,
+    get_executor_config,
+    get_results_dir,
+    reload_config,
+    set_config,
+    update_config,
+)
 from covalent._shared_files.defaults import DefaultConfig
 
 DEFAULT_CONFIG = asdict(DefaultConfig())
@@ -270,3 +282,104 @@ def test_config_manager_set(mocker, config_manager):
         "mock_section": {"mock_dir": "final_value", "new_mock_dir": "mock_value"},
         "new_mock_section": {"new_mock_dir": {"new_mock_dir": "mock_value"}},
     }
+
+
+@pytest.fixture
+def tmp_config_dir(monkeypatch):
+    """Point the config manager at an empty config directory."""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        monkeypatch.setenv("COVALENT_CONFIG_DIR", tmp_dir)
+        yield tmp_dir
+
+
+def test_get_config_cached(mocker, tmp_config_dir):
+    """Test that config lookups reuse the config manager while the file is unchanged."""
+
+    init_spy = mocker.spy(ConfigManager, "__init__")
+
+    port = get_config("dispatcher.port")
+    for _ in range(10):
+        assert get_config("dispatcher.port") == port
+
+    assert init_spy.call_count == 1
+
+
+def test_get_config_reloads_modified_file(tmp_config_dir):
+    """Test that config lookups reflect modifications of the config file."""
+
+    config_file = f"{tmp_config_dir}/covalent.conf"
+    get_config("dispatcher.port")
+
+    with open(config_file) as f:
+        config_data = toml.load(f)
+    config_data["dispatcher"]["port"] = 1234
+    with open(config_file, "w") as f:
+        toml.dump(config_data, f)
+
+    assert get_config("dispatcher.port") == 1234
+
+    set_config("dispatcher.port", 4321)
+    with open(config_file) as f:
+        assert toml.load(f)["dispatcher"]["port"] == 4321
+
+
+def test_get_config_returns_copies(tmp_config_dir):
+    """Test that modifying returned config values does not modify the configuration."""
+
+    get_config("dispatcher")["port"] = "modified"
+    get_config()["dispatcher"]["port"] = "modified"
+
+    assert get_config("dispatcher.port") != "modified"
+
+
+def test_typed_accessors(tmp_config_dir):
+    """Test the accessors of frequently used config values."""
+
+    assert get_results_dir() == get_config("dispatcher.results_dir")
+    assert get_db_path() == get_config("dispatcher.db_path")
+    assert get_executor_config("mock") == {}
+
+    update_config({"executors": {"mock": {"mock_param": "mock_value"}}})
+    assert get_executor_config("mock") == {"mock_param": "mock_value"}
+
+
+def test_update_config_skips_unchanged_write(mocker, tmp_config_dir):
+    """Test that the config file is only rewritten when its contents change."""
+
+    cm = ConfigManager()
+    write_config_spy = mocker.spy(cm, "write_config")
+
+    cm.update_config({"dispatcher": {"port": cm.get("dispatcher.port")}})
+    write_config_spy.assert_not_called()
+
+    cm.update_config({"dispatcher": {"port": 1234}})
+    write_config_spy.assert_called_once()
+
+
+def _update_config_many(config_dir, worker_id, num_updates):
+    os.environ["COVALENT_CONFIG_DIR"] = config_dir
+    for i in range(num_updates):
+        update_config({"contention_test": {f"worker_{worker_id}": i}})
+
+
+def test_update_config_multiprocess(tmp_config_dir):
+    """Test concurrent config updates from several processes."""
+
+    get_config()
+    num_workers, num_updates = 4, 10
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_update_config_many, args=(tmp_config_dir, i, num_updates))
+        for i in range(num_workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0] * num_workers
+    assert get_config("contention_test") == {
+        f"worker_{i}": num_updates - 1 for i in range(num_workers)
+    }
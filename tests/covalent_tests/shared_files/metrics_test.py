@@ -20,7 +20,13 @@
 
 """Unit tests for metrics module."""
 
-from covalent._shared_files.metrics import PlatformMetadata
+import json
+import time
+
+import pytest
+
+from covalent._shared_files import metrics
+from covalent._shared_files.metrics import MetricsRecorder, PlatformMetadata
 
 
 def test_platform_metdata():
@@ -37,3 +43,242 @@ def test_platform_metdata():
     print(pmd.machine)
     print(pmd.os)
     print(pmd.python_version)
+
+
+def test_metrics_recorder_aggregates_node_phases():
+    """Test that recorded events are aggregated per node and phase."""
+
+    recorder = MetricsRecorder()
+    recorder.record("dispatch", 0, metrics.EXECUTION, 1.0, 3.0)
+    recorder.record("dispatch", 0, metrics.EXECUTION, 4.0, 5.0)
+    recorder.record("dispatch", 1, metrics.INPUT_FETCH, 1.0, 1.5)
+    recorder.record("dispatch", metrics.DISPATCH_NODE_ID, metrics.RUNTIME, 0.0, 10.0)
+    recorder.record("other_dispatch", 0, metrics.EXECUTION, 0.0, 100.0)
+
+    dispatch_metrics = recorder.get_dispatch_metrics("dispatch")
+
+    assert dispatch_metrics.runtime == 10.0
+    assert dispatch_metrics.nodes[0].execution == 3.0
+    assert dispatch_metrics.nodes[1].input_fetch == 0.5
+    assert dispatch_metrics.nodes[1].execution == 0.0
+    assert recorder.get_dispatch_metrics("unknown_dispatch") is None
+
+
+def test_metrics_recorder_start_stop_and_timed():
+    """Test timing phases across calls and with the context manager."""
+
+    recorder = MetricsRecorder()
+    recorder.start("dispatch", 0, metrics.QUEUEING)
+    recorder.stop("dispatch", 0, metrics.QUEUEING)
+    recorder.stop("dispatch", 1, metrics.QUEUEING)
+    with recorder.timed("dispatch", 1, metrics.EXECUTION):
+        time.sleep(0.01)
+
+    dispatch_metrics = recorder.get_dispatch_metrics("dispatch")
+
+    assert dispatch_metrics.nodes[0].queueing >= 0
+    assert dispatch_metrics.nodes[1].queueing == 0
+    assert dispatch_metrics.nodes[1].execution >= 0.01
+
+
+def test_metrics_recorder_ring_buffer_is_bounded():
+    """Test that the oldest events are overwritten once the buffer is full."""
+
+    recorder = MetricsRecorder(max_events=2)
+    for node_id in range(3):
+        recorder.record("dispatch", node_id, metrics.EXECUTION, 0.0, 1.0)
+
+    assert list(recorder.get_dispatch_metrics("dispatch").nodes) == [1, 2]
+
+
+def test_metrics_recorder_pending_phases_are_bounded():
+    """Test that phases never stopped are discarded and do not accumulate."""
+
+    recorder = MetricsRecorder(max_events=2)
+    for node_id in range(3):
+        recorder.start("dispatch", node_id, metrics.QUEUEING)
+    recorder.start("other_dispatch", 0, metrics.QUEUEING)
+
+    assert list(recorder._pending) == [
+        ("dispatch", 2, metrics.QUEUEING),
+        ("other_dispatch", 0, metrics.QUEUEING),
+    ]
+
+    recorder.discard_pending("dispatch")
+    assert list(recorder._pending) == [("other_dispatch", 0, metrics.QUEUEING)]
+
+
+def test_metrics_recorder_counters():
+    """Test that counters are attributed to the dispatch in the current context."""
+
+    recorder = MetricsRecorder(max_dispatches=1)
+    recorder.count(metrics.DB_READS)
+    assert recorder.get_dispatch_metrics("dispatch") is None
+
+    token = metrics.current_dispatch_id.set("dispatch")
+    try:
+        recorder.count(metrics.DB_READS)
+        recorder.count(metrics.DB_READS)
+        recorder.count(metrics.BYTES_SERIALIZED, 128)
+    finally:
+        metrics.current_dispatch_id.reset(token)
+
+    dispatch_metrics = recorder.get_dispatch_metrics("dispatch")
+    assert dispatch_metrics.db_reads == 2
+    assert dispatch_metrics.db_writes == 0
+    assert dispatch_metrics.bytes_serialized == 128
+
+    # Counters of the least recently created dispatch are evicted
+    recorder.count(metrics.DB_WRITES, dispatch_id="other_dispatch")
+    assert recorder.get_dispatch_metrics("dispatch") is None
+    assert recorder.get_dispatch_metrics("other_dispatch").db_writes == 1
+
+
+def test_dispatch_metrics_to_performance_metrics():
+    """Test summarizing dispatch metrics as performance metrics."""
+
+    dispatch_metrics = metrics.DispatchMetrics(
+        dispatch_id="dispatch",
+        runtime=4.0,
+        persistence=0.5,
+        db_reads=3,
+        db_writes=2,
+        nodes={
+            0: metrics.NodeMetrics(node_id=0, execution=1.0, queueing=0.5, persistence=0.5),
+            1: metrics.NodeMetrics(node_id=1, execution=1.0, input_fetch=0.5),
+        },
+    )
+
+    performance_metrics = dispatch_metrics.to_performance_metrics()
+
+    assert performance_metrics.workflow_runtime == 2.0
+    assert performance_metrics.covalent_runtime == 4.0
+    assert performance_metrics.covalent_speedup == 0.5
+    assert performance_metrics.covalent_overhead == 1.0
+    assert performance_metrics.covalent_disk_io_time == 1.0
+    assert performance_metrics.covalent_total_db_reads == 3
+    assert performance_metrics.covalent_total_db_writes == 2
+    assert performance_metrics.covalent_electron_throughput == 0.5
+    assert performance_metrics.covalent_electron_latency == 0.75
+
+    assert (
+        metrics.DispatchMetrics(dispatch_id="dispatch").to_performance_metrics().covalent_speedup
+        == 0
+    )
+
+
+def test_counter_and_gauge_render():
+    """Test exporting counters and gauges in the Prometheus text format."""
+
+    counter = metrics.Counter("test_events_total", "Test events", ("kind",))
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    counter.labels('b"c').inc()
+    gauge = metrics.Gauge("test_level", "Test level")
+    gauge.inc(5)
+    gauge.dec(2)
+    computed_gauge = metrics.Gauge(
+        "test_computed", "Test computed", ("kind",), function=lambda: {("a",): 7}
+    )
+
+    assert counter.render() == (
+        "# HELP test_events_total Test events\n"
+        "# TYPE test_events_total counter\n"
+        'test_events_total{kind="a"} 3.0\n'
+        'test_events_total{kind="b\\"c"} 1.0\n'
+    )
+    assert gauge.render().endswith("test_level 3.0\n")
+    assert computed_gauge.render().endswith('test_computed{kind="a"} 7.0\n')
+
+    rendered = metrics.render_metrics()
+    assert counter.render() in rendered
+    assert gauge.render() in rendered
+
+    with pytest.raises(ValueError):
+        counter.labels()
+
+    for name in ["test_events_total", "test_level", "test_computed"]:
+        metrics._registry.pop(name)
+
+
+def test_histogram_render():
+    """Test that histogram buckets are exported cumulatively."""
+
+    histogram = metrics.Histogram("test_latency_seconds", "Test latency", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    with histogram.time():
+        pass
+
+    assert histogram.render().splitlines()[2:] == [
+        'test_latency_seconds_bucket{le="0.1"} 2.0',
+        'test_latency_seconds_bucket{le="1.0"} 3.0',
+        'test_latency_seconds_bucket{le="+Inf"} 4.0',
+        f"test_latency_seconds_sum {histogram.labels().sum!r}",
+        "test_latency_seconds_count 4.0",
+    ]
+
+    metrics._registry.pop("test_latency_seconds")
+
+
+def test_find_regressions():
+    """Test comparing benchmark results with a baseline."""
+
+    def benchmark_result(workflow_name, throughput, latency, run_id=0):
+        return metrics.WorkflowBenchmarkResult(
+            run_id=run_id,
+            workflow_name=workflow_name,
+            metrics=metrics.PerformanceMetrics(
+                workflow_runtime=1.0,
+                covalent_runtime=1.0,
+                covalent_speedup=1.0,
+                covalent_overhead=0.0,
+                covalent_electron_throughput=throughput,
+                covalent_electron_latency_p99=latency,
+            ),
+        )
+
+    baseline = [
+        benchmark_result("wide", 100.0, 1.0, 0),
+        benchmark_result("wide", 10.0, 1.0, 1),
+        benchmark_result("wide", 110.0, 1.0, 2),
+        benchmark_result("deep", 100.0, 1.0),
+    ]
+    results = [
+        benchmark_result("wide", 85.0, 1.05),
+        benchmark_result("deep", 100.0, 1.5),
+        benchmark_result("new", 1.0, 100.0),
+    ]
+
+    assert metrics.find_regressions(results, baseline) == [
+        metrics.BenchmarkRegression(
+            workflow_name="deep",
+            metric="covalent_electron_latency_p99",
+            baseline=1.0,
+            current=1.5,
+            change=0.5,
+        )
+    ]
+
+    regressions = metrics.find_regressions(results, baseline, tolerance=0.1)
+    assert [(r.workflow_name, r.metric) for r in regressions] == [
+        ("wide", "covalent_electron_throughput"),
+        ("deep", "covalent_electron_latency_p99"),
+    ]
+
+
+def test_workflow_benchmark_result_round_trip():
+    """Test that benchmark results can be reloaded from JSON."""
+
+    result = metrics.WorkflowBenchmarkResult(
+        run_id=0,
+        workflow_name="wide",
+        parameters={"num_tasks": 8},
+        metrics=metrics.PerformanceMetrics(
+            workflow_runtime=1.0, covalent_runtime=1.0, covalent_speedup=1.0, covalent_overhead=0
+        ),
+    )
+    data = json.loads(json.dumps(result.model_dump(mode="json")))
+
+    assert metrics.WorkflowBenchmarkResult.model_validate(data) == result
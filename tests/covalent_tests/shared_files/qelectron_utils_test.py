@@ -0,0 +1,113 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""Unit tests for the qelectron_utils module"""
+
+import base64
+
+import pytest
+
+from covalent._shared_files import qelectron_utils
+from covalent._shared_files.qelectron_utils import (
+    _QE_DB_DATA_MARKER,
+    export_qelectron_db,
+    extract_qelectron_db,
+    get_qelectron_db_dir,
+    qelectron_db_exists,
+    remove_qelectron_db,
+)
+from covalent.executor.utils import set_context
+
+MOCK_DATA = b"mock-data-mdb"
+
+
+@pytest.fixture
+def mock_dirs(tmp_path, mocker):
+    """Point the QServer database and results directories at temporary directories."""
+    qelectron_db_path = tmp_path / "qelectron_db"
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+
+    def get_config(section):
+        return {"qelectron_db_path": str(qelectron_db_path), "results_dir": str(results_dir)}
+
+    mocker.patch.object(qelectron_utils, "get_config", side_effect=get_config)
+    return qelectron_db_path, results_dir
+
+
+@pytest.fixture
+def task_db(mock_dirs):
+    """Create a task's database in the QServer database directory."""
+    qelectron_db_path, _ = mock_dirs
+    task_subdir = qelectron_db_path / "mock-dispatch-id" / "node-1"
+    task_subdir.mkdir(parents=True)
+    (task_subdir / "data.mdb").write_bytes(MOCK_DATA)
+
+
+def test_extract_qelectron_db():
+    """Test extracting database bytes from stdout."""
+    data = base64.b64encode(MOCK_DATA).decode()
+    stdout = f"hello\n{_QE_DB_DATA_MARKER}{data}{_QE_DB_DATA_MARKER}\n"
+
+    assert extract_qelectron_db(stdout) == ("hello", MOCK_DATA)
+    assert extract_qelectron_db("hello\n") == ("hello\n", b"")
+    assert extract_qelectron_db("") == ("", b"")
+    assert remove_qelectron_db(stdout) == "hello"
+    assert remove_qelectron_db(" hello\n") == "hello"
+
+
+def test_export_qelectron_db(mock_dirs, task_db, capsys):
+    """Test that the database is copied into a reachable results directory."""
+    _, results_dir = mock_dirs
+    (results_dir / "mock-dispatch-id").mkdir()
+
+    assert not qelectron_db_exists("mock-dispatch-id", 1)
+
+    qelectron_db_dir = get_qelectron_db_dir("mock-dispatch-id", 1)
+    with set_context(1, "mock-dispatch-id"):
+        export_qelectron_db(str(qelectron_db_dir))
+
+    assert (qelectron_db_dir / "data.mdb").read_bytes() == MOCK_DATA
+    assert list(qelectron_db_dir.iterdir()) == [qelectron_db_dir / "data.mdb"]
+    assert qelectron_db_exists("mock-dispatch-id", 1)
+    assert capsys.readouterr().out == ""
+
+
+def test_export_qelectron_db_unreachable(mock_dirs, task_db, capsys):
+    """Test that the database is printed when the results directory is not reachable."""
+    qelectron_db_dir = get_qelectron_db_dir("mock-dispatch-id", 1)
+    with set_context(1, "mock-dispatch-id"):
+        export_qelectron_db(str(qelectron_db_dir))
+
+    assert not qelectron_db_dir.exists()
+    assert extract_qelectron_db(capsys.readouterr().out)[1] == MOCK_DATA
+
+
+def test_export_qelectron_db_missing(mock_dirs, capsys):
+    """Test that nothing is exported for tasks without QElectrons."""
+    _, results_dir = mock_dirs
+    (results_dir / "mock-dispatch-id").mkdir()
+
+    qelectron_db_dir = get_qelectron_db_dir("mock-dispatch-id", 1)
+    with set_context(1, "mock-dispatch-id"):
+        export_qelectron_db(str(qelectron_db_dir))
+
+    assert not qelectron_db_dir.exists()
+    assert capsys.readouterr().out == ""
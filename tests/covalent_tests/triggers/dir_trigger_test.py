@@ -18,9 +18,12 @@
 #
 # Relief from the License may be granted by purchasing a commercial license.
 
+import threading
+import time
 from unittest import mock
 
 import pytest
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
 
 from covalent.triggers.dir_trigger import DirEventHandler, DirTrigger
 
@@ -79,6 +82,142 @@ def test_attach_methods_to_handler(mocker, event_to_func_names, dir_trigger):
     assert setattr_mock.call_count == len(dir_trigger.event_names)
 
 
+def test_debounced_events_coalesce(mocker):
+    """
+    Testing whether a burst of events is coalesced by path
+    into a single trigger action once the debounce window closes
+    """
+
+    dir_trigger = DirTrigger("test_dir_path", ["created", "modified", "moved"], debounce=0.1)
+    dir_trigger.trigger = mocker.MagicMock()
+    dir_trigger.event_handler = DirEventHandler()
+    dir_trigger.attach_methods_to_handler()
+
+    n_threads = threading.active_count()
+    for i in range(100):
+        dir_trigger.event_handler.on_created(FileCreatedEvent(f"file_{i}"))
+        dir_trigger.event_handler.on_modified(FileModifiedEvent(f"file_{i}"))
+    dir_trigger.event_handler.on_moved(FileMovedEvent("file_0", "file_100"))
+
+    dir_trigger.trigger.assert_not_called()
+    # The whole burst is handled by a single flusher thread
+    assert threading.active_count() <= n_threads + 1
+
+    time.sleep(0.5)
+
+    changed_paths = sorted(f"file_{i}" for i in range(101))
+    dir_trigger.trigger.assert_called_once_with(changed_paths=changed_paths)
+    assert dir_trigger.changed_paths == changed_paths
+    assert dir_trigger.n_changes == 0
+
+
+def test_debounced_events_max_latency(mocker):
+    """
+    Testing whether a continuous stream of events still fires
+    once the max latency since the first event is exceeded
+    """
+
+    dir_trigger = DirTrigger("test_dir_path", ["modified"], debounce=0.2, max_latency=0.1)
+    dir_trigger.trigger = mocker.MagicMock()
+    dir_trigger.event_handler = DirEventHandler()
+    dir_trigger.attach_methods_to_handler()
+
+    for _ in range(30):
+        dir_trigger.event_handler.on_modified(FileModifiedEvent("file"))
+        time.sleep(0.02)
+
+    assert dir_trigger.trigger.call_count >= 2
+
+    dir_trigger.observer = mock.Mock()
+    dir_trigger.stop()
+
+
+def test_debounced_events_batch_size(mocker):
+    """
+    Testing whether a debounced batch waits until
+    `batch_size` distinct paths have changed
+    """
+
+    dir_trigger = DirTrigger("test_dir_path", ["modified"], batch_size=2, debounce=0.05)
+    dir_trigger.trigger = mocker.MagicMock()
+    dir_trigger.event_handler = DirEventHandler()
+    dir_trigger.attach_methods_to_handler()
+
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_a"))
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_a"))
+    time.sleep(0.2)
+    dir_trigger.trigger.assert_not_called()
+
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_b"))
+    time.sleep(0.2)
+    dir_trigger.trigger.assert_called_once_with(changed_paths=["file_a", "file_b"])
+    assert dir_trigger.changed_paths == ["file_a", "file_b"]
+
+
+def test_debounced_events_max_latency_small_batch(mocker):
+    """
+    Testing whether a batch with fewer than `batch_size`
+    changed paths fires once the max latency has passed
+    """
+
+    dir_trigger = DirTrigger(
+        "test_dir_path", ["modified"], batch_size=10, debounce=0.02, max_latency=0.2
+    )
+    dir_trigger.trigger = mocker.MagicMock()
+    dir_trigger.event_handler = DirEventHandler()
+    dir_trigger.attach_methods_to_handler()
+
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_a"))
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_b"))
+    time.sleep(0.1)
+    dir_trigger.trigger.assert_not_called()
+
+    time.sleep(0.3)
+    dir_trigger.trigger.assert_called_once_with(changed_paths=["file_a", "file_b"])
+
+    dir_trigger.observer = mock.Mock()
+    dir_trigger.stop()
+
+
+def test_trigger_with_changed_paths(mocker):
+    """
+    Testing whether the trigger action with a batch of changed paths performs a redispatch
+    """
+
+    base_trigger_mock = mocker.patch("covalent.triggers.dir_trigger.BaseTrigger.trigger")
+
+    dir_trigger = DirTrigger("test_dir_path", ["modified"], debounce=0.02)
+    dir_trigger.trigger(changed_paths=["file_a"])
+
+    base_trigger_mock.assert_called_once_with()
+
+
+def test_debounced_events_flusher_stops(mocker):
+    """
+    Testing whether the thread flushing debounced batches is
+    reused across batches and exits when the trigger is stopped
+    """
+
+    dir_trigger = DirTrigger("test_dir_path", ["modified"], debounce=0.02)
+    dir_trigger.trigger = mocker.MagicMock()
+    dir_trigger.event_handler = DirEventHandler()
+    dir_trigger.attach_methods_to_handler()
+
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_a"))
+    flusher = dir_trigger._flusher
+    time.sleep(0.1)
+    dir_trigger.event_handler.on_modified(FileModifiedEvent("file_b"))
+    time.sleep(0.1)
+
+    assert dir_trigger.trigger.call_count == 2
+    assert dir_trigger._flusher is flusher
+
+    dir_trigger.observer = mock.Mock()
+    dir_trigger.stop()
+    flusher.join(timeout=1)
+    assert not flusher.is_alive()
+
+
 @pytest.mark.parametrize("test_recursive", [True, False])
 def test_observe(mocker, dir_trigger, test_recursive):
     """
@@ -19,6 +19,7 @@
 # Relief from the License may be granted by purchasing a commercial license.
 
 
+import sqlite3
 from sqlite3 import OperationalError
 
 import pytest
@@ -100,6 +101,52 @@ def test_sqlite_trigger_observe(mocker, where_clauses, sqlite_trigger):
     mock_sqlite.connect.return_value.close.assert_called_once()
 
 
+@pytest.mark.parametrize("use_data_version", [True, False])
+def test_sqlite_trigger_observe_incremental(mocker, tmp_path, use_data_version):
+    """
+    Test that incremental polling only fires for rows added after the last poll
+    and backs off while the table is idle
+    """
+
+    db_path = str(tmp_path / "test.db")
+    writer = sqlite3.connect(db_path)
+    writer.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, status TEXT)")
+    writer.executemany("INSERT INTO jobs (status) VALUES (?)", [("pending",), ("done",)])
+    writer.commit()
+
+    sqlite_trigger = SQLiteTrigger(
+        db_path,
+        "jobs",
+        1,
+        ["status = 'pending'"],
+        incremental=True,
+        use_data_version=use_data_version,
+        max_poll_interval=4,
+    )
+    sqlite_trigger.trigger = mocker.MagicMock()
+
+    # Insert a matching row after the third poll and a non-matching one after the fifth
+    inserts = {3: "pending", 5: "done"}
+    sleeps = []
+
+    def mock_sleep(interval):
+        sleeps.append(interval)
+        if status := inserts.get(len(sleeps)):
+            writer.execute("INSERT INTO jobs (status) VALUES (?)", (status,))
+            writer.commit()
+
+    mocker.patch("covalent.triggers.sqlite_trigger.time.sleep", side_effect=mock_sleep)
+    mock_event = mocker.patch("covalent.triggers.sqlite_trigger.Event")
+    mock_event.return_value.is_set.side_effect = [False] * 7 + [True]
+
+    sqlite_trigger.observe()
+    writer.close()
+
+    assert sqlite_trigger.trigger.call_count == 2
+    assert sqlite_trigger.high_water_mark == 3
+    assert sleeps == [1, 2, 4, 1, 2, 4, 4]
+
+
 def test_sqlite_trigger_exception(mocker, sqlite_trigger):
     """
     Test the observe method of SQLiteTrigger when an OperationalError is raised
@@ -289,3 +289,96 @@ def test_deps_pip_from_dict_makes_a_copy():
     object_dict["attributes"]["packages"] = "asdf"
     assert new_dep.packages != object_dict["attributes"]["packages"]
     assert new_dep.apply_fn != object_dict["attributes"]["apply_fn"]
+
+
+def test_deps_pip_apply_skips_cached_install(mocker, monkeypatch, tmp_path):
+    """Test that pip is only run again for the same requirements if the environment changed"""
+    from covalent._workflow.depspip import apply_pip_deps
+
+    monkeypatch.setenv("COVALENT_CACHE_DIR", str(tmp_path))
+    mock_run = mocker.patch("covalent._workflow.depspip.subprocess.run")
+    state = {"prefix": "/env", "site-packages": 1}
+    mocker.patch("covalent._workflow.depspip._site_packages_state", side_effect=lambda: state)
+
+    apply_pip_deps(["pydash==5.1.0", "numpy"])
+    apply_pip_deps(["numpy", "pydash==5.1.0"])
+    assert mock_run.call_count == 1
+    assert mock_run.call_args[0][0][-2:] == ["pydash==5.1.0", "numpy"]
+
+    state["site-packages"] = 2
+    apply_pip_deps(["numpy", "pydash==5.1.0"])
+    assert mock_run.call_count == 2
+
+    monkeypatch.setenv("COVALENT_DEPS_CACHE", "false")
+    apply_pip_deps(["numpy", "pydash==5.1.0"])
+    assert mock_run.call_count == 3
+
+
+def test_deps_pip_apply_failure_not_cached(mocker, monkeypatch, tmp_path):
+    """Test that failed installs are retried"""
+    from covalent._workflow.depspip import apply_pip_deps
+
+    monkeypatch.setenv("COVALENT_CACHE_DIR", str(tmp_path))
+    mock_run = mocker.patch(
+        "covalent._workflow.depspip.subprocess.run",
+        side_effect=subprocess.CalledProcessError(1, "pip"),
+    )
+
+    for _ in range(2):
+        with pytest.raises(subprocess.CalledProcessError):
+            apply_pip_deps(requirements_content="pydash==5.1.0\n")
+    assert mock_run.call_count == 2
+
+
+def test_deps_pip_normalize_requirements():
+    """Test that equivalent requirement specifications are normalized alike"""
+    from covalent._workflow.depspip import _normalize_requirements
+
+    assert _normalize_requirements(["b", " a", "b"], "# pinned\nd==1 # comment\n\nc\n") == [
+        "a",
+        "b",
+        "c",
+        "d==1",
+    ]
+    assert _normalize_requirements(["--find-links", "/wheels", "b", "a"], "") == [
+        "--find-links",
+        "/wheels",
+        "b",
+        "a",
+    ]
+
+
+def test_bash_deps_apply_cached(mocker, monkeypatch, tmp_path):
+    """Test that cached bash deps only run once"""
+    monkeypatch.setenv("COVALENT_CACHE_DIR", str(tmp_path))
+    mock_run = mocker.patch("covalent._workflow.depsbash.subprocess.run")
+
+    cached = ct.DepsBash(["apt install -y gcc"], cache=True)
+    fn, args, kwargs, _ = cached.apply()
+    assert kwargs.get_deserialized() == {"cache": True}
+    for _ in range(2):
+        fn.get_deserialized()(*args.get_deserialized(), **kwargs.get_deserialized())
+    assert mock_run.call_count == 1
+
+    uncached = ct.DepsBash(["apt install -y gcc"])
+    fn, args, kwargs, _ = uncached.apply()
+    for _ in range(2):
+        fn.get_deserialized()(*args.get_deserialized(), **kwargs.get_deserialized())
+    assert mock_run.call_count == 3
+
+
+def test_deps_cache_without_home(mocker, monkeypatch):
+    """Test that deps are set up uncached if no cache directory can be resolved"""
+    from covalent._workflow.deps import _deps_cache_dir
+
+    for var in ("COVALENT_CACHE_DIR", "XDG_CACHE_HOME", "HOME"):
+        monkeypatch.delenv(var, raising=False)
+    mocker.patch("covalent._workflow.deps.Path.home", side_effect=KeyError)
+    mock_run = mocker.patch("covalent._workflow.depsbash.subprocess.run")
+
+    assert _deps_cache_dir() is None
+
+    fn, args, kwargs, _ = ct.DepsBash(["apt install -y gcc"], cache=True).apply()
+    for _ in range(2):
+        fn.get_deserialized()(*args.get_deserialized(), **kwargs.get_deserialized())
+    assert mock_run.call_count == 2
@@ -20,8 +20,12 @@
 
 """Unit tests for leptons."""
 
+import ctypes
+import importlib
 import inspect
 import os
+import shutil
+import subprocess
 from contextlib import nullcontext
 from ctypes import c_int32
 from subprocess import PIPE, Popen
@@ -31,7 +35,7 @@ import pytest
 
 from covalent import DepsBash, TransportableObject
 from covalent._file_transfer.file_transfer import HTTP, File, FileTransfer, Order
-from covalent._workflow.lepton import Lepton
+from covalent._workflow.lepton import Lepton, _load_c_function, _load_python_function
 from covalent._workflow.transport import encode_metadata
 from covalent.executor import LocalExecutor
 
@@ -345,6 +349,105 @@ def test_python_wrapper():
     assert callable(wrapper)
 
 
+def test_python_wrapper_caches_function(mocker):
+    """
+    Test that the python wrapper only imports the foreign function once
+    """
+    _load_python_function.cache_clear()
+    import_spy = mocker.spy(importlib, "import_module")
+    wrapper = Lepton(library_name="math", function_name="hypot").wrap_task()
+
+    assert wrapper(3, 4) == 5.0
+    assert wrapper(6, 8) == 10.0
+    import_spy.assert_called_once_with("math")
+
+
+def test_c_wrapper_caches_handle(mocker, tmp_path):
+    """
+    Test that the C wrapper opens the library and prepares the function once
+    """
+    if not shutil.which("gcc"):
+        pytest.skip("gcc is required to build the test library")
+
+    c_source = tmp_path / "test.c"
+    c_source.write_text(test_c_source.replace('#include "test.h"', ""))
+    c_library = tmp_path / "libtest.so"
+    subprocess.run(["gcc", "-shared", "-fPIC", "-o", str(c_library), str(c_source)], check=True)
+
+    _load_c_function.cache_clear()
+    cdll_spy = mocker.spy(ctypes, "CDLL")
+    lepton = Lepton(
+        language="C",
+        library_name=str(c_library),
+        function_name="test_entry",
+        argtypes=[
+            (ctypes.c_int, Lepton.INPUT),
+            (ctypes.POINTER(ctypes.c_int), Lepton.INPUT_OUTPUT),
+            (ctypes.POINTER(ctypes.c_int), Lepton.OUTPUT),
+        ],
+    )
+    wrapper = TransportableObject(lepton.wrap_task()).get_deserialized()
+
+    assert wrapper(1, 2) == (3, 5)
+    assert wrapper(2, 2) == (4, 5)
+    cdll_spy.assert_called_once()
+
+
+def test_persistent_shell_rejected_for_other_languages():
+    """
+    Test that only shell leptons can use a persistent shell
+    """
+    with pytest.raises(ValueError):
+        Lepton(library_name="math", function_name="hypot", persistent_shell=True)
+
+
+def test_persistent_shell_reused(tmp_path):
+    """
+    Test that a persistent shell serves repeated calls and re-sources modified libraries
+    """
+    library = tmp_path / "lib.sh"
+    library.write_text("get() {\n  out=$$\n}\n")
+    lepton = Lepton(
+        "bash",
+        library_name=str(library),
+        function_name="get",
+        argtypes=[(int, Lepton.OUTPUT)],
+        named_outputs=["out"],
+        persistent_shell=True,
+    )
+    wrapper = lepton.wrap_task()
+
+    # $$ is the pid of the shell, not of the subshell the call runs in
+    assert wrapper() == wrapper()
+
+    library.write_text("get() {\n  out=7\n}\n")
+    os.utime(library, ns=(0, 0))
+    assert wrapper() == 7
+
+
+def test_persistent_shell_exits():
+    """
+    Test that a call which makes the persistent shell exit fails with the shell's errors
+    """
+    from covalent._workflow.lepton import _PersistentShell
+
+    shell = _PersistentShell()
+    assert shell.run("echo ok").stdout == b"ok\n"
+    stream_dir = shell._stream_dir
+
+    proc = shell.run("echo )")
+    assert proc.returncode == 2
+    assert b"syntax error" in proc.stderr
+    assert shell._proc is None
+
+    # The next call starts a new shell
+    assert shell.run("echo ok").stdout == b"ok\n"
+
+    shell.run("echo )")
+    shell.close()
+    assert not os.path.exists(stream_dir)
+
+
 # TODO: Needs improvement
 def test_c_wrapper():
     """
@@ -465,9 +568,11 @@ modify() {
         # TODO: Add more usage which should throw errors
     ],
 )
+@pytest.mark.parametrize("persistent_shell", [False, True])
 def test_shell_wrapper(
     mocker,
     init_mock,
+    persistent_shell,
     library_name,
     library_body,
     function_name,
@@ -492,6 +597,7 @@ def test_shell_wrapper(
     lepton.command = command
     lepton.named_outputs = named_outputs
     lepton.display_name = "name"
+    lepton.persistent_shell = persistent_shell
 
     task = lepton.wrap_task()
 
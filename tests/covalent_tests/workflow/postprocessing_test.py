@@ -23,12 +23,18 @@
 from unittest.mock import MagicMock, Mock
 
 import pytest
-from mock import call
 
 import covalent as ct
-from covalent._shared_files.defaults import postprocess_prefix
+from covalent._shared_files.defaults import (
+    electron_dict_prefix,
+    electron_list_prefix,
+    postprocess_prefix,
+)
 from covalent._workflow.electron import Electron
-from covalent._workflow.postprocessing import Postprocessor
+from covalent._workflow.postprocessing import Postprocessor, _NodeOutputRef, _NodeOutputStream
+from covalent._workflow.transport import TransportableObject
+from covalent._workflow.transportable_object import has_serialized_inputs
+from covalent.executor.base import wrapper_fn
 
 
 @pytest.fixture
@@ -99,9 +105,13 @@ def test_postprocess():
     mock_lattice.workflow_function = mock_workflow
 
     pp = Postprocessor(mock_lattice)
-    res = pp._postprocess(["mock_output_1", "mock_output_2"])
+    res = pp._postprocess(
+        TransportableObject("mock_output_1"), TransportableObject("mock_output_2")
+    )
 
-    assert mock_lattice.electron_outputs == [["mock_output_1", "mock_output_2"]]
+    assert isinstance(mock_lattice.electron_outputs, _NodeOutputStream)
+    assert len(mock_lattice.electron_outputs) == 2
+    assert mock_lattice.electron_outputs.pop(0) == "mock_output_1"
 
     mock_arg.get_deserialized.assert_called_once_with()
     mock_kwarg.get_deserialized.assert_called_once_with()
@@ -112,6 +122,35 @@ def test_postprocess():
     assert res == "mock_result"
 
 
+def test_node_output_stream():
+    """Test that node outputs are only deserialized when consumed."""
+    outputs = [Mock(), Mock()]
+    stream = _NodeOutputStream(outputs)
+
+    assert stream.pop(0) == outputs[0].get_deserialized.return_value
+    outputs[0].get_deserialized.assert_called_once_with()
+    outputs[1].get_deserialized.assert_not_called()
+    assert len(stream) == 1
+
+    with pytest.raises(IndexError):
+        stream.pop(1)
+
+
+def test_postprocess_takes_serialized_inputs(postprocessor):
+    """Test that the postprocess functions receive their inputs serialized."""
+    assert has_serialized_inputs(postprocessor._postprocess)
+    assert has_serialized_inputs(postprocessor._reconstruct)
+    assert not has_serialized_inputs(postprocessor._postprocess_recursively)
+
+
+def test_exhaustive_postprocess_in_wrapper_fn(postprocessor):
+    """Test running the exhaustive postprocess node as an executor would."""
+    postprocessor.lattice.build_graph(3)
+    outputs = [TransportableObject(3), TransportableObject([6])]
+    output = wrapper_fn(TransportableObject(postprocessor._postprocess), [], [], *outputs)
+    assert output.get_deserialized() == [3, 6]
+
+
 @pytest.mark.parametrize(
     "retval, node_ids",
     [
@@ -174,7 +213,8 @@ def test_add_reconstruct_postprocess_node(postprocessor, mocker):
         return x
 
     get_node_ids_from_retval_mock = mocker.patch(
-        "covalent._workflow.postprocessing.Postprocessor._get_node_ids_from_retval"
+        "covalent._workflow.postprocessing.Postprocessor._get_node_ids_from_retval",
+        return_value={0},
     )
     get_electron_metadata_mock = mocker.patch(
         "covalent._workflow.postprocessing.Postprocessor._get_electron_metadata"
@@ -184,11 +224,7 @@ def test_add_reconstruct_postprocess_node(postprocessor, mocker):
     mock_bound_electrons = {0: mock_electron}
     postprocessor.add_reconstruct_postprocess_node(mock_electron, mock_bound_electrons)
     get_electron_metadata_mock.assert_called_once_with()
-    assert get_node_ids_from_retval_mock.mock_calls == [
-        call(mock_electron),
-        call().__iter__(),
-        call().__contains__(0),
-    ]
+    get_node_ids_from_retval_mock.assert_called_once_with(mock_electron)
 
 
 def test_postprocess_recursively(postprocessor, mocker):
@@ -231,3 +267,58 @@ def test_postprocess_recursively(postprocessor, mocker):
         **{"node:0": "mock-output-0", "node:1": "mock-output-1"},
     )
     assert res == "mock"
+
+
+def test_reconstruct(postprocessor):
+    """Test that the return value is rebuilt from the outputs it references."""
+    retval = [_NodeOutputRef(0), {"a": (_NodeOutputRef(1), 2)}, _NodeOutputRef(0)]
+    res = postprocessor._reconstruct(
+        TransportableObject(retval),
+        **{"node:0": TransportableObject("mock-output-0"), "node:1": TransportableObject([1])},
+    )
+    assert res == ["mock-output-0", {"a": ([1], 2)}, "mock-output-0"]
+    assert res[0] is res[2]
+
+
+def test_reconstruct_postprocess_node_inputs(mocker):
+    """Test that the reconstruct postprocess node only receives referenced outputs once."""
+    mocker.patch(
+        "covalent._workflow.lattice.get_config",
+        side_effect=lambda key: "false"
+        if key == "sdk.exhaustive_postprocess"
+        else ct._shared_files.config.get_config(key),
+    )
+
+    @ct.electron
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x):
+        a = task(x)
+        b = task(a)
+        task(b)
+        return {"a": [a, (b, 1)], "b": b}
+
+    workflow.build_graph(1)
+    tg = workflow.transport_graph
+    names = {node_id: tg.get_node_value(node_id, "name") for node_id in tg._graph.nodes}
+    assert not any(name.startswith(electron_list_prefix) for name in names.values())
+    assert not any(name.startswith(electron_dict_prefix) for name in names.values())
+
+    pp_node = next(k for k, v in names.items() if v == f"{postprocess_prefix}reconstruct")
+    in_edges = [(parent, d) for parent, _, d in tg._graph.in_edges(pp_node, data=True)]
+    kwargs = {d["edge_name"]: parent for parent, d in in_edges if d.get("param_type") == "kwarg"}
+    assert kwargs == {"node:0": 0, "node:2": 2}
+    waits = [parent for parent, d in in_edges if d.get("wait_for")]
+    assert waits == [3]
+
+    (retval_node,) = [parent for parent, d in in_edges if d.get("param_type") == "arg"]
+    template = tg.get_node_value(retval_node, "value").get_deserialized()
+    assert template == {"a": [_NodeOutputRef(0), (_NodeOutputRef(2), 1)], "b": _NodeOutputRef(2)}
+    assert tg.get_node_value(retval_node, "name") == f":parameter:{template}"
+
+    outputs = {f"node:{i}": TransportableObject(i) for i in (0, 2)}
+    pp_function = tg.get_node_value(pp_node, "function")
+    output = wrapper_fn(pp_function, [], [], TransportableObject(template), **outputs)
+    assert output.get_deserialized() == {"a": [0, (2, 1)], "b": 2}
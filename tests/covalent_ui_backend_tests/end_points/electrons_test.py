@@ -26,6 +26,10 @@ from numpy import array
 
 from covalent_dispatcher._db.datastore import DataStore
 from tests.covalent_ui_backend_tests import fastapi_app
+from tests.covalent_ui_backend_tests.utils.assert_data.config_data import (
+    VALID_DISPATCH_ID,
+    VALID_NODE_ID,
+)
 from tests.covalent_ui_backend_tests.utils.assert_data.electrons import seed_electron_data
 from tests.covalent_ui_backend_tests.utils.client_template import MethodType, TestClientTemplate
 from tests.covalent_ui_backend_tests.utils.trigger_events import shutdown_event, startup_event
@@ -280,6 +284,42 @@ def test_electrons_file_bad_request():
     assert response.status_code == test_data["status_code"]
 
 
+def test_electrons_stream_tail_running(mocker, tmp_path):
+    """Test that the tail of a running electron's output is read from its spool file"""
+    stdout_path = tmp_path / "node.stdout"
+    stdout_path.write_text("line 1\nline 2\n")
+    mocker.patch(
+        "covalent_ui.api.v1.routes.end_points.electron_routes.get_task_stream_paths",
+        return_value=(str(stdout_path), str(tmp_path / "node.stderr")),
+    )
+    response = object_test_template(
+        api_path="/api/v1/dispatches/{}/electron/{}/tail/{}",
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path={"dispatch_id": VALID_DISPATCH_ID, "electron_id": VALID_NODE_ID, "name": "stdout"},
+        query_data={"max_bytes": 7},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == "line 2\n"
+
+
+def test_electrons_stream_tail_completed(mocker, tmp_path):
+    """Test that the tail of a completed electron's output is read from its stored stdout"""
+    mocker.patch(
+        "covalent_ui.api.v1.routes.end_points.electron_routes.get_task_stream_paths",
+        return_value=(str(tmp_path / "node.stdout"), str(tmp_path / "node.stderr")),
+    )
+    response = object_test_template(
+        api_path="/api/v1/dispatches/{}/electron/{}/tail/{}",
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path={"dispatch_id": VALID_DISPATCH_ID, "electron_id": VALID_NODE_ID, "name": "stdout"},
+        query_data={"max_bytes": 10},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == " on node 1"
+
+
 def test_electrons_inputs_bad_request():
     """Test electrons for inputs with bad request"""
     test_data = output_data["test_electrons_details"]["case_invalid"]
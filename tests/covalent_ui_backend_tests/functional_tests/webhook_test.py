@@ -81,3 +81,125 @@ def test_send_draw_request():
     lattice = Lattice.deserialize_from_json(workflow.serialize_to_json())
     response = send_draw_request(lattice)
     assert response is None
+
+
+@pytest.mark.asyncio
+async def test_send_update_coalesces_per_dispatch(mocker):
+    """Test that repeated updates of a dispatch are merged into one message"""
+    from covalent_ui import result_webhook
+
+    await result_webhook.close()
+    mock_post = mocker.patch("covalent_ui.result_webhook._UpdateCoalescer._post")
+    result_object = get_mock_result()
+
+    for _ in range(10):
+        await send_update(result_object)
+
+    coalescer = result_webhook._get_coalescer()
+    await coalescer._flush_task
+
+    mock_post.assert_awaited_once()
+    assert mock_post.await_args[0][0]["result"]["dispatch_id"] == "pipeline_workflow"
+    assert coalescer.updates_received == 10
+    await result_webhook.close()
+
+
+@pytest.mark.asyncio
+async def test_send_update_backpressure(mocker):
+    """Test that senders wait once too many dispatches have pending updates"""
+    import asyncio
+
+    from covalent_ui.result_webhook import _UpdateCoalescer
+
+    coalescer = _UpdateCoalescer(window=0.01, max_pending=2)
+    mocker.patch.object(coalescer, "_post")
+
+    await coalescer.submit("a", {})
+    await coalescer.submit("b", {})
+    blocked = asyncio.create_task(coalescer.submit("c", {}))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert list(coalescer._pending) == ["a", "b"]
+
+    await blocked
+    assert "c" in coalescer._pending
+    await coalescer.close()
+    assert coalescer._post.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_send_update_drops_logged(mocker):
+    """Test that updates which cannot be sent are counted and logged as warnings"""
+    from covalent_ui.result_webhook import _UpdateCoalescer
+
+    coalescer = _UpdateCoalescer(window=0.01)
+    mocker.patch.object(coalescer, "_post", side_effect=[None, ConnectionError("refused")])
+    mock_log = mocker.patch("covalent_ui.result_webhook.app_log")
+
+    await coalescer.submit("a", {})
+    await coalescer.submit("b", {})
+    await coalescer.flush()
+
+    assert coalescer.updates_dropped == 1
+    mock_log.warning.assert_called_once()
+    assert "Dropped 1 of 2" in mock_log.warning.call_args[0][0]
+    await coalescer.close()
+
+
+@pytest.mark.asyncio
+async def test_send_update_timeout_excludes_pool_wait():
+    """Test that waiting for a pooled connection does not count towards the timeout"""
+    from covalent_ui.result_webhook import REQUEST_TIMEOUT, _UpdateCoalescer
+
+    coalescer = _UpdateCoalescer()
+    timeout = coalescer._get_session().timeout
+    assert timeout.total is None
+    assert timeout.sock_connect == REQUEST_TIMEOUT
+    assert timeout.sock_read == REQUEST_TIMEOUT
+    await coalescer.close()
+
+
+def test_send_draw_request_shared_session(mocker):
+    """Test that draw requests are posted over a long-lived aiohttp session"""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from covalent_ui import result_webhook
+
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, json.loads(body)))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mocker.patch(
+        "covalent_ui.result_webhook.get_ui_url",
+        side_effect=lambda path: f"http://127.0.0.1:{server.server_port}{path}",
+    )
+    mocker.patch("covalent_ui.result_webhook.extract_graph", return_value={})
+    mock_log = mocker.patch("covalent_ui.result_webhook.app_log")
+
+    try:
+        workflow = get_mock_simple_workflow()
+        workflow.build_graph(x=1)
+        send_draw_request(workflow)
+        session = result_webhook._draw_session
+        send_draw_request(workflow)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    mock_log.error.assert_not_called()
+    assert result_webhook._draw_session is session
+    assert [path for path, _ in received] == ["/api/draw", "/api/draw"]
+    assert received[0][1]["event"] == "draw-request"
@@ -0,0 +1,165 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+import os
+import shutil
+
+import lmdb
+import pytest
+
+from covalent.quantum.qserver import database
+from covalent.quantum.qserver.database import Database, close_environments
+
+
+@pytest.fixture(autouse=True)
+def close_cached_environments():
+    """
+    Close database environments opened by each test.
+    """
+    yield
+    close_environments()
+
+
+def test_set_merges_records(tmp_path):
+    """
+    Test that records are inserted and merged into stored records.
+    """
+
+    db = Database(tmp_path)
+    db.set(["circuit_0", "circuit_1"], [{"a": 0}, {"a": 1}], dispatch_id="d", node_id=0)
+    db.set(["circuit_0", "circuit_2"], [{"b": 0}, {"b": 2}], dispatch_id="d", node_id=0)
+
+    assert db.get_db(dispatch_id="d", node_id=0) == {
+        "circuit_0": {"a": 0, "b": 0},
+        "circuit_1": {"a": 1},
+        "circuit_2": {"b": 2},
+    }
+    assert db.get_circuit_ids(dispatch_id="d", node_id=0) == [
+        "circuit_0",
+        "circuit_1",
+        "circuit_2",
+    ]
+
+
+def test_environment_reused(tmp_path, mocker):
+    """
+    Test that each database's environment is opened once and shared by readers.
+    """
+
+    open_spy = mocker.spy(lmdb, "open")
+
+    db = Database(tmp_path)
+    for i in range(5):
+        db.set([f"circuit_{i}"], [{"i": i}], dispatch_id="d", node_id=0)
+    db.set(["circuit_0"], [{"i": 0}], dispatch_id="d", node_id=1)
+
+    readonly_db = Database(tmp_path, readonly=True)
+    assert len(readonly_db.get_db(dispatch_id="d", node_id=0)) == 5
+
+    assert open_spy.call_count == 2
+
+
+def test_readonly_database(tmp_path):
+    """
+    Test that read-only databases open existing databases read-only.
+    """
+
+    Database(tmp_path).set(["circuit_0"], [{"i": 0}], dispatch_id="d", node_id=0)
+    close_environments()
+
+    readonly_db = Database(tmp_path, readonly=True)
+    assert readonly_db.get_db(dispatch_id="d", node_id=0) == {"circuit_0": {"i": 0}}
+
+    with pytest.raises(lmdb.ReadonlyError):
+        readonly_db.set(["circuit_1"], [{"i": 1}], dispatch_id="d", node_id=0)
+
+    with pytest.raises(FileNotFoundError):
+        readonly_db.get_db(dispatch_id="d", node_id=1)
+
+    # Writers reopen the environment for writing.
+    Database(tmp_path).set(["circuit_1"], [{"i": 1}], dispatch_id="d", node_id=0)
+    assert len(readonly_db.get_db(dispatch_id="d", node_id=0)) == 2
+
+
+def test_close_environments(tmp_path):
+    """
+    Test that environments are only closed inside the given directory.
+    """
+
+    db = Database(tmp_path)
+    db.set(["circuit_0"], [{"i": 0}], dispatch_id="d", node_id=0)
+    db.set(["circuit_0"], [{"i": 0}], dispatch_id="d", node_id=1)
+    node_0_path = str(db._get_db_path("d", 0))
+    node_1_path = str(db._get_db_path("d", 1))
+
+    close_environments(os.path.join(tmp_path, "d", "node-0"))
+    assert node_0_path not in database._environments
+    assert node_1_path in database._environments
+
+    close_environments(tmp_path)
+    assert not database._environments
+
+
+def test_least_recently_used_environments_closed(tmp_path, mocker):
+    """
+    Test that the least recently used environments are closed beyond the cache limit.
+    """
+
+    mocker.patch.object(database, "MAX_CACHED_ENVIRONMENTS", 2)
+
+    db = Database(tmp_path)
+    for node_id in range(3):
+        db.set(["circuit_0"], [{"i": node_id}], dispatch_id="d", node_id=node_id)
+    node_paths = [str(db._get_db_path("d", node_id)) for node_id in range(3)]
+    assert list(database._environments) == node_paths[1:]
+
+    # Reading marks an environment as recently used.
+    env = database._environments[node_paths[1]][2]
+    readonly_db = Database(tmp_path, readonly=True)
+    assert readonly_db.get_db(dispatch_id="d", node_id=1) == {"circuit_0": {"i": 1}}
+    assert readonly_db.get_db(dispatch_id="d", node_id=0) == {"circuit_0": {"i": 0}}
+    assert list(database._environments) == [node_paths[1], node_paths[0]]
+
+    # Evicted environments are closed.
+    assert database._environments[node_paths[1]][2] is env
+    db.set(["circuit_1"], [{"i": 2}], dispatch_id="d", node_id=2)
+    with pytest.raises(lmdb.Error):
+        env.stat()
+    assert list(database._environments) == [node_paths[0], node_paths[2]]
+
+
+def test_environment_reopened_when_data_file_replaced(tmp_path):
+    """
+    Test that a cached read-only environment is reopened once its data file is replaced.
+    """
+
+    Database(tmp_path / "a").set(["circuit_0"], [{"i": 0}], dispatch_id="d", node_id=0)
+    Database(tmp_path / "b").set(["circuit_0"], [{"i": 1}], dispatch_id="d", node_id=0)
+
+    readonly_db = Database(tmp_path / "a", readonly=True)
+    assert readonly_db.get_db(dispatch_id="d", node_id=0) == {"circuit_0": {"i": 0}}
+
+    db_path = readonly_db._get_db_path("d", 0)
+    replacement_path = Database(tmp_path / "b")._get_db_path("d", 0)
+    close_environments(str(replacement_path))
+    shutil.copyfile(replacement_path / "data.mdb", db_path / "data.mdb.tmp")
+    os.replace(db_path / "data.mdb.tmp", db_path / "data.mdb")
+
+    assert readonly_db.get_db(dispatch_id="d", node_id=0) == {"circuit_0": {"i": 1}}
@@ -0,0 +1,107 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# pylint: disable=no-member
+
+from unittest.mock import MagicMock
+
+import pennylane as qml
+import pytest
+
+import covalent as ct
+from covalent.quantum.qclient.core import middleware
+from covalent.quantum.qserver.core import QServer
+from covalent.quantum.qserver.database import Database
+
+
+@pytest.fixture
+def qserver_database(tmp_path, monkeypatch):
+    """
+    Point the local quantum server at a temporary database.
+    """
+    database = Database(tmp_path)
+    monkeypatch.setattr(middleware.qclient.qserver, "_database", database)
+    return database
+
+
+def test_submit_to_executors_groups_by_executor():
+    """
+    Test that qscripts are grouped into one sub-batch per distinct executor.
+    """
+
+    executor_1 = MagicMock()
+    executor_2 = MagicMock()
+    executor_1.batch_submit.side_effect = lambda qscripts: [f"future_{q}" for q in qscripts]
+    executor_2.batch_submit.side_effect = lambda qscripts: [f"future_{q}" for q in qscripts]
+
+    qscripts = [f"qscript_{i}" for i in range(6)]
+    linked_executors = [executor_1, executor_2, executor_1, executor_2, executor_2, executor_1]
+
+    executor_future_pairs, submission_order = QServer().submit_to_executors(
+        qscripts, linked_executors, MagicMock()
+    )
+
+    assert executor_future_pairs == [
+        [executor_1, {0: "future_qscript_0", 2: "future_qscript_2", 5: "future_qscript_5"}],
+        [executor_2, {1: "future_qscript_1", 3: "future_qscript_3", 4: "future_qscript_4"}],
+    ]
+    assert submission_order == [0, 2, 5, 1, 3, 4]
+    assert executor_1.batch_submit.call_count == 1
+    assert executor_2.batch_submit.call_count == 1
+
+
+def test_submit_to_executors_groups_equal_executors():
+    """
+    Test that equal executors which are distinct objects share a sub-batch.
+    """
+
+    executor_1 = ct.executor.Simulator(parallel=False)
+    executor_2 = ct.executor.Simulator(parallel=False)
+    executor_3 = ct.executor.Simulator(parallel=False, workers=2)
+    for executor in [executor_1, executor_2, executor_3]:
+        object.__setattr__(executor, "batch_submit", lambda qscripts: list(qscripts))
+
+    _, submission_order = QServer().submit_to_executors(
+        ["a", "b", "c", "d"], [executor_1, executor_3, executor_2, executor_1], MagicMock()
+    )
+
+    assert submission_order == [0, 2, 3, 1]
+
+
+@pytest.mark.parametrize("persist_data", [True, False])
+def test_circuit_diagram_persisted(qserver_database, persist_data):
+    """
+    Test that circuit diagrams are only drawn when the circuit data is persisted.
+    """
+
+    @ct.qelectron(executors=ct.executor.Simulator(persist_data=persist_data))
+    @qml.qnode(qml.device("default.qubit", wires=2))
+    def circuit(param):
+        qml.RX(param, wires=0)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    assert qml.math.allclose(circuit(0.5), qml.math.cos(0.5))
+
+    (circuit_info,) = qserver_database.get_db(dispatch_id=None, node_id=None).values()
+    if persist_data:
+        assert "RX" in circuit_info["circuit_diagram"]
+    else:
+        assert circuit_info["circuit_diagram"] is None
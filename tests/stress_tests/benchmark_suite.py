@@ -0,0 +1,342 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+"""
+Offline benchmark suite for the dispatcher.
+
+Runs synthetic workflow families against an in-process dispatcher with the
+local executor and writes the results as a JSON list of
+`WorkflowBenchmarkResult` objects. Each benchmark run happens in a fresh
+process with its own config directory, results directory and SQLite DB, so
+runs are independent of each other and of any running Covalent server.
+
+Usage:
+
+    python tests/stress_tests/benchmark_suite.py --repeat 3 \\
+        --output benchmark_results/suite/current/results.json \\
+        --baseline benchmark_results/suite/baseline/results.json
+
+The command exits with status 1 if any metric regressed by more than the
+tolerance with respect to the baseline.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# Parameters of each workflow family at scale 1; sizes are multiplied by the
+# scale passed on the command line.
+FAMILIES = {
+    "wide_map": {"num_tasks": 64},
+    "deep_chain": {"depth": 32},
+    "diamond": {"width": 8, "depth": 4},
+    "sublattice_fanout": {"num_sublattices": 4, "width": 8},
+    "large_payload": {"num_consumers": 8, "payload_mb": 8},
+}
+
+# Parameters which are not scaled
+UNSCALED_PARAMETERS = {"width"}
+
+EXECUTOR = "local"
+
+
+def wide_map(num_tasks: int):
+    import covalent as ct
+
+    @ct.electron
+    def task(x):
+        return x + 1
+
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def wide_map_workflow(num_tasks):
+        return [task(i) for i in range(num_tasks)]
+
+    return wide_map_workflow, (num_tasks,)
+
+
+def deep_chain(depth: int):
+    import covalent as ct
+
+    @ct.electron
+    def task(x):
+        return x + 1
+
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def deep_chain_workflow(depth):
+        x = 0
+        for _ in range(depth):
+            x = task(x)
+        return x
+
+    return deep_chain_workflow, (depth,)
+
+
+def diamond(width: int, depth: int):
+    import covalent as ct
+
+    @ct.electron
+    def fan_out(x):
+        return x
+
+    @ct.electron
+    def fan_in(*args):
+        return sum(args)
+
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def diamond_workflow(width, depth):
+        x = 0
+        for _ in range(depth):
+            x = fan_in(*[fan_out(x) for _ in range(width)])
+        return x
+
+    return diamond_workflow, (width, depth)
+
+
+def sublattice_fanout(num_sublattices: int, width: int):
+    import covalent as ct
+
+    @ct.electron
+    def task(x):
+        return x + 1
+
+    @ct.electron
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def sublattice(width):
+        return [task(i) for i in range(width)]
+
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def sublattice_fanout_workflow(num_sublattices, width):
+        return [sublattice(width) for _ in range(num_sublattices)]
+
+    return sublattice_fanout_workflow, (num_sublattices, width)
+
+
+def large_payload(num_consumers: int, payload_mb: int):
+    import covalent as ct
+
+    @ct.electron
+    def produce(size):
+        return bytes(size)
+
+    @ct.electron
+    def consume(payload):
+        return len(payload)
+
+    @ct.lattice(executor=EXECUTOR, workflow_executor=EXECUTOR)
+    def large_payload_workflow(num_consumers, size):
+        payload = produce(size)
+        return [consume(payload) for _ in range(num_consumers)]
+
+    return large_payload_workflow, (num_consumers, payload_mb * 1024 * 1024)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def _count_files(path: str) -> int:
+    return sum(len(files) for _, _, files in os.walk(path))
+
+
+def run_case(family: str, parameters: Dict[str, int], run_id: int) -> dict:
+    """Benchmark a workflow family in the current process.
+
+    Must run in a fresh interpreter since it points the dispatcher at a
+    temporary DB before importing it.
+
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, "results")
+        db_dir = os.path.join(tmp_dir, "db")
+        os.makedirs(db_dir)
+        os.environ["COVALENT_CONFIG_DIR"] = os.path.join(tmp_dir, "config")
+        os.environ["COVALENT_DATA_DIR"] = data_dir
+        os.environ["COVALENT_DATABASE_URL"] = f"sqlite+pysqlite:///{db_dir}/dispatcher.sqlite"
+
+        from covalent._shared_files.metrics import (
+            PerformanceMetrics,
+            WorkflowBenchmarkResult,
+            performance_recorder,
+        )
+        from covalent_dispatcher._core import make_dispatch, run_dispatch
+        from covalent_dispatcher._db import models
+        from covalent_dispatcher._db.datastore import workflow_db
+
+        models.Base.metadata.create_all(workflow_db.engine)
+
+        lattice, args = globals()[family](**parameters)
+        lattice.build_graph(*args)
+        json_lattice = lattice.serialize_to_json()
+
+        async def dispatch():
+            dispatch_id = await make_dispatch(json_lattice)
+            return await run_dispatch(dispatch_id)
+
+        start = time.perf_counter()
+        result = asyncio.run(dispatch())
+        covalent_runtime = time.perf_counter() - start
+        file_count = _count_files(data_dir)
+
+        # Aggregate over the dispatch and any sublattice dispatches
+        dispatch_ids = {event[0] for event in list(performance_recorder._events)}
+        dispatch_metrics = [performance_recorder.get_dispatch_metrics(i) for i in dispatch_ids]
+        nodes = [node for m in dispatch_metrics for node in m.nodes.values()]
+        latencies = [node.overhead + node.execution for node in nodes]
+        workflow_runtime = sum(node.execution for node in nodes)
+
+        usage = max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        peak_rss = usage if sys.platform == "darwin" else usage * 1024
+
+        metrics = PerformanceMetrics(
+            workflow_runtime=workflow_runtime,
+            covalent_runtime=covalent_runtime,
+            covalent_speedup=workflow_runtime / covalent_runtime,
+            covalent_overhead=(covalent_runtime - workflow_runtime) / workflow_runtime
+            if workflow_runtime
+            else 0.0,
+            covalent_total_db_reads=sum(m.db_reads for m in dispatch_metrics),
+            covalent_total_db_writes=sum(m.db_writes for m in dispatch_metrics),
+            covalent_electron_throughput=len(nodes) / covalent_runtime,
+            covalent_electron_latency=sum(latencies) / len(latencies) if latencies else 0.0,
+            covalent_electron_latency_p50=_percentile(latencies, 50),
+            covalent_electron_latency_p99=_percentile(latencies, 99),
+            covalent_peak_rss=peak_rss,
+            covalent_db_bytes_written=sum(m.db_bytes_written for m in dispatch_metrics),
+            covalent_bytes_serialized=sum(m.bytes_serialized for m in dispatch_metrics),
+            covalent_file_count=file_count,
+        )
+
+        if str(result.status) != "COMPLETED":
+            raise RuntimeError(
+                f"Benchmark {family} finished with status {result.status}: {result.error}"
+            )
+
+        return WorkflowBenchmarkResult(
+            run_id=run_id, workflow_name=family, parameters=parameters, metrics=metrics
+        ).model_dump(mode="json")
+
+
+def run_suite(families: List[str], scale: int, repeat: int) -> List[dict]:
+    """Run each benchmark `repeat` times, each time in a fresh interpreter."""
+
+    results = []
+    for family in families:
+        parameters = {
+            name: value if name in UNSCALED_PARAMETERS else value * scale
+            for name, value in FAMILIES[family].items()
+        }
+        for run_id in range(repeat):
+            with tempfile.NamedTemporaryFile(suffix=".json") as case_output:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--run-case",
+                        family,
+                        json.dumps(parameters),
+                        str(run_id),
+                        "--output",
+                        case_output.name,
+                    ],
+                    check=True,
+                )
+                with open(case_output.name) as f:
+                    result = json.load(f)
+
+            metrics = result["metrics"]
+            print(
+                f"{family} run {run_id}: "
+                f"{metrics['covalent_electron_throughput']:.1f} tasks/s, "
+                f"p50 {metrics['covalent_electron_latency_p50'] * 1000:.1f} ms, "
+                f"p99 {metrics['covalent_electron_latency_p99'] * 1000:.1f} ms, "
+                f"peak RSS {metrics['covalent_peak_rss'] / 2**20:.0f} MiB"
+            )
+            results.append(result)
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output", default="benchmark_results/suite/current/results.json")
+    parser.add_argument("--baseline", help="Results of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES))
+    parser.add_argument("--run-case", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        family, parameters, run_id = args.run_case
+        result = run_case(family, json.loads(parameters), int(run_id))
+        with open(args.output, "w") as f:
+            json.dump(result, f)
+        return 0
+
+    results = run_suite(args.families, args.scale, args.repeat)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir and not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    from covalent._shared_files.metrics import WorkflowBenchmarkResult, find_regressions
+
+    with open(args.baseline) as f:
+        baseline = [WorkflowBenchmarkResult.model_validate(result) for result in json.load(f)]
+    regressions = find_regressions(
+        [WorkflowBenchmarkResult.model_validate(result) for result in results],
+        baseline,
+        args.tolerance,
+    )
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.workflow_name} {regression.metric}: "
+            f"{regression.baseline:.4g} -> {regression.current:.4g} ({regression.change:+.0%})"
+        )
+    if not regressions:
+        print(f"No regressions with respect to {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,6 +54,20 @@ def run_benchmark(benchmark_id: int, lattice, *args, **kwargs):
         covalent_overhead=overhead,
     )
 
+    # Include the timings and counters recorded by the dispatcher
+    if dispatch_result.metrics is not None:
+        dispatcher_metrics = dispatch_result.metrics.to_performance_metrics()
+        metrics = dispatcher_metrics.model_copy(
+            update=metrics.model_dump(
+                include={
+                    "workflow_runtime",
+                    "covalent_runtime",
+                    "covalent_speedup",
+                    "covalent_overhead",
+                }
+            )
+        )
+
     return (
         WorkflowBenchmarkResult(
             run_id=benchmark_id, workflow_name=lattice.__name__, metrics=metrics
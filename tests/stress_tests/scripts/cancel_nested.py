@@ -0,0 +1,124 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Time-to-quiescence when cancelling nested dispatch trees
+# Each level of the tree is a sublattice which fans out into `width`
+# child sublattices; the leaves are long-running sleeping tasks.
+# Requires a running Covalent server.
+
+import os
+import time
+
+import yaml
+
+import covalent as ct
+
+benchmark_name = "cancel_nested"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+shapes = [(2, 2), (4, 2), (8, 2), (4, 3)]  # (width, depth)
+trials_per_shape = 3
+startup_delay = 10
+poll_interval = 0.1
+
+terminal_statuses = [str(s) for s in (ct.status.CANCELLED, ct.status.COMPLETED, ct.status.FAILED)]
+
+
+@ct.electron
+def sleeping_task(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def make_tree(width, depth):
+    if depth == 0:
+
+        @ct.lattice
+        def leaf():
+            return [sleeping_task(600) for _ in range(width)]
+
+        return leaf
+
+    child = ct.electron(make_tree(width, depth - 1))
+
+    @ct.lattice
+    def level():
+        return [child() for _ in range(width)]
+
+    return level
+
+
+def sub_dispatch_ids(result):
+    ids = []
+    tg = result.lattice.transport_graph
+    for node in tg._graph.nodes:
+        sub_id = tg.get_node_value(node, "sub_dispatch_id")
+        if sub_id:
+            ids.append(sub_id)
+    return ids
+
+
+def all_dispatch_ids(dispatch_id):
+    ids = [dispatch_id]
+    result = ct.get_result(dispatch_id)
+    for sub_id in sub_dispatch_ids(result):
+        ids.extend(all_dispatch_ids(sub_id))
+    return ids
+
+
+for width, depth in shapes:
+    for i in range(trials_per_shape):
+        dispatch_id = ct.dispatch(make_tree(width, depth))()
+        time.sleep(startup_delay)
+
+        dispatch_ids = all_dispatch_ids(dispatch_id)
+
+        start = time.time()
+        ct.cancel(dispatch_id)
+        cancel_returned = time.time()
+        while any(
+            ct.get_result(d, status_only=True)["status"] not in terminal_statuses
+            for d in dispatch_ids
+        ):
+            time.sleep(poll_interval)
+        quiescent = time.time()
+
+        outfile = f"{benchmark_dir}/{dispatch_id}"
+        with open(outfile, "w") as f:
+            yaml.dump(
+                {
+                    "test": benchmark_name,
+                    "dispatch_id": dispatch_id,
+                    "width": width,
+                    "depth": depth,
+                    "num_dispatches": len(dispatch_ids),
+                    "cancel_latency": cancel_returned - start,
+                    "time_to_quiescence": quiescent - start,
+                },
+                f,
+            )
+        print(
+            "width {}, depth {}: {} dispatches quiescent after {:.2f} seconds".format(
+                width, depth, len(dispatch_ids), quiescent - start
+            )
+        )
@@ -0,0 +1,98 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Chatty task output
+# Runs tasks which print large volumes of output through the local executor's
+# process wrapper, once capturing the output in memory as Covalent used to and
+# once spooling it to files with the default head/tail limits. Each task runs
+# in a fresh process; its wall time, peak RSS and the size of the output
+# returned to the dispatcher are reported. Does not require a server.
+
+import io
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+import yaml
+
+from covalent.executor.utils.wrappers import io_wrapper
+
+benchmark_name = "chatty_task_output"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+output_sizes_mb = [10, 100, 500]
+line = "x" * 99
+
+
+def chatty_task(size_mb):
+    for _ in range(size_mb * 1024 * 1024 // (len(line) + 1)):
+        print(line)
+    return size_mb
+
+
+def in_memory_io_wrapper(fn, args, kwargs, workdir="."):
+    """Output capture as done before task output was spooled."""
+
+    with redirect_stdout(io.StringIO()) as stdout, redirect_stderr(io.StringIO()) as stderr:
+        try:
+            output = fn(*args, **kwargs)
+            tb = ""
+        except Exception as ex:
+            output = None
+            tb = "".join(traceback.TracebackException.from_exception(ex).format())
+    return output, stdout.getvalue(), stderr.getvalue(), tb
+
+
+def run_task(wrapper, size_mb, queue):
+    workdir = tempfile.mkdtemp()
+    start = time.perf_counter()
+    _, stdout, stderr, _ = wrapper(chatty_task, [size_mb], {}, workdir)
+    wall_time = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put((wall_time, peak_rss, len(stdout) + len(stderr)))
+
+
+results = {"test": benchmark_name}
+ctx = multiprocessing.get_context("fork")
+
+for mode, wrapper in (("in_memory", in_memory_io_wrapper), ("spooled", io_wrapper)):
+    for size_mb in output_sizes_mb:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_task, args=(wrapper, size_mb, queue))
+        proc.start()
+        wall_time, peak_rss, returned = queue.get()
+        proc.join()
+        results[f"{mode}_{size_mb}mb_wall_time"] = wall_time
+        results[f"{mode}_{size_mb}mb_peak_rss_mb"] = peak_rss
+        results[f"{mode}_{size_mb}mb_returned_mb"] = returned / 1024 / 1024
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
@@ -0,0 +1,91 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Config lookups and updates
+# Measures config lookups per second through `get_config`, compared with
+# building a fresh `ConfigManager` per lookup as was previously done, and the
+# time for several processes to update the config concurrently. Uses a
+# temporary config directory and does not require a server.
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+import yaml
+
+tmp_dir = tempfile.TemporaryDirectory()
+os.environ["COVALENT_CONFIG_DIR"] = tmp_dir.name
+
+from covalent._shared_files.config import (  # noqa: E402
+    ConfigManager,
+    get_config,
+    get_results_dir,
+    update_config,
+)
+
+benchmark_name = "config_lookups"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_lookups = 10000
+num_processes = 8
+num_updates = 50
+
+
+def time_lookups(lookup, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        lookup()
+    return n / (time.perf_counter() - start)
+
+
+def update_many(worker_id):
+    for i in range(num_updates):
+        update_config({"benchmark": {f"worker_{worker_id}": i}})
+
+
+results = {
+    "test": benchmark_name,
+    "uncached_lookups_per_second": time_lookups(
+        lambda: ConfigManager().get("dispatcher.results_dir"), num_lookups // 100
+    ),
+    "get_config_lookups_per_second": time_lookups(
+        lambda: get_config("dispatcher.results_dir"), num_lookups
+    ),
+    "get_results_dir_lookups_per_second": time_lookups(get_results_dir, num_lookups),
+}
+
+start = time.perf_counter()
+with multiprocessing.Pool(num_processes) as pool:
+    pool.map(update_many, range(num_processes))
+results["num_processes"] = num_processes
+results["num_updates"] = num_processes * num_updates
+results["concurrent_update_time"] = time.perf_counter() - start
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
+
+tmp_dir.cleanup()
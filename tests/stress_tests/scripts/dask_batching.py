@@ -0,0 +1,118 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Submission throughput of the Dask executor against a LocalCluster
+# Compares one-by-one submission with batched submission and with
+# scattering of a large input shared by every task.
+
+import asyncio
+import io
+import os
+import time
+
+import yaml
+from dask.distributed import LocalCluster
+
+from covalent._shared_files.utils import _address_client_mapper
+from covalent._workflow.transport import TransportableObject
+from covalent.executor.executor_plugins.dask import DaskExecutor, _scattered_inputs
+
+benchmark_name = "dask_batching"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+widths = [2**i for i in range(4, 11, 2)]
+input_sizes = [0, 10**5, 10**7]  # bytes
+modes = {
+    "unbatched": {"batch_window": 0, "scatter_threshold": 0},
+    "batched": {"batch_window": 0.01, "scatter_threshold": 0},
+    "batched_scatter": {"batch_window": 0.01, "scatter_threshold": 2**16},
+}
+trials = 3
+
+
+def sample_task(data, i):
+    return len(data.get_deserialized()) + i
+
+
+async def run_width(address, width, shared_input, mode):
+    # Task inputs reach executors as TransportableObjects, as they do from the dispatcher
+    shared_input = TransportableObject(shared_input)
+
+    async def run_one(i):
+        executor = DaskExecutor(address, **modes[mode])
+        executor._task_stdout = io.StringIO()
+        executor._task_stderr = io.StringIO()
+        executor.get_cancel_requested = _not_cancelled
+        executor.set_job_handle = _ignore
+        return await executor.run(
+            sample_task, [shared_input], {"i": i}, {"dispatch_id": mode, "node_id": i}
+        )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(i) for i in range(width)))
+    runtime = time.perf_counter() - start
+
+    # Clients and scattered data are bound to the event loop of each run
+    _scattered_inputs.pop(address, None)
+    await _address_client_mapper.pop(address).close()
+    return runtime
+
+
+async def _not_cancelled():
+    return False
+
+
+async def _ignore(*args):
+    pass
+
+
+if __name__ == "__main__":
+    cluster = LocalCluster()
+
+    for size in input_sizes:
+        shared_input = b"x" * size
+        for width in widths:
+            for mode in modes:
+                for i in range(trials):
+                    runtime = asyncio.run(
+                        run_width(cluster.scheduler_address, width, shared_input, mode)
+                    )
+
+                    outfile = f"{benchmark_dir}/{mode}_size_{size}_width_{width}_trial_{i}"
+                    with open(outfile, "w") as f:
+                        yaml.dump(
+                            {
+                                "test": benchmark_name,
+                                "mode": mode,
+                                "input_size": size,
+                                "width": width,
+                                "runtime": runtime,
+                                "tasks_per_second": width / runtime,
+                            },
+                            f,
+                        )
+                    print(
+                        "{}: size {}, width {}: {:.3f} seconds".format(mode, size, width, runtime)
+                    )
+
+    cluster.close()
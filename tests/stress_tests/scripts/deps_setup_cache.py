@@ -0,0 +1,114 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Deps setup cache
+# Applies the same pip deps repeatedly, as successive electrons with
+# `deps_pip` do, with and without the deps setup cache. Packages are installed
+# offline from a local wheel directory into a scratch virtual environment, and
+# the time per application is reported. Does not require a server.
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+import yaml
+
+benchmark_name = "deps_setup_cache"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_packages = 5
+num_repeats = 10
+
+work_dir = tempfile.mkdtemp()
+wheel_dir = os.path.join(work_dir, "wheels")
+venv_dir = os.path.join(work_dir, "venv")
+os.makedirs(wheel_dir)
+
+
+def build_wheel(name):
+    """Write a minimal pure Python wheel for package `name`."""
+
+    dist_info = f"{name}-1.0.dist-info"
+    files = {
+        f"{name}/__init__.py": "VERSION = '1.0'\n",
+        f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n",
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nGenerator: bench\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    files[f"{dist_info}/RECORD"] = (
+        "".join(f"{path},,\n" for path in files) + f"{dist_info}/RECORD,,\n"
+    )
+    with zipfile.ZipFile(os.path.join(wheel_dir, f"{name}-1.0-py3-none-any.whl"), "w") as whl:
+        for path, content in files.items():
+            whl.writestr(path, content)
+
+
+packages = [f"covalent_bench_pkg{i}" for i in range(num_packages)]
+for package in packages:
+    build_wheel(package)
+
+# Covalent and its dependencies are visible in the environment, the packages are installed into it
+subprocess.run([sys.executable, "-m", "venv", "--system-site-packages", venv_dir], check=True)
+venv_python = os.path.join(venv_dir, "bin", "python")
+
+apply_script = f"""
+import sys, time
+from covalent._workflow.depspip import apply_pip_deps
+start = time.perf_counter()
+apply_pip_deps(["--no-index", "--find-links", {wheel_dir!r}, *{packages!r}])
+print(time.perf_counter() - start)
+"""
+
+
+def apply_deps(cache_enabled):
+    env = dict(
+        os.environ,
+        COVALENT_CACHE_DIR=os.path.join(work_dir, "cache"),
+        COVALENT_DEPS_CACHE=str(cache_enabled).lower(),
+        PYTHONPATH=os.pathsep.join(sys.path),
+    )
+    proc = subprocess.run(
+        [venv_python, "-c", apply_script], env=env, capture_output=True, text=True, check=True
+    )
+    return float(proc.stdout.strip())
+
+
+results = {"test": benchmark_name, "num_packages": num_packages, "num_repeats": num_repeats}
+
+results["first_install_time"] = apply_deps(cache_enabled=True)
+for cache_enabled in (False, True):
+    times = [apply_deps(cache_enabled) for _ in range(num_repeats)]
+    mode = "cached" if cache_enabled else "uncached"
+    results[f"{mode}_repeat_time_median"] = statistics.median(times)
+    results[f"{mode}_repeat_time_max"] = max(times)
+
+shutil.rmtree(work_dir)
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
@@ -0,0 +1,97 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Redispatch count and latency of DirTrigger under file bursts
+# A writer drops `burst_size` files into a watched directory as fast as it can,
+# and the trigger's redispatches are counted instead of performed, comparing
+# per-event firing against debounced, coalesced batches. Does not require a server.
+
+import asyncio
+import os
+import tempfile
+import time
+
+import yaml
+
+from covalent.triggers import DirTrigger
+
+benchmark_name = "dir_trigger_burst"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+burst_sizes = [10, 100, 1000, 5000]
+configurations = {
+    "per_event": {},
+    "debounced": {"debounce": 0.2, "max_latency": 2},
+}
+settle_time = 3
+
+
+class CountingDirTrigger(DirTrigger):
+    """DirTrigger which records trigger times instead of redispatching"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trigger_times = []
+        self.num_changed_paths = 0
+
+    def trigger(self, changed_paths=None):
+        self.trigger_times.append(time.perf_counter())
+        self.num_changed_paths += len(changed_paths) if changed_paths is not None else 1
+
+
+async def run_burst(burst_size, trigger_kwargs):
+    with tempfile.TemporaryDirectory() as watched_dir:
+        trigger = CountingDirTrigger(watched_dir, ["created", "modified"], **trigger_kwargs)
+        trigger.observe()
+
+        start = time.perf_counter()
+        for i in range(burst_size):
+            with open(os.path.join(watched_dir, f"file_{i}"), "w") as f:
+                f.write("data")
+        written = time.perf_counter()
+
+        await asyncio.sleep(settle_time)
+        trigger.stop()
+
+    return {
+        "burst_size": burst_size,
+        "num_redispatches": len(trigger.trigger_times),
+        "num_changed_paths": trigger.num_changed_paths,
+        "write_time": written - start,
+        "end_to_end_latency": trigger.trigger_times[-1] - start if trigger.trigger_times else None,
+    }
+
+
+for name, trigger_kwargs in configurations.items():
+    for burst_size in burst_sizes:
+        result = asyncio.run(run_burst(burst_size, trigger_kwargs))
+        result.update({"test": benchmark_name, "configuration": name})
+
+        outfile = f"{benchmark_dir}/{name}_{burst_size}"
+        with open(outfile, "w") as f:
+            yaml.dump(result, f)
+        print(
+            "{}, {} files: {} redispatches, last one after {} seconds".format(
+                name, burst_size, result["num_redispatches"], result["end_to_end_latency"]
+            )
+        )
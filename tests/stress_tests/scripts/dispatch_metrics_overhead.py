@@ -0,0 +1,98 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Dispatch metrics instrumentation overhead
+# Measures the cost per task of recording the phase timings and counters
+# collected by the dispatcher, compared with the time for an empty loop, and
+# the time to aggregate the metrics of a dispatch from a full ring buffer.
+# Does not require a server.
+
+import os
+import time
+
+import yaml
+
+from covalent._shared_files import metrics
+from covalent._shared_files.metrics import MetricsRecorder
+
+benchmark_name = "dispatch_metrics_overhead"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_tasks = 100000
+num_dispatches = 100
+recorder = MetricsRecorder()
+
+
+def instrumented_task(dispatch_id, node_id):
+    # The events and counters recorded for a single task by the runner
+    recorder.stop(dispatch_id, node_id, metrics.QUEUEING)
+    start = time.perf_counter()
+    recorder.record(dispatch_id, node_id, metrics.INPUT_FETCH, start, time.perf_counter())
+    recorder.start(dispatch_id, node_id, metrics.EXECUTOR_SETUP)
+    recorder.stop(dispatch_id, node_id, metrics.EXECUTOR_SETUP)
+    with recorder.timed(dispatch_id, node_id, metrics.EXECUTION):
+        pass
+    with recorder.timed(dispatch_id, node_id, metrics.RESULT_FETCH):
+        pass
+    with recorder.timed(dispatch_id, node_id, metrics.PERSISTENCE):
+        for _ in range(4):
+            recorder.count(metrics.DB_WRITES)
+        recorder.count(metrics.BYTES_SERIALIZED, 1024)
+
+
+def bare_task(dispatch_id, node_id):
+    pass
+
+
+def time_tasks(task):
+    start = time.perf_counter()
+    for node_id in range(num_tasks):
+        dispatch_id = f"dispatch_{node_id % num_dispatches}"
+        recorder.start(dispatch_id, node_id, metrics.QUEUEING)
+        task(dispatch_id, node_id)
+    return time.perf_counter() - start
+
+
+token = metrics.current_dispatch_id.set("dispatch_0")
+bare_time = time_tasks(bare_task)
+instrumented_time = time_tasks(instrumented_task)
+metrics.current_dispatch_id.reset(token)
+
+start = time.perf_counter()
+dispatch_metrics = recorder.get_dispatch_metrics("dispatch_0")
+aggregation_time = time.perf_counter() - start
+
+results = {
+    "test": benchmark_name,
+    "num_tasks": num_tasks,
+    "overhead_per_task_us": (instrumented_time - bare_time) / num_tasks * 1e6,
+    "ring_buffer_events": len(recorder._events),
+    "aggregation_time": aggregation_time,
+    "aggregated_nodes": len(dispatch_metrics.nodes),
+}
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
@@ -0,0 +1,107 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Throughput of chunked, parallel HTTP downloads
+# Serves a file from a local HTTP server which supports byte ranges and caps
+# each connection's bandwidth, then downloads it with the HTTP file transfer
+# strategy at increasing concurrency. Does not require a server.
+
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+from covalent._file_transfer import File
+from covalent._file_transfer.strategies.http_strategy import HTTP
+
+benchmark_name = "http_transfer_throughput"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+file_size = 256 * 1024 * 1024
+chunk_size = 8 * 1024 * 1024
+concurrencies = [1, 2, 4, 8, 16]
+per_connection_bandwidth = 32 * 1024 * 1024  # bytes per second
+block_size = 256 * 1024
+
+data = os.urandom(file_size)
+
+
+class ThrottledRangeHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send_headers(self, status, start, end):
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers(200, 0, file_size - 1)
+
+    def do_GET(self):
+        start, end = 0, file_size - 1
+        if range_header := self.headers.get("Range"):
+            start, end = map(int, range_header[len("bytes=") :].split("-"))
+        self._send_headers(206 if range_header else 200, start, end)
+        for offset in range(start, end + 1, block_size):
+            self.wfile.write(data[offset : min(offset + block_size, end + 1)])
+            time.sleep(block_size / per_connection_bandwidth)
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledRangeHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_port}/data.bin"
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    for max_concurrency in concurrencies:
+        to_filepath = os.path.join(tmpdir, f"data_{max_concurrency}.bin")
+        strategy = HTTP(chunk_size=chunk_size, max_concurrency=max_concurrency)
+
+        start = time.perf_counter()
+        strategy.download(File(url), File(to_filepath))()
+        elapsed = time.perf_counter() - start
+
+        assert os.path.getsize(to_filepath) == file_size
+        os.remove(to_filepath)
+
+        throughput = file_size / elapsed / 1024**2
+        outfile = f"{benchmark_dir}/concurrency_{max_concurrency}"
+        with open(outfile, "w") as f:
+            yaml.dump(
+                {
+                    "test": benchmark_name,
+                    "file_size": file_size,
+                    "chunk_size": chunk_size,
+                    "max_concurrency": max_concurrency,
+                    "time": elapsed,
+                    "throughput_mib_per_second": throughput,
+                },
+                f,
+            )
+        print(f"concurrency {max_concurrency}: {throughput:.1f} MiB/s")
+
+server.shutdown()
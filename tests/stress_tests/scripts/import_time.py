@@ -0,0 +1,104 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Import time
+# Measures the time to import the SDK, the CLI and the first executor lookup
+# in fresh interpreters using `python -X importtime`, and lists the slowest
+# modules imported by each. The SDK and CLI imports must each stay within
+# `budget` seconds; exceeded as soon as the quantum stack is imported eagerly again.
+# Does not require a server.
+
+import os
+import statistics
+import subprocess
+import sys
+
+import yaml
+
+benchmark_name = "import_time"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_repeats = 5
+num_slowest = 10
+budget = 1.5
+
+statements = {
+    "sdk": "import covalent",
+    "cli": "import covalent_dispatcher._cli.cli",
+    "executor_lookup": "import covalent; covalent.executor.LocalExecutor",
+}
+
+
+def measure_imports(statement):
+    """Return the total import time of `statement` and the cumulative times of the
+    modules imported one level below the top-level imports."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    nested = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Each level of nesting is indented by two more spaces
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            total += int(cumulative)
+        elif depth == 1:
+            nested[name.strip()] = int(cumulative) / 1e6
+    return total / 1e6, nested
+
+
+results = {"test": benchmark_name, "num_repeats": num_repeats, "budget": budget}
+
+for label, statement in statements.items():
+    totals = []
+    slowest = {}
+    for _ in range(num_repeats):
+        total, nested = measure_imports(statement)
+        totals.append(total)
+        slowest = nested
+    results[f"{label}_import_time"] = statistics.median(totals)
+    results[f"{label}_slowest_imports"] = dict(
+        sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:num_slowest]
+    )
+
+results["within_budget"] = all(
+    results[f"{label}_import_time"] <= budget for label in ["sdk", "cli"]
+)
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
+
+if not results["within_budget"]:
+    sys.exit(1)
@@ -0,0 +1,128 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Lepton calls
+# Calls small C, Python and Bash leptons many times in the same process, as a
+# worker running many such tasks does. C leptons call a function in a shared
+# library compiled here with gcc. Each lepton is timed with its handles looked
+# up on every call, as before they were cached, and with the cached handles
+# (or a persistent shell for Bash). Does not require a server.
+
+import ctypes
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import yaml
+
+from covalent._workflow.lepton import Lepton, _load_c_function, _load_python_function
+
+benchmark_name = "lepton_calls"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_calls = 10000
+num_shell_calls = 200
+
+c_source = """
+void accumulate(int x, int *total)
+{
+    *total += x;
+}
+"""
+
+build_dir = tempfile.mkdtemp()
+with open(os.path.join(build_dir, "accumulate.c"), "w") as f:
+    f.write(c_source)
+library_path = os.path.join(build_dir, "libaccumulate.so")
+subprocess.run(
+    [
+        "gcc",
+        "-O2",
+        "-shared",
+        "-fPIC",
+        "-o",
+        library_path,
+        os.path.join(build_dir, "accumulate.c"),
+    ],
+    check=True,
+)
+
+c_lepton = Lepton(
+    "C",
+    library_name=library_path,
+    function_name="accumulate",
+    argtypes=[(ctypes.c_int, Lepton.INPUT), (ctypes.POINTER(ctypes.c_int), Lepton.INPUT_OUTPUT)],
+).wrap_task()
+py_lepton = Lepton("python", library_name="math", function_name="hypot").wrap_task()
+shell_leptons = {
+    persistent: Lepton(
+        "bash",
+        command="total=$(( $1 + total ))",
+        argtypes=[(int, Lepton.INPUT_OUTPUT)],
+        named_outputs=["total"],
+        persistent_shell=persistent,
+    ).wrap_task()
+    for persistent in (False, True)
+}
+
+
+def time_calls(call, n, clear_cache=None):
+    start = time.perf_counter()
+    for i in range(n):
+        if clear_cache:
+            clear_cache()
+        call(i)
+    return (time.perf_counter() - start) / n
+
+
+results = {"test": benchmark_name, "num_calls": num_calls, "num_shell_calls": num_shell_calls}
+
+for label, call, clear_cache in (
+    ("c", lambda i: c_lepton(1, i), _load_c_function.cache_clear),
+    ("python", lambda i: py_lepton(3, i), _load_python_function.cache_clear),
+):
+    results[f"{label}_uncached_call_time"] = time_calls(call, num_calls, clear_cache)
+    results[f"{label}_cached_call_time"] = time_calls(call, num_calls)
+    results[f"{label}_speedup"] = (
+        results[f"{label}_uncached_call_time"] / results[f"{label}_cached_call_time"]
+    )
+
+results["shell_subprocess_call_time"] = time_calls(
+    lambda i: shell_leptons[False](str(i), total=1), num_shell_calls
+)
+results["shell_persistent_call_time"] = time_calls(
+    lambda i: shell_leptons[True](str(i), total=1), num_shell_calls
+)
+results["shell_speedup"] = (
+    results["shell_subprocess_call_time"] / results["shell_persistent_call_time"]
+)
+
+shutil.rmtree(build_dir)
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
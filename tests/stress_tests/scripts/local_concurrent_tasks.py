@@ -0,0 +1,145 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Local concurrent tasks
+# Runs many long-running tasks concurrently with the local executor, once
+# through the event loop's default thread pool, as the dispatcher used to, and
+# once through the executor's own pool with the tasks awaited on the loop.
+# Reports the wall time, the number of pool threads held by the tasks, and the
+# latency of other calls made on the default pool meanwhile. Does not require a server.
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import yaml
+
+import covalent as ct
+from covalent._workflow.transport import TransportableObject
+from covalent.executor import base, wrapper_fn
+from covalent.executor.executor_plugins import local
+
+benchmark_name = "local_concurrent_tasks"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_tasks = 64
+task_duration = 1.0
+probe_interval = 0.05
+
+# Give every task a worker process so that only thread usage differs between modes
+local.proc_pool = ProcessPoolExecutor(max_workers=num_tasks)
+
+
+class BenchmarkExecutor(local.LocalExecutor):
+    """Local executor which runs without the dispatcher's signal handler."""
+
+    def set_job_handle(self, handle):
+        pass
+
+    def get_cancel_requested(self):
+        return False
+
+    def _notify(self, action, body=None):
+        pass
+
+
+def long_task(x):
+    time.sleep(task_duration)
+    return x
+
+
+# Wrap the task as the dispatcher does
+task = partial(wrapper_fn, TransportableObject(long_task), [], [])
+
+
+async def probe_default_pool(done, latencies):
+    """Time trivial calls on the default pool until `done` is set."""
+
+    loop = asyncio.get_running_loop()
+    while not done.is_set():
+        start = time.perf_counter()
+        await loop.run_in_executor(None, time.perf_counter)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(probe_interval)
+
+
+async def run_tasks(mode):
+    loop = asyncio.get_running_loop()
+    executor = BenchmarkExecutor(log_stdout="", log_stderr="")
+    done = asyncio.Event()
+    latencies = []
+    peak_threads = 0
+
+    async def run_one(i):
+        args = [TransportableObject(i)]
+        if mode == "default_pool":
+            return await loop.run_in_executor(
+                None, executor.execute, task, args, {}, "bench", "/tmp", i
+            )
+        return await executor._execute(task, args, {}, "bench", "/tmp", i)
+
+    async def sample_threads():
+        nonlocal peak_threads
+        while not done.is_set():
+            if mode == "default_pool":
+                threads = len(loop._default_executor._threads) if loop._default_executor else 0
+            else:
+                threads = base._pool_active_gauge.labels("local").value
+            peak_threads = max(peak_threads, threads)
+            await asyncio.sleep(probe_interval)
+
+    probe = asyncio.create_task(probe_default_pool(done, latencies))
+    sampler = asyncio.create_task(sample_threads())
+    start = time.perf_counter()
+    outputs = await asyncio.gather(*(run_one(i) for i in range(num_tasks)))
+    wall_time = time.perf_counter() - start
+    done.set()
+    await asyncio.gather(probe, sampler)
+
+    assert all(status == ct.status.COMPLETED for _, _, _, status in outputs)
+    latencies.sort()
+    return {
+        "wall_time": wall_time,
+        "peak_threads": peak_threads,
+        "probe_latency_max": latencies[-1],
+        "probe_latency_p95": latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+results = {"test": benchmark_name, "num_tasks": num_tasks, "task_duration": task_duration}
+
+# Start the worker processes before timing
+list(local.proc_pool.map(abs, range(num_tasks)))
+
+for mode in ("default_pool", "executor_pool"):
+    # Each mode gets a fresh loop and therefore a fresh default pool
+    for key, value in asyncio.run(run_tasks(mode)).items():
+        results[f"{mode}_{key}"] = value
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
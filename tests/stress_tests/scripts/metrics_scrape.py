@@ -0,0 +1,109 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Dispatcher metrics under load
+# Dispatches a wide workflow to a running Covalent server and scrapes its
+# Prometheus metrics endpoint while the workflow runs, recording the peak
+# number of tasks in flight and status queue depth, and the time taken to
+# scrape the endpoint.
+
+import os
+import threading
+import time
+
+import requests
+import yaml
+
+import covalent as ct
+from covalent._shared_files.utils import get_ui_url
+
+benchmark_name = "metrics_scrape"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_tasks = 256
+scrape_interval = 0.1
+metrics_url = get_ui_url("/api/metrics")
+
+
+@ct.electron
+def sample_task(x):
+    time.sleep(0.1)
+    return x
+
+
+@ct.lattice
+def wide_workflow(n):
+    return [sample_task(i) for i in range(n)]
+
+
+def sample(text, name):
+    return sum(
+        float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith(name + "{") or line.startswith(name + " ")
+    )
+
+
+scrapes = []
+done = threading.Event()
+
+
+def scrape():
+    while not done.is_set():
+        start = time.perf_counter()
+        text = requests.get(metrics_url).text
+        scrapes.append((time.perf_counter() - start, text))
+        time.sleep(scrape_interval)
+
+
+scraper = threading.Thread(target=scrape)
+scraper.start()
+
+start = time.time()
+dispatch_id = ct.dispatch(wide_workflow)(num_tasks)
+result = ct.get_result(dispatch_id, wait=True)
+end = time.time()
+
+done.set()
+scraper.join()
+
+scrape_times = sorted(duration for duration, _ in scrapes)
+results = {
+    "test": benchmark_name,
+    "status": str(result.status),
+    "num_tasks": num_tasks,
+    "workflow_time": end - start,
+    "num_scrapes": len(scrapes),
+    "median_scrape_time": scrape_times[len(scrape_times) // 2],
+    "max_scrape_time": scrape_times[-1],
+    "peak_tasks_in_flight": max(sample(text, "covalent_tasks_in_flight") for _, text in scrapes),
+    "peak_status_queue_depth": max(
+        sample(text, "covalent_dispatch_status_queue_depth") for _, text in scrapes
+    ),
+}
+
+with open(f"{benchmark_dir}/results", "w") as f:
+    yaml.dump(results, f)
+
+for key, value in results.items():
+    print(f"{key}: {value}")
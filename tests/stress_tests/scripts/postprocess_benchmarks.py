@@ -54,7 +54,7 @@ for benchmark_name in benchmarks:
             with open(branch_dir / filename, "r") as f:
                 d = yaml.safe_load(f)
                 d["branch"] = branch
-                if d["ct"]:
+                if d.get("ct", True):
                     ct_results.append(d)
                 else:
                     noct_results.append(d)
@@ -0,0 +1,176 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Postprocess memory
+# Builds workflows whose tasks return large outputs, of which the return value
+# references only some, and runs their postprocess node with both the
+# "exhaustive" and "reconstruct" algorithms. The other nodes are run in process
+# as the dispatcher would; the postprocess node is then run through the
+# executor wrapper in a forked process, whose peak RSS is reported together with
+# the size of the outputs held by the transport graph. Each trial is written as
+# a separate record which `postprocess_benchmarks.py` aggregates. Does not
+# require a server.
+
+import ctypes
+import multiprocessing
+import os
+import time
+
+import networkx as nx
+import numpy as np
+import yaml
+
+import covalent as ct
+from covalent._shared_files.config import get_config, set_config
+from covalent.executor.base import wrapper_fn
+
+benchmark_name = "postprocess_memory"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_tasks = 16
+output_size_mb = 8
+referenced_counts = [4, 16]
+trials = 3
+
+
+@ct.electron
+def make_output(i, size_mb):
+    return np.full(size_mb * 1024 * 1024, i, dtype=np.uint8)
+
+
+def build_workflow(num_referenced):
+    @ct.lattice
+    def workflow(n, size_mb):
+        outputs = [make_output(i, size_mb) for i in range(n)]
+        return {"outputs": outputs[-num_referenced:]}
+
+    return workflow
+
+
+def get_inputs(tg, node_id):
+    """Assemble the serialized inputs of a node from the outputs of its parents."""
+
+    args = []
+    kwargs = {}
+    for parent, _, edge in tg._graph.in_edges(node_id, data=True):
+        if edge.get("wait_for"):
+            continue
+        value = tg.get_node_value(parent, "output")
+        if edge["param_type"] == "arg":
+            args.append((edge["arg_index"], value))
+        else:
+            kwargs[edge["edge_name"]] = value
+    return [value for _, value in sorted(args, key=lambda x: x[0])], kwargs
+
+
+def read_rss_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+
+
+def run_postprocess(fn, args, kwargs, queue):
+    # Release the free heap inherited from the parent and reset the peak RSS
+    ctypes.CDLL("libc.so.6").malloc_trim(0)
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    start_rss = read_rss_mb("VmRSS")
+    start = time.perf_counter()
+    output = wrapper_fn(fn, [], [], *args, **kwargs)
+    wall_time = time.perf_counter() - start
+    peak_rss = read_rss_mb("VmHWM") - start_rss
+    queue.put((wall_time, peak_rss, len(output.get_serialized()) / 1024 / 1024))
+
+
+def run_trial(num_referenced, trial_queue):
+    workflow = build_workflow(num_referenced)
+    workflow.build_graph(num_tasks, output_size_mb)
+    tg = workflow.transport_graph
+
+    pp_node = None
+    for node in nx.topological_sort(tg._graph):
+        name = tg.get_node_value(node, "name")
+        if name.startswith(":parameter:"):
+            tg.set_node_value(node, "output", tg.get_node_value(node, "value"))
+        elif name.startswith(":postprocess:"):
+            pp_node = node
+        else:
+            args, kwargs = get_inputs(tg, node)
+            fn = tg.get_node_value(node, "function")
+            tg.set_node_value(node, "output", wrapper_fn(fn, [], [], *args, **kwargs))
+
+    stored = sum(
+        len(tg.get_node_value(node, "output").get_serialized())
+        for node in tg._graph.nodes
+        if node != pp_node
+    )
+    args, kwargs = get_inputs(tg, pp_node)
+    fn = tg.get_node_value(pp_node, "function")
+
+    queue = ctx.Queue()
+    proc = ctx.Process(target=run_postprocess, args=(fn, args, kwargs, queue))
+    proc.start()
+    wall_time, peak_rss, returned = queue.get()
+    proc.join()
+    trial_queue.put((wall_time, peak_rss, stored / 1024 / 1024, returned))
+
+
+ctx = multiprocessing.get_context("fork")
+original_exhaustive = get_config("sdk.exhaustive_postprocess")
+
+try:
+    for algorithm, exhaustive in (("exhaustive", "true"), ("reconstruct", "false")):
+        set_config("sdk.exhaustive_postprocess", exhaustive)
+        for num_referenced in referenced_counts:
+            for i in range(trials):
+                # Each trial runs in a fresh process so that trials do not share a heap
+                queue = ctx.Queue()
+                proc = ctx.Process(target=run_trial, args=(num_referenced, queue))
+                proc.start()
+                wall_time, peak_rss, stored, returned = queue.get()
+                proc.join()
+                result = {
+                    "test": benchmark_name,
+                    "ct": True,
+                    "algorithm": algorithm,
+                    "num_tasks": num_tasks,
+                    "output_size_mb": output_size_mb,
+                    "num_referenced": num_referenced,
+                    "trial": i,
+                    "runtime": wall_time,
+                    "peak_rss_mb": peak_rss,
+                    "stored_outputs_mb": stored,
+                    "result_mb": returned,
+                }
+                outfile = f"{benchmark_dir}/{algorithm}_ref_{num_referenced}_trial_{i}"
+                with open(outfile, "w") as f:
+                    yaml.dump(result, f)
+                print(
+                    "{} postprocess referencing {} of {} outputs: {:.2f} s, peak RSS {:.0f} MB, "
+                    "stored outputs {:.0f} MB".format(
+                        algorithm, num_referenced, num_tasks, wall_time, peak_rss, stored
+                    )
+                )
+finally:
+    set_config("sdk.exhaustive_postprocess", original_exhaustive)
@@ -0,0 +1,91 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# QElectron batch submission
+# Executes batches of 10 to 10k circuits, as produced by parameter-shift
+# gradients, through a QElectron on a local Simulator executor, with and
+# without persisted circuit data. Does not require a server.
+
+import os
+import time
+
+import pennylane as qml
+import yaml
+
+import covalent as ct
+
+benchmark_name = "qelectron_batch"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+batch_sizes = [10, 100, 1000, 10000]
+num_params = 4
+
+
+def get_tapes(batch_size):
+    tapes = []
+    for i in range(batch_size):
+        shifted_param, shift = divmod(i, 2)
+        with qml.tape.QuantumTape() as tape:
+            for j in range(num_params):
+                qml.RX(0.1 + (j == shifted_param % num_params) * (-1) ** shift, wires=j % 2)
+                qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(1))
+        tapes.append(tape)
+    return tapes
+
+
+for persist_data in [True, False]:
+
+    @ct.qelectron(executors=ct.executor.Simulator(persist_data=persist_data))
+    @qml.qnode(qml.device("default.qubit", wires=2))
+    def circuit(params):
+        for j in range(num_params):
+            qml.RX(params[j], wires=j % 2)
+            qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    # Set up the QElectron's device.
+    circuit([0.1] * num_params)
+
+    for batch_size in batch_sizes:
+        tapes = get_tapes(batch_size)
+
+        start = time.perf_counter()
+        results = circuit.device.batch_execute(tapes)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == batch_size
+
+        outfile = f"{benchmark_dir}/persist_{persist_data}_batch_{batch_size}"
+        with open(outfile, "w") as f:
+            yaml.dump(
+                {
+                    "test": benchmark_name,
+                    "persist_data": persist_data,
+                    "batch_size": batch_size,
+                    "time": elapsed,
+                    "time_per_circuit": elapsed / batch_size,
+                },
+                f,
+            )
+        print(f"persist_data={persist_data}, {batch_size} circuits: {elapsed:.2f}s")
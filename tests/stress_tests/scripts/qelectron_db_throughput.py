@@ -0,0 +1,93 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Write throughput of the QElectron database
+# Writes circuit records to a QElectron database in submissions of increasing
+# size, then reads them back, and reports records per second. Does not
+# require a server.
+
+import datetime
+import os
+import tempfile
+import time
+
+import yaml
+
+from covalent.quantum.qserver.database import Database, close_environments
+
+benchmark_name = "qelectron_db_throughput"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_records = 10000
+submission_sizes = [1, 10, 100, 1000]
+
+
+def get_record(i):
+    return {
+        "electron_node_id": 0,
+        "dispatch_id": "benchmark",
+        "circuit_name": "circuit",
+        "circuit_description": None,
+        "circuit_diagram": "0: ──RX──╭●─┤     \n1: ──────╰X─┤  <Z>",
+        "save_time": str(datetime.datetime.now()),
+        "circuit_id": f"circuit_{i}",
+        "execution_time": 0.001 * i,
+        "result": [0.5],
+    }
+
+
+for submission_size in submission_sizes:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(tmpdir)
+        records = [get_record(i) for i in range(num_records)]
+
+        start = time.perf_counter()
+        for i in range(0, num_records, submission_size):
+            keys = [f"circuit_{j}" for j in range(i, i + submission_size)]
+            db.set(keys, records[i : i + submission_size], dispatch_id="benchmark", node_id=0)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(100):
+            Database(tmpdir, readonly=True).get_circuit_ids(dispatch_id="benchmark", node_id=0)
+        read_time = (time.perf_counter() - start) / 100
+
+        close_environments(tmpdir)
+
+    outfile = f"{benchmark_dir}/submission_size_{submission_size}"
+    with open(outfile, "w") as f:
+        yaml.dump(
+            {
+                "test": benchmark_name,
+                "num_records": num_records,
+                "submission_size": submission_size,
+                "write_time": write_time,
+                "records_per_second": num_records / write_time,
+                "read_time": read_time,
+            },
+            f,
+        )
+    print(
+        f"submission size {submission_size}: {num_records / write_time:.0f} records/s, "
+        f"{read_time * 1000:.1f} ms per read"
+    )
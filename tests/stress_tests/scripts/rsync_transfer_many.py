@@ -0,0 +1,94 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Per-file versus batched rsync transfers
+# Copies many small files with one rsync invocation per file and then with a
+# single TransferMany batch, using rsync's local mode so that no SSH server is
+# needed. Over SSH the batched transfers additionally share one connection.
+# Requires rsync.
+
+import os
+import tempfile
+import time
+
+import yaml
+
+from covalent._file_transfer.file_transfer import FileTransfer, TransferMany
+from covalent._file_transfer.strategies.rsync_strategy import Rsync
+
+benchmark_name = "rsync_transfer_many"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+file_counts = [10, 100, 1000]
+file_size = 4 * 1024
+
+strategy = Rsync()
+
+for num_files in file_counts:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_dir = os.path.join(tmpdir, "src")
+        os.makedirs(src_dir)
+        for i in range(num_files):
+            with open(os.path.join(src_dir, f"file_{i}.bin"), "wb") as f:
+                f.write(os.urandom(file_size))
+
+        timings = {}
+        for mode in ["per_file", "batched"]:
+            dest_dir = os.path.join(tmpdir, mode)
+            os.makedirs(dest_dir)
+            file_transfers = [
+                FileTransfer(
+                    os.path.join(src_dir, f"file_{i}.bin"),
+                    os.path.join(dest_dir, f"file_{i}.bin"),
+                    strategy=strategy,
+                )
+                for i in range(num_files)
+            ]
+
+            start = time.perf_counter()
+            if mode == "per_file":
+                for ft in file_transfers:
+                    ft.cp()[1]()
+            else:
+                TransferMany(file_transfers).cp()[1]()
+            timings[mode] = time.perf_counter() - start
+
+            assert len(os.listdir(dest_dir)) == num_files
+
+    outfile = f"{benchmark_dir}/files_{num_files}"
+    with open(outfile, "w") as f:
+        yaml.dump(
+            {
+                "test": benchmark_name,
+                "num_files": num_files,
+                "file_size": file_size,
+                "per_file_time": timings["per_file"],
+                "batched_time": timings["batched"],
+                "speedup": timings["per_file"] / timings["batched"],
+            },
+            f,
+        )
+    print(
+        f"{num_files} files: per-file {timings['per_file']:.2f}s, "
+        f"batched {timings['batched']:.2f}s"
+    )
@@ -0,0 +1,136 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Per-poll cost of SQLiteTrigger on a large table
+# Seeds a table with `num_rows` rows, then measures the latency of each poll
+# while a writer appends a few rows per second, comparing full re-reads
+# against incremental high-water-mark polling. Does not require a server.
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import yaml
+
+import covalent.triggers.sqlite_trigger as sqlite_trigger_module
+from covalent.triggers import SQLiteTrigger
+
+benchmark_name = "sqlite_trigger_poll"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_rows = 1_000_000
+poll_interval = 0.1
+duration = 10
+writes_per_second = 5
+
+
+class TimedSQLiteTrigger(SQLiteTrigger):
+    """SQLiteTrigger which counts triggers and records poll latencies"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trigger_count = 0
+
+    def trigger(self):
+        self.trigger_count += 1
+
+
+def seed(db_path):
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, status TEXT)")
+    connection.executemany(
+        "INSERT INTO jobs (status) VALUES (?)", (("pending",) for _ in range(num_rows))
+    )
+    connection.commit()
+    connection.close()
+
+
+def write_rows(db_path, stop):
+    connection = sqlite3.connect(db_path)
+    while not stop.is_set():
+        connection.execute("INSERT INTO jobs (status) VALUES ('pending')")
+        connection.commit()
+        time.sleep(1 / writes_per_second)
+    connection.close()
+
+
+def timed_sleep(polls):
+    last = [time.perf_counter()]
+
+    def sleep(seconds):
+        polls.append(time.perf_counter() - last[0])
+        time.sleep(seconds)
+        last[0] = time.perf_counter()
+
+    return sleep
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    db_path = os.path.join(tmpdir, "jobs.db")
+    seed(db_path)
+
+    for incremental in [False, True]:
+        trigger = TimedSQLiteTrigger(
+            db_path, "jobs", poll_interval, ["status = 'pending'"], incremental=incremental
+        )
+
+        # Only the observer's sleeps are timed, each one ends a poll
+        polls = []
+        sqlite_trigger_module.time = SimpleNamespace(sleep=timed_sleep(polls))
+
+        stop = threading.Event()
+        writer = threading.Thread(target=write_rows, args=(db_path, stop))
+        observer = threading.Thread(target=trigger.observe)
+        writer.start()
+        observer.start()
+
+        time.sleep(duration)
+        trigger.stop()
+        stop.set()
+        observer.join()
+        writer.join()
+        sqlite_trigger_module.time = time
+
+        mode = "incremental" if incremental else "full"
+        outfile = f"{benchmark_dir}/{mode}"
+        with open(outfile, "w") as f:
+            yaml.dump(
+                {
+                    "test": benchmark_name,
+                    "mode": mode,
+                    "num_rows": num_rows,
+                    "num_polls": len(polls),
+                    "num_triggers": trigger.trigger_count,
+                    "mean_poll_latency": sum(polls) / len(polls),
+                    "max_poll_latency": max(polls),
+                },
+                f,
+            )
+        print(
+            "{}: {} polls, {} triggers, mean poll latency {:.4f} seconds".format(
+                mode, len(polls), trigger.trigger_count, sum(polls) / len(polls)
+            )
+        )
@@ -0,0 +1,140 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Capacity of the Triggers server's trigger runtime
+# Registers many time, SQLite and directory triggers on one runtime, with the
+# redispatch replaced by a counter, and records how many of them fire, how late
+# the time triggers fire, and how many threads the process uses.
+# Does not require a server.
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from covalent.triggers import DirTrigger, SQLiteTrigger, TimeTrigger
+from covalent_dispatcher._triggers_app.runtime import TriggerRuntime
+
+benchmark_name = "trigger_runtime"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+trigger_counts = [100, 1000, 5000]  # per trigger type, directory triggers are capped below
+# Each watched directory still takes an inotify instance, which are limited per user
+max_dir_triggers = 100
+time_gap = 1
+poll_interval = 1
+duration = 5
+
+
+def counting(trigger, fired):
+    registered = time.perf_counter()
+
+    def trigger_action():
+        fired.append((id(trigger), time.perf_counter() - registered))
+
+    trigger.trigger = trigger_action
+    return trigger
+
+
+async def run(num_triggers, tmpdir):
+    db_path = os.path.join(tmpdir, f"jobs_{num_triggers}.db")
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, status TEXT)")
+    connection.commit()
+
+    num_dir_triggers = min(num_triggers, max_dir_triggers)
+    watched_dirs = []
+    for i in range(num_dir_triggers):
+        watched_dirs.append(os.path.join(tmpdir, f"dir_{num_triggers}_{i}"))
+        os.makedirs(watched_dirs[-1])
+
+    thread_pool = ThreadPoolExecutor()
+    runtime = TriggerRuntime(thread_pool)
+    fired = {"time": [], "sqlite": [], "dir": []}
+
+    start = time.perf_counter()
+    for _ in range(num_triggers):
+        runtime.start(counting(TimeTrigger(time_gap), fired["time"]))
+        runtime.start(
+            counting(
+                SQLiteTrigger(db_path, "jobs", poll_interval, incremental=True), fired["sqlite"]
+            )
+        )
+    for watched_dir in watched_dirs:
+        runtime.start(counting(DirTrigger(watched_dir, "created"), fired["dir"]))
+    registration_time = time.perf_counter() - start
+
+    connection.execute("INSERT INTO jobs (status) VALUES ('pending')")
+    connection.commit()
+    for watched_dir in watched_dirs:
+        with open(os.path.join(watched_dir, "new_file"), "w") as f:
+            f.write("data")
+
+    await asyncio.sleep(duration)
+    num_threads = threading.active_count()
+
+    runtime.shutdown()
+    thread_pool.shutdown(cancel_futures=True)
+    connection.close()
+
+    # Lateness of each time trigger's first action past its scheduled time
+    first_fired = {}
+    for trigger_id, elapsed in fired["time"]:
+        first_fired.setdefault(trigger_id, elapsed)
+    lateness = sorted(elapsed - time_gap for elapsed in first_fired.values())
+
+    return {
+        "test": benchmark_name,
+        "num_triggers": 2 * num_triggers + num_dir_triggers,
+        "registration_time": registration_time,
+        "num_threads": num_threads,
+        "time_triggers_fired": len(first_fired),
+        "time_trigger_actions": len(fired["time"]),
+        "time_trigger_median_lateness": lateness[len(lateness) // 2] if lateness else None,
+        "time_trigger_max_lateness": lateness[-1] if lateness else None,
+        "sqlite_triggers_fired": len({trigger_id for trigger_id, _ in fired["sqlite"]}),
+        "dir_triggers_fired": len({trigger_id for trigger_id, _ in fired["dir"]}),
+    }
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    for num_triggers in trigger_counts:
+        result = asyncio.run(run(num_triggers, tmpdir))
+
+        outfile = f"{benchmark_dir}/{num_triggers}"
+        with open(outfile, "w") as f:
+            yaml.dump(result, f)
+        print(
+            "{} triggers on {} threads: {} time, {} sqlite, {} dir fired".format(
+                result["num_triggers"],
+                result["num_threads"],
+                result["time_triggers_fired"],
+                result["sqlite_triggers_fired"],
+                result["dir_triggers_fired"],
+            )
+        )
@@ -0,0 +1,108 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the GNU Affero General Public License 3.0 (the "License").
+# A copy of the License may be obtained with this software package or at
+#
+#      https://www.gnu.org/licenses/agpl-3.0.en.html
+#
+# Use of this file is prohibited except in compliance with the License. Any
+# modifications or derivative works of this file must retain this copyright
+# notice, and modified files must contain a notice indicating that they have
+# been altered from the originals.
+#
+# Covalent is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the License for more details.
+#
+# Relief from the License may be granted by purchasing a commercial license.
+
+# Dispatcher-side throughput of result webhook updates
+# Simulates a dispatch with many node status changes, once with a UI server
+# attached (a local stub that responds after a configurable delay) and once
+# without (nothing listening on the UI port).
+
+import asyncio
+import os
+import time
+
+import yaml
+from aiohttp import web
+
+import covalent_ui.app as ui_server
+from covalent._shared_files.config import get_config
+from covalent_ui import result_webhook
+
+benchmark_name = "webhook_load"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+num_nodes = [100, 1000, 10000]
+dispatches = 4
+ui_delay = 0.005
+
+
+class _FakeResult:
+    def __init__(self, dispatch_id):
+        self.dispatch_id = dispatch_id
+        self.results_dir = ""
+        self.status = type("Status", (), {"STATUS": "RUNNING"})
+
+
+async def start_stub_ui():
+    received = []
+
+    async def handler(request):
+        received.append(await request.json())
+        await asyncio.sleep(ui_delay)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post(ui_server.WEBHOOK_PATH, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(
+        runner, get_config("user_interface.address"), get_config("user_interface.port")
+    )
+    await site.start()
+    return runner, received
+
+
+async def run_trial(n, attach_ui):
+    runner, received = (await start_stub_ui()) if attach_ui else (None, [])
+    results = [_FakeResult(f"dispatch_{i}") for i in range(dispatches)]
+
+    start = time.perf_counter()
+    for i in range(n):
+        await result_webhook.send_update(results[i % dispatches])
+    end = time.perf_counter()
+    await result_webhook.close()
+    drained = time.perf_counter()
+
+    if runner:
+        await runner.cleanup()
+
+    return {
+        "test": benchmark_name,
+        "ui_attached": attach_ui,
+        "updates": n,
+        "messages_delivered": len(received),
+        "updates_per_second": n / (end - start),
+        "drain_time": drained - end,
+    }
+
+
+for attach_ui in [False, True]:
+    for n in num_nodes:
+        record = asyncio.run(run_trial(n, attach_ui))
+        outfile = f"{benchmark_dir}/ui_{attach_ui}_updates_{n}"
+        with open(outfile, "w") as f:
+            yaml.dump(record, f)
+        print(
+            "ui attached: {}, updates: {}, {:.0f} updates/s, {} messages delivered".format(
+                attach_ui, n, record["updates_per_second"], record["messages_delivered"]
+            )
+        )